@@ -107,7 +107,7 @@ class Lab(models.Model):
                 avg_rating=models.Avg('rating')
             )['avg_rating']
             self.review_count = reviews.count()
-            self.save(update_fields=['overall_rating', 'review_count'])
+            self.save(update_fields=['overall_rating', 'review_count', 'updated_at'])
 
 
 class ResearchTopic(models.Model):
@@ -18,13 +18,19 @@ from .serializers import (
 )
 from .filters import LabFilter
 from apps.utils.cache import cache_response, CacheManager
+from apps.utils.cache_keys import filterset_query_params, normalize_choice
+from apps.utils.cache_warming import PRIORITY_HIGH, register_endpoint_warmer
+from apps.utils.fragment_cache import FragmentCacheListMixin
 from rest_framework.permissions import IsAuthenticated
 from django.shortcuts import get_object_or_404
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from .swagger_schemas import recruitment_status_request, recruitment_status_response, error_response
 
-class LabViewSet(viewsets.ModelViewSet):
+# Query params that affect the lab list response (anything else is left out of the cache key)
+LAB_LIST_QUERY_PARAMS = filterset_query_params(LabFilter, fields=normalize_choice('minimal', 'compact'))
+
+class LabViewSet(FragmentCacheListMixin, viewsets.ModelViewSet):
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_class = LabFilter
@@ -95,12 +101,17 @@ class LabViewSet(viewsets.ModelViewSet):
             return LabCompactSerializer
         return LabListSerializer
 
+    @cache_response('LABS', timeout=60 * 15, query_params=LAB_LIST_QUERY_PARAMS)
+    def list(self, request, *args, **kwargs):
+        """Cache lab list responses for 15 minutes"""
+        return super().list(request, *args, **kwargs)
+
     @cache_response('LABS', timeout=60 * 15)
     def retrieve(self, request, *args, **kwargs):
         """Cache lab detail responses for 15 minutes"""
         return super().retrieve(request, *args, **kwargs)
     
-    @cache_response('LABS', timeout=60*60)  # Cache for 1 hour
+    @cache_response('LABS', timeout=60*60, stale_ttl=60*15)  # Cache for 1 hour, serve stale up to 15 more minutes
     @action(detail=False, methods=['get'])
     def featured(self, request):
         """Get featured labs with high ratings and reviews"""
@@ -159,6 +170,11 @@ class LabViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
+register_endpoint_warmer('lab-list', namespaces=['LABS'], priority=PRIORITY_HIGH)
+register_endpoint_warmer('lab-featured', namespaces=['LABS'], priority=PRIORITY_HIGH)
+register_endpoint_warmer('lab-recruiting', namespaces=['LABS'])
+
+
 class RecruitmentStatusViewSet(viewsets.ModelViewSet):
     """
     연구실 모집 현황 관리 API
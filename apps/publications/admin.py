@@ -4,7 +4,7 @@ from django.db.models import Count
 from .models import (
     Publication, Author, Venue, ResearchArea,
     PublicationAuthor, PublicationVenue, PublicationResearchArea,
-    CitationMetric, Collaboration, LabPublicationStats, ScrapingLog
+    CitationMetric, CitationVelocity, Collaboration, LabPublicationStats, ScrapingLog, ImportJob
 )
 
 
@@ -194,6 +194,26 @@ class CitationMetricAdmin(admin.ModelAdmin):
     publication_short.short_description = 'Publication'
 
 
+@admin.register(CitationVelocity)
+class CitationVelocityAdmin(admin.ModelAdmin):
+    list_display = [
+        'publication_short', 'window_days', 'velocity', 'citations_gained',
+        'growth_rate', 'citation_count', 'computed_at'
+    ]
+    list_filter = ['window_days']
+    search_fields = ['publication__title']
+    list_select_related = ['publication']
+    # refresh_citation_velocity 명령으로만 갱신
+    readonly_fields = [
+        'publication', 'window_days', 'velocity', 'citations_gained',
+        'growth_rate', 'citation_count', 'computed_at'
+    ]
+
+    def publication_short(self, obj):
+        return obj.publication.title[:50] + '...'
+    publication_short.short_description = 'Publication'
+
+
 @admin.register(Collaboration)
 class CollaborationAdmin(admin.ModelAdmin):
     list_display = [
@@ -215,17 +235,17 @@ class LabPublicationStatsAdmin(admin.ModelAdmin):
     list_filter = ['best_venue_tier', 'last_updated']
     search_fields = ['lab__name']
     readonly_fields = ['last_updated']
-    autocomplete_fields = ['lab', 'most_cited_paper_id']
+    autocomplete_fields = ['lab', 'most_cited_paper']
 
     fieldsets = (
         ('기본 통계', {
-            'fields': ('lab', 'total_publications', 'total_citations', 'h_index')
+            'fields': ('lab', 'total_publications', 'total_citations', 'h_index', 'i10_index')
         }),
         ('세부 메트릭', {
             'fields': ('top_tier_count', 'avg_citations_per_paper', 'publications_last_5_years')
         }),
         ('최고 성과', {
-            'fields': ('most_cited_paper_id', 'best_venue_tier')
+            'fields': ('most_cited_paper', 'best_venue_tier')
         }),
         ('시스템 정보', {
             'fields': ('last_updated',),
@@ -270,6 +290,19 @@ class ScrapingLogAdmin(admin.ModelAdmin):
     )
 
 
+
+@admin.register(ImportJob)
+class ImportJobAdmin(admin.ModelAdmin):
+    list_display = [
+        'id', 'kind', 'status', 'professor', 'processed_items', 'total_items',
+        'created_count', 'updated_count', 'created_at'
+    ]
+    list_filter = ['kind', 'status', 'created_at']
+    search_fields = ['professor__name', 'error_message']
+    readonly_fields = ['created_at', 'started_at', 'finished_at', 'heartbeat_at', 'locked_by', 'attempts']
+    autocomplete_fields = ['professor']
+    exclude = ['payload']
+
 # Add publications to Lab admin if it exists
 try:
     from apps.labs.admin import LabAdmin
@@ -0,0 +1,242 @@
+# apps/publications/citation_metrics.py
+"""
+저자/연구실/교수 인용 지표 (총 인용 수, h-index, i10-index)
+
+논문 인용 수를 파이썬으로 가져와 정렬하지 않고, 엔티티별 논문 순위를
+윈도 함수로 매겨 쿼리 한 번에 모든 엔티티의 지표를 계산합니다:
+
+    ROW_NUMBER() OVER (PARTITION BY entity_id ORDER BY citation_count DESC)
+    h-index  = citation_count >= 순위인 논문 수
+    i10-index = citation_count >= 10인 논문 수
+
+엔티티별 논문:
+    author     PublicationAuthor
+    lab        Publication.labs (LabPublicationStats에 저장, lab_stats.py)
+    professor  Professor.scholar_id와 google_scholar_id가 같은 저자의 논문
+
+결과는 값이 바뀐 행만 bulk_update로 저장합니다. bulk_update는 auto_now를
+갱신하지 않으므로 수정 시각을 함께 저장하고 (프래그먼트 캐시 키가 바뀜),
+지표를 보여 주는 캐시 네임스페이스와 프래그먼트도 무효화합니다. 논문 인용
+수나 저자 연결이 바뀌면 signals에서 해당 저자/교수만 커밋 후 다시 계산하고,
+전체 재계산은 refresh_citation_metrics 명령으로 실행합니다.
+
+교수 지표는 Author.google_scholar_id가 교수의 scholar_id로 채워진 저자만
+집계합니다. Scholar 가져오기(scholar_import.py)는 교수 이름과 일치하는
+저자에 이 값을 채우고, 그 밖의 저자는 관리자가 연결해야 합니다.
+"""
+from collections import namedtuple
+from django.db import connection, transaction
+from django.utils import timezone
+
+
+I10_THRESHOLD = 10
+BATCH_SIZE = 1000
+ENTITY_KINDS = ('author', 'professor', 'lab')
+METRIC_FIELDS = ['total_citations', 'h_index', 'i10_index']
+
+EntityMetrics = namedtuple('EntityMetrics', ['publication_count', 'total_citations', 'h_index', 'i10_index'])
+EMPTY_METRICS = EntityMetrics(0, 0, 0, 0)
+
+# 저장 모델, 엔티티 id 필드, 수정 시각 필드, 프래그먼트 모델 (없으면 None), 캐시 네임스페이스
+MetricTarget = namedtuple('MetricTarget', ['model', 'key', 'timestamp_field', 'fragment_label', 'namespaces'])
+
+
+def _column(model, field_name):
+    return connection.ops.quote_name(model._meta.get_field(field_name).column)
+
+
+def _table(model):
+    return connection.ops.quote_name(model._meta.db_table)
+
+
+def _links_sql(kind):
+    """엔티티 종류별 (entity_id, publication_id) 쌍을 고르는 SELECT (WHERE 절은 호출 측에서 추가)"""
+    from apps.universities.models import Professor
+    from .models import Author, Publication, PublicationAuthor
+
+    if kind == 'author':
+        return (
+            f"SELECT DISTINCT {_column(PublicationAuthor, 'author')} AS entity_id, "
+            f"{_column(PublicationAuthor, 'publication')} AS publication_id "
+            f"FROM {_table(PublicationAuthor)}",
+            _column(PublicationAuthor, 'author'),
+        )
+    if kind == 'lab':
+        through = Publication.labs.through
+        return (
+            f"SELECT DISTINCT {_column(through, 'lab')} AS entity_id, "
+            f"{_column(through, 'publication')} AS publication_id "
+            f"FROM {_table(through)}",
+            _column(through, 'lab'),
+        )
+    if kind == 'professor':
+        professor_id = f"pr.{_column(Professor, 'id')}"
+        return (
+            f"SELECT DISTINCT {professor_id} AS entity_id, "
+            f"pa.{_column(PublicationAuthor, 'publication')} AS publication_id "
+            f"FROM {_table(Professor)} pr "
+            f"INNER JOIN {_table(Author)} a "
+            f"ON a.{_column(Author, 'google_scholar_id')} = pr.{_column(Professor, 'scholar_id')} "
+            f"INNER JOIN {_table(PublicationAuthor)} pa "
+            f"ON pa.{_column(PublicationAuthor, 'author')} = a.{_column(Author, 'id')} "
+            f"WHERE pr.{_column(Professor, 'scholar_id')} <> ''",
+            professor_id,
+        )
+    raise ValueError(f"Unknown entity kind: {kind}")
+
+
+def _metrics_sql(kind, entity_count=None):
+    """엔티티별 지표 SELECT (entity_count가 있으면 그 개수만큼의 IN 파라미터)"""
+    from .models import Publication
+
+    links, entity_column = _links_sql(kind)
+    if entity_count is not None:
+        keyword = 'AND' if ' WHERE ' in links else 'WHERE'
+        links = f"{links} {keyword} {entity_column} IN ({', '.join(['%s'] * entity_count)})"
+
+    sql = f"""
+        WITH links AS ({links}),
+        ranked AS (
+            SELECT links.entity_id AS entity_id,
+                   p.{_column(Publication, 'citation_count')} AS citations,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY links.entity_id ORDER BY p.{_column(Publication, 'citation_count')} DESC
+                   ) AS citation_rank
+            FROM links
+            INNER JOIN {_table(Publication)} p ON p.{_column(Publication, 'id')} = links.publication_id
+        )
+        SELECT entity_id,
+               COUNT(*),
+               COALESCE(SUM(citations), 0),
+               SUM(CASE WHEN citations >= citation_rank THEN 1 ELSE 0 END),
+               SUM(CASE WHEN citations >= %s THEN 1 ELSE 0 END)
+        FROM ranked
+        GROUP BY entity_id
+    """
+    return sql
+
+
+def compute_citation_metrics(kind, entity_ids=None):
+    """
+    엔티티 id -> EntityMetrics (논문이 없는 엔티티는 빠짐)
+
+    entity_ids가 없으면 모든 엔티티를 쿼리 한 번으로 계산하고, 있으면
+    BATCH_SIZE개당 쿼리 한 번입니다.
+    """
+    if entity_ids is None:
+        batches = [None]
+    else:
+        entity_ids = sorted({pk for pk in entity_ids if pk is not None})
+        batches = [entity_ids[start:start + BATCH_SIZE] for start in range(0, len(entity_ids), BATCH_SIZE)]
+
+    results = {}
+    for batch in batches:
+        sql = _metrics_sql(kind, None if batch is None else len(batch))
+        # 파라미터 순서: IN 목록 (links 안) -> i10 기준값
+        params = (list(batch) if batch is not None else []) + [I10_THRESHOLD]
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            while True:
+                rows = cursor.fetchmany(BATCH_SIZE)
+                if not rows:
+                    break
+                for entity_id, *values in rows:
+                    results[entity_id] = EntityMetrics(*(int(value or 0) for value in values))
+    return results
+
+
+def _targets(kind):
+    """엔티티 종류 -> MetricTarget"""
+    from apps.universities.models import Professor
+    from .models import Author, LabPublicationStats
+
+    return {
+        'author': MetricTarget(Author, 'pk', 'updated_at', None, ['AUTHORS']),
+        'professor': MetricTarget(
+            Professor, 'pk', 'updated_at', 'universities.Professor', ['PROFESSORS', 'LABS']
+        ),
+        # 연구실은 통계 행이 있는 경우만 (행 생성은 lab_stats.py)
+        'lab': MetricTarget(LabPublicationStats, 'lab_id', 'last_updated', None, ['LAB_STATS']),
+    }[kind]
+
+
+def refresh_citation_metrics(kind, entity_ids=None):
+    """
+    지표 다시 계산 후 바뀐 행만 저장 (entity_ids가 없으면 전체)
+
+    저장한 행 수를 반환합니다.
+    """
+    from apps.utils.invalidation import invalidate_namespaces, invalidate_object_fragments
+
+    target = _targets(kind)
+    model, key = target.model, target.key
+    if entity_ids is not None:
+        entity_ids = sorted({pk for pk in entity_ids if pk is not None})
+        if not entity_ids:
+            return 0
+    metrics = compute_citation_metrics(kind, entity_ids)
+
+    current = model.objects.order_by('pk').values_list('pk', key, *METRIC_FIELDS)
+
+    now = timezone.now()
+    changed = []
+    batches = [None] if entity_ids is None else [
+        entity_ids[start:start + BATCH_SIZE] for start in range(0, len(entity_ids), BATCH_SIZE)
+    ]
+    for batch in batches:
+        rows = current if batch is None else current.filter(**{f'{key}__in': batch})
+        for pk, entity_id, *values in rows.iterator(chunk_size=BATCH_SIZE):
+            computed = metrics.get(entity_id, EMPTY_METRICS)
+            wanted = [computed.total_citations, computed.h_index, computed.i10_index]
+            if values != wanted:
+                changed.append(model(pk=pk, **dict(zip(METRIC_FIELDS, wanted)), **{target.timestamp_field: now}))
+
+    if changed:
+        with transaction.atomic():
+            model.objects.bulk_update(changed, METRIC_FIELDS + [target.timestamp_field], batch_size=BATCH_SIZE)
+            if target.fragment_label:
+                invalidate_object_fragments(target.fragment_label, [row.pk for row in changed])
+            invalidate_namespaces(*target.namespaces)
+    return len(changed)
+
+
+def author_ids_for_publications(publication_ids):
+    """논문들의 저자 id"""
+    from .models import PublicationAuthor
+
+    return set(PublicationAuthor.objects.filter(
+        publication_id__in=list(publication_ids)
+    ).values_list('author_id', flat=True))
+
+
+def professor_ids_for_authors(author_ids):
+    """Google Scholar id로 저자와 연결된 교수 id"""
+    from apps.universities.models import Professor
+    from .models import Author
+
+    if not author_ids:
+        return set()
+    scholar_ids = Author.objects.filter(pk__in=list(author_ids)).exclude(
+        google_scholar_id=''
+    ).values_list('google_scholar_id', flat=True)
+    return set(Professor.objects.filter(scholar_id__in=scholar_ids).values_list('pk', flat=True))
+
+
+def _refresh_entities(author_ids=(), professor_ids=()):
+    professor_ids = set(professor_ids) | professor_ids_for_authors(author_ids)
+    refresh_citation_metrics('author', author_ids)
+    refresh_citation_metrics('professor', professor_ids)
+
+
+def schedule_citation_metrics_refresh(author_ids=(), professor_ids=()):
+    """
+    커밋 후 저자(와 연결된 교수)/교수 지표 재계산 (롤백 시 취소)
+
+    한 트랜잭션의 변경은 모아서 한 번에 계산하고, 트랜잭션 밖에서는
+    바로 계산합니다.
+    """
+    from apps.utils.invalidation import defer_until_commit
+
+    defer_until_commit(
+        'publications.citation_metrics', _refresh_entities, author_ids=author_ids, professor_ids=professor_ids
+    )
@@ -0,0 +1,202 @@
+# apps/publications/citation_velocity.py
+"""
+기간별 인용 증가 속도 (CitationVelocity)
+
+trending API는 요청마다 CitationMetric 시계열을 집계하지 않고, 주기 작업이
+미리 계산한 CitationVelocity를 (window_days, -velocity) 인덱스로 읽습니다.
+
+    python manage.py refresh_citation_velocity   # cron 등으로 주기 실행
+
+기간(WINDOWS) W마다 논문별로:
+
+    기준값 = 기간 시작(now - W) 이전의 마지막 기록
+             (없으면 기간 안의 첫 기록 - 기록이 짧은 논문)
+    최근값 = 현재 Publication.citation_count
+    citations_gained = max(최근값 - 기준값, 0)
+    velocity = citations_gained / 기준 시점부터 지난 일수 (하루당 증가 수)
+    growth_rate = citations_gained / max(기준값, 1)
+
+논문 REFRESH_BATCH_SIZE개씩 시계열을 한 번에 읽어 NumPy로 모든 기간을 벡터
+연산합니다 (NumPy가 없으면 같은 계산을 순수 Python으로 수행).
+"""
+import logging
+from django.db import transaction
+from django.utils import timezone
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+
+logger = logging.getLogger(__name__)
+
+WINDOWS = (30, 90, 365)
+DEFAULT_WINDOW = 90
+REFRESH_BATCH_SIZE = 500
+SECONDS_PER_DAY = 86400.0
+
+UPDATED_FIELDS = ['citation_count', 'citations_gained', 'velocity', 'growth_rate', 'computed_at']
+
+
+def parse_window(value, default=DEFAULT_WINDOW):
+    """'90d' / '90' -> 90 (지원하지 않는 기간이면 ValueError)"""
+    if value in (None, ''):
+        return default
+    text = str(value).strip().lower()
+    if text.endswith('d'):
+        text = text[:-1]
+    try:
+        days = int(text)
+    except ValueError:
+        days = None
+    if days not in WINDOWS:
+        raise ValueError(f"window must be one of {', '.join(f'{window}d' for window in WINDOWS)}")
+    return days
+
+
+def normalize_window(value):
+    """캐시 키용 window ('90', '90d', 기본값은 같은 키, 잘못된 값은 그대로)"""
+    try:
+        days = parse_window(value)
+    except ValueError:
+        return value.strip()
+    return None if days == DEFAULT_WINDOW else f'{days}d'
+
+
+def _window_stats_numpy(publication_ids, timestamps, counts, now):
+    """
+    (논문 pk, 기록 시각, 인용 수) 배열 -> {window: (gained, velocity, growth_rate) 배열}
+
+    배열은 (논문 pk, 기록 시각) 순으로 정렬되어 있고 논문마다 마지막 원소가
+    현재 인용 수입니다.
+    """
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+    counts = np.asarray(counts, dtype=np.float64)
+    publication_ids = np.asarray(publication_ids)
+
+    firsts = np.flatnonzero(np.r_[True, publication_ids[1:] != publication_ids[:-1]])
+    lasts = np.r_[firsts[1:], len(publication_ids)] - 1
+
+    stats = {}
+    for window in WINDOWS:
+        start = now - window * SECONDS_PER_DAY
+        # 논문별 기간 시작 이전 기록 수 -> 그 중 마지막 기록 (없으면 첫 기록)
+        before = np.add.reduceat((timestamps <= start).astype(np.int64), firsts)
+        baselines = firsts + np.maximum(before - 1, 0)
+
+        gained = np.maximum(counts[lasts] - counts[baselines], 0)
+        days = np.maximum((timestamps[lasts] - timestamps[baselines]) / SECONDS_PER_DAY, 1.0)
+        stats[window] = (gained, gained / days, gained / np.maximum(counts[baselines], 1))
+    return publication_ids[firsts], counts[lasts], stats
+
+
+def _window_stats_python(publication_ids, timestamps, counts, now):
+    """_window_stats_numpy와 같은 계산 (NumPy가 없을 때)"""
+    groups = []
+    for index, publication_id in enumerate(publication_ids):
+        if not groups or groups[-1][0] != publication_id:
+            groups.append((publication_id, index, index))
+        else:
+            groups[-1] = (publication_id, groups[-1][1], index)
+
+    stats = {}
+    for window in WINDOWS:
+        start = now - window * SECONDS_PER_DAY
+        gained_list, velocity_list, growth_list = [], [], []
+        for _, first, last in groups:
+            baseline = first
+            for index in range(first, last + 1):
+                if timestamps[index] > start:
+                    break
+                baseline = index
+            gained = max(counts[last] - counts[baseline], 0)
+            days = max((timestamps[last] - timestamps[baseline]) / SECONDS_PER_DAY, 1.0)
+            gained_list.append(gained)
+            velocity_list.append(gained / days)
+            growth_list.append(gained / max(counts[baseline], 1))
+        stats[window] = (gained_list, velocity_list, growth_list)
+    return [group[0] for group in groups], [counts[group[2]] for group in groups], stats
+
+
+def compute_citation_velocities(publication_ids, now=None):
+    """논문 묶음의 CitationVelocity 객체 목록 (저장하지 않음)"""
+    from .models import CitationMetric, CitationVelocity, Publication
+
+    now = now or timezone.now()
+    current = dict(Publication.objects.filter(pk__in=publication_ids).values_list('pk', 'citation_count'))
+    metrics = CitationMetric.objects.filter(
+        publication_id__in=list(current), recorded_at__lte=now
+    ).order_by('publication_id', 'recorded_at').values_list('publication_id', 'recorded_at', 'citation_count')
+
+    ids, timestamps, counts = [], [], []
+    previous = None
+    for publication_id, recorded_at, citation_count in metrics.iterator(chunk_size=2000):
+        if previous is not None and publication_id != previous:
+            # 논문마다 현재 인용 수를 마지막 기록으로 추가
+            ids.append(previous)
+            timestamps.append(now.timestamp())
+            counts.append(current[previous])
+        ids.append(publication_id)
+        timestamps.append(recorded_at.timestamp())
+        counts.append(citation_count)
+        previous = publication_id
+    if previous is None:
+        return []
+    ids.append(previous)
+    timestamps.append(now.timestamp())
+    counts.append(current[previous])
+
+    window_stats = _window_stats_numpy if np is not None else _window_stats_python
+    publication_ids, citation_counts, stats = window_stats(ids, timestamps, counts, now.timestamp())
+
+    rows = []
+    for window, (gained, velocity, growth_rate) in stats.items():
+        for index, publication_id in enumerate(publication_ids):
+            rows.append(CitationVelocity(
+                publication_id=int(publication_id),
+                window_days=window,
+                citation_count=int(citation_counts[index]),
+                citations_gained=int(gained[index]),
+                velocity=round(float(velocity[index]), 6),
+                growth_rate=round(float(growth_rate[index]), 6),
+                computed_at=now,
+            ))
+    return rows
+
+
+def refresh_citation_velocities(publication_ids=None, now=None):
+    """
+    CitationVelocity 다시 계산 (publication_ids가 없으면 기록이 있는 모든 논문)
+
+    논문 묶음마다 upsert 한 번으로 저장하고, 계산된 행 수를 반환합니다.
+    """
+    from apps.utils.invalidation import invalidate_namespaces
+    from .models import CitationMetric, CitationVelocity
+
+    now = now or timezone.now()
+    full_refresh = publication_ids is None
+    if full_refresh:
+        publication_ids = CitationMetric.objects.order_by('publication_id').values_list(
+            'publication_id', flat=True
+        ).distinct()
+    publication_ids = list(publication_ids)
+
+    refreshed = 0
+    for start in range(0, len(publication_ids), REFRESH_BATCH_SIZE):
+        batch = publication_ids[start:start + REFRESH_BATCH_SIZE]
+        rows = compute_citation_velocities(batch, now=now)
+        with transaction.atomic():
+            CitationVelocity.objects.bulk_create(
+                rows, update_conflicts=True, unique_fields=['publication', 'window_days'],
+                update_fields=UPDATED_FIELDS, batch_size=REFRESH_BATCH_SIZE
+            )
+        refreshed += len(rows)
+
+    if full_refresh:
+        # 기록이 모두 삭제된 논문의 행은 제거
+        CitationVelocity.objects.filter(publication__citation_metrics__isnull=True).delete()
+
+    invalidate_namespaces('PUBLICATIONS')
+    logger.info("Refreshed %d citation velocity rows (numpy=%s)", refreshed, np is not None)
+    return refreshed
@@ -0,0 +1,220 @@
+# apps/publications/collaboration_graph.py
+"""
+공저자 / 연구실 간 협업 그래프 (CoauthorEdge, LabCollaborationEdge)
+
+collaborators / network API는 요청마다 논문-저자 M2M을 두 번 조인하지 않고,
+미리 계산한 간선 테이블을 (author, -paper_count) 인덱스로 읽습니다.
+
+    CoauthorEdge          저자 쌍 -> 공동 논문 수, 첫/마지막 연도
+    LabCollaborationEdge  연구실 쌍 -> 공동 논문 수 (PublicationAuthor.affiliation_lab)
+
+간선은 양방향(a->b, b->a)으로 저장합니다. 논문-저자 연결이나 논문 연도가
+바뀌면 signals에서 해당 저자/연구실의 간선만 커밋 후 다시 계산합니다.
+처음 한 번(또는 전체 재계산)은 명령으로 만듭니다:
+
+    python manage.py rebuild_collaboration_graph
+"""
+from django.db import transaction
+from django.db.models import Count, F, Max, Min, Q, Sum
+
+
+REFRESH_BATCH_SIZE = 500
+
+
+def _pair_rows(queryset, key, other):
+    """(key, other) 쌍별 공동 논문 수와 첫/마지막 연도"""
+    return queryset.annotate(
+        _other=F(other)
+    ).filter(_other__isnull=False).exclude(_other=F(key)).values(key, '_other').annotate(
+        paper_count=Count('publication_id', distinct=True),
+        first_year=Min('publication__publication_year'),
+        last_year=Max('publication__publication_year'),
+    ).values_list(key, '_other', 'paper_count', 'first_year', 'last_year')
+
+
+def _refresh_edges(model, node_field, other_field, ids, rows):
+    """ids에 닿은 간선을 지우고 rows(한 방향)로 양방향 간선을 다시 생성"""
+    edges = {}
+    for node, other, paper_count, first_year, last_year in rows:
+        values = {'paper_count': paper_count, 'first_year': first_year, 'last_year': last_year}
+        edges[(node, other)] = values
+        edges[(other, node)] = values
+
+    with transaction.atomic():
+        model.objects.filter(Q(**{f'{node_field}__in': ids}) | Q(**{f'{other_field}__in': ids})).delete()
+        model.objects.bulk_create([
+            model(**{node_field: node, other_field: other}, **values)
+            for (node, other), values in edges.items()
+        ], batch_size=REFRESH_BATCH_SIZE)
+    return len(edges)
+
+
+def refresh_coauthor_edges(author_ids):
+    """저자들의 공저자 간선 재계산 (저자 REFRESH_BATCH_SIZE명당 조회, 삭제, 생성 1번씩)"""
+    from .models import CoauthorEdge, PublicationAuthor
+
+    author_ids = sorted({pk for pk in author_ids if pk is not None})
+    refreshed = 0
+    for start in range(0, len(author_ids), REFRESH_BATCH_SIZE):
+        batch = author_ids[start:start + REFRESH_BATCH_SIZE]
+        rows = _pair_rows(
+            PublicationAuthor.objects.filter(author_id__in=batch),
+            'author_id', 'publication__publicationauthor__author_id'
+        )
+        refreshed += _refresh_edges(CoauthorEdge, 'author_id', 'coauthor_id', batch, rows)
+    return refreshed
+
+
+def refresh_lab_edges(lab_ids):
+    """연구실들의 연구실 간 간선 재계산"""
+    from .models import LabCollaborationEdge, PublicationAuthor
+
+    lab_ids = sorted({pk for pk in lab_ids if pk is not None})
+    refreshed = 0
+    for start in range(0, len(lab_ids), REFRESH_BATCH_SIZE):
+        batch = lab_ids[start:start + REFRESH_BATCH_SIZE]
+        rows = _pair_rows(
+            PublicationAuthor.objects.filter(affiliation_lab_id__in=batch),
+            'affiliation_lab_id', 'publication__publicationauthor__affiliation_lab_id'
+        )
+        refreshed += _refresh_edges(LabCollaborationEdge, 'lab_id', 'other_lab_id', batch, rows)
+    return refreshed
+
+
+def rebuild_collaboration_graph():
+    """모든 간선 재계산 -> (공저자 간선 수, 연구실 간선 수)"""
+    from .models import PublicationAuthor
+
+    author_ids = PublicationAuthor.objects.order_by().values_list('author_id', flat=True).distinct()
+    lab_ids = PublicationAuthor.objects.filter(affiliation_lab__isnull=False).order_by().values_list(
+        'affiliation_lab_id', flat=True
+    ).distinct()
+    return _refresh_graph(author_ids, lab_ids)
+
+
+def _refresh_graph(author_ids=(), lab_ids=()):
+    from apps.utils.invalidation import invalidate_namespaces
+
+    counts = refresh_coauthor_edges(author_ids), refresh_lab_edges(lab_ids)
+    invalidate_namespaces('AUTHORS', 'COLLABORATIONS')
+    return counts
+
+
+def links_for_publications(publication_ids):
+    """논문들의 (저자 id 목록, 소속 연구실 id 목록)"""
+    from .models import PublicationAuthor
+
+    author_ids, lab_ids = set(), set()
+    for author_id, lab_id in PublicationAuthor.objects.filter(
+        publication_id__in=list(publication_ids)
+    ).values_list('author_id', 'affiliation_lab_id'):
+        author_ids.add(author_id)
+        lab_ids.add(lab_id)
+    lab_ids.discard(None)
+    return author_ids, lab_ids
+
+
+def schedule_collaboration_refresh(author_ids=(), lab_ids=()):
+    """
+    커밋 후 저자/연구실 간선 재계산 (롤백 시 취소)
+
+    한 트랜잭션의 변경은 모아서 한 번에 계산하고, 트랜잭션 밖에서는
+    바로 계산합니다.
+    """
+    from apps.utils.invalidation import defer_until_commit
+
+    defer_until_commit('publications.collaboration_graph', _refresh_graph, author_ids=author_ids, lab_ids=lab_ids)
+
+
+def ego_network(author_id, depth=1, max_nodes=50, max_edges=200, min_papers=1):
+    """
+    저자 중심 공저자 하위 그래프 (쿼리 4번)
+
+    공동 논문이 많은 공저자부터 max_nodes명까지 담고 (depth=2이면 공저자의
+    공저자까지), 그 노드들 사이의 간선을 무게 순으로 max_edges개까지 돌려줍니다.
+    """
+    from .models import Author, CoauthorEdge
+
+    edges = CoauthorEdge.objects.filter(paper_count__gte=min_papers)
+    levels = {author_id: 0}
+    # 잘렸는지 알기 위해 하나 더 조회
+    neighbors = list(edges.filter(author_id=author_id).order_by('-paper_count', 'coauthor_id').values_list(
+        'coauthor_id', flat=True
+    )[:max_nodes])
+    truncated = len(neighbors) > max_nodes - 1
+    neighbors = neighbors[:max_nodes - 1]
+    levels.update((pk, 1) for pk in neighbors)
+
+    if depth >= 2 and neighbors and len(levels) < max_nodes:
+        second = edges.filter(author_id__in=neighbors).exclude(coauthor_id__in=list(levels)).values(
+            'coauthor_id'
+        ).annotate(weight=Sum('paper_count')).order_by('-weight', 'coauthor_id').values_list(
+            'coauthor_id', flat=True
+        )[:max_nodes - len(levels)]
+        levels.update((pk, 2) for pk in second)
+
+    node_ids = list(levels)
+    order = {pk: index for index, pk in enumerate(node_ids)}
+    rows = list(edges.filter(
+        author_id__in=node_ids, coauthor_id__in=node_ids, author_id__lt=F('coauthor_id')
+    ).order_by('-paper_count', 'author_id', 'coauthor_id').values_list(
+        'author_id', 'coauthor_id', 'paper_count', 'first_year', 'last_year'
+    )[:max_edges + 1])
+
+    authors = Author.objects.filter(pk__in=node_ids).values('id', 'name', 'current_affiliation', 'h_index')
+    nodes = sorted(
+        (dict(author, depth=levels[author['id']]) for author in authors),
+        key=lambda node: order[node['id']]
+    )
+    return {
+        'nodes': nodes,
+        'edges': [
+            {'source': source, 'target': target, 'weight': weight, 'first_year': first, 'last_year': last}
+            for source, target, weight, first, last in rows[:max_edges]
+        ],
+        'truncated': truncated or len(rows) > max_edges,
+    }
+
+
+def lab_network(min_papers=2, lab_id=None, max_nodes=100, max_edges=300):
+    """
+    연구실 간 공동 논문 간선 + 수동 등록된 외부 공동연구 (Collaboration)
+
+    무게 순으로 간선을 담되 노드가 max_nodes개를 넘는 간선은 건너뜁니다.
+    lab_id가 있으면 그 연구실에 닿은 간선만 (인덱스 조회).
+    """
+    from .models import Collaboration, LabCollaborationEdge
+
+    lab_edges = LabCollaborationEdge.objects.filter(paper_count__gte=min_papers)
+    external = Collaboration.objects.filter(collaboration_count__gte=min_papers)
+    if lab_id is not None:
+        lab_edges = lab_edges.filter(lab_id=lab_id)
+        external = external.filter(lab_id=lab_id)
+    else:
+        # 양방향 저장이므로 한 방향만
+        lab_edges = lab_edges.filter(lab_id__lt=F('other_lab_id'))
+
+    candidates = [
+        (weight, source, target, 'lab')
+        for source, target, weight in lab_edges.order_by('-paper_count').values_list(
+            'lab__name', 'other_lab__name', 'paper_count'
+        )[:max_edges]
+    ] + [
+        (weight, source, target, collaborator_type)
+        for source, target, weight, collaborator_type in external.order_by('-collaboration_count').values_list(
+            'lab__name', 'collaborator_name', 'collaboration_count', 'collaborator_type'
+        )[:max_edges]
+    ]
+    candidates.sort(key=lambda edge: -edge[0])
+
+    nodes, edges = {}, []
+    truncated = False
+    for weight, source, target, edge_type in candidates:
+        new_nodes = {source, target} - nodes.keys()
+        if len(edges) >= max_edges or len(nodes) + len(new_nodes) > max_nodes:
+            truncated = True
+            continue
+        for name in (source, target):
+            nodes.setdefault(name, {'id': name, 'name': name})
+        edges.append({'source': source, 'target': target, 'weight': weight, 'type': edge_type})
+    return {'nodes': list(nodes.values()), 'edges': edges, 'truncated': truncated}
@@ -0,0 +1,126 @@
+# apps/publications/export.py
+"""
+논문 일괄 내보내기 (NDJSON / CSV 스트리밍)
+
+/publications/export/는 목록 API와 같은 PublicationFilter를 적용한 뒤
+결과 전체를 한 응답으로 스트리밍합니다:
+
+    /publications/export/?lab=3                       NDJSON (한 줄에 논문 하나)
+    /publications/export/?professor=7&export_format=csv
+
+논문은 .iterator(chunk_size=EXPORT_CHUNK_SIZE)로 청크 단위로 읽고, 저자/
+학회/연구 분야는 청크마다 prefetch (청크당 쿼리 3번)로 펼치므로 결과
+크기와 관계없이 메모리 사용량이 일정합니다. 응답은 캐시하지 않습니다.
+
+익명 요청은 ANONYMOUS_MAX_ROWS개까지만 내보내고 요청 빈도도 제한합니다
+(PublicationExportAnonThrottle). CSV에서 =, +, -, @로 시작하는 값은
+스프레드시트가 수식으로 실행하지 않도록 앞에 '를 붙입니다.
+"""
+import csv
+import json
+
+from rest_framework.throttling import AnonRateThrottle
+
+
+EXPORT_CHUNK_SIZE = 500
+ANONYMOUS_MAX_ROWS = 5000
+EXPORT_FORMATS = ('ndjson', 'csv')
+CONTENT_TYPES = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv; charset=utf-8',
+}
+
+EXPORT_FIELDS = [
+    'id', 'title', 'publication_year', 'publication_date', 'citation_count',
+    'authors', 'venues', 'research_areas', 'keywords',
+    'doi', 'arxiv_id', 'google_scholar_id', 'is_open_access',
+    'paper_url', 'code_url', 'abstract',
+]
+# CSV에서 목록 필드를 이어 붙이는 구분자
+CSV_LIST_SEPARATOR = '; '
+# 스프레드시트가 수식으로 해석하는 첫 글자 (CSV injection)
+CSV_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+class PublicationExportAnonThrottle(AnonRateThrottle):
+    """익명 내보내기 요청 빈도 제한 (REST_FRAMEWORK['DEFAULT_THROTTLE_RATES'])"""
+
+    scope = 'publication_export_anon'
+
+
+def export_queryset(queryset, max_rows=None):
+    """
+    필터된 queryset -> 내보낼 논문 (pk 순, 중복 없음, max_rows개까지)
+
+    M2M 필터(lab, author 등)의 중복 행은 넓은 행에 DISTINCT를 거는 대신
+    pk 서브쿼리로 제거합니다.
+    """
+    from .models import Publication
+    from .serializers import prefetch_publication_summaries
+
+    publications = prefetch_publication_summaries(
+        Publication.objects.filter(pk__in=queryset.order_by().values('pk')).order_by('pk')
+    )
+    return publications if max_rows is None else publications[:max_rows]
+
+
+def publication_rows(queryset, chunk_size=EXPORT_CHUNK_SIZE, max_rows=None):
+    """논문별 평탄화된 dict (저자/학회/연구 분야는 이름 목록)"""
+    for publication in export_queryset(queryset, max_rows).iterator(chunk_size=chunk_size):
+        yield {
+            'id': publication.pk,
+            'title': publication.title,
+            'publication_year': publication.publication_year,
+            'publication_date': publication.publication_date.isoformat() if publication.publication_date else None,
+            'citation_count': publication.citation_count,
+            'authors': [link.author.name for link in publication.ordered_author_links],
+            'venues': [link.venue.display_name for link in publication.ordered_venue_links],
+            'research_areas': [area.name for area in publication.research_areas.all()],
+            'keywords': publication.keywords if isinstance(publication.keywords, list) else [],
+            'doi': publication.doi or '',
+            'arxiv_id': publication.arxiv_id or '',
+            'google_scholar_id': publication.google_scholar_id or '',
+            'is_open_access': publication.is_open_access,
+            'paper_url': publication.paper_url or '',
+            'code_url': publication.code_url or '',
+            'abstract': publication.abstract,
+        }
+
+
+def iter_ndjson(rows):
+    for row in rows:
+        yield json.dumps(row, ensure_ascii=False, default=str) + '\n'
+
+
+class _Echo:
+    """csv.writer가 쓴 한 줄을 그대로 반환하는 버퍼"""
+
+    def write(self, value):
+        return value
+
+
+def csv_cell(value):
+    """CSV 셀 값 (목록은 이어 붙이고, 수식으로 시작하는 문자열은 ' 접두사)"""
+    if isinstance(value, list):
+        value = CSV_LIST_SEPARATOR.join(str(item) for item in value)
+    if value is None:
+        return ''
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return f"'{value}"
+    return value
+
+
+def iter_csv(rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(EXPORT_FIELDS)
+    for row in rows:
+        yield writer.writerow([csv_cell(row[field]) for field in EXPORT_FIELDS])
+
+
+def stream_publications(queryset, export_format='ndjson', chunk_size=EXPORT_CHUNK_SIZE, max_rows=None):
+    """(내용 iterator, Content-Type)"""
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"export_format must be one of: {', '.join(EXPORT_FORMATS)}")
+    rows = publication_rows(queryset, chunk_size, max_rows)
+    content = iter_csv(rows) if export_format == 'csv' else iter_ndjson(rows)
+    return content, CONTENT_TYPES[export_format]
@@ -1,6 +1,7 @@
 # apps/publications/filters.py
 import django_filters
 from django.db.models import Q
+from .keywords import filter_by_keywords, normalize_keyword, parse_keyword_list
 from .models import Publication, Author, Venue
 
 
@@ -34,6 +35,9 @@ class PublicationFilter(django_filters.FilterSet):
     lab = django_filters.NumberFilter(field_name='labs')
     lab_id = django_filters.NumberFilter(field_name='labs')  # lab_id로도 검색 가능
 
+    # 교수 논문 (Google Scholar id가 같은 저자의 논문)
+    professor = django_filters.NumberFilter(method='filter_by_professor')
+
     # 연구 분야 필터 (이름으로 검색)
     research_area = django_filters.CharFilter(method='filter_by_research_area')
     research_area_id = django_filters.NumberFilter(field_name='research_areas')  # ID로 검색할 때 사용
@@ -76,6 +80,14 @@ class PublicationFilter(django_filters.FilterSet):
             publicationauthor__is_first_author=True
         )
 
+    def filter_by_professor(self, queryset, name, value):
+        """교수 논문 필터링 (citation_metrics와 같은 Professor.scholar_id 기준)"""
+        from apps.universities.models import Professor
+        scholar_ids = Professor.objects.filter(pk=value).exclude(scholar_id='').values('scholar_id')
+        return queryset.filter(
+            pk__in=Publication.objects.filter(authors__google_scholar_id__in=scholar_ids).values('pk')
+        )
+
     def filter_award_papers(self, queryset, name, value):
         """수상 논문 필터링"""
         if value:
@@ -103,20 +115,17 @@ class PublicationFilter(django_filters.FilterSet):
         return queryset
 
     def filter_by_keyword(self, queryset, name, value):
-        """특정 키워드로 필터링"""
-        if value:
-            return queryset.filter(keywords__icontains=value)
+        """특정 키워드로 필터링 (정규화된 키워드 접두사 일치)"""
+        slug = normalize_keyword(value)
+        if slug:
+            return filter_by_keywords(queryset, [slug])
         return queryset
 
     def filter_keywords_contain(self, queryset, name, value):
-        """키워드 배열에서 특정 문자열 포함 검색"""
-        if value:
-            keywords = [k.strip() for k in value.split(',')]
-            q_objects = Q()
-            for keyword in keywords:
-                if keyword:
-                    q_objects |= Q(keywords__icontains=keyword)
-            return queryset.filter(q_objects)
+        """쉼표로 구분된 키워드 중 하나라도 일치 (정규화된 키워드 접두사 일치)"""
+        slugs = parse_keyword_list(value)
+        if slugs:
+            return filter_by_keywords(queryset, slugs)
         return queryset
 
     def filter_year_range(self, queryset, name, value):
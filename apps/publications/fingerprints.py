@@ -0,0 +1,154 @@
+# apps/publications/fingerprints.py
+"""
+논문 중복 판별용 지문 (fingerprint)
+
+Publication.fingerprint는 정규화한 제목의 SHA-1이며 인덱스가 있습니다.
+대소문자, 문장부호, 공백, 악센트만 다른 제목은 같은 지문을 가집니다:
+
+    "Attention Is All You Need."  -> "attention is all you need"
+    "attention is  all you-need"  -> "attention is all you need"
+
+DOI와 arXiv id도 저장 시 정규화되어, 가져오기에서는 DOI -> arXiv -> 제목
+지문 순으로 기존 논문을 찾습니다 (배치당 인덱스 IN 조회 3번). 정규화 전에
+저장된 값은 마이그레이션(0023)에서 normalize_stored_identifiers로 맞춥니다.
+"""
+import hashlib
+import re
+import unicodedata
+
+
+LOOKUP_BATCH_SIZE = 500
+
+_NON_ALNUM = re.compile(r'[\W_]+')
+_DOI_PREFIX = re.compile(r'^(?:https?://(?:dx\.)?doi\.org/|doi:\s*)', re.IGNORECASE)
+_ARXIV_PREFIX = re.compile(r'^(?:https?://arxiv\.org/(?:abs|pdf)/|arxiv:\s*)', re.IGNORECASE)
+_ARXIV_SUFFIX = re.compile(r'(?:v\d+)?(?:\.pdf)?$', re.IGNORECASE)
+
+
+def normalize_title(title):
+    """비교용 제목 (소문자, 악센트/문장부호 제거, 공백 통일)"""
+    if not isinstance(title, str):
+        return ''
+    value = unicodedata.normalize('NFKD', title)
+    value = ''.join(char for char in value if not unicodedata.combining(char)).casefold()
+    return _NON_ALNUM.sub(' ', value).strip()
+
+
+def title_fingerprint(title):
+    """정규화한 제목의 SHA-1 (제목이 비어 있으면 '')"""
+    normalized = normalize_title(title)
+    if not normalized:
+        return ''
+    return hashlib.sha1(normalized.encode('utf-8')).hexdigest()
+
+
+def normalize_doi(doi):
+    """'https://doi.org/10.1000/ABC' -> '10.1000/abc' (없으면 None, doi는 unique)"""
+    if not isinstance(doi, str):
+        return None
+    value = _DOI_PREFIX.sub('', doi.strip()).strip().lower()
+    return value or None
+
+
+def normalize_arxiv_id(arxiv_id):
+    """'arXiv:2101.00001v2' / 'https://arxiv.org/abs/2101.00001' -> '2101.00001'"""
+    if not isinstance(arxiv_id, str):
+        return ''
+    value = _ARXIV_PREFIX.sub('', arxiv_id.strip()).strip()
+    return _ARXIV_SUFFIX.sub('', value, count=1).lower()
+
+
+def normalize_stored_identifiers(model=None):
+    """
+    저장된 DOI/arXiv id 정규화 -> (DOI 바꾼 행 수, 중복으로 DOI를 비운 행 수)
+
+    doi는 unique라서 정규화하면 같아지는 DOI는 이미 정규화된 행(없으면 먼저
+    등록된 논문)에만 남기고, 나머지 행은 DOI를 비운 뒤 원래 값을
+    additional_notes에 남깁니다 (논문 병합은 관리자가 확인 후 진행).
+    model은 마이그레이션에서 과거 모델을 넘길 때 사용합니다.
+    """
+    from .models import Publication as CurrentPublication
+
+    Publication = model or CurrentPublication
+    groups = {}
+    rows = Publication.objects.exclude(doi__isnull=True).order_by('pk').values_list('pk', 'doi')
+    for pk, doi in rows.iterator(chunk_size=LOOKUP_BATCH_SIZE):
+        groups.setdefault(normalize_doi(doi), []).append((pk, doi))
+
+    keep, duplicates = [], {}
+    for normalized, members in groups.items():
+        if normalized is None:
+            duplicates.update(members)
+            continue
+        keeper = next(((pk, doi) for pk, doi in members if doi == normalized), members[0])
+        if keeper[1] != normalized:
+            keep.append(Publication(pk=keeper[0], doi=normalized))
+        duplicates.update((pk, doi) for pk, doi in members if pk != keeper[0])
+
+    # 중복을 먼저 비워야 남길 행의 정규화 값이 unique 제약에 걸리지 않음
+    cleared = []
+    for chunk in _chunks(duplicates):
+        for publication in Publication.objects.filter(pk__in=chunk).only('pk', 'additional_notes'):
+            raw = duplicates[publication.pk]
+            if raw.strip():
+                note = f"Duplicate DOI removed during normalization: {raw}"
+                publication.additional_notes = '\n'.join(filter(None, [publication.additional_notes, note]))
+            publication.doi = None
+            cleared.append(publication)
+    Publication.objects.bulk_update(cleared, ['doi', 'additional_notes'], batch_size=LOOKUP_BATCH_SIZE)
+    Publication.objects.bulk_update(keep, ['doi'], batch_size=LOOKUP_BATCH_SIZE)
+
+    arxiv_rows = Publication.objects.exclude(arxiv_id='').order_by('pk').values_list('pk', 'arxiv_id')
+    arxiv = [
+        Publication(pk=pk, arxiv_id=normalize_arxiv_id(arxiv_id))
+        for pk, arxiv_id in arxiv_rows.iterator(chunk_size=LOOKUP_BATCH_SIZE)
+        if arxiv_id != normalize_arxiv_id(arxiv_id)
+    ]
+    Publication.objects.bulk_update(arxiv, ['arxiv_id'], batch_size=LOOKUP_BATCH_SIZE)
+    return len(keep), len([publication for publication in cleared if duplicates[publication.pk].strip()])
+
+
+def _chunks(values):
+    values = list(values)
+    for start in range(0, len(values), LOOKUP_BATCH_SIZE):
+        yield values[start:start + LOOKUP_BATCH_SIZE]
+
+
+def existing_fingerprints(fingerprints):
+    """이미 있는 지문 -> 논문 pk (같은 지문이 여러 개면 먼저 등록된 논문)"""
+    from .models import Publication
+
+    found = {}
+    wanted = {fingerprint for fingerprint in fingerprints if fingerprint}
+    for chunk in _chunks(wanted):
+        rows = Publication.objects.filter(fingerprint__in=chunk).order_by('pk').values_list('fingerprint', 'pk')
+        for fingerprint, pk in rows:
+            found.setdefault(fingerprint, pk)
+    return found
+
+
+def match_publications(records):
+    """
+    (title, doi, arxiv_id) 목록 -> 같은 순서의 기존 논문 pk 목록 (없으면 None)
+
+    DOI, arXiv id, 제목 지문 순으로 일치하는 논문을 찾습니다.
+    """
+    from .models import Publication
+
+    keys = [
+        (normalize_doi(doi), normalize_arxiv_id(arxiv_id), title_fingerprint(title))
+        for title, doi, arxiv_id in records
+    ]
+
+    by_doi, by_arxiv = {}, {}
+    for chunk in _chunks({doi for doi, _, _ in keys if doi}):
+        by_doi.update(Publication.objects.filter(doi__in=chunk).values_list('doi', 'pk'))
+    for chunk in _chunks({arxiv_id for _, arxiv_id, _ in keys if arxiv_id}):
+        for arxiv_id, pk in Publication.objects.filter(arxiv_id__in=chunk).order_by('pk').values_list('arxiv_id', 'pk'):
+            by_arxiv.setdefault(arxiv_id, pk)
+    by_fingerprint = existing_fingerprints(fingerprint for _, _, fingerprint in keys)
+
+    return [
+        by_doi.get(doi) or by_arxiv.get(arxiv_id) or by_fingerprint.get(fingerprint)
+        for doi, arxiv_id, fingerprint in keys
+    ]
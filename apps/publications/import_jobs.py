@@ -0,0 +1,202 @@
+# apps/publications/import_jobs.py
+"""
+논문 가져오기 작업 큐 (ImportJob)
+
+가져오기 API는 작업만 저장하고 바로 job id를 돌려줍니다. 워커
+(process_import_jobs 명령)가 DB에서 대기 작업을 가져와 CHUNK_SIZE개씩
+처리합니다. 청크 처리와 진행 상황 저장은 같은 트랜잭션에서 커밋되므로,
+워커가 중단되어도 heartbeat가 오래된 작업은 다시 대기 상태가 되어 처리한
+위치부터 이어서 진행됩니다.
+
+    python manage.py process_import_jobs          # 계속 실행 (워커)
+    python manage.py process_import_jobs --once   # 대기 작업만 처리 후 종료
+
+Scholar 가져오기 작업은 ScrapingLog와 연결되어 결과가 함께 기록됩니다.
+"""
+import logging
+import os
+import socket
+import time
+from datetime import timedelta
+from django.conf import settings
+from django.db import OperationalError, close_old_connections, transaction
+from django.utils import timezone
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULTS = {
+    'CHUNK_SIZE': 50,
+    'POLL_INTERVAL': 5,  # 초
+    'STALE_AFTER': 600,  # heartbeat가 이보다 오래되면 중단된 작업으로 간주 (초)
+    'MAX_ATTEMPTS': 3,
+    'MAX_ERRORS': 200,  # 작업당 저장하는 항목별 오류 수
+}
+
+
+def job_setting(name):
+    return getattr(settings, 'PUBLICATION_IMPORT_JOBS', {}).get(name, DEFAULTS[name])
+
+
+def worker_name():
+    return f"{socket.gethostname()}:{os.getpid()}"[:100]
+
+
+def enqueue_import_job(kind, items, professor=None):
+    """가져오기 작업 생성 (Scholar 작업은 ScrapingLog도 함께 생성)"""
+    from .models import ImportJob, ScrapingLog
+
+    with transaction.atomic():
+        scraping_log = None
+        if kind == 'scholar' and professor is not None:
+            scraping_log = ScrapingLog.objects.create(professor=professor, status='pending')
+        return ImportJob.objects.create(
+            kind=kind, professor=professor, scraping_log=scraping_log,
+            payload=list(items), total_items=len(items)
+        )
+
+
+def claim_next_job(worker=None):
+    """가장 오래된 대기 작업을 실행 상태로 가져옴 (없으면 None)"""
+    from .models import ImportJob
+
+    worker = worker or worker_name()
+    candidates = ImportJob.objects.filter(status='pending').order_by('created_at', 'pk').values_list('pk', flat=True)
+    for pk in candidates[:10]:
+        now = timezone.now()
+        # 조건부 UPDATE로 여러 워커 중 하나만 가져감
+        claimed = ImportJob.objects.filter(pk=pk, status='pending').update(
+            status='running', locked_by=worker, heartbeat_at=now
+        )
+        if claimed:
+            job = ImportJob.objects.select_related('professor', 'scraping_log').get(pk=pk)
+            job.attempts += 1
+            job.started_at = job.started_at or now
+            job.save(update_fields=['attempts', 'started_at'])
+            return job
+    return None
+
+
+def requeue_stale_jobs():
+    """응답 없는 워커의 작업을 다시 대기 상태로 (재시도 횟수 초과 시 실패 처리)"""
+    from .models import ImportJob
+
+    cutoff = timezone.now() - timedelta(seconds=job_setting('STALE_AFTER'))
+    stale = ImportJob.objects.filter(status='running', heartbeat_at__lt=cutoff)
+    requeued = stale.filter(attempts__lt=job_setting('MAX_ATTEMPTS')).update(status='pending', locked_by='')
+    for job in stale.select_related('scraping_log'):
+        _finish(job, 'failed', 'Import worker stopped responding')
+    return requeued
+
+
+def run_import_job(job):
+    """작업을 청크 단위로 끝까지 처리"""
+    handler = _HANDLERS[job.kind]
+    chunk_size = job_setting('CHUNK_SIZE')
+    started = time.monotonic()
+    try:
+        while job.processed_items < job.total_items:
+            start = job.processed_items
+            chunk = job.payload[start:start + chunk_size]
+            with transaction.atomic():
+                result = handler(job, chunk)
+                for error in result['errors']:
+                    error['index'] += start
+                job.errors = (job.errors + result['errors'])[:job_setting('MAX_ERRORS')]
+                job.created_count += result['created']
+                job.updated_count += result['updated']
+                job.processed_items += len(chunk)
+                job.heartbeat_at = timezone.now()
+                job.save(update_fields=[
+                    'errors', 'created_count', 'updated_count', 'processed_items', 'heartbeat_at'
+                ])
+    except Exception as e:
+        logger.exception("Import job %s failed", job.pk)
+        _finish(job, 'failed', str(e), time.monotonic() - started)
+    else:
+        _finish(job, 'success', '', time.monotonic() - started)
+    return job
+
+
+def process_import_jobs(once=False, max_jobs=None, worker=None):
+    """
+    대기 작업 처리 루프
+
+    once=True이면 대기 작업이 없을 때 (또는 DB 오류 시) 종료합니다. 처리한
+    작업 수를 반환합니다.
+
+    오래 실행되는 워커는 요청 주기가 없으므로 반복마다 끊어졌거나
+    CONN_MAX_AGE가 지난 연결을 직접 정리하고, 작업을 가져오다 난 DB 오류는
+    기록 후 다음 폴링에서 다시 시도합니다.
+    """
+    worker = worker or worker_name()
+    processed = 0
+    while max_jobs is None or processed < max_jobs:
+        close_old_connections()
+        try:
+            requeue_stale_jobs()
+            job = claim_next_job(worker)
+        except OperationalError:
+            logger.exception("Could not claim an import job, retrying")
+            if once:
+                break
+            time.sleep(job_setting('POLL_INTERVAL'))
+            continue
+        if job is None:
+            if once:
+                break
+            time.sleep(job_setting('POLL_INTERVAL'))
+            continue
+        logger.info("Processing import job %s (%s, %d items)", job.pk, job.kind, job.total_items)
+        run_import_job(job)
+        processed += 1
+    return processed
+
+
+def _finish(job, status, error_message, elapsed=0):
+    job.status = status
+    job.error_message = error_message
+    job.locked_by = ''
+    job.finished_at = timezone.now()
+    update_fields = ['status', 'error_message', 'locked_by', 'finished_at']
+    if status == 'success':
+        # 처리된 요청 데이터는 더 이상 필요 없음
+        job.payload = []
+        update_fields.append('payload')
+    job.save(update_fields=update_fields)
+
+    log = job.scraping_log
+    if log is not None:
+        log.status = status
+        log.publications_count = job.created_count + job.updated_count
+        log.execution_time_seconds += int(elapsed)
+        log.error_message = error_message or (f"{len(job.errors)} items failed" if job.errors else '')
+        log.save(update_fields=['status', 'publications_count', 'execution_time_seconds', 'error_message'])
+
+
+def _import_scholar_chunk(job, chunk):
+    from .scholar_import import import_scholar_publications
+    return import_scholar_publications(job.professor, chunk)
+
+
+def _import_relations_chunk(job, chunk):
+    from .ingest import create_publication_with_relations
+
+    result = {'created': 0, 'updated': 0, 'errors': []}
+    for index, data in enumerate(chunk):
+        try:
+            # 항목마다 savepoint - 실패한 항목만 롤백
+            _, created = create_publication_with_relations(data)
+        except Exception as e:
+            title = data.get('title', 'Unknown') if isinstance(data, dict) else 'Unknown'
+            result['errors'].append({'index': index, 'title': title, 'error': str(e)})
+        else:
+            # 이미 있는 논문은 건너뛰고 updated로 집계
+            result['created' if created else 'updated'] += 1
+    return result
+
+
+_HANDLERS = {
+    'scholar': _import_scholar_chunk,
+    'relations': _import_relations_chunk,
+}
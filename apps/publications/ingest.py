@@ -0,0 +1,145 @@
+# apps/publications/ingest.py
+"""
+논문 한 편과 관련 데이터(연구실, 저자, 학회, 연구분야)를 한 번에 생성
+
+create_with_relations API와 가져오기 작업(import_jobs.py)에서 사용합니다.
+입력 오류는 ValueError로 알리며, 트랜잭션이 롤백되어 일부만 저장되지 않습니다.
+DOI, arXiv id 또는 제목 지문(fingerprints.py)이 같은 논문이 이미 있으면 새로
+만들지 않고 기존 논문을 돌려줍니다.
+"""
+from datetime import datetime
+from django.db import transaction
+
+from .fingerprints import match_publications
+
+
+REQUIRED_FIELDS = ['title', 'publication_year']
+
+
+def create_publication_with_relations(data):
+    """data(create_with_relations 요청 형식) -> (Publication, 생성 여부)"""
+    from apps.labs.models import Lab
+    from .models import (
+        Author, Publication, PublicationAuthor, PublicationResearchArea, PublicationVenue,
+        ResearchArea, Venue
+    )
+
+    if not isinstance(data, dict):
+        raise ValueError('publication must be an object')
+    for field in REQUIRED_FIELDS:
+        if field not in data:
+            raise ValueError(f'{field} is required')
+
+    existing_id, = match_publications([(data['title'], data.get('doi'), data.get('arxiv_id'))])
+    if existing_id is not None:
+        return Publication.objects.get(pk=existing_id), False
+
+    with transaction.atomic():
+        # 1. 논문 기본 정보 생성
+        publication_data = {
+            'title': data['title'],
+            'publication_year': data['publication_year'],
+            'abstract': data.get('abstract', ''),
+            # doi/arxiv_id는 save()에서 정규화 (빈 doi는 NULL)
+            'doi': data.get('doi'),
+            'arxiv_id': data.get('arxiv_id', ''),
+            'citation_count': data.get('citation_count', 0),
+            'keywords': data.get('keywords', []),
+            'additional_notes': data.get('additional_notes', ''),
+            'paper_url': data.get('paper_url', ''),
+            'code_url': data.get('code_url', ''),
+            'video_url': data.get('video_url', ''),
+            'dataset_url': data.get('dataset_url', ''),
+            'slides_url': data.get('slides_url', ''),
+            'is_open_access': data.get('is_open_access', False),
+            'language': data.get('language', 'en'),
+            'page_count': data.get('page_count'),
+        }
+
+        if data.get('publication_date'):
+            publication_data['publication_date'] = datetime.strptime(
+                data['publication_date'], '%Y-%m-%d'
+            ).date()
+
+        publication = Publication.objects.create(**publication_data)
+
+        # 2. 연구실 연결 (lab_id가 제공된 경우)
+        lab_ids = list(data.get('lab_ids', []))
+        if data.get('lab_id'):  # 단일 lab_id 지원
+            lab_ids.append(data['lab_id'])
+
+        for lab_id in lab_ids:
+            try:
+                lab = Lab.objects.get(id=lab_id)
+            except (Lab.DoesNotExist, ValueError):
+                raise ValueError(f'Lab with id {lab_id} not found')
+            publication.labs.add(lab)
+
+        # 3. 저자 정보 처리
+        for i, author_data in enumerate(data.get('authors', [])):
+            # 기존 저자 찾기 또는 새로 생성
+            author_name = author_data.get('name')
+            if not author_name:
+                continue
+
+            author, created = Author.objects.get_or_create(
+                name=author_name,
+                defaults={
+                    'email': author_data.get('email', ''),
+                    'current_affiliation': author_data.get('affiliation', ''),
+                    'current_position': author_data.get('position', ''),
+                }
+            )
+
+            # 논문-저자 관계 생성
+            PublicationAuthor.objects.create(
+                publication=publication,
+                author=author,
+                author_order=author_data.get('order', i + 1),
+                is_first_author=author_data.get('is_first_author', i == 0),
+                is_corresponding=author_data.get('is_corresponding', False),
+                is_last_author=author_data.get('is_last_author', False),
+                affiliation=author_data.get('affiliation', ''),
+                affiliation_lab_id=author_data.get('lab_id')
+            )
+
+        # 4. 학회/저널 정보 처리
+        for venue_data in data.get('venues', []):
+            venue_name = venue_data.get('name')
+            if not venue_name:
+                continue
+
+            venue, created = Venue.objects.get_or_create(
+                name=venue_name,
+                type=venue_data.get('type', 'conference'),
+                defaults={
+                    'short_name': venue_data.get('short_name', ''),
+                    'tier': venue_data.get('tier', 'unknown'),
+                    'field': venue_data.get('field', ''),
+                }
+            )
+
+            # 논문-학회 관계 생성
+            PublicationVenue.objects.create(
+                publication=publication,
+                venue=venue,
+                presentation_type=venue_data.get('presentation_type', 'poster'),
+                is_best_paper=venue_data.get('is_best_paper', False),
+                is_best_student_paper=venue_data.get('is_best_student_paper', False),
+                is_outstanding_paper=venue_data.get('is_outstanding_paper', False),
+                award_name=venue_data.get('award_name', ''),
+            )
+
+        # 5. 연구 분야 연결
+        for area_name in data.get('research_areas', []):
+            area, created = ResearchArea.objects.get_or_create(
+                name=area_name,
+                defaults={'description': f'{area_name} 연구 분야'}
+            )
+            PublicationResearchArea.objects.create(
+                publication=publication,
+                research_area=area,
+                relevance_score=1.0
+            )
+
+    return publication, True
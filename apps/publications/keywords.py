@@ -0,0 +1,130 @@
+# apps/publications/keywords.py
+"""
+논문 키워드 정규화 인덱스
+
+Publication.keywords (JSON 배열)는 원본 그대로 두고, 키워드를 정규화한
+slug로 Keyword / PublicationKeyword 테이블에 동기화합니다. 키워드 필터와
+집계는 JSON 문자열에 대한 icontains 대신 이 테이블을 사용합니다.
+
+    "Deep  Learning" -> "deep learning"
+    "Reinforcement-Learning" -> "reinforcement learning"
+"""
+import re
+import unicodedata
+from django.db.models import Count, Exists, OuterRef, Q
+
+
+SLUG_MAX_LENGTH = 255
+SYNC_BATCH_SIZE = 500
+
+_SEPARATORS = re.compile(r'[\s_\-/]+')
+_EDGE_PUNCTUATION = re.compile(r'^[^\w+#]+|[^\w+#.]+$|\.+$')
+
+
+def normalize_keyword(keyword):
+    """키워드 비교용 slug (소문자, 구분자/공백 통일, 양끝 문장부호 제거)"""
+    if not isinstance(keyword, str):
+        return ''
+    value = unicodedata.normalize('NFKC', keyword).lower()
+    value = _SEPARATORS.sub(' ', value).strip()
+    value = _EDGE_PUNCTUATION.sub('', value).strip()
+    return value[:SLUG_MAX_LENGTH]
+
+
+def parse_keyword_list(value):
+    """쉼표로 구분된 검색어 -> 정규화된 slug 목록 (중복 제거, 순서 유지)"""
+    slugs = (normalize_keyword(keyword) for keyword in (value or '').split(','))
+    return list(dict.fromkeys(slug for slug in slugs if slug))
+
+
+def keyword_slugs(keywords):
+    """Publication.keywords 값 -> {slug: 표기}"""
+    if isinstance(keywords, str):
+        keywords = [keywords]
+    if not isinstance(keywords, (list, tuple)):
+        return {}
+    slugs = {}
+    for keyword in keywords:
+        slug = normalize_keyword(keyword)
+        if slug and slug not in slugs:
+            slugs[slug] = keyword.strip()[:255]
+    return slugs
+
+
+def sync_publication_keywords(publications):
+    """
+    Publication.keywords를 정규화 인덱스에 반영
+
+    publications는 pk와 keywords만 로드되어 있으면 됩니다. 쿼리 수는
+    논문 수와 관계없이 일정합니다 (배치 단위).
+    """
+    from .models import Keyword, PublicationKeyword
+
+    wanted = {publication.pk: keyword_slugs(publication.keywords) for publication in publications}
+    if not wanted:
+        return
+
+    names = {}
+    for slugs in wanted.values():
+        for slug, name in slugs.items():
+            names.setdefault(slug, name)
+    if names:
+        Keyword.objects.bulk_create(
+            [Keyword(slug=slug, name=name) for slug, name in names.items()],
+            ignore_conflicts=True, batch_size=SYNC_BATCH_SIZE
+        )
+    keyword_ids = dict(Keyword.objects.filter(slug__in=list(names)).values_list('slug', 'id'))
+
+    target = {
+        (publication_id, keyword_ids[slug])
+        for publication_id, slugs in wanted.items()
+        for slug in slugs
+    }
+    existing = {
+        (publication_id, keyword_id): link_id
+        for link_id, publication_id, keyword_id in PublicationKeyword.objects.filter(
+            publication_id__in=list(wanted)
+        ).values_list('id', 'publication_id', 'keyword_id')
+    }
+
+    stale = [link_id for pair, link_id in existing.items() if pair not in target]
+    if stale:
+        PublicationKeyword.objects.filter(id__in=stale).delete()
+    missing = target - existing.keys()
+    if missing:
+        PublicationKeyword.objects.bulk_create(
+            [PublicationKeyword(publication_id=publication_id, keyword_id=keyword_id)
+             for publication_id, keyword_id in missing],
+            ignore_conflicts=True, batch_size=SYNC_BATCH_SIZE
+        )
+
+
+def filter_by_keywords(queryset, slugs, prefix=True):
+    """
+    slugs 중 하나라도 일치하는 키워드를 가진 논문 (OR, 중복 행 없음)
+
+    prefix=True이면 접두사 일치 ("neural network" -> "neural networks")
+    """
+    from .models import PublicationKeyword
+
+    if not slugs:
+        return queryset
+    lookup = 'keyword__slug__startswith' if prefix else 'keyword__slug'
+    condition = Q()
+    for slug in slugs:
+        condition |= Q(**{lookup: slug})
+    return queryset.filter(Exists(
+        PublicationKeyword.objects.filter(condition, publication=OuterRef('pk'))
+    ))
+
+
+def top_keywords(publications, limit=10):
+    """논문 queryset의 상위 키워드 ([{'keyword', 'count'}], SQL 집계)"""
+    from .models import Keyword
+
+    rows = Keyword.objects.filter(
+        publicationkeyword__publication__in=publications.order_by().values('pk')
+    ).annotate(
+        count=Count('publicationkeyword')
+    ).order_by('-count', 'slug').values('name', 'count')[:limit]
+    return [{'keyword': row['name'], 'count': row['count']} for row in rows]
@@ -0,0 +1,232 @@
+# apps/publications/lab_stats.py
+"""
+연구실 논문 통계 read model (LabPublicationStats)
+
+stats / filters / yearly_stats / by_lab API는 요청마다 집계하지 않고
+연구실당 한 행의 LabPublicationStats를 읽습니다. 통계는 논문, 연구실 연결,
+학회/연구분야 연결, 인용 수가 바뀔 때 signals에서 변경된 연구실만
+커밋 후 다시 계산합니다 (트랜잭션당 한 번, 연구실 묶음당 쿼리 수 일정).
+
+    yearly_histogram: {"2024": {"count": 3, "citations": 41}}
+    top_venues / top_research_areas: 논문 수 상위 항목
+    facets: filters API의 선택지 (years, venues, research_areas, venue_tiers, venue_types)
+"""
+from collections import defaultdict
+from datetime import datetime
+from django.utils import timezone
+
+
+TOP_VENUES_LIMIT = 5
+TOP_RESEARCH_AREAS_LIMIT = 5
+TOP_PUBLICATIONS_LIMIT = 10
+REFRESH_BATCH_SIZE = 200
+
+# 좋은 순서 (best_venue_tier)
+TIER_RANKING = ['top', 'high', 'mid', 'workshop']
+
+# 통계에 영향을 주는 Publication 필드
+LAB_STATS_FIELDS = {'citation_count', 'publication_year', 'is_open_access'}
+
+# refresh에서 다시 쓰는 LabPublicationStats 필드
+REFRESHED_FIELDS = [
+    'total_publications', 'total_citations', 'h_index', 'i10_index', 'top_tier_count',
+    'avg_citations_per_paper', 'publications_last_5_years', 'open_access_count',
+    'most_cited_paper', 'best_venue_tier', 'yearly_histogram', 'top_venues',
+    'top_research_areas', 'top_publication_ids', 'facets', 'last_updated',
+]
+
+class _LabStatsBuilder:
+    """한 연구실의 링크 행들로부터 통계 필드 계산"""
+
+    def __init__(self):
+        self.publications = {}  # pk -> (citation_count, year, is_open_access)
+        self.venues = {}
+        self.venue_publications = defaultdict(set)
+        self.areas = {}
+        self.area_publications = defaultdict(set)
+
+    def add_venue(self, publication_id, venue):
+        self.venues[venue['id']] = venue
+        self.venue_publications[venue['id']].add(publication_id)
+
+    def add_area(self, publication_id, area):
+        self.areas[area['id']] = area
+        self.area_publications[area['id']].add(publication_id)
+
+    def fields(self, current_year):
+        citations = {pk: row[0] for pk, row in self.publications.items()}
+        total_publications = len(self.publications)
+        total_citations = sum(citations.values())
+
+        histogram = defaultdict(lambda: {'count': 0, 'citations': 0})
+        for citation_count, year, _ in self.publications.values():
+            if year:
+                histogram[str(year)]['count'] += 1
+                histogram[str(year)]['citations'] += citation_count
+
+        most_cited = sorted(citations, key=lambda pk: (-citations[pk], pk))[:TOP_PUBLICATIONS_LIMIT]
+        tiers = {venue['tier'] for venue in self.venues.values()}
+        top_tier_publications = set()
+        for venue_id, venue in self.venues.items():
+            if venue['tier'] == 'top':
+                top_tier_publications |= self.venue_publications[venue_id]
+
+        return {
+            'total_publications': total_publications,
+            'total_citations': total_citations,
+            'top_tier_count': len(top_tier_publications),
+            'avg_citations_per_paper': total_citations / total_publications if total_publications else 0.0,
+            'publications_last_5_years': sum(
+                1 for _, year, _ in self.publications.values() if year and year >= current_year - 4
+            ),
+            'open_access_count': sum(1 for *_, is_open_access in self.publications.values() if is_open_access),
+            'most_cited_paper_id': most_cited[0] if most_cited else None,
+            'best_venue_tier': next((tier for tier in TIER_RANKING if tier in tiers), ''),
+            'yearly_histogram': dict(sorted(histogram.items())),
+            'top_venues': self._top(self.venues, self.venue_publications, TOP_VENUES_LIMIT),
+            'top_research_areas': self._top(self.areas, self.area_publications, TOP_RESEARCH_AREAS_LIMIT),
+            'top_publication_ids': most_cited,
+            'facets': self._facets(),
+        }
+
+    @staticmethod
+    def _top(items, publications, limit):
+        ranked = sorted(items, key=lambda pk: (-len(publications[pk]), items[pk]['name'], pk))[:limit]
+        return [dict(items[pk], publication_count=len(publications[pk])) for pk in ranked]
+
+    def _facets(self):
+        return {
+            'years': sorted({year for _, year, _ in self.publications.values() if year}, reverse=True),
+            'venues': sorted(self.venues.values(), key=lambda venue: (venue['name'], venue['id'])),
+            'research_areas': [
+                {'id': area['id'], 'name': area['name']}
+                for area in sorted(self.areas.values(), key=lambda area: (area['name'], area['id']))
+            ],
+            'venue_tiers': sorted({venue['tier'] for venue in self.venues.values()
+                                   if venue['tier'] and venue['tier'] != 'unknown'}),
+            'venue_types': sorted({venue['type'] for venue in self.venues.values() if venue['type']}),
+        }
+
+
+def refresh_lab_publication_stats(lab_ids, invalidate=True):
+    """
+    연구실 통계 재계산 후 저장 (없는 행은 생성)
+
+    연구실 REFRESH_BATCH_SIZE개당 조회 5번 + 저장 2번입니다. h-index/i10-index는
+    SQL 윈도 함수로 계산합니다 (citation_metrics.py).
+    invalidate=False이면 응답 캐시를 비우지 않습니다 (조회 중 빈 행 채우기, 백필).
+    """
+    from apps.labs.models import Lab
+    from apps.utils.invalidation import invalidate_namespaces
+    from .citation_metrics import EMPTY_METRICS, compute_citation_metrics
+    from .models import LabPublicationStats
+
+    lab_ids = sorted(Lab.objects.filter(pk__in=list(lab_ids)).values_list('pk', flat=True))
+    for start in range(0, len(lab_ids), REFRESH_BATCH_SIZE):
+        batch = lab_ids[start:start + REFRESH_BATCH_SIZE]
+        builders = _collect(batch)
+        metrics = compute_citation_metrics('lab', batch)
+        current_year = datetime.now().year
+        now = timezone.now()
+
+        existing = {stats.lab_id: stats for stats in LabPublicationStats.objects.filter(lab_id__in=batch)}
+        created, updated = [], []
+        for lab_id in batch:
+            stats = existing.get(lab_id)
+            if stats is None:
+                stats = LabPublicationStats(lab_id=lab_id)
+                created.append(stats)
+            else:
+                updated.append(stats)
+            for field, value in builders[lab_id].fields(current_year).items():
+                setattr(stats, field, value)
+            lab_metrics = metrics.get(lab_id, EMPTY_METRICS)
+            stats.h_index = lab_metrics.h_index
+            stats.i10_index = lab_metrics.i10_index
+            stats.last_updated = now
+
+        if created:
+            LabPublicationStats.objects.bulk_create(created, batch_size=REFRESH_BATCH_SIZE)
+        if updated:
+            LabPublicationStats.objects.bulk_update(updated, REFRESHED_FIELDS, batch_size=REFRESH_BATCH_SIZE)
+
+    if lab_ids and invalidate:
+        # by_lab(PUBLICATIONS)과 rankings(LAB_STATS) 응답 캐시
+        invalidate_namespaces('LAB_STATS', 'PUBLICATIONS')
+    return lab_ids
+
+
+def backfill_lab_publication_stats(invalidate=True):
+    """
+    모든 연구실 통계 재계산 (마이그레이션, refresh_lab_stats 명령)
+
+    연구실 id를 REFRESH_BATCH_SIZE개씩 읽어 묶음마다 계산하고,
+    캐시는 마지막에 한 번만 비웁니다. Returns 계산한 연구실 수
+    """
+    from apps.labs.models import Lab
+    from apps.utils.invalidation import invalidate_namespaces
+
+    refreshed = 0
+    last_id = 0
+    while True:
+        batch = list(Lab.objects.filter(pk__gt=last_id).order_by('pk').values_list(
+            'pk', flat=True
+        )[:REFRESH_BATCH_SIZE])
+        if not batch:
+            break
+        refreshed += len(refresh_lab_publication_stats(batch, invalidate=False))
+        last_id = batch[-1]
+
+    if refreshed and invalidate:
+        invalidate_namespaces('LAB_STATS', 'PUBLICATIONS')
+    return refreshed
+
+
+def _collect(lab_ids):
+    """연구실별 논문/학회/연구분야 행 로드 (쿼리 3번)"""
+    from .models import Publication, PublicationResearchArea, PublicationVenue
+
+    builders = defaultdict(_LabStatsBuilder)
+    links = Publication.labs.through.objects.filter(lab_id__in=lab_ids).values_list(
+        'lab_id', 'publication_id', 'publication__citation_count',
+        'publication__publication_year', 'publication__is_open_access'
+    )
+    for lab_id, publication_id, citation_count, year, is_open_access in links:
+        builders[lab_id].publications[publication_id] = (citation_count, year, is_open_access)
+
+    venues = PublicationVenue.objects.filter(publication__labs__in=lab_ids).values_list(
+        'publication__labs', 'publication_id',
+        'venue_id', 'venue__name', 'venue__short_name', 'venue__type', 'venue__tier'
+    )
+    for lab_id, publication_id, venue_id, name, short_name, venue_type, tier in venues:
+        builders[lab_id].add_venue(publication_id, {
+            'id': venue_id, 'name': name, 'short_name': short_name or '', 'type': venue_type, 'tier': tier
+        })
+
+    areas = PublicationResearchArea.objects.filter(publication__labs__in=lab_ids).values_list(
+        'publication__labs', 'publication_id', 'research_area_id', 'research_area__name', 'research_area__color_code'
+    )
+    for lab_id, publication_id, area_id, name, color_code in areas:
+        builders[lab_id].add_area(publication_id, {'id': area_id, 'name': name, 'color_code': color_code})
+    return builders
+
+
+def schedule_lab_stats_refresh(lab_ids):
+    """
+    커밋 후 연구실 통계 재계산 (롤백 시 취소)
+
+    한 트랜잭션의 변경은 모아서 한 번에 계산하고, 트랜잭션 밖에서는
+    바로 계산합니다.
+    """
+    from apps.utils.invalidation import defer_until_commit
+
+    defer_until_commit('publications.lab_stats', refresh_lab_publication_stats, lab_ids=lab_ids)
+
+
+def lab_ids_for_publications(publication_ids):
+    """논문들이 연결된 연구실 id"""
+    from .models import Publication
+
+    return set(Publication.labs.through.objects.filter(
+        publication_id__in=list(publication_ids)
+    ).values_list('lab_id', flat=True))
@@ -4,6 +4,7 @@ import os
 from django.core.management.base import BaseCommand
 from django.db import transaction
 from datetime import datetime
+from apps.publications.fingerprints import match_publications, normalize_doi, title_fingerprint
 from apps.publications.models import (
     Publication, Author, Venue, ResearchArea,
     PublicationAuthor, PublicationVenue, PublicationResearchArea
@@ -44,6 +45,7 @@ class Command(BaseCommand):
             json_files = [f for f in os.listdir(dataset_dir) if f.endswith('.json')]
 
         total_created = 0
+        total_skipped = 0
         total_errors = 0
 
         for json_file in json_files:
@@ -61,13 +63,15 @@ class Command(BaseCommand):
                 with open(file_path, 'r', encoding='utf-8') as f:
                     publications_data = json.load(f)
 
-                created_count, error_count = self.process_publications(publications_data, json_file)
+                created_count, skipped_count, error_count = self.process_publications(publications_data, json_file)
                 total_created += created_count
+                total_skipped += skipped_count
                 total_errors += error_count
 
                 self.stdout.write(
                     self.style.SUCCESS(
-                        f'✅ {json_file}: {created_count} publications created, {error_count} errors'
+                        f'✅ {json_file}: {created_count} publications created, '
+                        f'{skipped_count} already existed, {error_count} errors'
                     )
                 )
 
@@ -86,16 +90,36 @@ class Command(BaseCommand):
         self.stdout.write('\n' + '='*50)
         self.stdout.write(
             self.style.SUCCESS(
-                f'📊 SUMMARY: {total_created} publications created, {total_errors} errors'
+                f'📊 SUMMARY: {total_created} publications created, '
+                f'{total_skipped} already existed, {total_errors} errors'
             )
         )
 
     def process_publications(self, publications_data, filename):
-        """Process a list of publications from JSON data"""
+        """Process a list of publications from JSON data, skipping ones already loaded"""
         created_count = 0
+        skipped_count = 0
         error_count = 0
 
+        # Look up existing publications for the whole file at once (DOI, arXiv id, title fingerprint)
+        records = [
+            (data.get('title'), data.get('doi'), data.get('arxiv_id')) if isinstance(data, dict) else ('', None, '')
+            for data in publications_data
+        ]
+        existing_ids = match_publications(records)
+        seen = set()
+
         for i, data in enumerate(publications_data):
+            title, doi, _ = records[i]
+            keys = {('fingerprint', title_fingerprint(title)), ('doi', normalize_doi(doi))} - {
+                ('fingerprint', ''), ('doi', None)
+            }
+            if existing_ids[i] is not None or keys & seen:
+                skipped_count += 1
+                self.stdout.write(f'  ⏭️  [{i+1}] "{(title or "")[:50]}..." already exists')
+                continue
+            seen.update(keys)
+
             try:
                 with transaction.atomic():
                     publication = self.create_publication_with_relations(data)
@@ -114,7 +138,7 @@ class Command(BaseCommand):
                     )
                 )
 
-        return created_count, error_count
+        return created_count, skipped_count, error_count
 
     def create_publication_with_relations(self, data):
         """Create publication with all related data"""
@@ -137,11 +161,9 @@ class Command(BaseCommand):
             'page_count': data.get('page_count'),
         }
 
-        # Handle unique fields - only set if not empty
-        if data.get('doi') and data['doi'].strip():
-            publication_data['doi'] = data['doi']
-        if data.get('arxiv_id') and data['arxiv_id'].strip():
-            publication_data['arxiv_id'] = data['arxiv_id']
+        # Unique fields - Publication.save() normalizes them and stores an empty DOI as NULL
+        publication_data['doi'] = data.get('doi')
+        publication_data['arxiv_id'] = data.get('arxiv_id') or ''
 
         # Handle publication_date
         if data.get('publication_date'):
@@ -0,0 +1,25 @@
+# apps/publications/management/commands/process_import_jobs.py
+from django.core.management.base import BaseCommand
+from apps.publications.import_jobs import process_import_jobs
+
+
+class Command(BaseCommand):
+    help = 'Process queued publication import jobs (DB-backed worker)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Exit when no pending job is left instead of polling'
+        )
+        parser.add_argument(
+            '--max-jobs',
+            type=int,
+            default=None,
+            help='Exit after processing this many jobs'
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write('📥 Processing publication import jobs...')
+        processed = process_import_jobs(once=options['once'], max_jobs=options['max_jobs'])
+        self.stdout.write(self.style.SUCCESS(f'✅ Processed {processed} import jobs'))
@@ -0,0 +1,14 @@
+# apps/publications/management/commands/rebuild_collaboration_graph.py
+from django.core.management.base import BaseCommand
+from apps.publications.collaboration_graph import rebuild_collaboration_graph
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the co-authorship and lab-to-lab collaboration edges from PublicationAuthor'
+
+    def handle(self, *args, **options):
+        self.stdout.write('🕸️ Rebuilding collaboration graph...')
+        coauthor_edges, lab_edges = rebuild_collaboration_graph()
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ {coauthor_edges} co-author edges, {lab_edges} lab edges'
+        ))
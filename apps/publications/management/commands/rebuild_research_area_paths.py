@@ -0,0 +1,14 @@
+# apps/publications/management/commands/rebuild_research_area_paths.py
+from django.core.management.base import BaseCommand
+from apps.publications.research_area_tree import rebuild_research_area_paths
+from apps.utils.invalidation import invalidate_namespaces
+
+
+class Command(BaseCommand):
+    help = 'Recompute the materialized ResearchArea paths from parent (after bulk parent updates)'
+
+    def handle(self, *args, **options):
+        self.stdout.write('🌳 Rebuilding research area paths...')
+        updated = rebuild_research_area_paths()
+        invalidate_namespaces('RESEARCH_AREAS')
+        self.stdout.write(self.style.SUCCESS(f'✅ Updated {updated} research area paths'))
@@ -0,0 +1,21 @@
+# apps/publications/management/commands/refresh_citation_metrics.py
+from django.core.management.base import BaseCommand
+from apps.publications.citation_metrics import ENTITY_KINDS, refresh_citation_metrics
+
+
+class Command(BaseCommand):
+    help = 'Recompute total citations, h-index and i10-index of authors, professors and labs'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--entity',
+            choices=ENTITY_KINDS,
+            action='append',
+            help='Only refresh this entity kind (repeatable, default: all)'
+        )
+
+    def handle(self, *args, **options):
+        for kind in options.get('entity') or ENTITY_KINDS:
+            self.stdout.write(f'📊 Refreshing {kind} citation metrics...')
+            updated = refresh_citation_metrics(kind)
+            self.stdout.write(self.style.SUCCESS(f'✅ Updated {updated} {kind} rows'))
@@ -0,0 +1,20 @@
+# apps/publications/management/commands/refresh_citation_velocity.py
+from django.core.management.base import BaseCommand
+from apps.publications.citation_velocity import refresh_citation_velocities
+
+
+class Command(BaseCommand):
+    help = 'Recompute 30/90/365-day citation velocity from CitationMetric history (run periodically)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--publication-id',
+            type=int,
+            action='append',
+            help='Only refresh these publications (repeatable)'
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write('📈 Refreshing citation velocity...')
+        refreshed = refresh_citation_velocities(options.get('publication_id'))
+        self.stdout.write(self.style.SUCCESS(f'✅ Refreshed {refreshed} citation velocity rows'))
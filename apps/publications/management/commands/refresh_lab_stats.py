@@ -0,0 +1,23 @@
+# apps/publications/management/commands/refresh_lab_stats.py
+from django.core.management.base import BaseCommand
+from apps.publications.lab_stats import backfill_lab_publication_stats, refresh_lab_publication_stats
+
+
+class Command(BaseCommand):
+    help = 'Recompute the LabPublicationStats read model of every lab (or the given labs)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--lab',
+            type=int,
+            action='append',
+            help='Only refresh this lab id (repeatable, default: all labs)'
+        )
+
+    def handle(self, *args, **options):
+        self.stdout.write('📊 Refreshing lab publication stats...')
+        if options.get('lab'):
+            refreshed = len(refresh_lab_publication_stats(options['lab']))
+        else:
+            refreshed = backfill_lab_publication_stats()
+        self.stdout.write(self.style.SUCCESS(f'✅ Refreshed {refreshed} labs'))
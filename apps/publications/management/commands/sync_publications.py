@@ -6,8 +6,9 @@ import requests
 import time
 from datetime import datetime, timedelta
 
+from apps.publications.citation_velocity import refresh_citation_velocities
 from apps.publications.models import (
-    Publication, Author, Venue, CitationMetric, LabPublicationStats
+    Publication, Author, Venue, CitationMetric
 )
 
 
@@ -65,6 +66,11 @@ class Command(BaseCommand):
             # Update lab statistics
             self.update_lab_statistics(lab_id)
 
+            # 새 인용 기록으로 trending 속도 갱신 (--lab-id면 그 연구실 논문만)
+            refresh_citation_velocities(
+                list(Publication.objects.filter(labs=lab_id).values_list('pk', flat=True)) if lab_id else None
+            )
+
             self.stdout.write(
                 self.style.SUCCESS('✅ Publication sync completed successfully!')
             )
@@ -214,63 +220,14 @@ class Command(BaseCommand):
         self.stdout.write('📈 Updating lab statistics...')
 
         from apps.labs.models import Lab
-        from django.db.models import Count, Sum, Avg
+        from apps.publications.lab_stats import refresh_lab_publication_stats
 
         labs = Lab.objects.all()
         if lab_id:
             labs = labs.filter(id=lab_id)
 
-        updated_count = 0
-        for lab in labs:
-            # 기본 통계 계산
-            pub_stats = lab.publications.aggregate(
-                total_pubs=Count('id'),
-                total_citations=Sum('citation_count'),
-                avg_citations=Avg('citation_count')
-            )
-
-            # 최근 5년 논문 수
-            current_year = datetime.now().year
-            recent_pubs = lab.publications.filter(
-                publication_year__gte=current_year - 5
-            ).count()
-
-            # 탑티어 논문 수
-            top_tier_count = lab.publications.filter(
-                venues__tier='top'
-            ).count()
-
-            # 가장 많이 인용된 논문
-            most_cited = lab.publications.order_by('-citation_count').first()
-
-            # H-index 계산 (간단한 구현)
-            citations = list(
-                lab.publications.values_list('citation_count', flat=True).order_by('-citation_count')
-            )
-            h_index = 0
-            for i, citations_count in enumerate(citations, 1):
-                if citations_count >= i:
-                    h_index = i
-                else:
-                    break
-
-            # 통계 업데이트 또는 생성
-            stats, created = LabPublicationStats.objects.update_or_create(
-                lab=lab,
-                defaults={
-                    'total_publications': pub_stats['total_pubs'] or 0,
-                    'total_citations': pub_stats['total_citations'] or 0,
-                    'h_index': h_index,
-                    'avg_citations_per_paper': pub_stats['avg_citations'] or 0.0,
-                    'publications_last_5_years': recent_pubs,
-                    'top_tier_count': top_tier_count,
-                    'most_cited_paper': most_cited,
-                }
-            )
-
-            updated_count += 1
-
-        self.stdout.write(f'✅ Updated statistics for {updated_count} labs')
+        updated = refresh_lab_publication_stats(labs.values_list('id', flat=True))
+        self.stdout.write(f'✅ Updated statistics for {len(updated)} labs')
 
     def handle_api_rate_limit(self, wait_time=1):
         """API 속도 제한 처리"""
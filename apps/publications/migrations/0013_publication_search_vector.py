@@ -0,0 +1,55 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:04
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+# search.search_vector_expression()와 같은 가중치 (A: title, B: keywords, C: abstract, D: 저자/학회/노트)
+BACKFILL_SQL = """
+UPDATE publications p SET search_vector =
+    setweight(to_tsvector('english', coalesce(p.title, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(p.keywords::text, '')), 'B') ||
+    setweight(to_tsvector('english', coalesce(p.abstract, '')), 'C') ||
+    setweight(to_tsvector('english',
+        coalesce((SELECT string_agg(a.name, ' ')
+                  FROM publication_authors pa JOIN authors a ON a.id = pa.author_id
+                  WHERE pa.publication_id = p.id), '') || ' ' ||
+        coalesce((SELECT string_agg(v.name || ' ' || v.short_name, ' ')
+                  FROM publication_venues pv JOIN venues v ON v.id = pv.venue_id
+                  WHERE pv.publication_id = p.id), '') || ' ' ||
+        coalesce(p.additional_notes, '')
+    ), 'D')
+"""
+
+CREATE_INDEX_SQL = "CREATE INDEX IF NOT EXISTS publications_search_vector_gin ON publications USING gin (search_vector)"
+DROP_INDEX_SQL = "DROP INDEX IF EXISTS publications_search_vector_gin"
+
+
+def create_search_index(apps, schema_editor):
+    """GIN 인덱스 생성 및 기존 논문 search_vector 채우기 (PostgreSQL 전용)"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(BACKFILL_SQL)
+    schema_editor.execute(CREATE_INDEX_SQL)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(DROP_INDEX_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('publications', '0012_scrapinglog'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='publication',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,96 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:06
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def backfill_keywords(apps, schema_editor):
+    """기존 논문 keywords를 정규화 인덱스로 채우기"""
+    from apps.publications.keywords import keyword_slugs
+
+    Publication = apps.get_model('publications', 'Publication')
+    Keyword = apps.get_model('publications', 'Keyword')
+    PublicationKeyword = apps.get_model('publications', 'PublicationKeyword')
+
+    rows = Publication.objects.order_by('pk').values_list('pk', 'keywords')
+    batch = []
+    for row in rows.iterator(chunk_size=BACKFILL_BATCH_SIZE):
+        batch.append(row)
+        if len(batch) >= BACKFILL_BATCH_SIZE:
+            _backfill_batch(batch, Keyword, PublicationKeyword, keyword_slugs)
+            batch = []
+    if batch:
+        _backfill_batch(batch, Keyword, PublicationKeyword, keyword_slugs)
+
+
+def _backfill_batch(rows, Keyword, PublicationKeyword, keyword_slugs):
+    wanted = {pk: keyword_slugs(keywords) for pk, keywords in rows}
+    names = {}
+    for slugs in wanted.values():
+        for slug, name in slugs.items():
+            names.setdefault(slug, name)
+    if not names:
+        return
+    Keyword.objects.bulk_create(
+        [Keyword(slug=slug, name=name) for slug, name in names.items()], ignore_conflicts=True
+    )
+    keyword_ids = dict(Keyword.objects.filter(slug__in=list(names)).values_list('slug', 'id'))
+    PublicationKeyword.objects.bulk_create([
+        PublicationKeyword(publication_id=pk, keyword_id=keyword_ids[slug])
+        for pk, slugs in wanted.items()
+        for slug in slugs
+    ], ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('publications', '0013_publication_search_vector'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Keyword',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+                ('slug', models.CharField(max_length=255, unique=True)),
+            ],
+            options={
+                'db_table': 'keywords',
+                'ordering': ['slug'],
+            },
+        ),
+        migrations.CreateModel(
+            name='PublicationKeyword',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('keyword', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='publications.keyword')),
+                ('publication', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='publications.publication')),
+            ],
+            options={
+                'db_table': 'publication_keywords',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='keyword',
+            index=models.Index(fields=['slug'], name='keywords_slug_prefix_idx', opclasses=['varchar_pattern_ops']),
+        ),
+        migrations.AddField(
+            model_name='publication',
+            name='keyword_terms',
+            field=models.ManyToManyField(blank=True, related_name='publications', through='publications.PublicationKeyword', to='publications.keyword'),
+        ),
+        migrations.AddIndex(
+            model_name='publicationkeyword',
+            index=models.Index(fields=['keyword', 'publication'], name='publication_keyword_d08f56_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='publicationkeyword',
+            unique_together={('publication', 'keyword')},
+        ),
+        migrations.RunPython(backfill_keywords, migrations.RunPython.noop),
+    ]
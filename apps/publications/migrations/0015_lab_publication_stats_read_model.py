@@ -0,0 +1,48 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('publications', '0014_keyword_index'),
+    ]
+
+    operations = [
+        migrations.RenameField(
+            model_name='labpublicationstats',
+            old_name='most_cited_paper_id',
+            new_name='most_cited_paper',
+        ),
+        migrations.AddField(
+            model_name='labpublicationstats',
+            name='facets',
+            field=models.JSONField(default=dict),
+        ),
+        migrations.AddField(
+            model_name='labpublicationstats',
+            name='open_access_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='labpublicationstats',
+            name='top_publication_ids',
+            field=models.JSONField(default=list),
+        ),
+        migrations.AddField(
+            model_name='labpublicationstats',
+            name='top_research_areas',
+            field=models.JSONField(default=list),
+        ),
+        migrations.AddField(
+            model_name='labpublicationstats',
+            name='top_venues',
+            field=models.JSONField(default=list),
+        ),
+        migrations.AddField(
+            model_name='labpublicationstats',
+            name='yearly_histogram',
+            field=models.JSONField(default=dict),
+        ),
+    ]
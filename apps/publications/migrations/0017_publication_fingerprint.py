@@ -0,0 +1,43 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:19
+
+from django.db import migrations, models
+
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def backfill_fingerprints(apps, schema_editor):
+    """기존 논문의 제목 지문 채우기 (DOI/arXiv id는 unique 충돌 우려로 그대로 둠)"""
+    from apps.publications.fingerprints import title_fingerprint
+
+    Publication = apps.get_model('publications', 'Publication')
+
+    rows = Publication.objects.order_by('pk').values_list('pk', 'title')
+    batch = []
+    for pk, title in rows.iterator(chunk_size=BACKFILL_BATCH_SIZE):
+        batch.append(Publication(pk=pk, fingerprint=title_fingerprint(title)))
+        if len(batch) >= BACKFILL_BATCH_SIZE:
+            Publication.objects.bulk_update(batch, ['fingerprint'])
+            batch = []
+    if batch:
+        Publication.objects.bulk_update(batch, ['fingerprint'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('publications', '0016_importjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='publication',
+            name='fingerprint',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=40),
+        ),
+        migrations.AddIndex(
+            model_name='publication',
+            index=models.Index(fields=['arxiv_id'], name='publication_arxiv_i_67530b_idx'),
+        ),
+        migrations.RunPython(backfill_fingerprints, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:22
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('publications', '0017_publication_fingerprint'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CitationVelocity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('window_days', models.PositiveSmallIntegerField(choices=[(30, '30 days'), (90, '90 days'), (365, '365 days')])),
+                ('citation_count', models.PositiveIntegerField(default=0)),
+                ('citations_gained', models.PositiveIntegerField(default=0)),
+                ('velocity', models.FloatField(default=0)),
+                ('growth_rate', models.FloatField(default=0)),
+                ('computed_at', models.DateTimeField()),
+            ],
+            options={
+                'db_table': 'citation_velocities',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='citationmetric',
+            index=models.Index(fields=['publication', 'recorded_at'], name='citation_me_publica_c60d6b_idx'),
+        ),
+        migrations.AddField(
+            model_name='citationvelocity',
+            name='publication',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='citation_velocities', to='publications.publication'),
+        ),
+        migrations.AddIndex(
+            model_name='citationvelocity',
+            index=models.Index(fields=['window_days', '-velocity'], name='citation_velocity_rank_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='citationvelocity',
+            constraint=models.UniqueConstraint(fields=('publication', 'window_days'), name='unique_citation_velocity_window'),
+        ),
+    ]
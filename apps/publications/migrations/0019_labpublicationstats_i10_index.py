@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('publications', '0018_citationvelocity'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='labpublicationstats',
+            name='i10_index',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
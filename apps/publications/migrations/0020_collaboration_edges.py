@@ -0,0 +1,56 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:27
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('labs', '0008_remove_lab_professor'),
+        ('publications', '0019_labpublicationstats_i10_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CoauthorEdge',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('paper_count', models.PositiveIntegerField(default=0)),
+                ('first_year', models.PositiveIntegerField(blank=True, null=True)),
+                ('last_year', models.PositiveIntegerField(blank=True, null=True)),
+                ('author', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='coauthor_edges', to='publications.author')),
+                ('coauthor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='publications.author')),
+            ],
+            options={
+                'db_table': 'coauthor_edges',
+            },
+        ),
+        migrations.CreateModel(
+            name='LabCollaborationEdge',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('paper_count', models.PositiveIntegerField(default=0)),
+                ('first_year', models.PositiveIntegerField(blank=True, null=True)),
+                ('last_year', models.PositiveIntegerField(blank=True, null=True)),
+                ('lab', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='collaboration_edges', to='labs.lab')),
+                ('other_lab', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='labs.lab')),
+            ],
+            options={
+                'db_table': 'lab_collaboration_edges',
+                'indexes': [models.Index(fields=['lab', '-paper_count'], name='lab_edge_rank_idx'), models.Index(fields=['-paper_count'], name='lab_edge_weight_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='labcollaborationedge',
+            constraint=models.UniqueConstraint(fields=('lab', 'other_lab'), name='unique_lab_collaboration_edge'),
+        ),
+        migrations.AddIndex(
+            model_name='coauthoredge',
+            index=models.Index(fields=['author', '-paper_count'], name='coauthor_edge_rank_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='coauthoredge',
+            constraint=models.UniqueConstraint(fields=('author', 'coauthor'), name='unique_coauthor_edge'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('publications', '0020_collaboration_edges'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='author',
+            index=models.Index(fields=['-total_citations', 'name', 'id'], name='author_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='publication',
+            index=models.Index(fields=['-publication_year', '-citation_count', 'id'], name='publication_keyset_idx'),
+        ),
+    ]
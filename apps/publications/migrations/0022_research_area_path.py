@@ -0,0 +1,31 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:36
+
+from django.db import migrations, models
+
+
+def backfill_paths(apps, schema_editor):
+    """기존 연구 분야의 path/depth 채우기"""
+    from apps.publications.research_area_tree import rebuild_research_area_paths
+
+    rebuild_research_area_paths(apps.get_model('publications', 'ResearchArea'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('publications', '0021_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='researcharea',
+            name='depth',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='researcharea',
+            name='path',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, max_length=255),
+        ),
+        migrations.RunPython(backfill_paths, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-17 09:12
+
+from django.db import migrations
+
+
+def normalize_identifiers(apps, schema_editor):
+    """0017 이전에 저장된 DOI/arXiv id 정규화 (중복 DOI는 먼저 정리)"""
+    from apps.publications.fingerprints import normalize_stored_identifiers
+
+    normalize_stored_identifiers(apps.get_model('publications', 'Publication'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('publications', '0022_research_area_path'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_identifiers, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-17 15:40
+
+from django.db import migrations
+
+
+def backfill_lab_stats(apps, schema_editor):
+    """0015에서 추가된 통계 필드를 모든 연구실에 대해 채움 (연구실 묶음 단위)"""
+    from apps.publications.lab_stats import backfill_lab_publication_stats
+
+    backfill_lab_publication_stats(invalidate=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('publications', '0023_normalize_publication_identifiers'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_lab_stats, migrations.RunPython.noop),
+    ]
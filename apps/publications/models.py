@@ -1,6 +1,8 @@
 # apps/publications/models.py
 from django.db import models
+from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import MinValueValidator, MaxValueValidator
+from django.core.exceptions import ValidationError
 import json
 
 
@@ -34,6 +36,10 @@ class ResearchArea(models.Model):
     description = models.TextField(blank=True)
     color_code = models.CharField(max_length=7, default='#3498db')  # hex color
 
+    # 루트부터 자신까지의 id 경로 (예: '3/12/40/', research_area_tree.py)
+    path = models.CharField(max_length=255, blank=True, default='', db_index=True, editable=False)
+    depth = models.PositiveSmallIntegerField(default=0, editable=False)
+
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -44,12 +50,53 @@ class ResearchArea(models.Model):
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        """저장 후 path 갱신 (추가: 자신의 path, 이동: 하위 트리 전체)"""
+        from .research_area_tree import build_path, move_subtree, path_depth, path_ids
+
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'parent' not in update_fields and self.path:
+            return super().save(*args, **kwargs)
+
+        parent_path = ''
+        if self.parent_id is not None:
+            parent_path = ResearchArea.objects.filter(pk=self.parent_id).values_list('path', flat=True).first() or ''
+            if self.pk is not None and self.pk in path_ids(parent_path):
+                raise ValidationError({'parent': 'A research area cannot be moved under itself or its descendants.'})
+
+        super().save(*args, **kwargs)
+
+        # 다른 곳에서 이동되었을 수 있으므로 저장된 path 기준
+        old_path = ResearchArea.objects.filter(pk=self.pk).values_list('path', flat=True).first()
+        new_path = build_path(parent_path, self.pk)
+        if old_path != new_path:
+            if old_path:
+                move_subtree(old_path, new_path)
+            else:
+                ResearchArea.objects.filter(pk=self.pk).update(path=new_path, depth=path_depth(new_path))
+        self.path, self.depth = new_path, path_depth(new_path)
+
+    def is_ancestor_of(self, area):
+        """area가 자신이거나 하위 분야인지"""
+        return bool(self.path) and (area.path or '').startswith(self.path)
+
+    def clean(self):
+        super().clean()
+        if self.parent_id is not None and self.is_ancestor_of(self.parent):
+            raise ValidationError({'parent': 'A research area cannot be moved under itself or its descendants.'})
+
     @property
     def full_path(self):
-        """상위 카테고리 포함한 전체 경로"""
-        if self.parent:
-            return f"{self.parent.full_path} > {self.name}"
-        return self.name
+        """상위 카테고리 포함한 전체 경로 (조상 이름은 path로 한 번에 조회)"""
+        names = getattr(self, '_path_names', None)
+        if names is None:
+            if not self.path:
+                if self.parent:
+                    return f"{self.parent.full_path} > {self.name}"
+                return self.name
+            from .research_area_tree import attach_path_names
+            names = attach_path_names([self])[0]._path_names
+        return ' > '.join(names)
 
 
 class Venue(models.Model):
@@ -125,7 +172,7 @@ class Author(models.Model):
     current_affiliation = models.CharField(max_length=255, blank=True)
     current_position = models.CharField(max_length=100, blank=True)
 
-    # 메트릭스
+    # 메트릭스 (citation_metrics.py에서 논문 변경 시 갱신)
     total_citations = models.PositiveIntegerField(default=0)
     h_index = models.PositiveIntegerField(default=0)
     i10_index = models.PositiveIntegerField(default=0)
@@ -144,6 +191,8 @@ class Author(models.Model):
         indexes = [
             models.Index(fields=['name']),
             models.Index(fields=['google_scholar_id']),
+            # 커서 페이지네이션 (AuthorViewSet.cursor_ordering)
+            models.Index(fields=['-total_citations', 'name', 'id'], name='author_keyset_idx'),
         ]
 
     def __str__(self):
@@ -192,6 +241,16 @@ class Publication(models.Model):
     venues = models.ManyToManyField(Venue, through='PublicationVenue', related_name='publications')
     research_areas = models.ManyToManyField(ResearchArea, through='PublicationResearchArea', related_name='publications')
     labs = models.ManyToManyField('labs.Lab', related_name='publications', blank=True)
+    # keywords의 정규화 인덱스 (저장 시 keywords.py에서 동기화)
+    keyword_terms = models.ManyToManyField(
+        'Keyword', through='PublicationKeyword', related_name='publications', blank=True
+    )
+
+    # 전문 검색용 가중치 tsvector (PostgreSQL 전용, search.py 참고)
+    search_vector = SearchVectorField(null=True, blank=True, editable=False)
+
+    # 정규화한 제목의 SHA-1, 중복 판별용 (fingerprints.py, 저장 시 갱신)
+    fingerprint = models.CharField(max_length=40, blank=True, editable=False, db_index=True)
 
     # 메타데이터
     created_at = models.DateTimeField(auto_now_add=True)
@@ -204,11 +263,26 @@ class Publication(models.Model):
             models.Index(fields=['publication_year']),
             models.Index(fields=['citation_count']),
             models.Index(fields=['doi']),
+            models.Index(fields=['arxiv_id']),
+            # 커서 페이지네이션 (PublicationViewSet.cursor_ordering)
+            models.Index(fields=['-publication_year', '-citation_count', 'id'], name='publication_keyset_idx'),
         ]
+        # search_vector GIN 인덱스는 PostgreSQL에서만 마이그레이션(0013)으로 생성
 
     def __str__(self):
         return f"{self.title[:100]}... ({self.publication_year})"
 
+    def save(self, *args, **kwargs):
+        from .fingerprints import normalize_arxiv_id, normalize_doi, title_fingerprint
+
+        self.fingerprint = title_fingerprint(self.title)
+        self.doi = normalize_doi(self.doi)
+        self.arxiv_id = normalize_arxiv_id(self.arxiv_id)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'title' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'fingerprint'}
+        super().save(*args, **kwargs)
+
     @property
     def first_author(self):
         """첫 번째 저자"""
@@ -318,6 +392,39 @@ class PublicationResearchArea(models.Model):
         return f"{self.publication.title[:50]} - {self.research_area.name}"
 
 
+class Keyword(models.Model):
+    """정규화된 논문 키워드 (Publication.keywords 인덱스)"""
+    name = models.CharField(max_length=255)  # 처음 등록된 표기
+    slug = models.CharField(max_length=255, unique=True)  # 소문자/공백 정규화 (keywords.normalize_keyword)
+
+    class Meta:
+        db_table = 'keywords'
+        ordering = ['slug']
+        indexes = [
+            # slug 접두사 검색 (LIKE 'x%')용 인덱스
+            models.Index(fields=['slug'], name='keywords_slug_prefix_idx', opclasses=['varchar_pattern_ops']),
+        ]
+
+    def __str__(self):
+        return self.name
+
+
+class PublicationKeyword(models.Model):
+    """논문-키워드 연결"""
+    publication = models.ForeignKey(Publication, on_delete=models.CASCADE)
+    keyword = models.ForeignKey(Keyword, on_delete=models.CASCADE)
+
+    class Meta:
+        db_table = 'publication_keywords'
+        unique_together = ['publication', 'keyword']
+        indexes = [
+            models.Index(fields=['keyword', 'publication']),
+        ]
+
+    def __str__(self):
+        return f"{self.publication.title[:50]} - {self.keyword.name}"
+
+
 class CitationMetric(models.Model):
     """인용 메트릭 히스토리"""
 
@@ -347,12 +454,47 @@ class CitationMetric(models.Model):
         ordering = ['-recorded_at']
         indexes = [
             models.Index(fields=['recorded_at']),
+            # 논문별 시계열 조회 (citation_velocity.py)
+            models.Index(fields=['publication', 'recorded_at']),
         ]
 
     def __str__(self):
         return f"{self.publication.title[:50]} - {self.citation_count} citations ({self.source})"
 
 
+class CitationVelocity(models.Model):
+    """기간별 인용 증가 속도 (CitationMetric에서 주기적으로 계산, citation_velocity.py)"""
+
+    WINDOW_CHOICES = [
+        (30, '30 days'),
+        (90, '90 days'),
+        (365, '365 days'),
+    ]
+
+    publication = models.ForeignKey(Publication, on_delete=models.CASCADE, related_name='citation_velocities')
+    window_days = models.PositiveSmallIntegerField(choices=WINDOW_CHOICES)
+
+    citation_count = models.PositiveIntegerField(default=0)  # 계산 시점의 인용 수
+    citations_gained = models.PositiveIntegerField(default=0)  # 기간 동안 증가한 인용 수
+    velocity = models.FloatField(default=0)  # 하루당 인용 증가 수
+    growth_rate = models.FloatField(default=0)  # 기간 시작 대비 증가율
+
+    computed_at = models.DateTimeField()
+
+    class Meta:
+        db_table = 'citation_velocities'
+        constraints = [
+            models.UniqueConstraint(fields=['publication', 'window_days'], name='unique_citation_velocity_window'),
+        ]
+        indexes = [
+            # trending?window=90d 정렬
+            models.Index(fields=['window_days', '-velocity'], name='citation_velocity_rank_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.publication_id} - {self.velocity:.2f}/day ({self.window_days}d)"
+
+
 class Collaboration(models.Model):
     """공동연구 관계"""
 
@@ -386,19 +528,74 @@ class Collaboration(models.Model):
         return f"{self.lab.name} <-> {self.collaborator_name} ({self.collaboration_count} papers)"
 
 
+class CoauthorEdge(models.Model):
+    """공저자 관계 (저자 쌍별 공동 논문 수, 양방향 저장, collaboration_graph.py에서 갱신)"""
+    author = models.ForeignKey(Author, on_delete=models.CASCADE, related_name='coauthor_edges')
+    coauthor = models.ForeignKey(Author, on_delete=models.CASCADE, related_name='+')
+
+    paper_count = models.PositiveIntegerField(default=0)
+    first_year = models.PositiveIntegerField(null=True, blank=True)
+    last_year = models.PositiveIntegerField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'coauthor_edges'
+        constraints = [
+            models.UniqueConstraint(fields=['author', 'coauthor'], name='unique_coauthor_edge'),
+        ]
+        indexes = [
+            # 저자별 상위 공저자
+            models.Index(fields=['author', '-paper_count'], name='coauthor_edge_rank_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.author_id} <-> {self.coauthor_id} ({self.paper_count} papers)"
+
+
+class LabCollaborationEdge(models.Model):
+    """연구실 간 공동 논문 (PublicationAuthor.affiliation_lab 기준, 양방향 저장)"""
+    lab = models.ForeignKey('labs.Lab', on_delete=models.CASCADE, related_name='collaboration_edges')
+    other_lab = models.ForeignKey('labs.Lab', on_delete=models.CASCADE, related_name='+')
+
+    paper_count = models.PositiveIntegerField(default=0)
+    first_year = models.PositiveIntegerField(null=True, blank=True)
+    last_year = models.PositiveIntegerField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'lab_collaboration_edges'
+        constraints = [
+            models.UniqueConstraint(fields=['lab', 'other_lab'], name='unique_lab_collaboration_edge'),
+        ]
+        indexes = [
+            models.Index(fields=['lab', '-paper_count'], name='lab_edge_rank_idx'),
+            models.Index(fields=['-paper_count'], name='lab_edge_weight_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.lab_id} <-> {self.other_lab_id} ({self.paper_count} papers)"
+
+
 class LabPublicationStats(models.Model):
-    """연구실 논문 통계 (집계 테이블)"""
+    """연구실 논문 통계 (집계 테이블, lab_stats.py에서 변경 시 갱신)"""
     lab = models.OneToOneField('labs.Lab', on_delete=models.CASCADE, related_name='publication_stats')
 
     total_publications = models.PositiveIntegerField(default=0)
     total_citations = models.PositiveIntegerField(default=0)
     h_index = models.PositiveIntegerField(default=0)
+    i10_index = models.PositiveIntegerField(default=0)
     top_tier_count = models.PositiveIntegerField(default=0)
     avg_citations_per_paper = models.FloatField(default=0.0)
     publications_last_5_years = models.PositiveIntegerField(default=0)
+    open_access_count = models.PositiveIntegerField(default=0)
+
+    # 연도별/상위 항목 (API 응답용)
+    yearly_histogram = models.JSONField(default=dict)  # {"2024": {"count": 3, "citations": 41}}
+    top_venues = models.JSONField(default=list)  # [{"id", "name", "short_name", "type", "tier", "publication_count"}]
+    top_research_areas = models.JSONField(default=list)  # [{"id", "name", "color_code", "publication_count"}]
+    top_publication_ids = models.JSONField(default=list)  # 인용 수 순
+    facets = models.JSONField(default=dict)  # filters API 선택지
 
     # 최고 성과
-    most_cited_paper_id = models.ForeignKey(
+    most_cited_paper = models.ForeignKey(
         Publication,
         on_delete=models.SET_NULL,
         null=True,
@@ -461,4 +658,75 @@ class ScrapingLog(models.Model):
         ]
 
     def __str__(self):
-        return f"{self.professor.name} - {self.status} ({self.created_at.strftime('%Y-%m-%d %H:%M')})"
\ No newline at end of file
+        return f"{self.professor.name} - {self.status} ({self.created_at.strftime('%Y-%m-%d %H:%M')})"
+
+
+class ImportJob(models.Model):
+    """논문 가져오기 작업 (DB 큐, import_jobs.py / process_import_jobs 명령에서 처리)"""
+
+    KIND_CHOICES = [
+        ('scholar', 'Google Scholar Import'),
+        ('relations', 'Create With Relations'),
+    ]
+
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('success', 'Success'),
+        ('failed', 'Failed'),
+    ]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    professor = models.ForeignKey(
+        'universities.Professor',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='import_jobs'
+    )
+    scraping_log = models.OneToOneField(
+        ScrapingLog,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='import_job',
+        help_text='Scholar 가져오기 작업의 스크래핑 로그'
+    )
+
+    # 요청 데이터 (논문 목록, 완료 후 비움)
+    payload = models.JSONField(default=list, blank=True)
+
+    # 진행 상황
+    total_items = models.PositiveIntegerField(default=0)
+    processed_items = models.PositiveIntegerField(default=0)
+    created_count = models.PositiveIntegerField(default=0)
+    updated_count = models.PositiveIntegerField(default=0)
+    errors = models.JSONField(default=list, blank=True)  # [{"index", "title", "error"}]
+    error_message = models.TextField(blank=True)  # 작업 전체 실패 사유
+
+    # 워커
+    attempts = models.PositiveSmallIntegerField(default=0)
+    locked_by = models.CharField(max_length=100, blank=True)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'import_jobs'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.get_kind_display()} #{self.pk} - {self.status} ({self.processed_items}/{self.total_items})"
+
+    @property
+    def progress(self):
+        """진행률 (%)"""
+        if not self.total_items:
+            return 100.0 if self.status in ('success', 'failed') else 0.0
+        return round(self.processed_items / self.total_items * 100, 1)
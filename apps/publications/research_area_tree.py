@@ -0,0 +1,199 @@
+# apps/publications/research_area_tree.py
+"""
+연구 분야 계층 (materialized path)
+
+ResearchArea.path에 루트부터 자신까지의 id를 '/'로 이어 저장합니다
+(예: '3/12/40/', depth=2). 조상은 path에서 바로 알 수 있고, 하위 트리는
+path 접두사 조회 한 번입니다:
+
+    ResearchArea.objects.filter(path__startswith=area.path)
+
+path는 모델 저장(추가/이동) 시 ResearchArea.save()에서, 삭제 시 signals에서
+(SET_NULL로 루트가 되는 자식들) 갱신됩니다. parent를 queryset.update()나
+bulk_create로 바꾼 경우에는 명령으로 다시 계산합니다:
+
+    python manage.py rebuild_research_area_paths
+
+hierarchy API는 트리 전체와 분야별 / 하위 트리 논문 수를 쿼리 3번으로
+읽어 메모리에서 조립합니다.
+"""
+from functools import reduce
+from operator import or_
+
+from django.db import connection
+from django.db.models import F, Q, Value
+from django.db.models.functions import Concat, Substr
+
+
+PATH_SEPARATOR = '/'
+BATCH_SIZE = 1000
+
+
+def build_path(parent_path, pk):
+    return f"{parent_path or ''}{pk}{PATH_SEPARATOR}"
+
+
+def path_ids(path):
+    """path -> 루트부터의 id 목록"""
+    return [int(pk) for pk in path.split(PATH_SEPARATOR) if pk]
+
+
+def path_depth(path):
+    return max(len(path_ids(path)) - 1, 0)
+
+
+def move_subtree(old_path, new_path):
+    """old_path 하위 트리 전체(자신 포함)의 path 접두사를 new_path로 (쿼리 1번)"""
+    from .models import ResearchArea
+
+    if not old_path or old_path == new_path:
+        return 0
+    return ResearchArea.objects.filter(path__startswith=old_path).update(
+        path=Concat(Value(new_path), Substr('path', len(old_path) + 1)),
+        depth=F('depth') + (path_depth(new_path) - path_depth(old_path)),
+    )
+
+
+def detach_descendants(pk):
+    """
+    삭제된 분야의 하위 트리에서 그 분야까지의 조상을 path에서 제거
+
+    부모가 삭제되면 자식은 SET_NULL로 루트가 되므로 자식의 path는 자신의
+    id부터 시작합니다. 같은 삭제에서 조상이 먼저 지워졌을 수 있어 삭제된
+    인스턴스의 path 대신 id로 하위 분야를 찾습니다.
+    """
+    from .models import ResearchArea
+
+    segment = f"{pk}{PATH_SEPARATOR}"
+    descendants = ResearchArea.objects.filter(
+        Q(path__startswith=segment) | Q(path__contains=f"{PATH_SEPARATOR}{segment}")
+    ).values_list('pk', 'path')
+
+    changed = []
+    for area_id, path in descendants:
+        ids = path_ids(path)
+        if pk not in ids:
+            continue
+        new_path = ''.join(f"{ancestor}{PATH_SEPARATOR}" for ancestor in ids[ids.index(pk) + 1:])
+        changed.append(ResearchArea(pk=area_id, path=new_path, depth=path_depth(new_path)))
+    ResearchArea.objects.bulk_update(changed, ['path', 'depth'], batch_size=BATCH_SIZE)
+    return len(changed)
+
+
+def rebuild_research_area_paths(model=None):
+    """
+    parent로부터 모든 path 다시 계산 후 바뀐 행만 저장 -> 저장한 행 수
+
+    model은 마이그레이션에서 과거 모델을 넘길 때 사용합니다.
+    """
+    from .models import ResearchArea as CurrentResearchArea
+
+    ResearchArea = model or CurrentResearchArea
+    rows = {
+        pk: (parent_id, path)
+        for pk, parent_id, path in ResearchArea.objects.values_list('pk', 'parent_id', 'path')
+    }
+    paths = {}
+
+    def resolve(pk):
+        chain, node = [], pk
+        while node is not None and node not in paths and node not in chain:
+            chain.append(node)
+            parent_id = rows[node][0]
+            node = parent_id if parent_id in rows else None
+        # 순환 참조는 순환이 닫히는 분야를 루트로 취급
+        prefix = paths.get(node, '')
+        for area_id in reversed(chain):
+            prefix = paths[area_id] = build_path(prefix, area_id)
+        return paths[pk]
+
+    changed = []
+    for pk, (_, path) in rows.items():
+        new_path = resolve(pk)
+        if new_path != path:
+            changed.append(ResearchArea(pk=pk, path=new_path, depth=path_depth(new_path)))
+    ResearchArea.objects.bulk_update(changed, ['path', 'depth'], batch_size=BATCH_SIZE)
+    return len(changed)
+
+
+def _publication_counts(root_ids):
+    """
+    root_ids 하위 트리의 분야 id -> (직접 연결된 논문 수, 하위 트리 전체의
+    중복 없는 논문 수) (쿼리 1번)
+
+    d.path LIKE (a.path || '%') 조인은 열 값 패턴이라 인덱스를 쓰지 못하므로,
+    양쪽을 상수 접두사 LIKE('3/%')로 요청한 하위 트리에 먼저 한정합니다.
+    """
+    from .models import PublicationResearchArea, ResearchArea
+
+    def column(model, field_name):
+        return connection.ops.quote_name(model._meta.get_field(field_name).column)
+
+    areas = connection.ops.quote_name(ResearchArea._meta.db_table)
+    links = connection.ops.quote_name(PublicationResearchArea._meta.db_table)
+    area_id, path = column(ResearchArea, 'id'), column(ResearchArea, 'path')
+    link_area, link_publication = column(PublicationResearchArea, 'research_area'), column(
+        PublicationResearchArea, 'publication'
+    )
+    prefixes = [f"{build_path('', pk)}%" for pk in root_ids]
+
+    def in_subtrees(alias):
+        return ' OR '.join([f"{alias}.{path} LIKE %s"] * len(prefixes))
+
+    sql = f"""
+        SELECT a.{area_id},
+               COUNT(DISTINCT CASE WHEN d.{area_id} = a.{area_id} THEN l.{link_publication} END),
+               COUNT(DISTINCT l.{link_publication})
+        FROM {areas} a
+        INNER JOIN {areas} d ON d.{path} LIKE (a.{path} || %s)
+        INNER JOIN {links} l ON l.{link_area} = d.{area_id}
+        WHERE ({in_subtrees('a')}) AND ({in_subtrees('d')})
+        GROUP BY a.{area_id}
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(sql, ['%', *prefixes, *prefixes])
+        return {pk: (direct, subtree) for pk, direct, subtree in cursor.fetchall()}
+
+
+def research_area_tree(root_ids):
+    """
+    root_ids를 루트로 하는 트리 목록 (쿼리 2번, 루트 순서 유지)
+
+    하위 분야는 root_ids를 고른 조건과 관계없이 모두 포함합니다.
+
+    각 노드: id, name, description, color_code, depth, publication_count
+    (직접 연결), subtree_publication_count (하위 분야 포함, 중복 없음),
+    children (Meta.ordering 순)
+    """
+    from .models import ResearchArea
+
+    root_ids = list(root_ids)
+    if not root_ids:
+        return []
+    counts = _publication_counts(root_ids)
+    nodes, children = {}, {}
+    # 부서 이름, 이름 순 (ResearchArea.Meta.ordering)
+    subtrees = reduce(or_, (Q(path__startswith=build_path('', pk)) for pk in root_ids))
+    for area in ResearchArea.objects.filter(subtrees).order_by('department__name', 'name').values(
+        'id', 'name', 'description', 'color_code', 'depth', 'parent_id'
+    ):
+        direct, subtree = counts.get(area['id'], (0, 0))
+        parent_id = area.pop('parent_id')
+        nodes[area['id']] = dict(
+            area, publication_count=direct, subtree_publication_count=subtree,
+            children=children.setdefault(area['id'], [])
+        )
+        children.setdefault(parent_id, []).append(nodes[area['id']])
+    return [nodes[pk] for pk in root_ids if pk in nodes]
+
+
+def attach_path_names(areas):
+    """분야들의 조상 이름을 한 번에 읽어 full_path에 사용 (쿼리 1번)"""
+    from .models import ResearchArea
+
+    areas = list(areas)
+    ancestor_ids = {pk for area in areas for pk in path_ids(area.path)[:-1]}
+    names = dict(ResearchArea.objects.filter(pk__in=ancestor_ids).values_list('pk', 'name')) if ancestor_ids else {}
+    for area in areas:
+        area._path_names = [names[pk] for pk in path_ids(area.path)[:-1] if pk in names] + [area.name]
+    return areas
@@ -0,0 +1,276 @@
+# apps/publications/scholar_import.py
+"""
+Google Scholar 논문 일괄 가져오기 (bulk_import_from_scholar)
+
+논문마다 get_or_create를 반복하지 않고 단계별로 묶어서 처리합니다:
+
+    1. 항목 검증/정규화 - 잘못된 항목은 항목별 오류로 보고하고 제외
+    2. 기존 논문(제목 지문, fingerprints.py)/저자/학회를 IN 조회로 확인
+    3. 새 논문/저자/학회와 연결 행을 bulk_create
+    4. 증가한 인용 수를 UPDATE 한 번으로 반영
+
+2~4는 한 트랜잭션에서 실행되어, 실패하면 배치 전체가 롤백됩니다. 쿼리 수는
+항목 수가 아니라 BATCH_SIZE 단위로 늘어납니다.
+
+bulk 작업은 signal을 보내지 않으므로 키워드 인덱스, 검색 벡터, 연구실 통계,
+저자/교수 인용 지표, 공저자 간선, 캐시 무효화를 여기서 직접 처리합니다.
+"""
+from django.db import transaction
+from django.db.models import Case, PositiveIntegerField, Value, When
+from django.utils import timezone
+
+from .fingerprints import title_fingerprint
+
+
+BATCH_SIZE = 500
+
+
+def _chunks(values, size=BATCH_SIZE):
+    values = list(values)
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+def _clean_item(data):
+    """스크레이핑 항목 하나를 검증/정규화 (제목이 없으면 None)"""
+    if not isinstance(data, dict):
+        raise ValueError('publication must be an object')
+    title = (data.get('title') or '').strip()
+    fingerprint = title_fingerprint(title)
+    if not fingerprint:
+        return None
+
+    try:
+        year = int(data.get('year'))
+    except (TypeError, ValueError):
+        raise ValueError('year is required')
+    try:
+        citations = int(data.get('citations') or 0)
+    except (TypeError, ValueError):
+        raise ValueError('citations must be a number')
+    if year <= 0 or citations < 0:
+        raise ValueError('year and citations must not be negative')
+
+    authors = data.get('authors') or []
+    if not isinstance(authors, list):
+        raise ValueError('authors must be a list')
+    bib = data.get('bib') if isinstance(data.get('bib'), dict) else {}
+
+    return {
+        'title': title,
+        'fingerprint': fingerprint,
+        'year': year,
+        'citations': citations,
+        'abstract': data.get('abstract') or '',
+        'paper_url': data.get('pub_url') or '',
+        # (저자 순서, 이름) - 순서는 원본 목록 위치 기준
+        'authors': [
+            (index, name.strip()) for index, name in enumerate(authors, 1)
+            if isinstance(name, str) and name.strip()
+        ],
+        'venue': (data.get('venue') or '').strip(),
+        'affiliation': bib.get('venue', ''),
+    }
+
+
+def import_scholar_publications(professor, items):
+    """
+    스크레이핑한 논문 목록을 가져와 교수의 연구실에 연결
+
+    Returns {'created', 'updated', 'errors': [{'index', 'title', 'error'}], 'publication_ids'}
+    """
+    result = {'created': 0, 'updated': 0, 'errors': [], 'publication_ids': []}
+
+    rows = {}
+    for index, data in enumerate(items):
+        try:
+            row = _clean_item(data)
+        except ValueError as e:
+            title = data.get('title', 'Unknown') if isinstance(data, dict) else 'Unknown'
+            result['errors'].append({'index': index, 'title': title, 'error': str(e)})
+            continue
+        if row is None:
+            continue
+        # 같은 배치의 중복 제목은 (대소문자/문장부호가 달라도) 하나로 합침
+        if row['fingerprint'] in rows:
+            duplicate = rows[row['fingerprint']]
+            duplicate['citations'] = max(duplicate['citations'], row['citations'])
+            continue
+        rows[row['fingerprint']] = row
+
+    if rows:
+        with transaction.atomic():
+            _import_rows(professor, rows, result)
+    return result
+
+
+def _import_rows(professor, rows, result):
+    from apps.utils.cache import CacheManager
+    from apps.utils.invalidation import invalidate_object_fragments
+    from .citation_metrics import author_ids_for_publications, schedule_citation_metrics_refresh
+    from .collaboration_graph import schedule_collaboration_refresh
+    from .keywords import sync_publication_keywords
+    from .lab_stats import lab_ids_for_publications, schedule_lab_stats_refresh
+    from .models import Publication
+    from .search import schedule_search_vector_update
+
+    # 1. 기존 논문 - 제목 지문 인덱스 조회 (같은 지문이 여러 개면 먼저 등록된 논문)
+    existing = {}
+    for fingerprints in _chunks(rows):
+        for pk, fingerprint, citation_count in Publication.objects.filter(
+            fingerprint__in=fingerprints
+        ).order_by('pk').values_list('pk', 'fingerprint', 'citation_count'):
+            existing.setdefault(fingerprint, (pk, citation_count))
+
+    # 2. 새 논문 (bulk_create는 save()를 거치지 않으므로 지문을 직접 지정)
+    created = Publication.objects.bulk_create([
+        Publication(
+            title=row['title'], fingerprint=fingerprint, publication_year=row['year'],
+            abstract=row['abstract'], citation_count=row['citations'], paper_url=row['paper_url'],
+        )
+        for fingerprint, row in rows.items() if fingerprint not in existing
+    ], batch_size=BATCH_SIZE)
+    publication_ids = {publication.fingerprint: publication.pk for publication in created}
+    publication_ids.update({fingerprint: pk for fingerprint, (pk, _) in existing.items()})
+
+    # 3. 인용 수 증가분 (UPDATE 한 번, 배치 단위)
+    increases = {
+        pk: rows[fingerprint]['citations'] for fingerprint, (pk, citation_count) in existing.items()
+        if rows[fingerprint]['citations'] > citation_count
+    }
+    for pks in _chunks(increases):
+        Publication.objects.filter(pk__in=pks).update(
+            citation_count=Case(
+                *[When(pk=pk, then=Value(increases[pk])) for pk in pks],
+                output_field=PositiveIntegerField()
+            ),
+            updated_at=timezone.now(),
+        )
+
+    # 4. 연구실/저자/학회 연결
+    if professor.lab_id:
+        Publication.labs.through.objects.bulk_create([
+            Publication.labs.through(publication_id=pk, lab_id=professor.lab_id)
+            for pk in publication_ids.values()
+        ], ignore_conflicts=True, batch_size=BATCH_SIZE)
+    author_names = _link_authors(rows, publication_ids, existing)
+    _link_professor_author(professor, author_names)
+    _link_venues(rows, publication_ids)
+
+    # 5. signal 대신 직접 처리
+    pks = list(publication_ids.values())
+    sync_publication_keywords(created)
+    schedule_search_vector_update(pks)
+    schedule_lab_stats_refresh(lab_ids_for_publications(pks))
+    author_ids = author_ids_for_publications(pks)
+    schedule_citation_metrics_refresh(author_ids=author_ids, professor_ids=[professor.pk])
+    schedule_collaboration_refresh(author_ids=author_ids)
+    CacheManager.invalidate_related_caches('publication')
+    invalidate_object_fragments('publications.Publication', pks)
+
+    result['created'] = len(created)
+    result['updated'] = len(existing)
+    result['publication_ids'] = pks
+
+
+def _link_authors(rows, publication_ids, existing):
+    """저자 생성/연결 -> 이름 -> 저자 id"""
+    from .models import Author, PublicationAuthor
+
+    names = {}
+    for row in rows.values():
+        for _, name in row['authors']:
+            names.setdefault(name, row['affiliation'])
+
+    # 같은 이름의 저자가 여러 명이면 먼저 등록된 저자
+    author_ids = {}
+    for chunk in _chunks(names):
+        for pk, name in Author.objects.filter(name__in=chunk).order_by('pk').values_list('pk', 'name'):
+            author_ids.setdefault(name, pk)
+    new_authors = Author.objects.bulk_create([
+        Author(name=name, current_affiliation=affiliation)
+        for name, affiliation in names.items() if name not in author_ids
+    ], batch_size=BATCH_SIZE)
+    author_ids.update({author.name: author.pk for author in new_authors})
+
+    # 기존 논문에 이미 연결된 저자는 건너뜀
+    linked = set()
+    existing_ids = [pk for pk, _ in existing.values()]
+    for chunk in _chunks(existing_ids):
+        linked.update(PublicationAuthor.objects.filter(publication_id__in=chunk).values_list(
+            'publication_id', 'author_id'
+        ))
+
+    links = []
+    for fingerprint, row in rows.items():
+        publication_id = publication_ids[fingerprint]
+        for order, name in row['authors']:
+            pair = (publication_id, author_ids[name])
+            if pair not in linked:
+                linked.add(pair)
+                links.append(PublicationAuthor(publication_id=publication_id, author_id=pair[1], author_order=order))
+    # 같은 순서에 다른 저자가 있으면 기존 연결 유지
+    PublicationAuthor.objects.bulk_create(links, ignore_conflicts=True, batch_size=BATCH_SIZE)
+    return author_ids
+
+
+NAME_TITLES = {'dr', 'prof', 'professor'}
+
+
+def _name_forms(name):
+    """비교용 이름 형태: 전체 이름, Scholar 약어 ('Dr. Jane Kim' -> 'jane kim', 'j kim')"""
+    parts = name.replace('.', ' ').casefold().split()
+    while parts[:-1] and parts[0] in NAME_TITLES:
+        parts = parts[1:]
+    if not parts:
+        return set()
+    return {' '.join(parts), ' '.join([part[0] for part in parts[:-1]] + parts[-1:])}
+
+
+def _link_professor_author(professor, author_ids):
+    """
+    교수 이름과 일치하는 저자에 교수의 scholar_id를 채움
+
+    교수 인용 지표는 Author.google_scholar_id == Professor.scholar_id로
+    논문을 찾습니다 (citation_metrics.py). 이미 연결된 저자가 있거나,
+    일치하는 저자가 없거나 여러 명이면 그대로 둡니다.
+    """
+    from .models import Author
+
+    if not professor.scholar_id or Author.objects.filter(google_scholar_id=professor.scholar_id).exists():
+        return
+    forms = _name_forms(professor.name)
+    matches = {pk for name, pk in author_ids.items() if forms & _name_forms(name)}
+    if len(matches) == 1:
+        Author.objects.filter(pk__in=matches, google_scholar_id='').update(
+            google_scholar_id=professor.scholar_id, updated_at=timezone.now()
+        )
+
+
+def _link_venues(rows, publication_ids):
+    from .models import PublicationVenue, Venue
+
+    names = {row['venue'] for row in rows.values() if row['venue']}
+    if not names:
+        return
+
+    def venue_ids():
+        ids = {}
+        for chunk in _chunks(names):
+            for pk, name in Venue.objects.filter(name__in=chunk).order_by('pk').values_list('pk', 'name'):
+                ids.setdefault(name, pk)
+        return ids
+
+    ids = venue_ids()
+    missing = names - ids.keys()
+    if missing:
+        # 동시에 같은 학회가 생성돼도 (name, type) 충돌은 무시하고 다시 조회
+        Venue.objects.bulk_create([
+            Venue(name=name, type='conference', tier='unknown') for name in missing
+        ], ignore_conflicts=True, batch_size=BATCH_SIZE)
+        ids = venue_ids()
+
+    PublicationVenue.objects.bulk_create([
+        PublicationVenue(publication_id=publication_ids[fingerprint], venue_id=ids[row['venue']])
+        for fingerprint, row in rows.items() if row['venue']
+    ], ignore_conflicts=True, batch_size=BATCH_SIZE)
@@ -0,0 +1,216 @@
+# apps/publications/search.py
+"""
+논문 전문 검색 (full-text search)
+
+PostgreSQL에서는 Publication.search_vector (가중치 tsvector, GIN 인덱스)를
+사용합니다:
+
+    A: title
+    B: keywords
+    C: abstract
+    D: authors, venues, additional_notes
+
+search_vector는 논문/저자/학회 변경 시 signals에서 커밋 후 갱신됩니다.
+SQLite (로컬/테스트)에서는 icontains 기반으로 같은 인터페이스를 제공합니다.
+"""
+import html
+import re
+from django.db import connection
+from django.db.models import Case, Exists, F, FloatField, OuterRef, Q, Subquery, TextField, Value, When
+from django.db.models.functions import Cast, Concat
+
+
+SEARCH_CONFIG = 'english'
+
+# 검색 벡터에 영향을 주는 Publication 필드
+SEARCH_VECTOR_FIELDS = {'title', 'keywords', 'abstract', 'additional_notes'}
+
+# 하이라이트 옵션: 본문에 나오지 않는 문자(사용자 정의 영역)로 표시한 뒤
+# 본문을 HTML 이스케이프하고 <mark> 태그로 바꿉니다
+HIGHLIGHT_START = '<mark>'
+HIGHLIGHT_STOP = '</mark>'
+HIGHLIGHT_START_MARKER = '\ue000'
+HIGHLIGHT_STOP_MARKER = '\ue001'
+SNIPPET_MAX_WORDS = 35
+SNIPPET_MIN_WORDS = 15
+SNIPPET_MAX_FRAGMENTS = 2
+SNIPPET_DELIMITER = ' … '
+
+# SQLite 대체 구현의 필드별 가중치 (ts_rank 기본 가중치와 동일)
+FALLBACK_WEIGHTS = {'A': 1.0, 'B': 0.4, 'C': 0.2, 'D': 0.1}
+FALLBACK_MAX_TERMS = 10
+FALLBACK_SNIPPET_CHARS = 240
+
+
+def is_full_text_supported():
+    """PostgreSQL에서만 tsvector 검색 사용"""
+    return connection.vendor == 'postgresql'
+
+
+def search_vector_expression():
+    """Publication 한 행의 가중치 tsvector (update()에서 사용)"""
+    from django.contrib.postgres.aggregates import StringAgg
+    from django.contrib.postgres.search import SearchVector
+    from .models import PublicationAuthor, PublicationVenue
+
+    author_names = PublicationAuthor.objects.filter(
+        publication=OuterRef('pk')
+    ).values('publication').annotate(
+        names=StringAgg('author__name', ' ')
+    ).values('names')
+    venue_names = PublicationVenue.objects.filter(
+        publication=OuterRef('pk')
+    ).values('publication').annotate(
+        names=StringAgg(Concat('venue__name', Value(' '), 'venue__short_name'), ' ')
+    ).values('names')
+
+    return (
+        SearchVector('title', weight='A', config=SEARCH_CONFIG)
+        + SearchVector(Cast('keywords', TextField()), weight='B', config=SEARCH_CONFIG)
+        + SearchVector('abstract', weight='C', config=SEARCH_CONFIG)
+        + SearchVector(
+            Subquery(author_names), Subquery(venue_names), 'additional_notes',
+            weight='D', config=SEARCH_CONFIG
+        )
+    )
+
+
+def update_search_vectors(pks=None):
+    """search_vector 재계산 (pks=None이면 전체)"""
+    from .models import Publication
+
+    if not is_full_text_supported():
+        return 0
+    queryset = Publication.objects.all()
+    if pks is not None:
+        queryset = queryset.filter(pk__in=list(pks))
+    # update()는 signal을 발생시키지 않으므로 재귀 갱신이 없음
+    return queryset.update(search_vector=search_vector_expression())
+
+
+def schedule_search_vector_update(pks):
+    """
+    트랜잭션 커밋 후 search_vector 갱신 (롤백 시 취소)
+
+    한 트랜잭션에서 바뀐 논문은 모아서 UPDATE 한 번으로 갱신합니다.
+    """
+    from apps.utils.invalidation import defer_until_commit
+
+    if not is_full_text_supported():
+        return
+    defer_until_commit('publications.search_vectors', update_search_vectors, pks=pks)
+
+
+def search_publications(queryset, query):
+    """
+    검색어와 일치하는 논문만 남기고 관련도(search_rank) 순으로 정렬
+
+    query는 웹 검색 문법을 따릅니다 ("exact phrase", -exclude, or).
+    """
+    if is_full_text_supported():
+        from django.contrib.postgres.search import SearchQuery, SearchRank
+
+        search_query = SearchQuery(query, search_type='websearch', config=SEARCH_CONFIG)
+        queryset = queryset.filter(search_vector=search_query).annotate(
+            search_rank=SearchRank(F('search_vector'), search_query)
+        )
+    else:
+        queryset = _fallback_search(queryset, query)
+    return queryset.order_by('-search_rank', '-citation_count', 'pk')
+
+
+def _search_terms(query):
+    terms = [term.strip('"') for term in query.split()]
+    return [term for term in terms if term and term.lower() != 'or'][:FALLBACK_MAX_TERMS]
+
+
+def _fallback_search(queryset, query):
+    """SQLite용: 모든 검색어를 포함하는 논문, 필드 가중치 합으로 정렬"""
+    from .models import PublicationAuthor, PublicationVenue
+
+    rank = Value(0.0, output_field=FloatField())
+    for term in _search_terms(query):
+        author_match = Exists(PublicationAuthor.objects.filter(
+            publication=OuterRef('pk'), author__name__icontains=term
+        ))
+        venue_match = Exists(PublicationVenue.objects.filter(
+            Q(venue__name__icontains=term) | Q(venue__short_name__icontains=term),
+            publication=OuterRef('pk')
+        ))
+        weighted = [
+            (Q(title__icontains=term), FALLBACK_WEIGHTS['A']),
+            (Q(keywords__icontains=term), FALLBACK_WEIGHTS['B']),
+            (Q(abstract__icontains=term), FALLBACK_WEIGHTS['C']),
+            (Q(author_match) | Q(venue_match) | Q(additional_notes__icontains=term), FALLBACK_WEIGHTS['D']),
+        ]
+        any_field = Q()
+        for condition, weight in weighted:
+            any_field |= condition
+            rank = rank + Case(When(condition, then=Value(weight)), default=Value(0.0), output_field=FloatField())
+        queryset = queryset.filter(any_field)
+    return queryset.annotate(search_rank=rank)
+
+
+def search_snippets(pks, query):
+    """페이지에 표시할 논문들의 하이라이트된 제목/초록 ({pk: {'title', 'abstract'}})"""
+    from .models import Publication
+
+    publications = Publication.objects.filter(pk__in=list(pks))
+    if is_full_text_supported():
+        from django.contrib.postgres.search import SearchHeadline, SearchQuery
+
+        search_query = SearchQuery(query, search_type='websearch', config=SEARCH_CONFIG)
+        rows = publications.annotate(
+            title_headline=SearchHeadline(
+                'title', search_query, config=SEARCH_CONFIG, highlight_all=True,
+                start_sel=HIGHLIGHT_START_MARKER, stop_sel=HIGHLIGHT_STOP_MARKER,
+            ),
+            abstract_headline=SearchHeadline(
+                'abstract', search_query, config=SEARCH_CONFIG,
+                start_sel=HIGHLIGHT_START_MARKER, stop_sel=HIGHLIGHT_STOP_MARKER,
+                max_words=SNIPPET_MAX_WORDS, min_words=SNIPPET_MIN_WORDS,
+                max_fragments=SNIPPET_MAX_FRAGMENTS, fragment_delimiter=SNIPPET_DELIMITER,
+            ),
+        ).values_list('pk', 'title_headline', 'abstract_headline')
+    else:
+        pattern = _highlight_pattern(query)
+        rows = [
+            (pk, _highlight(title, pattern), _highlight(_fallback_snippet(abstract, pattern), pattern))
+            for pk, title, abstract in publications.values_list('pk', 'title', 'abstract')
+        ]
+    return {
+        pk: {'title': _render_highlight(title), 'abstract': _render_highlight(abstract)}
+        for pk, title, abstract in rows
+    }
+
+
+def _highlight_pattern(query):
+    terms = _search_terms(query)
+    if not terms:
+        return None
+    return re.compile('|'.join(re.escape(term) for term in terms), re.IGNORECASE)
+
+
+def _highlight(text, pattern):
+    if not text or pattern is None:
+        return text
+    return pattern.sub(lambda match: f"{HIGHLIGHT_START_MARKER}{match.group(0)}{HIGHLIGHT_STOP_MARKER}", text)
+
+
+def _render_highlight(text):
+    """하이라이트 표시가 들어간 본문을 이스케이프한 HTML로 변환"""
+    if not text:
+        return text
+    return html.escape(text).replace(HIGHLIGHT_START_MARKER, HIGHLIGHT_START).replace(
+        HIGHLIGHT_STOP_MARKER, HIGHLIGHT_STOP
+    )
+
+
+def _fallback_snippet(text, pattern):
+    """첫 번째 일치 위치 주변의 초록 일부"""
+    if not text or len(text) <= FALLBACK_SNIPPET_CHARS:
+        return text
+    match = pattern.search(text) if pattern else None
+    start = max(0, match.start() - FALLBACK_SNIPPET_CHARS // 3) if match else 0
+    snippet = text[start:start + FALLBACK_SNIPPET_CHARS]
+    return f"{'… ' if start else ''}{snippet}{' …' if start + FALLBACK_SNIPPET_CHARS < len(text) else ''}"
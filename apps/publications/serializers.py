@@ -1,10 +1,13 @@
 # apps/publications/serializers.py
+from django.db.models import Prefetch
+from django.db.models.manager import BaseManager
 from rest_framework import serializers
 from .models import (
     Publication, Author, Venue, ResearchArea,
     PublicationAuthor, PublicationVenue, PublicationResearchArea,
-    CitationMetric, Collaboration, LabPublicationStats, ScrapingLog
+    CitationMetric, Collaboration, LabPublicationStats, ScrapingLog, ImportJob
 )
+from .research_area_tree import attach_path_names
 
 
 class ResearchAreaMinimalSerializer(serializers.ModelSerializer):
@@ -14,6 +17,14 @@ class ResearchAreaMinimalSerializer(serializers.ModelSerializer):
         fields = ['id', 'name']
 
 
+class ResearchAreaListSerializer(serializers.ListSerializer):
+    """목록의 모든 분야의 조상 이름을 한 번에 로드 (full_path용)"""
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, BaseManager) else data
+        return super().to_representation(attach_path_names(iterable))
+
+
 class ResearchAreaSerializer(serializers.ModelSerializer):
     """연구 분야 시리얼라이저"""
     full_path = serializers.ReadOnlyField()
@@ -22,13 +33,22 @@ class ResearchAreaSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = ResearchArea
+        list_serializer_class = ResearchAreaListSerializer
         fields = [
             'id', 'name', 'department', 'department_name', 'parent', 'description', 'color_code',
-            'full_path', 'children_count', 'created_at'
+            'full_path', 'depth', 'children_count', 'created_at'
         ]
+        read_only_fields = ['depth']
 
     def get_children_count(self, obj):
-        return obj.children.count()
+        # ResearchAreaViewSet은 children_total을 annotate
+        count = getattr(obj, 'children_total', None)
+        return obj.children.count() if count is None else count
+
+    def validate_parent(self, parent):
+        if parent is not None and self.instance is not None and self.instance.is_ancestor_of(parent):
+            raise serializers.ValidationError('A research area cannot be moved under itself or its descendants.')
+        return parent
 
 
 class VenueSerializer(serializers.ModelSerializer):
@@ -75,12 +95,23 @@ class AuthorSerializer(serializers.ModelSerializer):
     def get_recent_publications(self, obj):
         from datetime import datetime
         current_year = datetime.now().year
-        recent_pubs = obj.publications.filter(
+        recent_pubs = prefetch_publication_summaries(obj.publications.filter(
             publication_year__gte=current_year - 3
-        ).order_by('-publication_year')[:5]
+        ).order_by('-publication_year')[:5])
         return PublicationListSerializer(recent_pubs, many=True).data
 
 
+class AuthorMinimalSerializer(serializers.ModelSerializer):
+    """저자 요약 (목록/그래프용, 추가 쿼리 없음)"""
+
+    class Meta:
+        model = Author
+        fields = [
+            'id', 'name', 'current_affiliation', 'current_position',
+            'total_citations', 'h_index', 'i10_index'
+        ]
+
+
 class PublicationAuthorSerializer(serializers.ModelSerializer):
     """논문-저자 관계 시리얼라이저"""
     author_name = serializers.CharField(source='author.name', read_only=True)
@@ -114,7 +145,68 @@ class PublicationVenueSerializer(serializers.ModelSerializer):
         ]
 
 
-class PublicationMinimalSerializer(serializers.ModelSerializer):
+def prefetch_publication_summaries(queryset):
+    """
+    목록 시리얼라이저(PublicationList/MinimalSerializer)가 사용하는 관계를
+    정렬된 Prefetch로 미리 로드 (논문 수와 관계없이 쿼리 3개)
+    """
+    return queryset.prefetch_related(
+        Prefetch(
+            'publicationauthor_set',
+            queryset=PublicationAuthor.objects.select_related('author').order_by('author_order'),
+            to_attr='ordered_author_links'
+        ),
+        Prefetch(
+            # Publication.primary_venue (venues.first())와 같은 순서
+            'publicationvenue_set',
+            queryset=PublicationVenue.objects.select_related('venue').order_by('-venue__tier', 'venue__name'),
+            to_attr='ordered_venue_links'
+        ),
+        'research_areas',
+    )
+
+
+class PublicationSummaryMixin:
+    """
+    목록 시리얼라이저 공통 필드
+
+    prefetch_publication_summaries()로 로드된 관계를 사용하고, 로드되지
+    않은 경우에도 관계마다 객체당 한 번만 조회합니다.
+    """
+
+    @staticmethod
+    def _author_links(obj):
+        links = getattr(obj, 'ordered_author_links', None)
+        if links is None:
+            links = list(obj.publicationauthor_set.select_related('author').order_by('author_order'))
+            obj.ordered_author_links = links
+        return links
+
+    @staticmethod
+    def _primary_venue(obj):
+        links = getattr(obj, 'ordered_venue_links', None)
+        if links is None:
+            links = list(obj.publicationvenue_set.select_related('venue').order_by('-venue__tier', 'venue__name'))
+            obj.ordered_venue_links = links
+        return links[0].venue if links else None
+
+    def get_authors(self, obj):
+        """Get author names as simple list ordered by author_order"""
+        return [link.author.name for link in self._author_links(obj)]
+
+    def get_primary_venue_name(self, obj):
+        venue = self._primary_venue(obj)
+        return venue.display_name if venue else ""
+
+    def get_primary_venue_tier(self, obj):
+        venue = self._primary_venue(obj)
+        return venue.tier if venue else ""
+
+    def get_research_area_names(self, obj):
+        return [area.name for area in obj.research_areas.all()]
+
+
+class PublicationMinimalSerializer(PublicationSummaryMixin, serializers.ModelSerializer):
     """논문 최소 필드 시리얼라이저 - Lab Detail용"""
     authors = serializers.SerializerMethodField()
     primary_venue_name = serializers.SerializerMethodField()
@@ -159,24 +251,8 @@ class PublicationMinimalSerializer(serializers.ModelSerializer):
 
         return data
 
-    def get_authors(self, obj):
-        """Get author names as simple list ordered by author_order"""
-        authors_qs = obj.publicationauthor_set.select_related('author').order_by('author_order')
-        return [pa.author.name for pa in authors_qs]
 
-    def get_primary_venue_name(self, obj):
-        venue = obj.primary_venue
-        return venue.display_name if venue else ""
-
-    def get_primary_venue_tier(self, obj):
-        venue = obj.primary_venue
-        return venue.tier if venue else ""
-
-    def get_research_area_names(self, obj):
-        return list(obj.research_areas.values_list('name', flat=True))
-
-
-class PublicationListSerializer(serializers.ModelSerializer):
+class PublicationListSerializer(PublicationSummaryMixin, serializers.ModelSerializer):
     """논문 목록용 간단한 시리얼라이저"""
     authors = serializers.SerializerMethodField()
     first_author_name = serializers.SerializerMethodField()
@@ -225,28 +301,12 @@ class PublicationListSerializer(serializers.ModelSerializer):
 
         return data
 
-    def get_authors(self, obj):
-        """Get author names as simple list ordered by author_order"""
-        authors_qs = obj.publicationauthor_set.select_related('author').order_by('author_order')
-        return [pa.author.name for pa in authors_qs]
-
     def get_first_author_name(self, obj):
-        first_author = obj.first_author
+        first_author = next((link.author for link in self._author_links(obj) if link.is_first_author), None)
         return first_author.name if first_author else ""
 
-    def get_primary_venue_name(self, obj):
-        venue = obj.primary_venue
-        return venue.display_name if venue else ""
-
-    def get_primary_venue_tier(self, obj):
-        venue = obj.primary_venue
-        return venue.tier if venue else ""
-
     def get_author_count(self, obj):
-        return obj.authors.count()
-
-    def get_research_area_names(self, obj):
-        return list(obj.research_areas.values_list('name', flat=True))
+        return len(self._author_links(obj))
 
 
 class PublicationDetailSerializer(serializers.ModelSerializer):
@@ -359,13 +419,12 @@ class LabPublicationStatsSerializer(serializers.ModelSerializer):
         read_only=True
     )
     publications_by_year = serializers.SerializerMethodField()
-    top_research_areas = serializers.SerializerMethodField()
 
     class Meta:
         model = LabPublicationStats
         fields = [
             'lab', 'lab_name',
-            'total_publications', 'total_citations', 'h_index',
+            'total_publications', 'total_citations', 'h_index', 'i10_index',
             'top_tier_count', 'avg_citations_per_paper',
             'publications_last_5_years', 'best_venue_tier',
             'most_cited_paper_id', 'most_cited_paper_title',
@@ -375,35 +434,13 @@ class LabPublicationStatsSerializer(serializers.ModelSerializer):
         ]
 
     def get_publications_by_year(self, obj):
-        from django.db.models import Count
         from datetime import datetime
 
         current_year = datetime.now().year
-        years_data = obj.lab.publications.filter(
-            publication_year__gte=current_year - 10
-        ).values('publication_year').annotate(
-            count=Count('id')
-        ).order_by('publication_year')
-
-        return {str(item['publication_year']): item['count'] for item in years_data}
-
-    def get_top_research_areas(self, obj):
-        from django.db.models import Count
-
-        top_areas = ResearchArea.objects.filter(
-            publications__labs=obj.lab
-        ).annotate(
-            pub_count=Count('publications')
-        ).order_by('-pub_count')[:5]
-
-        return [
-            {
-                'name': area.name,
-                'publication_count': area.pub_count,
-                'color_code': area.color_code
-            }
-            for area in top_areas
-        ]
+        return {
+            year: bucket['count'] for year, bucket in sorted(obj.yearly_histogram.items())
+            if int(year) >= current_year - 10
+        }
 
 
 class ScrapingLogSerializer(serializers.ModelSerializer):
@@ -419,4 +456,23 @@ class ScrapingLogSerializer(serializers.ModelSerializer):
             'status', 'status_display', 'publications_count',
             'execution_time_seconds', 'error_message', 'created_at'
         ]
-        read_only_fields = ['id', 'created_at']
\ No newline at end of file
+        read_only_fields = ['id', 'created_at']
+
+
+class ImportJobSerializer(serializers.ModelSerializer):
+    """논문 가져오기 작업 시리얼라이저 (진행 상황 조회용, payload 제외)"""
+    progress = serializers.FloatField(read_only=True)
+    error_count = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ImportJob
+        fields = [
+            'id', 'kind', 'status', 'professor', 'scraping_log',
+            'total_items', 'processed_items', 'progress',
+            'created_count', 'updated_count', 'error_count', 'errors', 'error_message',
+            'attempts', 'created_at', 'started_at', 'finished_at'
+        ]
+        read_only_fields = fields
+
+    def get_error_count(self, obj):
+        return len(obj.errors)
@@ -0,0 +1,120 @@
+from io import StringIO
+
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from apps.labs.models import Lab
+from apps.publications.citation_metrics import (
+    EntityMetrics, compute_citation_metrics, refresh_citation_metrics
+)
+from apps.publications.models import Author, LabPublicationStats, Publication, PublicationAuthor
+from apps.publications.scholar_import import import_scholar_publications
+from apps.universities.models import Professor
+
+
+class CitationMetricsTest(TestCase):
+    """Test cases for the SQL window-function citation metrics"""
+
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.professor = Professor.objects.create(name='Dr. Test', scholar_id='abc123')
+            self.lab = Lab.objects.create(name='Vision Lab', head_professor=self.professor)
+            self.alice = Author.objects.create(name='Alice', google_scholar_id='abc123')
+            self.bob = Author.objects.create(name='Bob')
+            self.idle = Author.objects.create(name='Idle', total_citations=99, h_index=9)
+            self.publications = []
+            for index, citations in enumerate([10, 8, 5, 4, 3]):
+                publication = Publication.objects.create(
+                    title=f'Paper {index}', publication_year=2020, citation_count=citations
+                )
+                PublicationAuthor.objects.create(publication=publication, author=self.alice, author_order=1)
+                if index < 2:
+                    PublicationAuthor.objects.create(publication=publication, author=self.bob, author_order=2)
+                self.lab.publications.add(publication)
+                self.publications.append(publication)
+
+    def test_compute_metrics(self):
+        """Test h-index, i10-index and total citations of each entity in one query"""
+        with self.assertNumQueries(1):
+            metrics = compute_citation_metrics('author')
+
+        self.assertEqual(metrics[self.alice.pk], EntityMetrics(5, 30, 4, 1))
+        self.assertEqual(metrics[self.bob.pk], EntityMetrics(2, 18, 2, 1))
+        self.assertNotIn(self.idle.pk, metrics)
+        self.assertEqual(compute_citation_metrics('lab', [self.lab.pk]), {self.lab.pk: EntityMetrics(5, 30, 4, 1)})
+        self.assertEqual(compute_citation_metrics('professor')[self.professor.pk].h_index, 4)
+
+    def test_metrics_follow_publication_changes(self):
+        """Test the authors, professor and lab are refreshed after a citation change"""
+        self.alice.refresh_from_db()
+        self.professor.refresh_from_db()
+        self.assertEqual((self.alice.total_citations, self.alice.h_index, self.alice.i10_index), (30, 4, 1))
+        self.assertEqual((self.professor.h_index, self.professor.i10_index), (4, 1))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            publication = self.publications[4]
+            publication.citation_count = 20
+            publication.save(update_fields=['citation_count'])
+
+        self.alice.refresh_from_db()
+        self.professor.refresh_from_db()
+        self.assertEqual((self.alice.total_citations, self.alice.i10_index), (47, 2))
+        self.assertEqual(self.professor.total_citations, 47)
+        stats = LabPublicationStats.objects.get(lab=self.lab)
+        self.assertEqual((stats.total_citations, stats.h_index, stats.i10_index), (47, 4, 2))
+
+    def test_refresh_only_writes_changed_rows(self):
+        """Test a full refresh resets stale values and skips up-to-date rows"""
+        self.assertEqual(refresh_citation_metrics('author'), 1)
+        self.idle.refresh_from_db()
+        self.assertEqual((self.idle.total_citations, self.idle.h_index), (0, 0))
+        self.assertEqual(refresh_citation_metrics('author'), 0)
+
+    def test_scholar_import_refreshes_author_metrics(self):
+        """Test bulk imports, which skip signals, refresh the author metrics"""
+        with self.captureOnCommitCallbacks(execute=True):
+            import_scholar_publications(self.professor, [
+                {'title': 'Imported', 'year': 2024, 'citations': 40, 'authors': ['Bob']},
+            ])
+
+        self.bob.refresh_from_db()
+        self.assertEqual((self.bob.total_citations, self.bob.h_index), (58, 3))
+
+    def test_refresh_invalidates_cached_metrics(self):
+        """Test saved metrics bump updated_at and invalidate the professor fragments and namespaces"""
+        Professor.objects.filter(pk=self.professor.pk).update(h_index=0)
+        before = Professor.objects.get(pk=self.professor.pk).updated_at
+
+        with mock.patch('apps.utils.invalidation.invalidate_object_fragments') as fragments, \
+                mock.patch('apps.utils.invalidation.invalidate_namespaces') as namespaces:
+            self.assertEqual(refresh_citation_metrics('professor', [self.professor.pk]), 1)
+
+        self.assertGreater(Professor.objects.get(pk=self.professor.pk).updated_at, before)
+        fragments.assert_called_once_with('universities.Professor', [self.professor.pk])
+        namespaces.assert_called_once_with('PROFESSORS', 'LABS')
+
+    def test_scholar_import_links_professor_author(self):
+        """Test the import links the professor's own author row so professor metrics include it"""
+        with self.captureOnCommitCallbacks(execute=True):
+            professor = Professor.objects.create(name='Prof. Jane Kim', scholar_id='kim42')
+            import_scholar_publications(professor, [
+                {'title': 'Kim Paper', 'year': 2024, 'citations': 12, 'authors': ['J Kim', 'Bob']},
+            ])
+
+        self.assertEqual(Author.objects.get(name='J Kim').google_scholar_id, 'kim42')
+        self.bob.refresh_from_db()
+        self.assertEqual(self.bob.google_scholar_id, '')
+        professor.refresh_from_db()
+        self.assertEqual((professor.total_citations, professor.i10_index), (12, 1))
+
+    def test_command(self):
+        """Test the management command refreshes the requested entities"""
+        Author.objects.filter(pk=self.alice.pk).update(h_index=0)
+        out = StringIO()
+        call_command('refresh_citation_metrics', entity=['author'], stdout=out)
+
+        self.assertIn('Updated 2 author rows', out.getvalue())
+        self.alice.refresh_from_db()
+        self.assertEqual(self.alice.h_index, 4)
@@ -0,0 +1,143 @@
+from datetime import timedelta
+from unittest import skipUnless
+
+from django.test import TestCase
+from django.utils import timezone
+
+from rest_framework.test import APIRequestFactory
+
+from apps.labs.models import Lab
+from apps.publications import citation_velocity
+from apps.publications.citation_velocity import (
+    _window_stats_numpy, _window_stats_python, parse_window, refresh_citation_velocities
+)
+from apps.publications.models import CitationMetric, CitationVelocity, Publication
+from apps.publications.views import PublicationViewSet
+from apps.universities.models import Professor
+
+
+def record(publication, citation_count, days_ago, now):
+    metric = CitationMetric.objects.create(publication=publication, citation_count=citation_count, source='manual')
+    CitationMetric.objects.filter(pk=metric.pk).update(recorded_at=now - timedelta(days=days_ago))
+
+
+class CitationVelocityTest(TestCase):
+    """Test cases for the precomputed citation velocity table"""
+
+    def setUp(self):
+        self.now = timezone.now()
+        # Fast riser: 10 -> 70 over the last 30 days
+        self.rising = Publication.objects.create(title='Rising', publication_year=2024, citation_count=70)
+        record(self.rising, 5, 400, self.now)
+        record(self.rising, 10, 30, self.now)
+        # Highly cited but flat
+        self.classic = Publication.objects.create(title='Classic', publication_year=2015, citation_count=5000)
+        record(self.classic, 4990, 400, self.now)
+        record(self.classic, 5000, 60, self.now)
+        # Only recent history: 0 -> 20 within 10 days
+        self.new = Publication.objects.create(title='New', publication_year=2025, citation_count=20)
+        record(self.new, 0, 10, self.now)
+        Publication.objects.create(title='No history', publication_year=2024, citation_count=100)
+
+    def velocity(self, publication, window):
+        return CitationVelocity.objects.get(publication=publication, window_days=window)
+
+    def test_refresh_computes_each_window(self):
+        """Test the gain since the start of each window is stored per day"""
+        self.assertEqual(refresh_citation_velocities(now=self.now), 9)
+
+        rising = self.velocity(self.rising, 30)
+        self.assertEqual((rising.citations_gained, rising.citation_count), (60, 70))
+        self.assertAlmostEqual(rising.velocity, 2.0)
+        self.assertAlmostEqual(rising.growth_rate, 6.0)
+        self.assertEqual(self.velocity(self.rising, 365).citations_gained, 65)
+        self.assertEqual(self.velocity(self.classic, 30).citations_gained, 0)
+        # A shorter history than the window is measured from its first record
+        self.assertAlmostEqual(self.velocity(self.new, 365).velocity, 2.0)
+        self.assertFalse(CitationVelocity.objects.filter(publication__title='No history').exists())
+
+    def test_refresh_updates_rows_in_place(self):
+        """Test a second refresh updates the existing rows"""
+        refresh_citation_velocities(now=self.now)
+        Publication.objects.filter(pk=self.classic.pk).update(citation_count=5600)
+
+        refresh_citation_velocities(now=self.now)
+
+        self.assertEqual(CitationVelocity.objects.count(), 9)
+        # Measured from the last record before the window (4990, 400 days ago)
+        self.assertEqual(self.velocity(self.classic, 90).citations_gained, 610)
+
+    def test_python_fallback(self):
+        """Test the pure Python computation is used without NumPy"""
+        original = citation_velocity.np
+        citation_velocity.np = None
+        try:
+            refresh_citation_velocities(now=self.now)
+        finally:
+            citation_velocity.np = original
+        self.assertEqual(self.velocity(self.rising, 30).citations_gained, 60)
+
+    @skipUnless(citation_velocity.np is not None, 'NumPy is not installed')
+    def test_numpy_matches_python(self):
+        """Test the vectorized computation gives the same results"""
+        series = ([1, 1, 1, 2, 2], [0.0, 50 * 86400.0, 100 * 86400.0, 90 * 86400.0, 100 * 86400.0], [1, 4, 9, 0, 3])
+        now = 100 * 86400.0
+        ids, counts, stats = _window_stats_numpy(*series, now)
+        expected_ids, expected_counts, expected = _window_stats_python(*series, now)
+        self.assertEqual((list(ids), list(counts)), (expected_ids, expected_counts))
+        for window, values in expected.items():
+            for actual, wanted in zip(stats[window], values):
+                self.assertEqual([round(value, 6) for value in actual], [round(value, 6) for value in wanted])
+
+    def test_parse_window(self):
+        """Test supported windows are accepted with or without the day suffix"""
+        self.assertEqual((parse_window('30d'), parse_window('365'), parse_window(None)), (30, 365, 90))
+        with self.assertRaises(ValueError):
+            parse_window('7d')
+
+
+class TrendingEndpointTest(TestCase):
+    """Test cases for the velocity-based trending endpoint"""
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.view = PublicationViewSet.as_view({'get': 'trending'})
+        now = timezone.now()
+        self.rising = Publication.objects.create(title='Rising', publication_year=2024, citation_count=70)
+        record(self.rising, 10, 30, now)
+        self.classic = Publication.objects.create(title='Classic', publication_year=2015, citation_count=5000)
+        record(self.classic, 4000, 400, now)
+        record(self.classic, 4990, 60, now)
+        refresh_citation_velocities(now=now)
+
+    def test_trending_orders_by_velocity(self):
+        """Test papers are ranked by recent growth rather than total citations"""
+        response = self.view(self.factory.get('/', {'window': '30d'}))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item['title'] for item in response.data], ['Rising', 'Classic'])
+        self.assertEqual([item['citations_gained'] for item in response.data], [60, 10])
+
+        response = self.view(self.factory.get('/', {'window': '365d'}))
+        self.assertEqual([item['title'] for item in response.data], ['Classic', 'Rising'])
+
+    def test_trending_lab_filter_and_invalid_window(self):
+        """Test the lab filter applies and unknown windows are rejected"""
+        professor = Professor.objects.create(name='Dr. Test')
+        lab = Lab.objects.create(name='Vision Lab', head_professor=professor)
+        self.classic.labs.add(lab)
+
+        response = self.view(self.factory.get('/', {'window': '365d', 'lab': lab.pk}))
+        self.assertEqual([item['title'] for item in response.data], ['Classic'])
+        self.assertEqual(self.view(self.factory.get('/', {'window': '7d'})).status_code, 400)
+
+    def test_trending_falls_back_before_velocities_exist(self):
+        """Test the total-citation ranking is served until velocities are computed"""
+        CitationVelocity.objects.all().delete()
+        Publication.objects.create(title='Recent', publication_year=timezone.now().year - 1, citation_count=200)
+
+        response = self.view(self.factory.get('/', {'window': '30d'}))
+        titles = [item['title'] for item in response.data]
+        self.assertEqual(titles[0], 'Recent')
+        # Classic is older than three years
+        self.assertNotIn('Classic', titles)
+        self.assertIsNone(response.data[0]['citation_velocity'])
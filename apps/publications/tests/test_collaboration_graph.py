@@ -0,0 +1,153 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from rest_framework.test import APIRequestFactory
+
+from apps.labs.models import Lab
+from apps.publications.collaboration_graph import ego_network
+from apps.publications.models import (
+    Author, CoauthorEdge, Collaboration, LabCollaborationEdge, Publication, PublicationAuthor
+)
+from apps.publications.views import AuthorViewSet, CollaborationViewSet
+from apps.universities.models import Professor
+
+
+class CollaborationGraphTestMixin:
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        professor = Professor.objects.create(name='Dr. Test')
+        with self.captureOnCommitCallbacks(execute=True):
+            self.vision = Lab.objects.create(name='Vision Lab', head_professor=professor)
+            self.robotics = Lab.objects.create(name='Robotics Lab', head_professor=professor)
+            self.alice, self.bob, self.carol, self.dave = [
+                Author.objects.create(name=name) for name in ('Alice', 'Bob', 'Carol', 'Dave')
+            ]
+            self.paper(2019, (self.alice, self.vision), (self.bob, self.robotics))
+            self.paper(2022, (self.alice, self.vision), (self.bob, self.robotics), (self.carol, None))
+            self.paper(2023, (self.carol, None), (self.dave, None))
+
+    def paper(self, year, *authors):
+        publication = Publication.objects.create(title=f'Paper {year}', publication_year=year)
+        for order, (author, lab) in enumerate(authors, 1):
+            PublicationAuthor.objects.create(
+                publication=publication, author=author, author_order=order, affiliation_lab=lab
+            )
+        return publication
+
+    def edge(self, author, coauthor):
+        return CoauthorEdge.objects.get(author=author, coauthor=coauthor)
+
+
+class CollaborationEdgeTest(CollaborationGraphTestMixin, TestCase):
+    """Test cases for maintaining the co-authorship and lab edge tables"""
+
+    def test_edges_are_built_from_links(self):
+        """Test edges hold the shared paper count and years in both directions"""
+        edge = self.edge(self.alice, self.bob)
+        self.assertEqual((edge.paper_count, edge.first_year, edge.last_year), (2, 2019, 2022))
+        self.assertEqual(self.edge(self.bob, self.alice).paper_count, 2)
+        self.assertEqual(self.edge(self.carol, self.dave).paper_count, 1)
+        self.assertFalse(CoauthorEdge.objects.filter(author=self.alice, coauthor=self.dave).exists())
+
+        lab_edge = LabCollaborationEdge.objects.get(lab=self.vision, other_lab=self.robotics)
+        self.assertEqual((lab_edge.paper_count, lab_edge.first_year), (2, 2019))
+        self.assertEqual(LabCollaborationEdge.objects.count(), 2)
+
+    def test_edges_follow_link_changes(self):
+        """Test removed links and moved affiliations update the old edges too"""
+        link = PublicationAuthor.objects.get(author=self.bob, publication__publication_year=2019)
+        with self.captureOnCommitCallbacks(execute=True):
+            link.affiliation_lab = self.vision
+            link.save()
+        self.assertEqual(LabCollaborationEdge.objects.get(lab=self.vision, other_lab=self.robotics).paper_count, 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Publication.objects.get(publication_year=2022).delete()
+        self.assertEqual(self.edge(self.alice, self.bob).last_year, 2019)
+        self.assertFalse(CoauthorEdge.objects.filter(author=self.carol, coauthor=self.alice).exists())
+        self.assertFalse(LabCollaborationEdge.objects.exists())
+
+    def test_edges_follow_year_changes_only(self):
+        """Test saving a publication refreshes its edges only when the year changed"""
+        publication = Publication.objects.get(publication_year=2022)
+        with mock.patch('apps.publications.collaboration_graph._refresh_graph') as refresh:
+            with self.captureOnCommitCallbacks(execute=True):
+                publication.citation_count = 5
+                publication.save()
+            refresh.assert_not_called()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            publication.publication_year = 2024
+            publication.save()
+        self.assertEqual(self.edge(self.alice, self.bob).last_year, 2024)
+
+    def test_rebuild_command(self):
+        """Test the rebuild command recreates every edge"""
+        CoauthorEdge.objects.all().delete()
+        out = StringIO()
+        call_command('rebuild_collaboration_graph', stdout=out)
+
+        self.assertIn('8 co-author edges, 2 lab edges', out.getvalue())
+        self.assertEqual(self.edge(self.bob, self.carol).paper_count, 1)
+
+
+class CollaborationEndpointTest(CollaborationGraphTestMixin, TestCase):
+    """Test cases for the collaborator and network endpoints"""
+
+    def test_collaborators(self):
+        """Test top collaborators come from the edge table in two queries"""
+        view = AuthorViewSet.as_view({'get': 'collaborators'})
+        with self.assertNumQueries(2):
+            response = view(self.factory.get('/'), pk=self.alice.pk)
+
+        self.assertEqual(
+            [(item['author']['name'], item['collaboration_count']) for item in response.data],
+            [('Bob', 2), ('Carol', 1)]
+        )
+        response = view(self.factory.get('/', {'limit': 1}), pk=self.alice.pk)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(view(self.factory.get('/', {'limit': 'x'}), pk=self.alice.pk).status_code, 400)
+
+    def test_ego_network(self):
+        """Test the ego network expands to the second degree within the node limit"""
+        network = ego_network(self.alice.pk)
+        self.assertEqual([node['name'] for node in network['nodes']], ['Alice', 'Bob', 'Carol'])
+        self.assertEqual(len(network['edges']), 3)
+
+        network = ego_network(self.alice.pk, depth=2)
+        self.assertEqual(network['nodes'][-1], {
+            'id': self.dave.pk, 'name': 'Dave', 'current_affiliation': '', 'h_index': 0, 'depth': 2
+        })
+
+        network = ego_network(self.alice.pk, depth=2, max_nodes=2, max_edges=1)
+        self.assertEqual((len(network['nodes']), len(network['edges']), network['truncated']), (2, 1, True))
+
+    def test_network_endpoint(self):
+        """Test the author network endpoint validates its limits"""
+        view = AuthorViewSet.as_view({'get': 'network'})
+        with self.assertNumQueries(5):
+            response = view(self.factory.get('/', {'depth': 2}), pk=self.carol.pk)
+        self.assertEqual(response.data['author_id'], self.carol.pk)
+        self.assertEqual(len(response.data['nodes']), 4)
+        self.assertEqual(view(self.factory.get('/', {'max_nodes': 0}), pk=self.carol.pk).status_code, 400)
+
+    def test_lab_network(self):
+        """Test lab-to-lab edges are merged with recorded collaborations"""
+        Collaboration.objects.create(
+            lab=self.vision, collaborator_type='company', collaborator_name='Acme', collaboration_count=5
+        )
+        view = CollaborationViewSet.as_view({'get': 'network'})
+
+        response = view(self.factory.get('/'))
+        self.assertEqual(
+            [(edge['source'], edge['target'], edge['weight'], edge['type']) for edge in response.data['edges']],
+            [('Vision Lab', 'Acme', 5, 'company'), ('Vision Lab', 'Robotics Lab', 2, 'lab')]
+        )
+
+        response = view(self.factory.get('/', {'lab': self.robotics.pk, 'max_nodes': 2}))
+        self.assertEqual(len(response.data['edges']), 1)
+        self.assertEqual(response.data['edges'][0]['target'], 'Vision Lab')
@@ -0,0 +1,116 @@
+import csv
+import io
+import json
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from rest_framework.test import APIRequestFactory
+
+from apps.labs.models import Lab
+from apps.publications import views
+from apps.publications.export import PublicationExportAnonThrottle, publication_rows
+from apps.publications.models import (
+    Author, Publication, PublicationAuthor, PublicationVenue, ResearchArea, Venue
+)
+from apps.publications.views import PublicationViewSet
+from apps.universities.models import Professor
+from apps.utils.tests.test_cache import LOCMEM_CACHES
+
+
+class PublicationExportTest(TestCase):
+    """Test cases for the streaming publication export"""
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        # Action options such as throttle_classes are otherwise only applied by the router
+        self.view = PublicationViewSet.as_view({'get': 'export'}, **PublicationViewSet.export.kwargs)
+        self.professor = Professor.objects.create(name='Dr. Test', scholar_id='abc123')
+        self.lab = Lab.objects.create(name='Vision Lab', head_professor=self.professor)
+        self.other_lab = Lab.objects.create(name='Robotics Lab', head_professor=self.professor)
+        alice = Author.objects.create(name='Alice', google_scholar_id='abc123')
+        bob = Author.objects.create(name='Bob')
+        venue = Venue.objects.create(name='Computer Vision and Pattern Recognition', short_name='CVPR')
+        area = ResearchArea.objects.create(name='Computer Vision')
+
+        for index in range(5):
+            publication = Publication.objects.create(
+                title=f'Paper {index}', publication_year=2020 + index, citation_count=index,
+                keywords=['vision', 'detection']
+            )
+            PublicationAuthor.objects.create(publication=publication, author=bob, author_order=2)
+            if index % 2 == 0:
+                PublicationAuthor.objects.create(publication=publication, author=alice, author_order=1)
+            PublicationVenue.objects.create(publication=publication, venue=venue)
+            publication.research_areas.add(area)
+            # Both labs: the export must not repeat the row
+            publication.labs.add(self.lab, self.other_lab)
+        Publication.objects.create(title='Unrelated', publication_year=2024)
+
+    def export(self, **params):
+        response = self.view(self.factory.get('/', params))
+        self.assertEqual(response.status_code, 200)
+        return b''.join(response.streaming_content).decode()
+
+    def test_ndjson_export(self):
+        """Test one flattened JSON object per publication matching the filter"""
+        lines = self.export(lab=self.lab.pk).splitlines()
+
+        self.assertEqual(len(lines), 5)
+        row = json.loads(lines[0])
+        self.assertEqual(row['title'], 'Paper 0')
+        self.assertEqual(row['authors'], ['Alice', 'Bob'])
+        self.assertEqual(row['venues'], ['CVPR'])
+        self.assertEqual(row['research_areas'], ['Computer Vision'])
+
+    def test_csv_export(self):
+        """Test the CSV export has a header row and joined list columns"""
+        rows = list(csv.DictReader(io.StringIO(self.export(lab=self.lab.pk, export_format='csv', year_from=2023))))
+
+        self.assertEqual([row['title'] for row in rows], ['Paper 3', 'Paper 4'])
+        self.assertEqual(rows[1]['authors'], 'Alice; Bob')
+        self.assertEqual(rows[1]['keywords'], 'vision; detection')
+
+    def test_professor_filter(self):
+        """Test the professor filter selects the publications of the matching scholar"""
+        lines = self.export(professor=self.professor.pk).splitlines()
+        self.assertEqual([json.loads(line)['title'] for line in lines], ['Paper 0', 'Paper 2', 'Paper 4'])
+
+    def test_queries_per_chunk(self):
+        """Test relations are prefetched per chunk instead of per publication"""
+        rows = publication_rows(Publication.objects.filter(labs=self.lab), chunk_size=2)
+        with self.assertNumQueries(10):
+            # One publication query read in 3 chunks, authors, venues and areas per chunk
+            self.assertEqual(len(list(rows)), 5)
+
+    def test_invalid_format(self):
+        """Test unknown formats are rejected"""
+        response = self.view(self.factory.get('/', {'export_format': 'xml'}))
+        self.assertEqual(response.status_code, 400)
+
+    def test_csv_formula_cells_are_escaped(self):
+        """Test cells that spreadsheets would run as formulas are prefixed with a quote"""
+        Publication.objects.filter(title='Unrelated').update(title='=HYPERLINK("http://evil")', abstract='-1+2')
+        rows = list(csv.DictReader(io.StringIO(self.export(export_format='csv', year_from=2024))))
+
+        row = next(row for row in rows if 'HYPERLINK' in row['title'])
+        self.assertEqual((row['title'], row['abstract']), ('\'=HYPERLINK("http://evil")', "'-1+2"))
+        self.assertEqual(rows[0]['citation_count'], '4')
+
+    def test_anonymous_row_limit(self):
+        """Test anonymous exports stop at the row limit and say so"""
+        with mock.patch.object(views, 'ANONYMOUS_MAX_ROWS', 2):
+            response = self.view(self.factory.get('/', {'lab': self.lab.pk}))
+            lines = b''.join(response.streaming_content).decode().splitlines()
+
+        self.assertEqual(response['X-Export-Row-Limit'], '2')
+        self.assertEqual([json.loads(line)['title'] for line in lines], ['Paper 0', 'Paper 1'])
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    @mock.patch.object(PublicationExportAnonThrottle, 'THROTTLE_RATES', {'publication_export_anon': '2/hour'})
+    def test_anonymous_exports_are_throttled(self):
+        """Test anonymous callers are rate limited"""
+        cache.clear()
+        statuses = [self.view(self.factory.get('/', {'lab': self.lab.pk})).status_code for _ in range(3)]
+        self.assertEqual(statuses, [200, 200, 429])
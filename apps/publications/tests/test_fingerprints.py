@@ -0,0 +1,159 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from rest_framework.test import APIRequestFactory
+
+from apps.publications.fingerprints import (
+    existing_fingerprints, match_publications, normalize_arxiv_id, normalize_doi, normalize_stored_identifiers,
+    normalize_title, title_fingerprint
+)
+from apps.publications.models import Publication
+from apps.publications.scholar_import import import_scholar_publications
+from apps.publications.views import PublicationViewSet
+from apps.universities.models import Professor
+
+
+class FingerprintNormalizationTest(TestCase):
+    """Test cases for title, DOI and arXiv id normalization"""
+
+    def test_normalize_title(self):
+        """Test case, punctuation, accents and whitespace are ignored"""
+        self.assertEqual(normalize_title('  Attention Is All You-Need. '), 'attention is all you need')
+        self.assertEqual(normalize_title('Réseaux  de neurones'), 'reseaux de neurones')
+        self.assertEqual(title_fingerprint('Deep Learning.'), title_fingerprint('deep   LEARNING'))
+        self.assertNotEqual(title_fingerprint('Deep Learning'), title_fingerprint('Deep Learning 2'))
+        self.assertEqual(title_fingerprint(' ... '), '')
+
+    def test_normalize_identifiers(self):
+        """Test DOI and arXiv id prefixes, versions and case are stripped"""
+        self.assertEqual(normalize_doi('https://doi.org/10.1000/ABC'), '10.1000/abc')
+        self.assertEqual(normalize_doi('doi: 10.1000/abc'), '10.1000/abc')
+        self.assertIsNone(normalize_doi('  '))
+        self.assertEqual(normalize_arxiv_id('arXiv:2101.00001v2'), '2101.00001')
+        self.assertEqual(normalize_arxiv_id('https://arxiv.org/pdf/2101.00001v1.pdf'), '2101.00001')
+        self.assertEqual(normalize_arxiv_id(None), '')
+
+
+class FingerprintLookupTest(TestCase):
+    """Test cases for matching incoming publications to existing ones"""
+
+    def setUp(self):
+        self.first = Publication.objects.create(
+            title='Deep Learning', publication_year=2020, doi='https://doi.org/10.1000/DL'
+        )
+        self.second = Publication.objects.create(
+            title='Graph Networks', publication_year=2021, arxiv_id='arXiv:2101.00001v3'
+        )
+
+    def test_save_sets_fingerprint_and_normalizes_identifiers(self):
+        """Test saving a publication keeps the fingerprint in sync with the title"""
+        self.assertEqual(self.first.fingerprint, title_fingerprint('deep learning'))
+        self.assertEqual((self.first.doi, self.second.arxiv_id), ('10.1000/dl', '2101.00001'))
+
+        self.first.title = 'Deeper Learning'
+        self.first.save(update_fields=['title'])
+        self.first.refresh_from_db()
+        self.assertEqual(self.first.fingerprint, title_fingerprint('Deeper Learning'))
+
+    def test_existing_fingerprints(self):
+        """Test a batch of fingerprints is resolved to publication ids"""
+        found = existing_fingerprints([title_fingerprint('DEEP learning!'), title_fingerprint('Unknown'), ''])
+        self.assertEqual(found, {title_fingerprint('Deep Learning'): self.first.pk})
+
+    def test_match_publications(self):
+        """Test DOI, arXiv id and title fingerprint are tried in order"""
+        with self.assertNumQueries(3):
+            matches = match_publications([
+                ('Different title', 'DOI:10.1000/dl', None),
+                ('Another title', None, '2101.00001v1'),
+                ('graph  networks.', None, ''),
+                ('New paper', '10.1000/new', ''),
+            ])
+        self.assertEqual(matches, [self.first.pk, self.second.pk, self.second.pk, None])
+
+    def test_normalize_stored_identifiers(self):
+        """Test legacy identifiers are normalized and colliding DOIs are cleared before saving"""
+        legacy = Publication.objects.create(title='Legacy', publication_year=2019)
+        duplicate = Publication.objects.create(title='Legacy copy', publication_year=2019, additional_notes='Imported')
+        # Rows stored before save() normalized the identifiers
+        Publication.objects.filter(pk=legacy.pk).update(doi='https://doi.org/10.1000/OLD', arxiv_id='arXiv:1901.00001v2')
+        Publication.objects.filter(pk=duplicate.pk).update(doi='doi:10.1000/Old')
+        Publication.objects.filter(pk=self.first.pk).update(doi='10.1000/DL')
+
+        self.assertEqual(normalize_stored_identifiers(), (2, 1))
+
+        legacy.refresh_from_db()
+        duplicate.refresh_from_db()
+        self.assertEqual((legacy.doi, legacy.arxiv_id), ('10.1000/old', '1901.00001'))
+        self.assertIsNone(duplicate.doi)
+        self.assertEqual(
+            duplicate.additional_notes, 'Imported\nDuplicate DOI removed during normalization: doi:10.1000/Old'
+        )
+        # Re-saving no longer collides on the unique DOI
+        duplicate.save()
+        self.assertEqual(normalize_stored_identifiers(), (0, 0))
+
+
+class FingerprintImportTest(TestCase):
+    """Test cases for fingerprint-based deduplication in imports"""
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.professor = Professor.objects.create(name='Dr. Test')
+
+    def test_scholar_import_merges_near_duplicate_titles(self):
+        """Test titles differing only in case and punctuation map to one publication"""
+        with self.captureOnCommitCallbacks(execute=True):
+            first = import_scholar_publications(self.professor, [
+                {'title': 'Deep Learning.', 'year': 2020, 'citations': 3},
+                {'title': 'deep  learning', 'year': 2020, 'citations': 5},
+            ])
+        with self.captureOnCommitCallbacks(execute=True):
+            second = import_scholar_publications(self.professor, [
+                {'title': 'DEEP LEARNING', 'year': 2020, 'citations': 7},
+            ])
+
+        self.assertEqual((first['created'], second['created'], second['updated']), (1, 0, 1))
+        publication = Publication.objects.get()
+        self.assertEqual((publication.title, publication.citation_count), ('Deep Learning.', 7))
+        self.assertEqual(publication.fingerprint, title_fingerprint('deep learning'))
+
+    def test_create_with_relations_returns_existing_publication(self):
+        """Test a differently formatted DOI of an existing publication is not created again"""
+        existing = Publication.objects.create(title='Paper', publication_year=2024, doi='10.1000/abc')
+        view = PublicationViewSet.as_view({'post': 'create_with_relations'})
+
+        response = view(self.factory.post('/', {
+            'title': 'Paper (extended)', 'publication_year': 2024, 'doi': 'https://doi.org/10.1000/ABC'
+        }, format='json'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['publication']['id'], existing.pk)
+        self.assertEqual(Publication.objects.count(), 1)
+
+    def test_load_publication_data_is_idempotent(self):
+        """Test loading the same dataset twice skips publications that already exist"""
+        items = [
+            {'title': 'Paper A', 'publication_year': 2024, 'doi': '10.1000/a'},
+            {'title': 'paper a.', 'publication_year': 2024},
+            {'title': 'Paper B', 'publication_year': 2023, 'arxiv_id': 'arXiv:2301.00001v1'},
+        ]
+        with tempfile.TemporaryDirectory() as dataset_dir:
+            with open(os.path.join(dataset_dir, 'papers.json'), 'w', encoding='utf-8') as f:
+                json.dump(items, f)
+
+            first = StringIO()
+            call_command('load_publication_data', dataset_dir=dataset_dir, stdout=first)
+            second = StringIO()
+            call_command('load_publication_data', dataset_dir=dataset_dir, stdout=second)
+
+        self.assertIn('2 publications created, 1 already existed', first.getvalue())
+        self.assertIn('0 publications created, 3 already existed', second.getvalue())
+        self.assertEqual(
+            set(Publication.objects.values_list('title', 'arxiv_id')), {('Paper A', ''), ('Paper B', '2301.00001')}
+        )
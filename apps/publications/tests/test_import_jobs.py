@@ -0,0 +1,155 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.db import OperationalError
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from rest_framework.test import APIRequestFactory
+
+from apps.labs.models import Lab
+from apps.publications.import_jobs import enqueue_import_job, process_import_jobs, requeue_stale_jobs
+from apps.publications.models import ImportJob, Publication
+from apps.publications.views import ImportJobViewSet, PublicationViewSet
+from apps.universities.models import Professor
+
+
+def scholar_items(count, start=0):
+    return [{'title': f'Paper {index}', 'year': 2024, 'citations': index} for index in range(start, start + count)]
+
+
+@override_settings(PUBLICATION_IMPORT_JOBS={'CHUNK_SIZE': 2})
+# Closing the connection would end the test case's transaction
+@mock.patch('apps.publications.import_jobs.close_old_connections')
+class ImportJobWorkerTest(TestCase):
+    """Test cases for processing queued import jobs"""
+
+    def setUp(self):
+        self.professor = Professor.objects.create(name='Dr. Test')
+
+    def test_scholar_job_is_processed_in_chunks(self, close_old_connections):
+        """Test a queued Scholar import is processed and logged"""
+        items = scholar_items(5)
+        items[3] = {'title': 'No Year'}
+        job = enqueue_import_job('scholar', items, professor=self.professor)
+        self.assertEqual((job.status, job.scraping_log.status), ('pending', 'pending'))
+        self.assertEqual(Publication.objects.count(), 0)
+
+        self.assertEqual(process_import_jobs(once=True), 1)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'success')
+        self.assertEqual((job.processed_items, job.created_count, job.progress), (5, 4, 100.0))
+        self.assertEqual([error['index'] for error in job.errors], [3])
+        self.assertEqual(job.payload, [])
+        log = job.scraping_log
+        log.refresh_from_db()
+        self.assertEqual((log.status, log.publications_count), ('success', 4))
+        self.assertEqual(log.error_message, '1 items failed')
+
+    def test_relations_job_reports_item_errors(self, close_old_connections):
+        """Test failing items of a relations job are rolled back one by one"""
+        job = enqueue_import_job('relations', [
+            {'title': 'Good', 'publication_year': 2024},
+            {'title': 'Bad lab', 'publication_year': 2024, 'lab_id': 999},
+            {'title': 'Missing year'},
+        ])
+
+        process_import_jobs(once=True)
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.created_count), ('success', 1))
+        self.assertEqual([error['error'] for error in job.errors], [
+            'Lab with id 999 not found', 'publication_year is required'
+        ])
+        self.assertEqual(list(Publication.objects.values_list('title', flat=True)), ['Good'])
+
+    def test_stale_job_resumes_where_it_stopped(self, close_old_connections):
+        """Test a job of a stopped worker is requeued and continues after the last chunk"""
+        job = enqueue_import_job('scholar', scholar_items(4), professor=self.professor)
+        ImportJob.objects.filter(pk=job.pk).update(
+            status='running', processed_items=2, attempts=1,
+            heartbeat_at=timezone.now() - timedelta(hours=1)
+        )
+
+        self.assertEqual(requeue_stale_jobs(), 1)
+        process_import_jobs(once=True)
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts, job.created_count), ('success', 2, 2))
+        self.assertEqual(set(Publication.objects.values_list('title', flat=True)), {'Paper 2', 'Paper 3'})
+
+    def test_database_errors_do_not_stop_the_worker(self, close_old_connections):
+        """Test stale connections are dropped every iteration and claim errors are retried"""
+        job = enqueue_import_job('scholar', scholar_items(1), professor=self.professor)
+
+        with mock.patch('apps.publications.import_jobs.time.sleep') as sleep, \
+                mock.patch('apps.publications.import_jobs.requeue_stale_jobs', side_effect=[OperationalError, 0]):
+            self.assertEqual(process_import_jobs(max_jobs=1), 1)
+
+        sleep.assert_called_once()
+        self.assertEqual(close_old_connections.call_count, 2)
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'success')
+
+    def test_database_error_ends_single_pass(self, close_old_connections):
+        """Test --once exits on a database error instead of retrying forever"""
+        with mock.patch('apps.publications.import_jobs.claim_next_job', side_effect=OperationalError):
+            self.assertEqual(process_import_jobs(once=True), 0)
+
+
+class ImportJobEndpointTest(TestCase):
+    """Test cases for queueing import jobs over the API"""
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.professor = Professor.objects.create(name='Dr. Test')
+
+    def test_create_and_poll_job(self):
+        """Test creating a job returns its id right away and the job can be polled"""
+        create = ImportJobViewSet.as_view({'post': 'create'})
+        response = create(self.factory.post('/', {
+            'professor_id': self.professor.pk, 'publications': scholar_items(3)
+        }, format='json'))
+        self.assertEqual(response.status_code, 202)
+        job_id = response.data['job']['id']
+
+        retrieve = ImportJobViewSet.as_view({'get': 'retrieve'})
+        data = retrieve(self.factory.get('/'), pk=job_id).data
+        self.assertEqual((data['status'], data['total_items'], data['progress']), ('pending', 3, 0.0))
+        self.assertNotIn('payload', data)
+
+    def test_create_requires_professor_for_scholar_jobs(self):
+        """Test invalid job requests are rejected"""
+        create = ImportJobViewSet.as_view({'post': 'create'})
+        self.assertEqual(create(self.factory.post('/', {'publications': []}, format='json')).status_code, 400)
+        self.assertEqual(create(self.factory.post('/', {'kind': 'other'}, format='json')).status_code, 400)
+
+    def test_bulk_import_async(self):
+        """Test async=true queues the Scholar import instead of running it"""
+        view = PublicationViewSet.as_view({'post': 'bulk_import_from_scholar'})
+        response = view(self.factory.post('/?async=true', {
+            'professor_id': self.professor.pk, 'publications': scholar_items(2)
+        }, format='json'))
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(Publication.objects.count(), 0)
+        self.assertEqual(ImportJob.objects.get().scraping_log.professor, self.professor)
+
+    def test_create_with_relations(self):
+        """Test create_with_relations creates the publication or rolls it back"""
+        view = PublicationViewSet.as_view({'post': 'create_with_relations'})
+        lab = Lab.objects.create(name='Vision Lab', head_professor=self.professor)
+
+        response = view(self.factory.post('/', {
+            'title': 'Paper', 'publication_year': 2024, 'lab_id': lab.pk,
+            'authors': [{'name': 'Alice'}], 'venues': [{'name': 'CVPR'}]
+        }, format='json'))
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['publication']['first_author']['name'], 'Alice')
+
+        response = view(self.factory.post('/', {
+            'title': 'Other', 'publication_year': 2024, 'lab_id': 999
+        }, format='json'))
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Publication.objects.filter(title='Other').exists())
@@ -0,0 +1,79 @@
+from django.test import TestCase
+
+from apps.publications.filters import PublicationFilter
+from apps.publications.keywords import normalize_keyword, top_keywords
+from apps.publications.models import Keyword, Publication, PublicationKeyword
+
+
+class NormalizeKeywordTest(TestCase):
+    """Test cases for keyword normalization"""
+
+    def test_normalization(self):
+        """Test case, separators and surrounding punctuation are normalized"""
+        self.assertEqual(normalize_keyword('  Deep   Learning '), 'deep learning')
+        self.assertEqual(normalize_keyword('Reinforcement-Learning'), 'reinforcement learning')
+        self.assertEqual(normalize_keyword('"NLP",'), 'nlp')
+        self.assertEqual(normalize_keyword('C++'), 'c++')
+        self.assertEqual(normalize_keyword(None), '')
+
+
+class KeywordIndexTest(TestCase):
+    """Test cases for the normalized keyword index"""
+
+    def setUp(self):
+        self.vision = Publication.objects.create(
+            title='Vision', publication_year=2023, keywords=['Computer Vision', 'Deep Learning']
+        )
+        self.networks = Publication.objects.create(
+            title='Networks', publication_year=2023, keywords=['neural networks', 'deep-learning']
+        )
+        self.robots = Publication.objects.create(
+            title='Robots', publication_year=2024, keywords=['Robotics']
+        )
+
+    def filter(self, **params):
+        return set(PublicationFilter(params, queryset=Publication.objects.all()).qs)
+
+    def test_index_is_synced_on_save(self):
+        """Test keywords are linked on create and update"""
+        self.assertEqual(
+            set(self.vision.keyword_terms.values_list('slug', flat=True)),
+            {'computer vision', 'deep learning'}
+        )
+        self.robots.keywords = ['Manipulation']
+        self.robots.save()
+        self.assertEqual(list(self.robots.keyword_terms.values_list('slug', flat=True)), ['manipulation'])
+
+    def test_keywords_are_shared(self):
+        """Test spellings of the same keyword map to one row"""
+        self.assertEqual(Keyword.objects.filter(slug='deep learning').count(), 1)
+        self.assertEqual(PublicationKeyword.objects.filter(keyword__slug='deep learning').count(), 2)
+
+    def test_keyword_filter_matches_prefix(self):
+        """Test keyword matches whole keywords by prefix, not JSON substrings"""
+        self.assertEqual(self.filter(keyword='Deep Learning'), {self.vision, self.networks})
+        self.assertEqual(self.filter(keyword='neural network'), {self.networks})
+        # A substring inside a keyword no longer matches
+        self.assertEqual(self.filter(keyword='learning'), set())
+        # JSON punctuation is not a keyword, the filter is ignored
+        self.assertEqual(self.filter(keyword='", "'), {self.vision, self.networks, self.robots})
+
+    def test_keywords_contain_is_any_of(self):
+        """Test comma-separated keywords match any of them without duplicates"""
+        queryset = PublicationFilter(
+            {'keywords_contain': 'robotics, deep learning, computer'}, queryset=Publication.objects.all()
+        ).qs
+        self.assertEqual(queryset.count(), 3)
+
+    def test_keywords_contain_without_keywords_is_ignored(self):
+        """Test a value with only separators leaves the queryset unfiltered"""
+        for value in [',', ' , ', ', ,']:
+            queryset = PublicationFilter({'keywords_contain': value}, queryset=Publication.objects.all()).qs
+            self.assertEqual(set(queryset), {self.vision, self.networks, self.robots})
+
+    def test_top_keywords(self):
+        """Test top keywords are counted in SQL"""
+        self.assertEqual(
+            top_keywords(Publication.objects.all(), limit=2),
+            [{'keyword': 'Deep Learning', 'count': 2}, {'keyword': 'Computer Vision', 'count': 1}]
+        )
@@ -0,0 +1,198 @@
+from datetime import datetime
+from unittest import mock
+
+from django.test import TestCase
+
+from rest_framework.test import APIRequestFactory
+
+from apps.labs.models import Lab
+from apps.publications import lab_stats
+from apps.publications.models import (
+    LabPublicationStats, Publication, PublicationResearchArea, PublicationVenue, ResearchArea, Venue
+)
+from apps.publications.views import LabPublicationStatsViewSet, PublicationViewSet
+from apps.universities.models import Department, Professor, University, UniversityDepartment
+
+
+CURRENT_YEAR = datetime.now().year
+
+
+class LabStatsTestMixin:
+
+    def setUp(self):
+        university = University.objects.create(name='Test University', country='USA', city='Test City')
+        department = Department.objects.create(name='Computer Science')
+        uni_dept = UniversityDepartment.objects.create(university=university, department=department)
+        professor = Professor.objects.create(name='Dr. Test', university_department=uni_dept)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.lab = Lab.objects.create(name='Vision Lab', head_professor=professor)
+            self.conference = Venue.objects.create(name='CVPR', short_name='CVPR', type='conference', tier='top')
+            self.journal = Venue.objects.create(name='TPAMI', type='journal', tier='high')
+            self.area = ResearchArea.objects.create(name='Computer Vision')
+            self.old = self.add_publication('Old', CURRENT_YEAR - 6, 50, self.journal)
+            self.recent = self.add_publication('Recent', CURRENT_YEAR, 8, self.conference, is_open_access=True)
+            self.other = self.add_publication('Other', CURRENT_YEAR, 1, self.conference)
+
+    def add_publication(self, title, year, citations, venue, **fields):
+        publication = Publication.objects.create(
+            title=title, publication_year=year, citation_count=citations, **fields
+        )
+        PublicationVenue.objects.create(publication=publication, venue=venue)
+        PublicationResearchArea.objects.create(publication=publication, research_area=self.area)
+        self.lab.publications.add(publication)
+        return publication
+
+    def lab_stats(self):
+        return LabPublicationStats.objects.get(lab=self.lab)
+
+
+class LabStatsReadModelTest(LabStatsTestMixin, TestCase):
+    """Test cases for the materialized lab publication statistics"""
+
+    def test_stats_are_materialized(self):
+        """Test linking publications to a lab fills its statistics"""
+        stats = self.lab_stats()
+
+        self.assertEqual(stats.total_publications, 3)
+        self.assertEqual(stats.total_citations, 59)
+        self.assertEqual(stats.h_index, 2)
+        self.assertEqual(stats.top_tier_count, 2)
+        self.assertEqual(stats.best_venue_tier, 'top')
+        self.assertEqual(stats.publications_last_5_years, 2)
+        self.assertEqual(stats.open_access_count, 1)
+        self.assertEqual(stats.most_cited_paper, self.old)
+        self.assertEqual(stats.top_publication_ids, [self.old.pk, self.recent.pk, self.other.pk])
+        self.assertEqual(stats.yearly_histogram[str(CURRENT_YEAR)], {'count': 2, 'citations': 9})
+        self.assertEqual([venue['name'] for venue in stats.top_venues], ['CVPR', 'TPAMI'])
+        self.assertEqual(stats.facets['venue_tiers'], ['high', 'top'])
+        self.assertEqual(stats.facets['years'], [CURRENT_YEAR, CURRENT_YEAR - 6])
+
+    def test_citation_update_refreshes_stats(self):
+        """Test a citation change is reflected after commit"""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.other.citation_count = 100
+            self.other.save(update_fields=['citation_count'])
+
+        stats = self.lab_stats()
+        self.assertEqual(stats.total_citations, 158)
+        self.assertEqual(stats.most_cited_paper, self.other)
+
+    def test_unrelated_update_is_ignored(self):
+        """Test saving fields the statistics do not use schedules nothing"""
+        with mock.patch.object(lab_stats, 'refresh_lab_publication_stats') as refresh:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.other.title = 'Renamed'
+                self.other.save(update_fields=['title'])
+        refresh.assert_not_called()
+
+    def test_unlink_and_delete_refresh_stats(self):
+        """Test removing a publication from the lab or deleting it updates the counts"""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.lab.publications.remove(self.other)
+        self.assertEqual(self.lab_stats().total_publications, 2)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.old.delete()
+        stats = self.lab_stats()
+        self.assertEqual(stats.total_publications, 1)
+        self.assertEqual(stats.facets['venue_tiers'], ['top'])
+
+    def test_venue_change_refreshes_facets(self):
+        """Test renaming a venue updates the filter options of its labs"""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.journal.name = 'IEEE TPAMI'
+            self.journal.save()
+
+        self.assertIn('IEEE TPAMI', [venue['name'] for venue in self.lab_stats().facets['venues']])
+
+    def test_changes_in_one_transaction_refresh_once(self):
+        """Test several changes of a transaction are coalesced into one refresh"""
+        with mock.patch.object(lab_stats, 'refresh_lab_publication_stats') as refresh:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.add_publication('New', CURRENT_YEAR, 3, self.journal)
+                self.recent.citation_count = 20
+                self.recent.save()
+        refresh.assert_called_once_with(lab_ids={self.lab.pk})
+
+    def test_backfill_refreshes_every_lab(self):
+        """Test the backfill recomputes all labs in batches and invalidates once"""
+        other_lab = Lab.objects.create(name='Robotics Lab', head_professor=self.lab.head_professor)
+        LabPublicationStats.objects.all().delete()
+
+        with mock.patch.object(lab_stats, 'REFRESH_BATCH_SIZE', 1), \
+                mock.patch('apps.utils.invalidation.invalidate_namespaces') as invalidate:
+            self.assertEqual(lab_stats.backfill_lab_publication_stats(), 2)
+
+        self.assertEqual(self.lab_stats().total_publications, 3)
+        self.assertEqual(LabPublicationStats.objects.get(lab=other_lab).total_publications, 0)
+        invalidate.assert_called_once_with('LAB_STATS', 'PUBLICATIONS')
+
+
+class LabStatsEndpointTest(LabStatsTestMixin, TestCase):
+    """Test cases for the lab statistics endpoints"""
+
+    def get(self, action, **params):
+        view = PublicationViewSet.as_view({'get': action})
+        return view(APIRequestFactory().get('/', params))
+
+    def test_actions_read_one_row(self):
+        """Test stats, filters and yearly_stats need a single query"""
+        for action in ('stats', 'filters', 'yearly_stats'):
+            with self.assertNumQueries(1):
+                response = self.get(action, lab_id=self.lab.pk)
+            self.assertEqual(response.status_code, 200)
+
+    def test_stats_payload(self):
+        """Test the stats summary is served from the read model"""
+        data = self.get('stats', lab_id=self.lab.pk).data
+
+        self.assertEqual(data['summary']['total_publications'], 3)
+        self.assertEqual(data['summary']['h_index'], 2)
+        self.assertEqual(data['summary']['recent_publications_5years'], 2)
+        self.assertEqual(data['summary']['open_access_ratio'], 33.3)
+        self.assertEqual(data['top_cited_paper']['title'], 'Old')
+        self.assertEqual(data['top_venues'][0], {'name': 'CVPR', 'type': 'conference', 'tier': 'top', 'publication_count': 2})
+
+    def test_yearly_stats_fill_empty_years(self):
+        """Test missing years of the range are filled with zero"""
+        data = self.get('yearly_stats', lab_id=self.lab.pk, start_year=CURRENT_YEAR - 1).data
+
+        self.assertEqual(data['yearly_stats'], {str(CURRENT_YEAR - 1): 0, str(CURRENT_YEAR): 2})
+        self.assertEqual(data['total_publications'], 2)
+
+    def test_by_lab_top_publications(self):
+        """Test by_lab lists the most cited publications"""
+        data = self.get('by_lab', lab_id=self.lab.pk).data
+
+        self.assertEqual([paper['title'] for paper in data['top_publications']], ['Old', 'Recent', 'Other'])
+        self.assertEqual(data['yearly_statistics'][0], {'publication_year': CURRENT_YEAR, 'count': 2, 'avg_citations': 4.5})
+
+    def test_missing_stats_are_computed_on_read(self):
+        """Test a lab without a statistics row gets one on the first request"""
+        LabPublicationStats.objects.all().delete()
+
+        response = self.get('filters', lab_id=self.lab.pk)
+
+        self.assertEqual(response.data['filters']['venue_types'], ['conference', 'journal'])
+        self.assertTrue(LabPublicationStats.objects.filter(lab=self.lab).exists())
+
+    def test_missing_stats_on_read_keep_caches(self):
+        """Test filling a missing statistics row on a GET does not invalidate caches"""
+        LabPublicationStats.objects.all().delete()
+
+        with mock.patch('apps.utils.invalidation.invalidate_namespaces') as invalidate:
+            self.assertEqual(self.get('stats', lab_id=self.lab.pk).status_code, 200)
+        invalidate.assert_not_called()
+
+    def test_invalid_lab_id(self):
+        """Test lab_id is required and must be a number"""
+        self.assertEqual(self.get('stats').status_code, 400)
+        self.assertEqual(self.get('stats', lab_id='abc').status_code, 400)
+
+    def test_lab_stats_list_includes_most_cited_paper(self):
+        """Test the lab statistics list resolves the most cited paper"""
+        view = LabPublicationStatsViewSet.as_view({'get': 'list'})
+        response = view(APIRequestFactory().get('/'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['results'][0]['most_cited_paper_title'], 'Old')
@@ -0,0 +1,146 @@
+from io import StringIO
+
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework.test import APIRequestFactory
+
+from apps.publications.models import Publication, PublicationResearchArea, ResearchArea
+from apps.publications.research_area_tree import research_area_tree
+from apps.publications.serializers import ResearchAreaSerializer
+from apps.publications.views import ResearchAreaViewSet
+from apps.universities.models import Department
+
+
+class ResearchAreaTreeTestMixin:
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.department = Department.objects.create(name='Computer Science')
+        self.ai = self.area('AI')
+        self.ml = self.area('Machine Learning', self.ai)
+        self.cv = self.area('Computer Vision', self.ai)
+        self.detection = self.area('Object Detection', self.cv)
+        self.systems = self.area('Systems')
+
+    def area(self, name, parent=None):
+        return ResearchArea.objects.create(name=name, department=self.department, parent=parent)
+
+    def tag(self, title, *areas):
+        publication = Publication.objects.create(title=title, publication_year=2024)
+        for area in areas:
+            PublicationResearchArea.objects.create(publication=publication, research_area=area)
+        return publication
+
+    def paths(self):
+        return dict(ResearchArea.objects.values_list('name', 'path'))
+
+
+class ResearchAreaPathTest(ResearchAreaTreeTestMixin, TestCase):
+    """Test cases for maintaining the materialized research area paths"""
+
+    def test_insert_sets_path_and_depth(self):
+        """Test new areas store the ids from the root and their depth"""
+        self.detection.refresh_from_db()
+        self.assertEqual(self.detection.path, f'{self.ai.pk}/{self.cv.pk}/{self.detection.pk}/')
+        self.assertEqual(self.detection.depth, 2)
+        self.assertEqual(self.detection.full_path, 'AI > Computer Vision > Object Detection')
+
+    def test_move_updates_subtree(self):
+        """Test moving an area rewrites the paths of its whole subtree"""
+        self.cv.parent = self.systems
+        self.cv.save()
+
+        self.detection.refresh_from_db()
+        self.assertEqual(self.detection.path, f'{self.systems.pk}/{self.cv.pk}/{self.detection.pk}/')
+        self.assertEqual(self.detection.depth, 2)
+
+        self.cv.parent = None
+        self.cv.save()
+        self.detection.refresh_from_db()
+        self.assertEqual((self.detection.path, self.detection.depth), (f'{self.cv.pk}/{self.detection.pk}/', 1))
+
+    def test_move_under_descendant_is_rejected(self):
+        """Test an area cannot become its own descendant"""
+        self.ai.parent = self.detection
+        with self.assertRaises(ValidationError):
+            self.ai.save()
+
+        with self.assertRaises(ValidationError):
+            self.ai.full_clean()
+
+        self.ai.refresh_from_db()
+        serializer = ResearchAreaSerializer(self.ai, data={'parent': self.detection.pk}, partial=True)
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('parent', serializer.errors)
+
+    def test_delete_detaches_children(self):
+        """Test children of a deleted area become roots with shortened paths"""
+        self.cv.delete()
+        self.detection.refresh_from_db()
+        self.assertIsNone(self.detection.parent_id)
+        self.assertEqual((self.detection.path, self.detection.depth), (f'{self.detection.pk}/', 0))
+
+    def test_rebuild_command(self):
+        """Test the command recomputes paths changed behind the model's back"""
+        ResearchArea.objects.filter(pk=self.cv.pk).update(parent=self.systems)
+        out = StringIO()
+        call_command('rebuild_research_area_paths', stdout=out)
+
+        self.assertIn('Updated 2 research area paths', out.getvalue())
+        self.assertEqual(self.paths()['Object Detection'], f'{self.systems.pk}/{self.cv.pk}/{self.detection.pk}/')
+
+
+class ResearchAreaHierarchyTest(ResearchAreaTreeTestMixin, TestCase):
+    """Test cases for the constant-query research area hierarchy"""
+
+    def setUp(self):
+        super().setUp()
+        self.tag('Detector', self.detection)
+        # Tagged in a parent and its child: counted once for the subtree
+        self.tag('Survey', self.ai, self.cv)
+        self.tag('Transformer', self.ml)
+
+    def test_tree_counts(self):
+        """Test per-area and distinct subtree publication counts"""
+        tree = research_area_tree([self.ai.pk])
+        ai = tree[0]
+        self.assertEqual((ai['publication_count'], ai['subtree_publication_count']), (1, 3))
+        self.assertEqual([child['name'] for child in ai['children']], ['Computer Vision', 'Machine Learning'])
+        cv = ai['children'][0]
+        self.assertEqual((cv['publication_count'], cv['subtree_publication_count'], cv['depth']), (1, 2, 1))
+        self.assertEqual(cv['children'][0]['name'], 'Object Detection')
+
+    def test_counts_only_cover_requested_roots(self):
+        """Test the count query is restricted to the subtrees of the requested roots"""
+        self.tag('Scheduler', self.systems)
+        with CaptureQueriesContext(connection) as queries:
+            tree = research_area_tree([self.systems.pk])
+
+        self.assertEqual(tree[0]['subtree_publication_count'], 1)
+        self.assertIn(f"'{self.systems.pk}/%'", queries[0]['sql'])
+
+    def test_hierarchy_queries_do_not_grow_with_nodes(self):
+        """Test the endpoint reads the whole tree in three queries"""
+        view = ResearchAreaViewSet.as_view({'get': 'hierarchy'})
+        with self.assertNumQueries(3):
+            response = view(self.factory.get('/'))
+        self.assertEqual([node['name'] for node in response.data], ['AI', 'Systems'])
+
+        for index in range(5):
+            self.area(f'Sub {index}', self.ml)
+        with self.assertNumQueries(3):
+            view(self.factory.get('/'))
+
+    def test_list_full_path_and_children_count(self):
+        """Test the list serializer loads full paths and child counts without per-row queries"""
+        view = ResearchAreaViewSet.as_view({'get': 'list'})
+        with self.assertNumQueries(3):
+            response = view(self.factory.get('/'))
+
+        items = {item['name']: item for item in response.data['results']}
+        self.assertEqual(items['Object Detection']['full_path'], 'AI > Computer Vision > Object Detection')
+        self.assertEqual(items['AI']['children_count'], 2)
@@ -0,0 +1,100 @@
+from django.test import TestCase
+
+from rest_framework.test import APIRequestFactory
+
+from apps.labs.models import Lab
+from apps.publications.models import Author, LabPublicationStats, Publication, PublicationAuthor, Venue
+from apps.publications.scholar_import import import_scholar_publications
+from apps.publications.views import PublicationViewSet
+from apps.universities.models import Professor
+
+
+def scholar_item(title, year=2024, citations=0, authors=('Alice', 'Bob'), venue='NeurIPS'):
+    return {'title': title, 'year': year, 'citations': citations, 'authors': list(authors), 'venue': venue}
+
+
+class ScholarImportTest(TestCase):
+    """Test cases for the batched Google Scholar import"""
+
+    def setUp(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.professor = Professor.objects.create(name='Dr. Test')
+            self.lab = Lab.objects.create(name='Vision Lab', head_professor=self.professor)
+            self.professor.lab = self.lab
+            self.professor.save()
+
+    def run_import(self, items):
+        with self.captureOnCommitCallbacks(execute=True):
+            return import_scholar_publications(self.professor, items)
+
+    def test_creates_publications_with_relations(self):
+        """Test publications are created and linked to authors, venue and lab"""
+        result = self.run_import([scholar_item('Paper A', citations=5), scholar_item('Paper B', authors=['Bob'])])
+
+        self.assertEqual((result['created'], result['updated'], result['errors']), (2, 0, []))
+        paper = Publication.objects.get(title='Paper A')
+        self.assertEqual(
+            list(paper.publicationauthor_set.values_list('author__name', 'author_order')),
+            [('Alice', 1), ('Bob', 2)]
+        )
+        self.assertEqual(Author.objects.filter(name='Bob').count(), 1)
+        self.assertEqual(list(paper.venues.values_list('name', flat=True)), ['NeurIPS'])
+        self.assertEqual(set(self.lab.publications.all()), set(Publication.objects.all()))
+        # Signals are skipped by bulk_create, so the lab statistics are refreshed explicitly
+        self.assertEqual(LabPublicationStats.objects.get(lab=self.lab).total_publications, 2)
+
+    def test_existing_publications_are_updated(self):
+        """Test existing publications only get higher citation counts and new links"""
+        self.run_import([scholar_item('Paper A', citations=5), scholar_item('Paper B', citations=9)])
+
+        result = self.run_import([
+            scholar_item('Paper A', citations=12, authors=['Alice', 'Bob', 'Carol']),
+            scholar_item('Paper B', citations=3),
+        ])
+
+        self.assertEqual((result['created'], result['updated']), (0, 2))
+        self.assertEqual(
+            dict(Publication.objects.values_list('title', 'citation_count')), {'Paper A': 12, 'Paper B': 9}
+        )
+        self.assertEqual(PublicationAuthor.objects.filter(publication__title='Paper A').count(), 3)
+        self.assertEqual(Venue.objects.count(), 1)
+
+    def test_invalid_items_are_reported(self):
+        """Test invalid items are reported by index while the others are imported"""
+        result = self.run_import([
+            scholar_item('Paper A'),
+            {'title': 'No Year'},
+            'not an object',
+            {'title': '  '},
+            scholar_item('Paper A', citations=4),
+        ])
+
+        self.assertEqual([error['index'] for error in result['errors']], [1, 2])
+        self.assertEqual(result['errors'][0]['error'], 'year is required')
+        self.assertEqual(result['created'], 1)
+        self.assertEqual(Publication.objects.get().citation_count, 4)
+
+    def test_query_count_does_not_grow_with_batch(self):
+        """Test the import needs the same queries for small and larger batches"""
+        self.run_import([scholar_item('Existing')])
+
+        with self.assertNumQueries(30):
+            self.run_import([scholar_item(f'Paper {index}', authors=[f'Author {index}']) for index in range(2)])
+        with self.assertNumQueries(30):
+            self.run_import([scholar_item(f'Paper {index}', authors=[f'Author {index}']) for index in range(2, 30)])
+        self.assertEqual(Publication.objects.count(), 31)
+
+    def test_endpoint(self):
+        """Test the bulk import action validates its input"""
+        view = PublicationViewSet.as_view({'post': 'bulk_import_from_scholar'})
+        factory = APIRequestFactory()
+
+        response = view(factory.post('/', {'professor_id': self.professor.pk, 'publications': {}}, format='json'))
+        self.assertEqual(response.status_code, 400)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = view(factory.post('/', {
+                'professor_id': self.professor.pk, 'publications': [scholar_item('Paper A')]
+            }, format='json'))
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual((response.data['created'], response.data['total_processed']), (1, 1))
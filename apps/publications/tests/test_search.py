@@ -0,0 +1,94 @@
+from unittest import mock
+
+from django.test import TestCase
+
+from apps.publications import search
+from apps.publications.models import Author, Publication, PublicationAuthor
+from apps.publications.search import (
+    HIGHLIGHT_START, HIGHLIGHT_STOP, search_publications, search_snippets, update_search_vectors
+)
+
+
+class PublicationSearchTest(TestCase):
+    """Test cases for publication full-text search (SQLite fallback)"""
+
+    def setUp(self):
+        self.title_match = Publication.objects.create(
+            title='Graph neural networks for molecules', abstract='We study chemistry.',
+            publication_year=2023, citation_count=5,
+        )
+        self.abstract_match = Publication.objects.create(
+            title='Molecular property prediction',
+            abstract='A benchmark of graph neural models on molecules.',
+            publication_year=2024, citation_count=50,
+        )
+        self.keyword_match = Publication.objects.create(
+            title='Learning on sets', abstract='', keywords=['graph learning'],
+            publication_year=2022,
+        )
+        self.unrelated = Publication.objects.create(
+            title='Robot grasping', abstract='Manipulation with tactile sensors.',
+            publication_year=2024,
+        )
+
+    def search(self, query):
+        return list(search_publications(Publication.objects.all(), query))
+
+    def test_ranked_by_field_weight(self):
+        """Test title matches rank above keyword and abstract matches"""
+        results = self.search('graph')
+        self.assertEqual(results, [self.title_match, self.keyword_match, self.abstract_match])
+        self.assertGreater(results[0].search_rank, results[-1].search_rank)
+
+    def test_all_terms_required(self):
+        """Test every term has to match some field"""
+        self.assertEqual(self.search('graph molecules'), [self.title_match, self.abstract_match])
+        self.assertEqual(self.search('graph tactile'), [])
+
+    def test_author_names_match_without_duplicates(self):
+        """Test author names are searched without duplicating rows"""
+        for order, name in enumerate(['Ada Tactile', 'Bob Tactile'], start=1):
+            PublicationAuthor.objects.create(
+                publication=self.unrelated, author=Author.objects.create(name=name), author_order=order
+            )
+        self.assertEqual(self.search('tactile'), [self.unrelated])
+
+    def test_snippets_highlight_terms(self):
+        """Test matched terms are highlighted in title and abstract"""
+        snippets = search_snippets([self.abstract_match.pk], 'graph')
+        self.assertEqual(snippets[self.abstract_match.pk]['title'], 'Molecular property prediction')
+        self.assertIn(f"{HIGHLIGHT_START}graph{HIGHLIGHT_STOP}", snippets[self.abstract_match.pk]['abstract'])
+
+    def test_snippets_escape_markup(self):
+        """Test markup in titles and abstracts is escaped around the highlights"""
+        publication = Publication.objects.create(
+            title='<img src=x onerror=alert(1)> graph & amp',
+            abstract='<script>alert("graph")</script>', publication_year=2024,
+        )
+        snippets = search_snippets([publication.pk], 'graph amp')[publication.pk]
+
+        self.assertEqual(
+            snippets['title'],
+            f'&lt;img src=x onerror=alert(1)&gt; {HIGHLIGHT_START}graph{HIGHLIGHT_STOP} &amp; '
+            f'{HIGHLIGHT_START}amp{HIGHLIGHT_STOP}'
+        )
+        self.assertEqual(
+            snippets['abstract'],
+            f'&lt;script&gt;alert(&quot;{HIGHLIGHT_START}graph{HIGHLIGHT_STOP}&quot;)&lt;/script&gt;'
+        )
+
+    def test_search_vectors_need_postgres(self):
+        """Test vector updates are skipped on SQLite"""
+        self.assertEqual(update_search_vectors(), 0)
+
+    def test_vector_updates_are_coalesced_per_transaction(self):
+        """Test saves in one transaction update the search vectors once after commit"""
+        with mock.patch.object(search, 'is_full_text_supported', return_value=True), \
+                mock.patch.object(search, 'update_search_vectors') as update:
+            with self.captureOnCommitCallbacks(execute=True):
+                for publication in (self.title_match, self.abstract_match):
+                    publication.abstract = 'Updated'
+                    publication.save()
+                update.assert_not_called()
+
+        update.assert_called_once_with(pks={self.title_match.pk, self.abstract_match.pk})
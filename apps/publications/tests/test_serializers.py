@@ -0,0 +1,76 @@
+from django.test import TestCase
+
+from rest_framework.test import APIRequestFactory
+
+from apps.publications.models import (
+    Author, Publication, PublicationAuthor, PublicationResearchArea, PublicationVenue, ResearchArea, Venue
+)
+from apps.publications.serializers import (
+    PublicationListSerializer, PublicationMinimalSerializer, prefetch_publication_summaries
+)
+from apps.publications.views import PublicationViewSet
+
+
+class PublicationListQueryCountTest(TestCase):
+    """Test cases for the number of queries of publication list serializers"""
+
+    def setUp(self):
+        self.area = ResearchArea.objects.create(name='Machine Learning')
+        self.workshop = Venue.objects.create(name='ML Workshop', type='workshop', tier='workshop')
+        self.conference = Venue.objects.create(name='NeurIPS', short_name='NeurIPS', type='conference', tier='top')
+
+    def add_publications(self, count):
+        for index in range(count):
+            publication = Publication.objects.create(
+                title=f'Paper {Publication.objects.count()}', publication_year=2024, citation_count=index
+            )
+            for order, name in enumerate(['Second', 'First', 'Third'], start=1):
+                author, _ = Author.objects.get_or_create(name=f'{name} {publication.pk}')
+                PublicationAuthor.objects.create(
+                    publication=publication, author=author, author_order=order if name != 'First' else 0,
+                    is_first_author=name == 'First'
+                )
+            PublicationVenue.objects.create(publication=publication, venue=self.workshop)
+            PublicationVenue.objects.create(publication=publication, venue=self.conference)
+            PublicationResearchArea.objects.create(publication=publication, research_area=self.area)
+
+    def serialize(self, serializer_class):
+        return serializer_class(prefetch_publication_summaries(Publication.objects.all()), many=True).data
+
+    def test_query_count_is_constant(self):
+        """Test serializing more publications does not need more queries"""
+        self.add_publications(2)
+        with self.assertNumQueries(4):
+            small = self.serialize(PublicationListSerializer)
+        self.add_publications(8)
+        with self.assertNumQueries(4):
+            large = self.serialize(PublicationListSerializer)
+        with self.assertNumQueries(4):
+            self.serialize(PublicationMinimalSerializer)
+        self.assertEqual((len(small), len(large)), (2, 10))
+
+    def test_list_endpoint_query_count(self):
+        """Test the list endpoint needs the same queries for small and full pages"""
+        self.add_publications(3)
+        view = PublicationViewSet.as_view({'get': 'list'})
+        factory = APIRequestFactory()
+        with self.assertNumQueries(6):
+            view(factory.get('/'))
+        self.add_publications(9)
+        with self.assertNumQueries(6):
+            response = view(factory.get('/'))
+        self.assertEqual(len(response.data['results']), 12)
+
+    def test_summary_fields(self):
+        """Test prefetched relations match the per-object model lookups"""
+        self.add_publications(1)
+        data = self.serialize(PublicationListSerializer)[0]
+        publication_id = data['id']
+
+        self.assertEqual(data['authors'], [f'First {publication_id}', f'Second {publication_id}', f'Third {publication_id}'])
+        self.assertEqual(data['first_author_name'], f'First {publication_id}')
+        self.assertEqual(data['author_count'], 3)
+        primary_venue = Publication.objects.get(pk=publication_id).primary_venue
+        self.assertEqual(data['primary_venue_name'], primary_venue.display_name)
+        self.assertEqual(data['primary_venue_tier'], primary_venue.tier)
+        self.assertEqual(data['research_area_names'], ['Machine Learning'])
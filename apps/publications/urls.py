@@ -3,10 +3,12 @@ from rest_framework.routers import DefaultRouter
 from .views import (
     PublicationViewSet, AuthorViewSet, VenueViewSet,
     ResearchAreaViewSet, LabPublicationStatsViewSet,
-    CollaborationViewSet, ScrapingLogViewSet
+    CollaborationViewSet, ScrapingLogViewSet, ImportJobViewSet
 )
 
 router = DefaultRouter()
+# 빈 prefix의 상세 경로('<pk>/')가 'import-jobs/'를 가리지 않도록 먼저 등록
+router.register(r'import-jobs', ImportJobViewSet, basename='import-job')
 router.register(r'', PublicationViewSet, basename='publication')  # Empty prefix for main endpoint
 router.register(r'authors', AuthorViewSet, basename='author')
 router.register(r'venues', VenueViewSet, basename='venue')
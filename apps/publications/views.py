@@ -4,6 +4,7 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticatedOrReadOnly, AllowAny
 from django_filters.rest_framework import DjangoFilterBackend
+from django.http import StreamingHttpResponse
 from django.utils.decorators import method_decorator
 from django.views.decorators.cache import cache_page
 from django.db.models import Count, Avg, Q, F, Sum
@@ -12,23 +13,59 @@ from datetime import datetime, timedelta
 
 from .models import (
     Publication, Author, Venue, ResearchArea,
-    CitationMetric, Collaboration, LabPublicationStats,
-    PublicationAuthor, PublicationVenue, PublicationResearchArea, ScrapingLog
+    CitationMetric, CoauthorEdge, Collaboration, LabPublicationStats,
+    PublicationAuthor, PublicationVenue, PublicationResearchArea, ScrapingLog, ImportJob
 )
 from .serializers import (
     PublicationMinimalSerializer, PublicationListSerializer, PublicationDetailSerializer,
-    AuthorSerializer, VenueSerializer, ResearchAreaSerializer, ResearchAreaMinimalSerializer,
+    AuthorSerializer, AuthorMinimalSerializer, VenueSerializer, ResearchAreaSerializer, ResearchAreaMinimalSerializer,
     CitationMetricSerializer, CollaborationSerializer,
-    LabPublicationStatsSerializer, ScrapingLogSerializer
+    LabPublicationStatsSerializer, ScrapingLogSerializer, ImportJobSerializer, prefetch_publication_summaries
 )
 from .filters import PublicationFilter, AuthorFilter, VenueFilter
+from .keywords import filter_by_keywords, parse_keyword_list, top_keywords
+from .lab_stats import refresh_lab_publication_stats
+from .citation_velocity import normalize_window, parse_window
+from .collaboration_graph import ego_network, lab_network
+from .export import ANONYMOUS_MAX_ROWS, PublicationExportAnonThrottle, stream_publications
+from .research_area_tree import research_area_tree
+from .scholar_import import import_scholar_publications
+from .import_jobs import enqueue_import_job
+from .ingest import create_publication_with_relations
+from .search import search_publications, search_snippets
 from apps.utils.cache import cache_response
+from apps.utils.cache_warming import PRIORITY_HIGH, PRIORITY_LOW, register_endpoint_warmer
+from apps.utils.fragment_cache import FragmentCacheListMixin, serialize_many
+from apps.utils.pagination import KeysetPaginationMixin
+from apps.utils.cache_keys import (
+    KEYSET_QUERY_PARAMS, filterset_query_params, normalize_choice, normalize_csv, normalize_number,
+    normalize_search
+)
+
+
+# 캐시 키에 포함되는 쿼리 파라미터 (fields=''이면 Minimal serializer)
+PUBLICATION_LIST_QUERY_PARAMS = filterset_query_params(
+    PublicationFilter,
+    fields=normalize_choice(''),
+    years=normalize_csv,
+    keywords_contain=normalize_csv,
+    q=normalize_search,
+    **KEYSET_QUERY_PARAMS,
+)
+PUBLICATION_LAB_QUERY_PARAMS = {
+    'lab': normalize_number(),
+    'fields': normalize_choice(''),
+}
+PUBLICATION_TRENDING_QUERY_PARAMS = {
+    **PUBLICATION_LAB_QUERY_PARAMS,
+    'window': normalize_window,
+}
 
 
 # # @method_decorator(cache_page(60 * 60), name='list')  # Cache list for 1 hour
 # @method_decorator(cache_page(60 * 60 * 2), name='retrieve')  # Cache detail for 2 hours
-class PublicationViewSet(viewsets.ModelViewSet):
-    """논문 관리 ViewSet"""
+class PublicationViewSet(KeysetPaginationMixin, FragmentCacheListMixin, viewsets.ModelViewSet):
+    """논문 관리 ViewSet (?pagination=cursor이면 커서 페이지네이션)"""
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_class = PublicationFilter
@@ -38,14 +75,23 @@ class PublicationViewSet(viewsets.ModelViewSet):
         'created_at', 'title'
     ]
     ordering = ['-publication_year', '-citation_count']
+    cursor_ordering = ('-publication_year', '-citation_count', 'id')
+
+    def get_cursor_ordering(self):
+        # 전문 검색(?q=)은 관련도 순이므로 페이지 번호로만
+        if self.request.query_params.get('q', '').strip():
+            return None
+        return super().get_cursor_ordering()
 
     def get_queryset(self):
-        queryset = Publication.objects.select_related().prefetch_related(
-            'authors', 'venues', 'research_areas', 'labs',
-            'publicationauthor_set__author',
-            'publicationvenue_set__venue'
-        )
-        return queryset
+        if self.action == 'retrieve':
+            return Publication.objects.prefetch_related(
+                'authors', 'venues', 'research_areas', 'labs',
+                'publicationauthor_set__author', 'publicationauthor_set__affiliation_lab',
+                'publicationvenue_set__venue'
+            )
+        # 목록 시리얼라이저용 정렬된 Prefetch (페이지당 쿼리 수 일정)
+        return prefetch_publication_summaries(Publication.objects.all())
 
     def get_serializer_class(self):
         if self.action == 'retrieve':
@@ -57,27 +103,121 @@ class PublicationViewSet(viewsets.ModelViewSet):
             return PublicationMinimalSerializer
         return PublicationListSerializer
 
-    @cache_response('PUBLICATIONS', timeout=60*30)
+    @cache_response('PUBLICATIONS', timeout=60*15, query_params=PUBLICATION_LIST_QUERY_PARAMS)
+    def list(self, request, *args, **kwargs):
+        query = request.query_params.get('q', '').strip()
+        if query:
+            return self.full_text_list(request, query)
+        return super().list(request, *args, **kwargs)
+
+    def full_text_list(self, request, query):
+        """
+        전문 검색 모드 (?q=)
+
+        필터(PublicationFilter)는 그대로 적용되고, 결과는 관련도 순으로
+        정렬됩니다. 각 항목에 search_rank와 하이라이트된 제목/초록
+        (highlight)이 추가됩니다.
+        """
+        queryset = DjangoFilterBackend().filter_queryset(request, self.get_queryset(), self)
+        # 정렬/페이지네이션은 pk, updated_at, 관련도만으로 수행
+        light_queryset = search_publications(
+            queryset.select_related(None).prefetch_related(None).only('pk', 'updated_at'), query
+        )
+
+        page = self.paginate_queryset(light_queryset)
+        objects = page if page is not None else list(light_queryset)
+
+        items = serialize_many(
+            objects, self.get_serializer_class(),
+            lambda pks: self.get_queryset().filter(pk__in=pks),
+            self.get_serializer_context()
+        )
+        items = {item['id']: item for item in items}
+        snippets = search_snippets([obj.pk for obj in objects], query)
+
+        data = []
+        for obj in objects:
+            if obj.pk not in items:
+                continue
+            # 캐시된 fragment는 공유되므로 복사 후 검색 정보 추가
+            item = dict(items[obj.pk])
+            item['search_rank'] = round(float(obj.search_rank), 6)
+            item['highlight'] = snippets.get(obj.pk)
+            data.append(item)
+
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
+
+    @cache_response('PUBLICATIONS', timeout=60*30, stale_ttl=60*15, query_params=PUBLICATION_TRENDING_QUERY_PARAMS)
     @action(detail=False, methods=['get'])
     def trending(self, request):
-        """최근 인기 논문 (최근 인용수 증가율 기준)"""
-        current_year = datetime.now().year
-        trending_papers = self.get_queryset().filter(
-            publication_year__gte=current_year - 3,
-            citation_count__gte=10
-        )
+        """
+        최근 인기 논문 (최근 인용수 증가 속도 기준)
+
+        ?window=30d|90d|365d (기본 90d). 주기 작업이 계산한 CitationVelocity를
+        (window_days, -velocity) 인덱스 순으로 읽습니다 (citation_velocity.py).
+        증가한 논문이 없으면 (속도를 아직 계산하지 않은 경우 포함) 최근 3년
+        논문의 총 인용 수 순위로 대신합니다 (citation_velocity는 null).
+        """
+        try:
+            window = parse_window(request.query_params.get('window'))
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        publications = self.get_queryset()
 
         # Lab 필터링 추가
         lab_id = request.query_params.get('lab')
         if lab_id:
-            trending_papers = trending_papers.filter(labs=lab_id)
+            publications = publications.filter(labs=lab_id)
 
-        trending_papers = trending_papers.order_by('-citation_count', '-publication_year')[:20]
+        papers = list(publications.filter(
+            citation_velocities__window_days=window,
+            citation_velocities__velocity__gt=0,
+        ).annotate(
+            citation_velocity=F('citation_velocities__velocity'),
+            citations_gained=F('citation_velocities__citations_gained'),
+        ).order_by('-citation_velocity', '-citation_count', 'pk')[:20])
+
+        if not papers:
+            current_year = datetime.now().year
+            papers = list(publications.filter(
+                publication_year__gte=current_year - 3,
+                citation_count__gte=10
+            ).order_by('-citation_count', '-publication_year', 'pk')[:20])
+
+        data = self.get_serializer(papers, many=True).data
+        for item, paper in zip(data, papers):
+            item['citation_velocity'] = getattr(paper, 'citation_velocity', None)
+            item['citations_gained'] = getattr(paper, 'citations_gained', None)
+        return Response(data)
+
+    @action(detail=False, methods=['get'], throttle_classes=[PublicationExportAnonThrottle])
+    def export(self, request):
+        """
+        필터된 논문 전체 스트리밍 내보내기 (export.py)
+
+        ?export_format=ndjson(기본)|csv. 필터는 목록 API와 같은 PublicationFilter
+        (lab, professor, year_from 등)이고, 페이지네이션 없이 전부 내보냅니다.
+        익명 요청은 빈도 제한이 있고 ANONYMOUS_MAX_ROWS개까지만 내보냅니다
+        (X-Export-Row-Limit 헤더).
+        """
+        export_format = request.query_params.get('export_format', 'ndjson')
+        queryset = DjangoFilterBackend().filter_queryset(request, Publication.objects.all(), self)
+        max_rows = None if request.user.is_authenticated else ANONYMOUS_MAX_ROWS
+        try:
+            content, content_type = stream_publications(queryset, export_format, max_rows=max_rows)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
-        serializer = self.get_serializer(trending_papers, many=True)
-        return Response(serializer.data)
+        response = StreamingHttpResponse(content, content_type=content_type)
+        response['Content-Disposition'] = f'attachment; filename="publications.{export_format}"'
+        if max_rows is not None:
+            response['X-Export-Row-Limit'] = str(max_rows)
+        return response
 
-    @cache_response('PUBLICATIONS', timeout=60*60)
+    @cache_response('PUBLICATIONS', timeout=60*60, query_params=PUBLICATION_LAB_QUERY_PARAMS)
     @action(detail=False, methods=['get'])
     def top_cited(self, request):
         """가장 많이 인용된 논문들"""
@@ -95,7 +235,7 @@ class PublicationViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(top_papers, many=True)
         return Response(serializer.data)
 
-    @cache_response('PUBLICATIONS', timeout=60*15)
+    @cache_response('PUBLICATIONS', timeout=60*15, query_params=PUBLICATION_LAB_QUERY_PARAMS)
     @action(detail=False, methods=['get'])
     def recent(self, request):
         """최근 발표된 논문들"""
@@ -114,84 +254,93 @@ class PublicationViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(recent_papers, many=True)
         return Response(serializer.data)
 
-    @cache_response('PUBLICATIONS', timeout=60*60*2)
-    @action(detail=False, methods=['get'])
-    def by_lab(self, request):
-        """연구실별 논문 분석"""
+    def get_lab_stats(self, request):
+        """
+        lab_id 파라미터의 연구실 통계 read model (인덱스 조회 1번)
+
+        아직 계산되지 않은 연구실은 여기서 계산해 저장합니다.
+        Returns (lab_id, stats) 또는 (None, 400 Response)
+        """
         lab_id = request.query_params.get('lab_id')
         if not lab_id:
-            return Response(
+            return None, Response(
                 {'error': 'lab_id parameter is required'},
                 status=status.HTTP_400_BAD_REQUEST
             )
+        try:
+            lab_id = int(lab_id)
+        except ValueError:
+            return None, Response(
+                {'error': 'lab_id must be an integer'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
 
-        publications = self.get_queryset().filter(labs=lab_id)
-
-        # 기본 통계
-        total_count = publications.count()
-        total_citations = publications.aggregate(
-            total=Sum('citation_count')
-        )['total'] or 0
+        stats_queryset = LabPublicationStats.objects.select_related('most_cited_paper')
+        stats = stats_queryset.filter(lab_id=lab_id).first()
+        if stats is None:
+            # 조회 경로에서는 캐시를 비우지 않음
+            refresh_lab_publication_stats([lab_id], invalidate=False)
+            # 없는 연구실은 빈 통계
+            stats = stats_queryset.filter(lab_id=lab_id).first() or LabPublicationStats(lab_id=lab_id)
+        return lab_id, stats
 
-        # 연도별 통계
-        yearly_stats = publications.values('publication_year').annotate(
-            count=Count('id'),
-            avg_citations=Avg('citation_count')
-        ).order_by('-publication_year')[:10]
+    @cache_response('PUBLICATIONS', timeout=60*60*2)
+    @action(detail=False, methods=['get'])
+    def by_lab(self, request):
+        """연구실별 논문 분석"""
+        lab_id, stats = self.get_lab_stats(request)
+        if lab_id is None:
+            return stats
+
+        # 연도별 통계 (최근 10개 연도)
+        yearly_stats = [
+            {
+                'publication_year': int(year),
+                'count': bucket['count'],
+                'avg_citations': bucket['citations'] / bucket['count']
+            }
+            for year, bucket in sorted(stats.yearly_histogram.items(), reverse=True)[:10]
+        ]
 
         # 탑 논문들
-        top_papers = publications.order_by('-citation_count')[:10]
+        top_papers = prefetch_publication_summaries(
+            Publication.objects.filter(pk__in=stats.top_publication_ids)
+        ).order_by('-citation_count', 'pk')
         top_papers_data = self.get_serializer(top_papers, many=True).data
 
         return Response({
             'lab_id': lab_id,
-            'total_publications': total_count,
-            'total_citations': total_citations,
-            'avg_citations_per_paper': total_citations / total_count if total_count > 0 else 0,
-            'yearly_statistics': list(yearly_stats),
+            'total_publications': stats.total_publications,
+            'total_citations': stats.total_citations,
+            'avg_citations_per_paper': stats.avg_citations_per_paper,
+            'yearly_statistics': yearly_stats,
             'top_publications': top_papers_data
         })
 
     @action(detail=False, methods=['get'])
     def yearly_stats(self, request):
         """특정 랩의 연도별 논문 개수 통계"""
-        lab_id = request.query_params.get('lab_id')
-        if not lab_id:
-            return Response(
-                {'error': 'lab_id parameter is required'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        lab_id, stats = self.get_lab_stats(request)
+        if lab_id is None:
+            return stats
 
         # 연도 범위 설정 (기본: 최근 10년)
         current_year = datetime.now().year
         start_year = int(request.query_params.get('start_year', current_year - 9))
         end_year = int(request.query_params.get('end_year', current_year))
 
-        # 해당 랩의 논문들 필터링
-        publications = self.get_queryset().filter(
-            labs=lab_id,
-            publication_year__gte=start_year,
-            publication_year__lte=end_year
-        )
-
-        # 연도별 논문 개수 집계
-        yearly_counts = publications.values('publication_year').annotate(
-            count=Count('id')
-        ).order_by('publication_year')
-
-        # 결과를 딕셔너리 형태로 변환
-        yearly_stats = {}
-        for item in yearly_counts:
-            year = str(item['publication_year'])
-            yearly_stats[year] = item['count']
+        yearly_stats = {
+            year: bucket['count']
+            for year, bucket in stats.yearly_histogram.items()
+            if start_year <= int(year) <= end_year
+        }
 
         # 빈 연도들도 0으로 채우기 (선택적)
         fill_empty_years = request.query_params.get('fill_empty', 'true').lower() == 'true'
         if fill_empty_years:
             for year in range(start_year, end_year + 1):
-                year_str = str(year)
-                if year_str not in yearly_stats:
-                    yearly_stats[year_str] = 0
+                yearly_stats.setdefault(str(year), 0)
+        yearly_stats = dict(sorted(yearly_stats.items()))
 
         return Response({
             'lab_id': lab_id,
@@ -206,96 +355,46 @@ class PublicationViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def filters(self, request):
         """특정 랩의 필터 옵션 제공 API"""
-        lab_id = request.query_params.get('lab_id')
-        if not lab_id:
-            return Response(
-                {'error': 'lab_id parameter is required'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-
-        # 해당 랩의 논문들 필터링
-        publications = self.get_queryset().filter(labs=lab_id)
-
-        # 1. 연도 옵션 (발표년도 기준)
-        years = publications.values_list('publication_year', flat=True).distinct().order_by('-publication_year')
-        years_list = [year for year in years if year]
-
-        # 2. 학회/저널 옵션
-        venues = publications.values(
-            'venues__id', 'venues__name', 'venues__short_name', 'venues__type', 'venues__tier'
-        ).distinct().order_by('venues__name')
-        venues_list = []
-        seen_venues = set()
-        for venue in venues:
-            if venue['venues__id'] and venue['venues__id'] not in seen_venues:
-                venues_list.append({
-                    'id': venue['venues__id'],
-                    'name': venue['venues__name'],
-                    'short_name': venue['venues__short_name'] or '',
-                    'type': venue['venues__type'],
-                    'tier': venue['venues__tier']
-                })
-                seen_venues.add(venue['venues__id'])
-
-        # 3. 연구 분야 옵션
-        research_areas = publications.values(
-            'research_areas__id', 'research_areas__name'
-        ).distinct().order_by('research_areas__name')
-        research_areas_list = []
-        seen_areas = set()
-        for area in research_areas:
-            if area['research_areas__id'] and area['research_areas__id'] not in seen_areas:
-                research_areas_list.append({
-                    'id': area['research_areas__id'],
-                    'name': area['research_areas__name']
-                })
-                seen_areas.add(area['research_areas__id'])
-
-        # 4. 학회 티어 옵션
-        venue_tiers = publications.values_list('venues__tier', flat=True).distinct()
-        tiers_list = [tier for tier in venue_tiers if tier and tier != 'unknown']
-
-        # 5. 학회 타입 옵션
-        venue_types = publications.values_list('venues__type', flat=True).distinct()
-        types_list = [vtype for vtype in venue_types if vtype]
+        lab_id, stats = self.get_lab_stats(request)
+        if lab_id is None:
+            return stats
 
+        facets = stats.facets
         return Response({
             'lab_id': lab_id,
             'filters': {
-                'years': years_list,
-                'venues': venues_list,
-                'research_areas': research_areas_list,
-                'venue_tiers': sorted(list(set(tiers_list))),
-                'venue_types': sorted(list(set(types_list)))
+                'years': facets.get('years', []),
+                'venues': facets.get('venues', []),
+                'research_areas': facets.get('research_areas', []),
+                'venue_tiers': facets.get('venue_tiers', []),
+                'venue_types': facets.get('venue_types', [])
             }
         })
 
     @action(detail=False, methods=['get'])
     def stats(self, request):
         """특정 랩의 요약/통계 API"""
-        lab_id = request.query_params.get('lab_id')
-        if not lab_id:
-            return Response(
-                {'error': 'lab_id parameter is required'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-
-        # 해당 랩의 논문들 필터링
-        publications = self.get_queryset().filter(labs=lab_id)
-
-        # 기본 통계
-        total_publications = publications.count()
-        total_citations = publications.aggregate(total=Sum('citation_count'))['total'] or 0
-        avg_citations = total_citations / total_publications if total_publications > 0 else 0
+        lab_id, stats = self.get_lab_stats(request)
+        if lab_id is None:
+            return stats
 
-        # 최근 5년 논문 수
+        # 최근 5년 / 최근 10년 연도별 논문 수 (현재 연도 기준으로 조회 시 계산)
         current_year = datetime.now().year
-        recent_publications = publications.filter(
-            publication_year__gte=current_year - 4
-        ).count()
+        recent_publications = sum(
+            bucket['count'] for year, bucket in stats.yearly_histogram.items()
+            if int(year) >= current_year - 4
+        )
+        yearly_distribution = {
+            year: bucket['count'] for year, bucket in sorted(stats.yearly_histogram.items())
+            if int(year) >= current_year - 9
+        }
+
+        total_publications = stats.total_publications
+        open_access_ratio = (
+            stats.open_access_count / total_publications * 100 if total_publications > 0 else 0
+        )
 
-        # 탑 인용 논문
-        top_cited_paper = publications.order_by('-citation_count').first()
+        top_cited_paper = stats.most_cited_paper
         top_cited_info = None
         if top_cited_paper:
             top_cited_info = {
@@ -305,76 +404,38 @@ class PublicationViewSet(viewsets.ModelViewSet):
                 'publication_year': top_cited_paper.publication_year
             }
 
-        # 주요 학회/저널 (논문 수 기준 상위 5개)
-        top_venues = publications.values(
-            'venues__name', 'venues__type', 'venues__tier'
-        ).annotate(
-            count=Count('id')
-        ).order_by('-count')[:5]
-
-        # 주요 연구 분야 (논문 수 기준 상위 5개)
-        top_research_areas = publications.values(
-            'research_areas__name'
-        ).annotate(
-            count=Count('id')
-        ).order_by('-count')[:5]
-
-        # 연도별 논문 수 (최근 10년)
-        yearly_counts = publications.filter(
-            publication_year__gte=current_year - 9
-        ).values('publication_year').annotate(
-            count=Count('id')
-        ).order_by('publication_year')
-
-        yearly_distribution = {}
-        for item in yearly_counts:
-            if item['publication_year']:
-                yearly_distribution[str(item['publication_year'])] = item['count']
-
-        # 오픈 액세스 논문 비율
-        open_access_count = publications.filter(is_open_access=True).count()
-        open_access_ratio = (open_access_count / total_publications * 100) if total_publications > 0 else 0
-
-        # H-index 계산 (간단 버전)
-        citations_list = list(publications.values_list('citation_count', flat=True).order_by('-citation_count'))
-        h_index = 0
-        for i, citations in enumerate(citations_list, 1):
-            if citations >= i:
-                h_index = i
-            else:
-                break
-
         return Response({
             'lab_id': lab_id,
             'summary': {
                 'total_publications': total_publications,
-                'total_citations': total_citations,
-                'avg_citations_per_paper': round(avg_citations, 2),
+                'total_citations': stats.total_citations,
+                'avg_citations_per_paper': round(stats.avg_citations_per_paper, 2),
                 'recent_publications_5years': recent_publications,
-                'h_index': h_index,
+                'h_index': stats.h_index,
+                'i10_index': stats.i10_index,
                 'open_access_ratio': round(open_access_ratio, 1)
             },
             'top_cited_paper': top_cited_info,
             'top_venues': [
                 {
-                    'name': venue['venues__name'],
-                    'type': venue['venues__type'],
-                    'tier': venue['venues__tier'],
-                    'publication_count': venue['count']
+                    'name': venue['name'],
+                    'type': venue['type'],
+                    'tier': venue['tier'],
+                    'publication_count': venue['publication_count']
                 }
-                for venue in top_venues if venue['venues__name']
+                for venue in stats.top_venues
             ],
             'top_research_areas': [
                 {
-                    'name': area['research_areas__name'],
-                    'publication_count': area['count']
+                    'name': area['name'],
+                    'publication_count': area['publication_count']
                 }
-                for area in top_research_areas if area['research_areas__name']
+                for area in stats.top_research_areas
             ],
             'yearly_distribution': yearly_distribution
         })
 
-    @cache_response('PUBLICATIONS', timeout=60*60)
+    @cache_response('PUBLICATIONS', timeout=60*60, single_flight=True)
     @action(detail=False, methods=['get'])
     def statistics(self, request):
         """전체 논문 통계"""
@@ -460,15 +521,10 @@ class PublicationViewSet(viewsets.ModelViewSet):
         if year_to:
             publications = publications.filter(publication_year__lte=int(year_to))
 
-        # 키워드 필터링
-        keywords = request.query_params.get('keywords')
-        if keywords:
-            keyword_list = [k.strip() for k in keywords.split(',')]
-            q_objects = Q()
-            for keyword in keyword_list:
-                if keyword:
-                    q_objects |= Q(keywords__icontains=keyword)
-            publications = publications.filter(q_objects)
+        # 키워드 필터링 (정규화된 키워드 인덱스)
+        keyword_slugs = parse_keyword_list(request.query_params.get('keywords'))
+        if keyword_slugs:
+            publications = filter_by_keywords(publications, keyword_slugs)
 
         # 기본 통계
         total_count = publications.count()
@@ -483,21 +539,6 @@ class PublicationViewSet(viewsets.ModelViewSet):
             total_citations=Sum('citation_count')
         ).order_by('-publication_year')
 
-        # 키워드별 통계
-        all_keywords = []
-        for pub in publications.values_list('keywords', flat=True):
-            if pub:
-                all_keywords.extend(pub)
-
-        keyword_stats = {}
-        for keyword in all_keywords:
-            if keyword in keyword_stats:
-                keyword_stats[keyword] += 1
-            else:
-                keyword_stats[keyword] = 1
-
-        # 상위 키워드 10개
-        top_keywords = sorted(keyword_stats.items(), key=lambda x: x[1], reverse=True)[:10]
 
         # 탑 논문들
         top_papers = publications.order_by('-citation_count')[:10]
@@ -513,12 +554,13 @@ class PublicationViewSet(viewsets.ModelViewSet):
             'total_citations': total_citations,
             'avg_citations_per_paper': total_citations / total_count if total_count > 0 else 0,
             'yearly_statistics': list(yearly_stats),
-            'top_keywords': [{'keyword': k, 'count': v} for k, v in top_keywords],
+            # 상위 키워드 10개 (SQL 집계)
+            'top_keywords': top_keywords(publications, limit=10),
             'top_publications': top_papers_data,
             'award_publications': award_papers_data
         })
 
-    @cache_response('PUBLICATIONS', timeout=60*30)
+    @cache_response('PUBLICATIONS', timeout=60*30, rendered=True)
     @action(detail=False, methods=['get'])
     def by_keywords(self, request):
         """키워드별 논문 검색 및 분석"""
@@ -529,13 +571,9 @@ class PublicationViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        keyword_list = [k.strip() for k in keywords.split(',')]
-        q_objects = Q()
-        for keyword in keyword_list:
-            if keyword:
-                q_objects |= Q(keywords__icontains=keyword)
-
-        publications = self.get_queryset().filter(q_objects)
+        keyword_list = [k.strip() for k in keywords.split(',') if k.strip()]
+        # 정규화된 키워드 인덱스에서 접두사 일치 (하나라도 일치하면 포함)
+        publications = filter_by_keywords(self.get_queryset(), parse_keyword_list(keywords))
 
         # Lab 필터링
         lab_id = request.query_params.get('lab')
@@ -590,8 +628,7 @@ class PublicationViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['post'])
     def bulk_import_from_scholar(self, request):
-        """Google Scholar에서 스크레이핑한 논문 데이터를 벌크 생성"""
-        from django.db import transaction
+        """Google Scholar에서 스크레이핑한 논문 데이터를 벌크 생성 (scholar_import.py)"""
         from apps.universities.models import Professor
 
         data = request.data
@@ -612,233 +649,99 @@ class PublicationViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_404_NOT_FOUND
             )
 
-        created_count = 0
-        updated_count = 0
-        errors = []
-
-        with transaction.atomic():
-            for pub_data in publications_data:
-                try:
-                    title = pub_data.get('title', '').strip()
-                    if not title:
-                        continue
-
-                    # Check if publication already exists
-                    publication, created = Publication.objects.get_or_create(
-                        title=title,
-                        defaults={
-                            'publication_year': pub_data.get('year'),
-                            'abstract': pub_data.get('abstract', ''),
-                            'citation_count': pub_data.get('citations', 0),
-                            'paper_url': pub_data.get('pub_url', ''),
-                        }
-                    )
-
-                    if created:
-                        created_count += 1
-                    else:
-                        # Update citation count if changed
-                        if pub_data.get('citations', 0) > publication.citation_count:
-                            publication.citation_count = pub_data.get('citations', 0)
-                            publication.save()
-                        updated_count += 1
-
-                    # Link to professor's lab if exists
-                    if professor.lab:
-                        publication.labs.add(professor.lab)
-
-                    # Create or link authors
-                    authors_list = pub_data.get('authors', [])
-                    for idx, author_name in enumerate(authors_list):
-                        if not author_name:
-                            continue
-                        author, _ = Author.objects.get_or_create(
-                            name=author_name.strip(),
-                            defaults={'current_affiliation': pub_data.get('bib', {}).get('venue', '')}
-                        )
-                        PublicationAuthor.objects.get_or_create(
-                            publication=publication,
-                            author=author,
-                            defaults={'author_order': idx + 1}
-                        )
-
-                    # Create or link venue
-                    venue_name = pub_data.get('venue', '').strip()
-                    if venue_name:
-                        venue, _ = Venue.objects.get_or_create(
-                            name=venue_name,
-                            defaults={'type': 'conference', 'tier': 'unknown'}
-                        )
-                        PublicationVenue.objects.get_or_create(
-                            publication=publication,
-                            venue=venue
-                        )
-
-                except Exception as e:
-                    errors.append({'title': pub_data.get('title', 'Unknown'), 'error': str(e)})
-                    continue
+        if not isinstance(publications_data, list):
+            return Response(
+                {'error': 'publications must be a list'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # async=true: 작업만 만들고 job id 반환 (import-jobs/{id}/로 진행 상황 조회)
+        if wants_async(request):
+            job = enqueue_import_job('scholar', publications_data, professor=professor)
+            return queued_job_response(job)
+
+        # 검증 오류는 항목별로 보고하고, 나머지는 한 트랜잭션에서 일괄 저장
+        result = import_scholar_publications(professor, publications_data)
 
         return Response({
             'message': 'Bulk import completed',
-            'created': created_count,
-            'updated': updated_count,
+            'created': result['created'],
+            'updated': result['updated'],
             'total_processed': len(publications_data),
-            'errors': errors
+            'errors': result['errors']
         }, status=status.HTTP_201_CREATED)
 
     @action(detail=False, methods=['post'])
     def create_with_relations(self, request):
-        """논문과 모든 관련 데이터를 한번에 생성"""
-        from django.db import transaction
-        from apps.labs.models import Lab
-        from apps.professors.models import Professor
-
+        """논문과 모든 관련 데이터를 한번에 생성 (ingest.py)"""
         data = request.data
 
-        # 필수 필드 검증
-        required_fields = ['title', 'publication_year']
-        for field in required_fields:
-            if field not in data:
-                return Response(
-                    {'error': f'{field} is required'},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
+        if wants_async(request):
+            job = enqueue_import_job('relations', [data])
+            return queued_job_response(job)
 
         try:
-            with transaction.atomic():
-                # 1. 논문 기본 정보 생성
-                publication_data = {
-                    'title': data['title'],
-                    'publication_year': data['publication_year'],
-                    'abstract': data.get('abstract', ''),
-                    'doi': data.get('doi', ''),
-                    'arxiv_id': data.get('arxiv_id', ''),
-                    'citation_count': data.get('citation_count', 0),
-                    'keywords': data.get('keywords', []),
-                    'additional_notes': data.get('additional_notes', ''),
-                    'paper_url': data.get('paper_url', ''),
-                    'code_url': data.get('code_url', ''),
-                    'video_url': data.get('video_url', ''),
-                    'dataset_url': data.get('dataset_url', ''),
-                    'slides_url': data.get('slides_url', ''),
-                    'is_open_access': data.get('is_open_access', False),
-                    'language': data.get('language', 'en'),
-                    'page_count': data.get('page_count'),
-                }
-
-                if data.get('publication_date'):
-                    from datetime import datetime
-                    publication_data['publication_date'] = datetime.strptime(
-                        data['publication_date'], '%Y-%m-%d'
-                    ).date()
-
-                publication = Publication.objects.create(**publication_data)
-
-                # 2. 연구실 연결 (lab_id가 제공된 경우)
-                lab_ids = data.get('lab_ids', [])
-                if data.get('lab_id'):  # 단일 lab_id 지원
-                    lab_ids.append(data['lab_id'])
-
-                for lab_id in lab_ids:
-                    try:
-                        lab = Lab.objects.get(id=lab_id)
-                        publication.labs.add(lab)
-                    except Lab.DoesNotExist:
-                        return Response(
-                            {'error': f'Lab with id {lab_id} not found'},
-                            status=status.HTTP_400_BAD_REQUEST
-                        )
-
-                # 3. 저자 정보 처리
-                authors_data = data.get('authors', [])
-                for i, author_data in enumerate(authors_data):
-                    # 기존 저자 찾기 또는 새로 생성
-                    author_name = author_data.get('name')
-                    author_email = author_data.get('email', '')
-
-                    if not author_name:
-                        continue
-
-                    author, created = Author.objects.get_or_create(
-                        name=author_name,
-                        defaults={
-                            'email': author_email,
-                            'current_affiliation': author_data.get('affiliation', ''),
-                            'current_position': author_data.get('position', ''),
-                        }
-                    )
-
-                    # 논문-저자 관계 생성
-                    PublicationAuthor.objects.create(
-                        publication=publication,
-                        author=author,
-                        author_order=author_data.get('order', i + 1),
-                        is_first_author=author_data.get('is_first_author', i == 0),
-                        is_corresponding=author_data.get('is_corresponding', False),
-                        is_last_author=author_data.get('is_last_author', False),
-                        affiliation=author_data.get('affiliation', ''),
-                        affiliation_lab_id=author_data.get('lab_id')
-                    )
-
-                # 4. 학회/저널 정보 처리
-                venues_data = data.get('venues', [])
-                for venue_data in venues_data:
-                    venue_name = venue_data.get('name')
-                    if not venue_name:
-                        continue
-
-                    venue, created = Venue.objects.get_or_create(
-                        name=venue_name,
-                        type=venue_data.get('type', 'conference'),
-                        defaults={
-                            'short_name': venue_data.get('short_name', ''),
-                            'tier': venue_data.get('tier', 'unknown'),
-                            'field': venue_data.get('field', ''),
-                        }
-                    )
-
-                    # 논문-학회 관계 생성
-                    PublicationVenue.objects.create(
-                        publication=publication,
-                        venue=venue,
-                        presentation_type=venue_data.get('presentation_type', 'poster'),
-                        is_best_paper=venue_data.get('is_best_paper', False),
-                        is_best_student_paper=venue_data.get('is_best_student_paper', False),
-                        is_outstanding_paper=venue_data.get('is_outstanding_paper', False),
-                        award_name=venue_data.get('award_name', ''),
-                    )
-
-                # 5. 연구 분야 연결
-                research_areas = data.get('research_areas', [])
-                for area_name in research_areas:
-                    area, created = ResearchArea.objects.get_or_create(
-                        name=area_name,
-                        defaults={'description': f'{area_name} 연구 분야'}
-                    )
-                    PublicationResearchArea.objects.create(
-                        publication=publication,
-                        research_area=area,
-                        relevance_score=1.0
-                    )
-
-                # 6. 응답 데이터 생성
-                serializer = PublicationDetailSerializer(publication)
-                return Response({
-                    'message': 'Publication created successfully with all relations',
-                    'publication': serializer.data
-                }, status=status.HTTP_201_CREATED)
-
+            publication, created = create_publication_with_relations(data)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
             return Response(
                 {'error': f'Failed to create publication: {str(e)}'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+        serializer = PublicationDetailSerializer(publication)
+        if not created:
+            # DOI/arXiv id/제목 지문이 같은 논문이 이미 있음
+            return Response({
+                'message': 'Publication already exists',
+                'publication': serializer.data
+            }, status=status.HTTP_200_OK)
+        return Response({
+            'message': 'Publication created successfully with all relations',
+            'publication': serializer.data
+        }, status=status.HTTP_201_CREATED)
+
+
+def wants_async(request):
+    """async 파라미터 (쿼리 또는 본문)가 참이면 가져오기 작업으로 처리"""
+    value = request.query_params.get('async', request.data.get('async') if isinstance(request.data, dict) else None)
+    return str(value).lower() in ('1', 'true', 'yes')
+
+
+def int_query_param(request, name, default, maximum=None):
+    """정수 쿼리 파라미터 (1 이상, maximum으로 제한, 잘못된 값이면 ValueError)"""
+    value = request.query_params.get(name)
+    if value in (None, ''):
+        return default
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f'{name} must be a positive integer')
+    if number < 1:
+        raise ValueError(f'{name} must be a positive integer')
+    return min(number, maximum) if maximum is not None else number
+
+
+def queued_job_response(job):
+    return Response({
+        'message': 'Import job queued',
+        'job': ImportJobSerializer(job).data
+    }, status=status.HTTP_202_ACCEPTED)
+
+
+# 캐시 워밍 대상 엔드포인트 (배포/무효화 후 미리 재생성)
+register_endpoint_warmer('publication-statistics', namespaces=['PUBLICATIONS'], priority=PRIORITY_HIGH)
+register_endpoint_warmer('publication-list', namespaces=['PUBLICATIONS'])
+register_endpoint_warmer('publication-trending', namespaces=['PUBLICATIONS'])
+register_endpoint_warmer('publication-top-cited', namespaces=['PUBLICATIONS'])
+register_endpoint_warmer('publication-recent', namespaces=['PUBLICATIONS'])
+
 
 # @method_decorator(cache_page(60 * 60 * 6), name='list')  # Cache list for 6 hours
 # @method_decorator(cache_page(60 * 60 * 12), name='retrieve')  # Cache detail for 12 hours
-class AuthorViewSet(viewsets.ModelViewSet):
-    """저자 관리 ViewSet"""
+class AuthorViewSet(KeysetPaginationMixin, viewsets.ModelViewSet):
+    """저자 관리 ViewSet (?pagination=cursor이면 커서 페이지네이션)"""
     queryset = Author.objects.all()
     serializer_class = AuthorSerializer
     permission_classes = [AllowAny]
@@ -847,6 +750,7 @@ class AuthorViewSet(viewsets.ModelViewSet):
     search_fields = ['name', 'current_affiliation', 'bio']
     ordering_fields = ['name', 'total_citations', 'h_index', 'created_at']
     ordering = ['-total_citations', 'name']
+    cursor_ordering = ('-total_citations', 'name', 'id')
 
     @cache_response('AUTHORS', timeout=60*60)
     @action(detail=False, methods=['get'])
@@ -871,7 +775,7 @@ class AuthorViewSet(viewsets.ModelViewSet):
     def publications(self, request, pk=None):
         """특정 저자의 논문들"""
         author = self.get_object()
-        publications = author.publications.all().order_by('-publication_year')
+        publications = prefetch_publication_summaries(author.publications.all().order_by('-publication_year'))
 
         page = self.paginate_queryset(publications)
         if page is not None:
@@ -884,28 +788,48 @@ class AuthorViewSet(viewsets.ModelViewSet):
     @cache_response('AUTHORS', timeout=60*60)
     @action(detail=True, methods=['get'])
     def collaborators(self, request, pk=None):
-        """공동 저자들"""
+        """공동 저자들 (공저자 간선 테이블, ?limit=20 최대 100)"""
         author = self.get_object()
+        try:
+            limit = int_query_param(request, 'limit', default=20, maximum=100)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        edges = CoauthorEdge.objects.filter(author=author).select_related('coauthor').order_by(
+            '-paper_count', 'coauthor_id'
+        )[:limit]
+
+        return Response([
+            {
+                'author': AuthorMinimalSerializer(edge.coauthor).data,
+                'collaboration_count': edge.paper_count,
+                'first_year': edge.first_year,
+                'last_year': edge.last_year,
+            }
+            for edge in edges
+        ])
 
-        # 같은 논문에 참여한 저자들
-        collaborator_ids = author.publications.values_list(
-            'authors', flat=True
-        ).distinct().exclude(id=author.id)
+    @cache_response('AUTHORS', timeout=60*60)
+    @action(detail=True, methods=['get'])
+    def network(self, request, pk=None):
+        """
+        저자 중심 공저자 네트워크
 
-        collaborators = Author.objects.filter(
-            id__in=collaborator_ids
-        ).annotate(
-            collaboration_count=Count('publications', filter=Q(publications__authors=author))
-        ).order_by('-collaboration_count')[:20]
-
-        collaborator_data = []
-        for collaborator in collaborators:
-            collaborator_data.append({
-                'author': AuthorSerializer(collaborator).data,
-                'collaboration_count': collaborator.collaboration_count
-            })
+        ?depth=1|2 (기본 1), max_nodes (기본 50, 최대 500),
+        max_edges (기본 200, 최대 2000), min_papers (기본 1)
+        """
+        author = self.get_object()
+        try:
+            params = {
+                'depth': int_query_param(request, 'depth', default=1, maximum=2),
+                'max_nodes': int_query_param(request, 'max_nodes', default=50, maximum=500),
+                'max_edges': int_query_param(request, 'max_edges', default=200, maximum=2000),
+                'min_papers': int_query_param(request, 'min_papers', default=1),
+            }
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
-        return Response(collaborator_data)
+        return Response(dict(ego_network(author.pk, **params), author_id=author.pk))
 
 
 # @method_decorator(cache_page(60 * 60 * 12), name='list')  # Cache list for 12 hours
@@ -944,7 +868,7 @@ class VenueViewSet(viewsets.ModelViewSet):
     def publications(self, request, pk=None):
         """특정 학회의 논문들"""
         venue = self.get_object()
-        publications = venue.publications.all().order_by('-publication_year')
+        publications = prefetch_publication_summaries(venue.publications.all().order_by('-publication_year'))
 
         page = self.paginate_queryset(publications)
         if page is not None:
@@ -968,6 +892,8 @@ class ResearchAreaViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         """Filter research areas by department if specified"""
         queryset = ResearchArea.objects.select_related('department').filter(department__isnull=False)
+        if self.action in ('list', 'retrieve'):
+            queryset = queryset.annotate(children_total=Count('children'))
 
         # Filter by department if specified
         department_id = self.request.query_params.get('department', None)
@@ -986,29 +912,21 @@ class ResearchAreaViewSet(viewsets.ModelViewSet):
     @cache_response('RESEARCH_AREAS', timeout=60*60*6)
     @action(detail=False, methods=['get'])
     def hierarchy(self, request):
-        """계층적 연구 분야 구조"""
-        root_areas = self.get_queryset().filter(parent__isnull=True)
-
-        def build_tree(area):
-            children = area.children.all()
-            return {
-                'id': area.id,
-                'name': area.name,
-                'description': area.description,
-                'color_code': area.color_code,
-                'publication_count': area.publications.count(),
-                'children': [build_tree(child) for child in children]
-            }
+        """
+        계층적 연구 분야 구조 (research_area_tree.py)
 
-        hierarchy_data = [build_tree(area) for area in root_areas]
-        return Response(hierarchy_data)
+        트리 전체와 분야별 / 하위 트리 논문 수를 노드 수와 관계없이 쿼리
+        3번으로 읽어 메모리에서 조립합니다.
+        """
+        root_ids = self.get_queryset().filter(parent__isnull=True).values_list('id', flat=True)
+        return Response(research_area_tree(root_ids))
 
     @cache_response('RESEARCH_AREAS', timeout=60*60*2)
     @action(detail=True, methods=['get'])
     def publications(self, request, pk=None):
         """특정 연구 분야의 논문들"""
         area = self.get_object()
-        publications = area.publications.all().order_by('-publication_year')
+        publications = prefetch_publication_summaries(area.publications.all().order_by('-publication_year'))
 
         page = self.paginate_queryset(publications)
         if page is not None:
@@ -1033,7 +951,7 @@ class LabPublicationStatsViewSet(viewsets.ReadOnlyModelViewSet):
     ]
     ordering = ['-total_citations']
 
-    @cache_response('LAB_STATS', timeout=60*60*2)
+    @cache_response('LAB_STATS', timeout=60*60*2, stale_ttl=60*30)
     @action(detail=False, methods=['get'])
     def rankings(self, request):
         """연구실 랭킹"""
@@ -1069,36 +987,30 @@ class CollaborationViewSet(viewsets.ReadOnlyModelViewSet):
     @cache_response('COLLABORATIONS', timeout=60*60)
     @action(detail=False, methods=['get'])
     def network(self, request):
-        """공동연구 네트워크 분석"""
-        min_collaborations = int(request.query_params.get('min_collaborations', 2))
+        """
+        공동연구 네트워크 분석
 
-        collaborations = self.get_queryset().filter(
-            collaboration_count__gte=min_collaborations
-        )
-
-        # 네트워크 데이터 구성
-        nodes = set()
-        edges = []
-
-        for collab in collaborations:
-            lab_name = collab.lab.name
-            collaborator_name = collab.collaborator_name
+        연구실 간 공동 논문 간선(LabCollaborationEdge)과 외부 공동연구를 무게 순으로
+        ?max_nodes (기본 100, 최대 500), max_edges (기본 300, 최대 2000)까지.
+        ?lab=<id>이면 그 연구실의 간선만.
+        """
+        try:
+            min_collaborations = int_query_param(request, 'min_collaborations', default=2)
+            lab_id = int_query_param(request, 'lab', default=None)
+            max_nodes = int_query_param(request, 'max_nodes', default=100, maximum=500)
+            max_edges = int_query_param(request, 'max_edges', default=300, maximum=2000)
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
-            nodes.add(lab_name)
-            nodes.add(collaborator_name)
+        network = lab_network(min_collaborations, lab_id=lab_id, max_nodes=max_nodes, max_edges=max_edges)
+        return Response(dict(network, min_collaborations=min_collaborations))
 
-            edges.append({
-                'source': lab_name,
-                'target': collaborator_name,
-                'weight': collab.collaboration_count,
-                'type': collab.collaborator_type
-            })
 
-        return Response({
-            'nodes': [{'id': node, 'name': node} for node in nodes],
-            'edges': edges,
-            'min_collaborations': min_collaborations
-        })
+register_endpoint_warmer('author-top-cited', namespaces=['AUTHORS'], priority=PRIORITY_LOW)
+register_endpoint_warmer('venue-top-tier', namespaces=['VENUES'], priority=PRIORITY_LOW)
+register_endpoint_warmer('research-area-hierarchy', namespaces=['RESEARCH_AREAS'], priority=PRIORITY_LOW)
+register_endpoint_warmer('lab-stats-rankings', namespaces=['LAB_STATS'], priority=PRIORITY_LOW)
+register_endpoint_warmer('collaboration-network', namespaces=['COLLABORATIONS'], priority=PRIORITY_LOW)
 
 
 class ScrapingLogViewSet(viewsets.ModelViewSet):
@@ -1136,3 +1048,54 @@ class ScrapingLogViewSet(viewsets.ModelViewSet):
             'total_publications_scraped': total_publications
         })
 
+
+class ImportJobViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    논문 가져오기 작업 ViewSet
+
+    POST로 작업을 만들면 바로 202와 job id를 반환하고, 워커
+    (process_import_jobs)가 처리합니다. GET import-jobs/{id}/로 진행 상황,
+    건수, 항목별 오류를 조회합니다.
+    """
+    queryset = ImportJob.objects.all()
+    serializer_class = ImportJobSerializer
+    permission_classes = [AllowAny]
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
+    filterset_fields = ['kind', 'status', 'professor']
+    ordering = ['-created_at']
+
+    def create(self, request):
+        from apps.universities.models import Professor
+
+        kind = request.data.get('kind', 'scholar')
+        items = request.data.get('publications', [])
+        if kind not in dict(ImportJob.KIND_CHOICES):
+            return Response(
+                {'error': f'kind must be one of {", ".join(dict(ImportJob.KIND_CHOICES))}'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if not isinstance(items, list):
+            return Response(
+                {'error': 'publications must be a list'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        professor = None
+        professor_id = request.data.get('professor_id')
+        if kind == 'scholar' and not professor_id:
+            return Response(
+                {'error': 'professor_id is required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if professor_id:
+            try:
+                professor = Professor.objects.get(id=professor_id)
+            except Professor.DoesNotExist:
+                return Response(
+                    {'error': f'Professor with id {professor_id} not found'},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+
+        job = enqueue_import_job(kind, items, professor=professor)
+        return queued_job_response(job)
+
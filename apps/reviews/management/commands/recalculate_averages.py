@@ -7,6 +7,7 @@ from django.core.management.base import BaseCommand
 from django.db import transaction
 from apps.labs.models import Lab, LabCategoryAverage
 from apps.reviews.models import RatingCategory
+from apps.utils.invalidation import batch_invalidations
 import time
 
 
@@ -39,12 +40,14 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         start_time = time.time()
 
-        if options['lab_id']:
-            self.recalculate_lab(options['lab_id'], options['dry_run'])
-        elif options['category_id']:
-            self.recalculate_category(options['category_id'], options['dry_run'])
-        else:
-            self.recalculate_all(options['dry_run'], options['batch_size'])
+        # Every saved average/lab would invalidate caches; flush once at the end instead
+        with batch_invalidations():
+            if options['lab_id']:
+                self.recalculate_lab(options['lab_id'], options['dry_run'])
+            elif options['category_id']:
+                self.recalculate_category(options['category_id'], options['dry_run'])
+            else:
+                self.recalculate_all(options['dry_run'], options['batch_size'])
 
         elapsed_time = time.time() - start_time
         self.stdout.write(
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0008_auto_20251025_1136'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['-helpful_count', '-created_at', 'id'], name='review_keyset_idx'),
+        ),
+    ]
@@ -1,7 +1,6 @@
 
 # apps/reviews/models.py
 from django.db import models
-from django.db.models import Q
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.contrib.auth import get_user_model
 
@@ -94,6 +93,10 @@ class Review(models.Model):
         db_table = 'reviews'
         ordering = ['-helpful_count', '-created_at']
         unique_together = ['professor', 'user']
+        indexes = [
+            # Keyset pagination (ReviewViewSet.cursor_ordering)
+            models.Index(fields=['-helpful_count', '-created_at', 'id'], name='review_keyset_idx'),
+        ]
 
     def __str__(self):
         lab_context = f" in {self.lab.name}" if self.lab else ""
@@ -109,25 +112,27 @@ class Review(models.Model):
 
     def set_category_ratings(self, ratings_dict):
         """Set category ratings from a dictionary"""
-        from apps.reviews.models import RatingCategory
+        from apps.utils.cache import CacheManager
+
+        # Active categories by display name or name (cached, no query per category)
+        category_ids = {}
+        for category in CacheManager.get_rating_categories():
+            category_ids[category['name']] = category['id']
+            category_ids[category['display_name']] = category['id']
 
         # Clear existing ratings for this review
         self.category_ratings.all().delete()
 
         # Create new ratings
         for category_name, rating_value in ratings_dict.items():
-            try:
-                category = RatingCategory.objects.get(
-                    Q(display_name=category_name) | Q(name=category_name),
-                    is_active=True
-                )
-                ReviewRating.objects.create(
-                    review=self,
-                    category=category,
-                    rating=rating_value
-                )
-            except RatingCategory.DoesNotExist:
+            category_id = category_ids.get(category_name)
+            if category_id is None:
                 continue
+            ReviewRating.objects.create(
+                review=self,
+                category_id=category_id,
+                rating=rating_value
+            )
 
     @classmethod
     def get_active_categories(cls):
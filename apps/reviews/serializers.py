@@ -3,6 +3,7 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from .models import Review, ReviewHelpful, RatingCategory, ReviewRating
+from apps.utils.cache import CacheManager
 
 User = get_user_model()
 
@@ -50,8 +51,7 @@ class ReviewSerializer(serializers.ModelSerializer):
 
     def validate_ratings_input(self, value):
         """Validate the category ratings input"""
-        active_categories = RatingCategory.objects.filter(is_active=True)
-        active_category_names = set(cat.display_name for cat in active_categories)
+        active_category_names = CacheManager.get_active_rating_category_names()
 
         for category_name, rating in value.items():
             if category_name not in active_category_names:
@@ -8,20 +8,28 @@ from rest_framework.exceptions import ValidationError
 from django.db import IntegrityError
 from django.db.models import F, Avg
 from django.shortcuts import get_object_or_404
-from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
 from django.views.decorators.vary import vary_on_headers
 from .models import Review, ReviewHelpful, RatingCategory, ReviewRating
 from .serializers import ReviewSerializer, ReviewHelpfulSerializer, RatingCategorySerializer
 from .permissions import IsOwnerOrReadOnly
-from apps.utils.cache import cache_response
+from apps.utils.cache import cache_api_view, cache_response, CacheManager
+from apps.utils.cache_warming import PRIORITY_CRITICAL, register_endpoint_warmer
+from apps.utils.pagination import KeysetPaginationMixin
 
-@method_decorator(cache_page(60 * 15), name='list')  # Cache list for 15 minutes
-@method_decorator(cache_page(60 * 30), name='retrieve')  # Cache detail for 30 minutes
-class ReviewViewSet(viewsets.ModelViewSet):
+class ReviewViewSet(KeysetPaginationMixin, viewsets.ModelViewSet):
     serializer_class = ReviewSerializer
     permission_classes = [IsAuthenticatedOrReadOnly, IsOwnerOrReadOnly]
-    
+    # ?pagination=cursor pages by the default ordering instead of page numbers
+    cursor_ordering = ('-helpful_count', '-created_at', 'id')
+
+    @cache_response('REVIEWS', timeout=60 * 15)  # Cache list for 15 minutes
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @cache_response('REVIEWS', timeout=60 * 30)  # Cache detail for 30 minutes
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
     def get_queryset(self):
         queryset = Review.objects.select_related('user', 'lab', 'professor').prefetch_related(
             'category_ratings__category'
@@ -127,24 +135,36 @@ class ReviewViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-@method_decorator(cache_page(60 * 60 * 12), name='list')  # Cache list for 12 hours
-@method_decorator(cache_page(60 * 60 * 12), name='retrieve')  # Cache detail for 12 hours
+register_endpoint_warmer('review-list', namespaces=['REVIEWS'])
+
+
 class RatingCategoryViewSet(viewsets.ReadOnlyModelViewSet):
     """ViewSet for rating categories - read-only for API consumers"""
     serializer_class = RatingCategorySerializer
     permission_classes = [AllowAny]
 
+    @cache_response('RATING_CATEGORIES', timeout=60 * 60 * 12)  # Cache list for 12 hours
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @cache_response('RATING_CATEGORIES', timeout=60 * 60 * 12)  # Cache detail for 12 hours
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
     def get_queryset(self):
         return RatingCategory.objects.filter(is_active=True).order_by('sort_order')
 
 
+register_endpoint_warmer('rating-category-list', namespaces=['RATING_CATEGORIES'], priority=PRIORITY_CRITICAL)
+
+
 @api_view(['GET'])
 @permission_classes([AllowAny])
-@cache_page(60 * 60 * 12)  # Cache for 12 hours
+@cache_api_view('RATING_CATEGORIES', timeout=60 * 60 * 12)  # Cache for 12 hours
 def get_review_categories(request):
     """Get available review categories for rating labs"""
-    categories = RatingCategory.objects.filter(is_active=True).order_by('sort_order')
-    category_names = [cat.display_name for cat in categories]
+    categories = CacheManager.get_rating_categories()
+    category_names = [cat['display_name'] for cat in categories]
 
     return Response({
         'categories': category_names,
@@ -154,7 +174,7 @@ def get_review_categories(request):
 
 @api_view(['GET'])
 @permission_classes([AllowAny])
-@cache_page(60 * 15)  # Cache for 15 minutes
+@cache_api_view('REVIEWS', timeout=60 * 15)  # Cache for 15 minutes
 def get_lab_rating_averages(request, lab_id):
     """Get precomputed category-wise rating averages for a specific lab"""
     from apps.labs.models import Lab, LabCategoryAverage
@@ -200,7 +220,7 @@ def get_lab_rating_averages(request, lab_id):
 
 @api_view(['GET'])
 @permission_classes([AllowAny])
-@cache_page(60 * 15)  # Cache for 15 minutes
+@cache_api_view('REVIEWS', timeout=60 * 15)  # Cache for 15 minutes
 def compare_labs_averages(request):
     """Compare multiple labs by their category averages"""
     from apps.labs.models import Lab, LabCategoryAverage
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('universities', '0008_professor_scholar_id'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='professor',
+            name='h_index',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='professor',
+            name='i10_index',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='professor',
+            name='total_citations',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -180,6 +180,11 @@ class Professor(models.Model):
         help_text='Cached count of active reviews'
     )
 
+    # Citation metrics of the Google Scholar profile (publications.citation_metrics)
+    total_citations = models.PositiveIntegerField(default=0)
+    h_index = models.PositiveIntegerField(default=0)
+    i10_index = models.PositiveIntegerField(default=0)
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -204,7 +209,7 @@ class Professor(models.Model):
         else:
             self.overall_rating = 0
             self.review_count = 0
-        self.save(update_fields=['overall_rating', 'review_count'])
+        self.save(update_fields=['overall_rating', 'review_count', 'updated_at'])
 
 
 class UniversityEmailDomain(models.Model):
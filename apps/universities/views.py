@@ -12,6 +12,8 @@ from .models import University, Professor, ResearchGroup, UniversityDepartment,
 from .serializers import UniversityMinimalSerializer, UniversitySerializer, ProfessorMinimalSerializer, ProfessorSerializer, ResearchGroupMinimalSerializer, ResearchGroupSerializer, UniversityDepartmentMinimalSerializer, UniversityDepartmentSerializer, DepartmentSerializer, DepartmentMinimalSerializer
 from .filters import ProfessorFilter
 from apps.utils.cache import cache_response, CacheManager
+from apps.utils.cache_warming import PRIORITY_CRITICAL, register_endpoint_warmer
+from apps.utils.fragment_cache import FragmentCacheListMixin
 
 class UniversityViewSet(viewsets.ModelViewSet):
     queryset = University.objects.all()
@@ -22,7 +24,7 @@ class UniversityViewSet(viewsets.ModelViewSet):
     ordering_fields = ['name', 'ranking']
     ordering = ['name']
 
-    @cache_response('UNIVERSITIES', timeout=60*60*24)  # Cache for 24 hours
+    @cache_response('UNIVERSITIES', timeout=60*60*24, single_flight=True, local=True)  # Cache for 24 hours
     def list(self, request, *args, **kwargs):
         """Override list to add caching for university list"""
         return super().list(request, *args, **kwargs)
@@ -181,7 +183,7 @@ class UniversityViewSet(viewsets.ModelViewSet):
                 else:
                     return Response({"error": "Either department_name or department ID is required"}, status=400)
 
-    @cache_response('PROFESSORS')
+    @cache_response('PROFESSORS', rendered=True)
     @action(detail=True, methods=['get'])
     def professors(self, request, pk=None):
         """Get all professors in a university"""
@@ -207,6 +209,9 @@ class UniversityViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
+register_endpoint_warmer('university-list', namespaces=['UNIVERSITIES'], priority=PRIORITY_CRITICAL)
+
+
 class ResearchGroupViewSet(viewsets.ModelViewSet):
     queryset = ResearchGroup.objects.select_related(
         'university_department__university',
@@ -250,7 +255,7 @@ class ResearchGroupViewSet(viewsets.ModelViewSet):
         return Response(serializer.data)
 
 
-class ProfessorViewSet(viewsets.ModelViewSet):
+class ProfessorViewSet(FragmentCacheListMixin, viewsets.ModelViewSet):
     permission_classes = [AllowAny]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_class = ProfessorFilter
@@ -1,10 +1,118 @@
 # apps/utils/cache.py
+import copy
 import hashlib
+import logging
+import math
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 from django.core.cache import cache
+from django.db import connections
 from django.conf import settings
+from django.utils.cache import patch_cache_control, patch_vary_headers
 from django.utils.encoding import force_bytes
+from django.utils.http import parse_etags
 from functools import wraps
 import json
+from .cache_keys import canonical_query_string
+from .cache_metrics import cache_metrics
+from .cache_warming import PRIORITY_CRITICAL, register_warmer, schedule_warming, warm_caches
+from .invalidation import invalidate_namespaces
+from .local_cache import local_cache
+
+
+logger = logging.getLogger(__name__)
+
+
+# Cache namespaces (the cache_type / key prefix used across the apps).
+# Every namespace has a generation counter that is folded into its keys;
+# bumping the counter invalidates the whole namespace in O(1).
+CACHE_NAMESPACES = [
+    'UNIVERSITIES', 'DEPARTMENTS', 'PROFESSORS', 'LABS', 'REVIEWS',
+    'RESEARCH_GROUPS', 'USER_PROFILE', 'SEARCH_RESULTS',
+    'PUBLICATIONS', 'AUTHORS', 'VENUES', 'RESEARCH_AREAS',
+    'LAB_STATS', 'COLLABORATIONS', 'RATING_CATEGORIES',
+    'FRAGMENTS',  # Per-object serialized fragments (see fragment_cache)
+]
+
+# Namespaces to invalidate when a model changes
+MODEL_CACHE_DEPENDENCIES = {
+    # University/department/group names are shown in every lab and professor fragment
+    'university': ['UNIVERSITIES', 'DEPARTMENTS', 'PROFESSORS', 'LABS', 'FRAGMENTS'],
+    'department': ['DEPARTMENTS', 'PROFESSORS', 'LABS', 'FRAGMENTS'],
+    'professor': ['PROFESSORS', 'LABS'],
+    'research_group': ['RESEARCH_GROUPS', 'PROFESSORS', 'LABS', 'FRAGMENTS'],
+    'lab': ['LABS', 'REVIEWS', 'LAB_STATS'],
+    'review': ['REVIEWS', 'LABS', 'PROFESSORS'],  # Labs/professors cache includes ratings
+    'publication': ['PUBLICATIONS', 'AUTHORS', 'VENUES', 'RESEARCH_AREAS', 'LAB_STATS'],
+    'rating_category': ['RATING_CATEGORIES', 'REVIEWS'],
+    # The hierarchy endpoint shows per-area and subtree publication counts
+    'research_area': ['RESEARCH_AREAS'],
+}
+
+GENERATION_KEY_PREFIX = 'cache_generation'
+
+# Single-flight recomputation (see cache_response)
+SINGLE_FLIGHT_LOCK_TIMEOUT = 30      # Max seconds a recompute may hold the lock
+SINGLE_FLIGHT_WAIT_TIMEOUT = 3       # Max seconds other workers wait for the result
+SINGLE_FLIGHT_POLL_INTERVAL = 0.05
+
+# Stale-while-revalidate background refreshes (see cache_response)
+BACKGROUND_REFRESH_WORKERS = 2
+
+_refresh_executor = None
+
+
+def _generation_key(namespace):
+    return f"{GENERATION_KEY_PREFIX}:{namespace}"
+
+
+def _initial_generation():
+    # Seeded from the clock so a counter that was evicted (or lost on a
+    # Redis restart) never comes back with a value used before.
+    return int(time.time() * 1000)
+
+
+def get_namespace_generation(namespace):
+    """Return the current generation counter for a cache namespace"""
+    use_local = _local_cache_enabled()
+    if use_local:
+        generation = local_cache.get_generation(namespace)
+        if generation is not None:
+            return generation
+
+    key = _generation_key(namespace)
+    generation = cache.get(key)
+    if generation is None:
+        # add() is atomic, so concurrent workers agree on a single seed
+        if cache.add(key, _initial_generation(), None):
+            # Counter was lost (Redis restart/eviction): the namespace is cold
+            schedule_warming([namespace])
+        generation = cache.get(key)
+    generation = generation or 0
+    if use_local:
+        local_cache.set_generation(namespace, generation)
+    return generation
+
+
+def invalidate_cache_namespace(namespace):
+    """
+    Invalidate every cache entry of a namespace by bumping its generation.
+
+    Old entries are never read again and simply expire through their TTL.
+    This is a single INCR, independent of the keyspace size and of the
+    KEY_PREFIX/VERSION the cache backend is configured with.
+    """
+    key = _generation_key(namespace)
+    try:
+        generation = cache.incr(key)
+    except ValueError:
+        # Counter does not exist yet (or backend does not support incr)
+        generation = _initial_generation()
+        cache.set(key, generation, None)
+    # This process reads its own invalidation right away
+    local_cache.set_generation(namespace, generation)
+    return generation
 
 
 def get_cache_key(prefix, *args, **kwargs):
@@ -16,10 +124,223 @@ def get_cache_key(prefix, *args, **kwargs):
     }
     key_string = json.dumps(key_data, sort_keys=True, default=str)
     key_hash = hashlib.md5(force_bytes(key_string)).hexdigest()
-    return f"{prefix}:{key_hash}"
+    generation = get_namespace_generation(prefix)
+    return f"{prefix}:{generation}:{key_hash}"
+
+
+def _local_cache_enabled():
+    # Without a shared cache the generation counters cannot be bumped, so
+    # per-process copies could never be invalidated
+    cache_backend = settings.CACHES.get('default', {}).get('BACKEND', '')
+    return 'dummy' not in cache_backend.lower()
+
+
+def tiered_get(cache_key):
+    """Get a value from the per-process cache, falling back to the shared cache"""
+    use_local = _local_cache_enabled() and local_cache.accepts(cache_key)
+    if use_local:
+        value = local_cache.get(cache_key)
+        if value is not None:
+            return value
+
+    value = cache.get(cache_key)
+    if value is not None and use_local:
+        local_cache.set(cache_key, value)
+    return value
+
+
+def tiered_set(cache_key, value, timeout):
+    """Store a value in both the shared and the per-process cache"""
+    cache.set(cache_key, value, timeout)
+    if _local_cache_enabled():
+        local_cache.set(cache_key, value, timeout)
+
+
+def tiered_delete(cache_key):
+    cache.delete(cache_key)
+    local_cache.delete(cache_key)
+
+
+def _build_response_cache_key(cache_type, request, vary_on_user, rendered=False, query_params=None):
+    """Build the cache key of a view response"""
+    key_parts = [cache_type, request.method, request.path]
+
+    # Rendered entries are stored in a different format than data entries
+    if rendered:
+        key_parts.append('rendered')
+
+    # Add query parameters to cache key, in canonical form
+    query_string = canonical_query_string(request.GET, query_params)
+    if query_string:
+        key_parts.append(query_string)
+
+    # Add user ID if requested
+    if vary_on_user and hasattr(request, 'user') and request.user.is_authenticated:
+        key_parts.append(f"user_{request.user.id}")
+
+    return get_cache_key(*key_parts)
+
+
+def _get_entry(cache_key, local):
+    """Look up a cached response entry, trying the per-process tier first if enabled"""
+    use_local = local and _local_cache_enabled()
+    if use_local:
+        entry = local_cache.get(cache_key)
+        # Only fresh local copies are served; stale ones are re-read from the
+        # shared cache, where another worker may already have refreshed them
+        if entry is not None and time.time() < entry.get('expires_at', 0):
+            return entry
+
+    entry = cache.get(cache_key)
+    if entry is not None and use_local:
+        remaining = entry.get('expires_at', 0) - time.time()
+        if remaining > 0:
+            local_cache.set(cache_key, entry, remaining)
+    return entry
+
+
+def _should_refresh_early(entry, beta):
+    """
+    Probabilistic early expiration (XFetch).
+
+    The closer an entry is to its expiry and the longer it took to compute,
+    the more likely a request refreshes it ahead of time, so refreshes of a
+    hot key spread out instead of all workers missing at the same instant.
+    """
+    delta = entry.get('delta') or 0
+    expires_at = entry.get('expires_at')
+    if not expires_at or delta <= 0 or beta <= 0:
+        return False
+    # 1 - random() lies in (0, 1], so log() is always defined
+    return time.time() - delta * beta * math.log(1.0 - random.random()) >= expires_at
+
+
+def _acquire_lock(lock_key):
+    """Try to become the single worker recomputing an entry"""
+    return cache.add(lock_key, 1, SINGLE_FLIGHT_LOCK_TIMEOUT)
+
+
+def _wait_for_entry(cache_key):
+    """Wait briefly for the lock holder to store a fresh entry"""
+    deadline = time.monotonic() + SINGLE_FLIGHT_WAIT_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(SINGLE_FLIGHT_POLL_INTERVAL)
+        entry = cache.get(cache_key)
+        if entry is not None:
+            return entry
+    return None
+
+
+def _get_refresh_executor():
+    global _refresh_executor
+    if _refresh_executor is None:
+        _refresh_executor = ThreadPoolExecutor(
+            max_workers=BACKGROUND_REFRESH_WORKERS,
+            thread_name_prefix='cache-refresh'
+        )
+    return _refresh_executor
+
+
+def _run_refresh(func, *args):
+    try:
+        func(*args)
+    except Exception as e:
+        logger.warning("Background cache refresh failed: %s", e)
+    finally:
+        # Worker threads hold their own DB connections
+        connections.close_all()
+
+
+def _submit_refresh(func, *args):
+    """Run a cache refresh on the background thread pool"""
+    _get_refresh_executor().submit(_run_refresh, func, *args)
+
+
+def _wants_rendered(request):
+    """Rendered bytes are only cached for JSON (never for the browsable API)"""
+    renderer = getattr(request, 'accepted_renderer', None)
+    return renderer is not None and renderer.format == 'json'
 
 
-def cache_response(cache_type, timeout=None, vary_on_user=False):
+def _render_entry(view, request, response):
+    """Render a response to the bytes, content type and headers it is served with"""
+    renderer = request.accepted_renderer
+    media_type = request.accepted_media_type
+    renderer_context = view.get_renderer_context()
+    renderer_context['response'] = response
+    content = renderer.render(response.data, media_type, renderer_context)
+    if isinstance(content, str):
+        content = content.encode(renderer.charset or 'utf-8')
+
+    content_type = media_type
+    if renderer.charset:
+        content_type = f"{media_type}; charset={renderer.charset}"
+
+    headers = {
+        name: value for name, value in response.items()
+        if name.lower() != 'content-type'
+    }
+    return {'content': content, 'content_type': content_type, 'headers': headers}
+
+
+def _entry_payload(entry):
+    """Serialized payload of a cache entry (used for its ETag and size)"""
+    if 'content' in entry:
+        return entry['content']
+    return force_bytes(json.dumps(entry['data'], sort_keys=True, default=str))
+
+
+def _compute_etag(payload):
+    """Strong ETag of a serialized payload"""
+    return f'"{hashlib.md5(payload).hexdigest()}"'
+
+
+def _etag_matches(request, etag):
+    if not etag:
+        return False
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if not if_none_match:
+        return False
+    etags = parse_etags(if_none_match)
+    return '*' in etags or etag in etags
+
+
+def _patch_http_caching(response, etag, private):
+    """Add ETag/Cache-Control/Vary so clients revalidate with If-None-Match"""
+    if etag:
+        response['ETag'] = etag
+    # Clients may keep the payload but must revalidate it on every use
+    if private:
+        patch_cache_control(response, private=True, max_age=0, must_revalidate=True)
+        patch_vary_headers(response, ['Accept', 'Authorization'])
+    else:
+        patch_cache_control(response, public=True, max_age=0, must_revalidate=True)
+        patch_vary_headers(response, ['Accept'])
+    return response
+
+
+def _entry_response(request, entry, private=False):
+    """Build the response served for a cache entry (304 if the client has it)"""
+    etag = entry.get('etag')
+    if _etag_matches(request, etag):
+        from django.http import HttpResponseNotModified
+        return _patch_http_caching(HttpResponseNotModified(), etag, private)
+
+    if 'content' in entry:
+        from django.http import HttpResponse
+        response = HttpResponse(entry['content'], content_type=entry['content_type'])
+        for name, value in entry['headers'].items():
+            response[name] = value
+    else:
+        from rest_framework.response import Response
+        response = Response(entry['data'])
+        for name, value in entry.get('headers', {}).items():
+            response[name] = value
+    return _patch_http_caching(response, etag, private)
+
+
+def cache_response(cache_type, timeout=None, vary_on_user=False, single_flight=False, xfetch_beta=1.0,
+                   stale_ttl=None, local=False, rendered=False, query_params=None):
     """
     Decorator to cache view responses
 
@@ -27,6 +348,25 @@ def cache_response(cache_type, timeout=None, vary_on_user=False):
         cache_type: Key from CACHE_TIMEOUTS settings
         timeout: Override default timeout (in seconds)
         vary_on_user: Include user ID in cache key
+        single_flight: Only one worker recomputes a missing/expiring entry,
+            the others wait briefly for its result or keep serving the old one
+        xfetch_beta: Eagerness of probabilistic early refresh in single-flight
+            mode (1.0 is the standard XFetch setting, 0 disables it)
+        stale_ttl: Stale-while-revalidate window (in seconds). Once timeout
+            (the soft TTL) has passed, the stale entry is still served for up
+            to stale_ttl seconds while it is refreshed in the background
+        local: Also keep the entry in the per-process cache (for small, very
+            hot responses; the namespace needs a LOCAL_CACHE limit)
+        rendered: Cache the rendered JSON bytes and serve hits as a plain
+            HttpResponse, skipping unpickling of response.data and JSON
+            rendering (for large payloads; JSON requests only)
+        query_params: Key declaration ({param: normalizer}, see cache_keys)
+            listing the query params that affect the response. Others are
+            left out of the key. By default all params except tracking
+            params are used, in canonical order.
+
+    Cached responses carry a strong ETag; a GET whose If-None-Match matches
+    the cached entry gets a 304 without a body.
     """
     def decorator(view_func):
         @wraps(view_func)
@@ -34,91 +374,127 @@ def cache_response(cache_type, timeout=None, vary_on_user=False):
             # Get timeout from settings or use provided
             cache_timeout = timeout or getattr(settings, 'CACHE_TIMEOUTS', {}).get(cache_type, 300)
 
-            # Build cache key
-            key_parts = [cache_type, request.method, request.path]
-
-            # Add query parameters to cache key
-            if request.GET:
-                query_string = request.GET.urlencode()
-                key_parts.append(query_string)
-
-            # Add user ID if requested
-            if vary_on_user and hasattr(request, 'user') and request.user.is_authenticated:
-                key_parts.append(f"user_{request.user.id}")
-
-            cache_key = get_cache_key(*key_parts)
+            render = rendered and _wants_rendered(request)
+            cache_key = _build_response_cache_key(
+                cache_type, request, vary_on_user, rendered=render, query_params=query_params
+            )
+            lock_key = f"{cache_key}:lock"
+            private = vary_on_user or (hasattr(request, 'user') and request.user.is_authenticated)
 
             # Try to get from cache
-            cached_data = cache.get(cache_key)
-            if cached_data is not None:
-                print(f"🎯 Cache HIT for key: {cache_key}")
-                from rest_framework.response import Response
-                return Response(cached_data)
-            else:
-                print(f"❌ Cache MISS for key: {cache_key}")
-
-            # Get fresh response
-            response = view_func(self, request, *args, **kwargs)
-
-            # Cache successful responses (cache the data, not the Response object)
-            if hasattr(response, 'status_code') and response.status_code == 200:
-                try:
-                    # Only cache the data, not the rendered response
-                    if hasattr(response, 'data'):
-                        cache.set(cache_key, response.data, cache_timeout)
-                        print(f"✅ Cache SET for key: {cache_key}, timeout: {cache_timeout}s")
-                    else:
-                        print(f"❌ Response has no data attribute: {cache_key}")
-                except Exception as e:
-                    # If caching fails, just return the response without caching
-                    print(f"❌ Cache SET failed for key: {cache_key}, error: {e}")
-                    pass
-
-            return response
+            lookup_started = time.perf_counter()
+            entry = _get_entry(cache_key, local)
+            lookup_seconds = time.perf_counter() - lookup_started
+            if entry is not None:
+                cache_metrics.record_hit(cache_type, lookup_seconds)
+                if stale_ttl and time.time() >= entry.get('expires_at', 0):
+                    # Stale: answer right away, one worker refreshes in the background.
+                    # The view is copied so the refresh does not share per-request state.
+                    if _acquire_lock(lock_key):
+                        _submit_refresh(
+                            recompute, copy.copy(self), request, args, kwargs,
+                            cache_key, cache_timeout, render, private, lock_key
+                        )
+                    return _entry_response(request, entry, private)
+                if not (single_flight and _should_refresh_early(entry, xfetch_beta)):
+                    return _entry_response(request, entry, private)
+                # Early refresh: only the lock holder recomputes, everyone else
+                # keeps serving the current value
+                if not _acquire_lock(lock_key):
+                    return _entry_response(request, entry, private)
+                return recompute(self, request, args, kwargs, cache_key, cache_timeout, render, private, lock_key)
+
+            cache_metrics.record_miss(cache_type, lookup_seconds)
+
+            if single_flight:
+                if _acquire_lock(lock_key):
+                    return recompute(self, request, args, kwargs, cache_key, cache_timeout, render, private, lock_key)
+                entry = _wait_for_entry(cache_key)
+                if entry is not None:
+                    return _entry_response(request, entry, private)
+                # The lock holder is too slow (or died), compute it ourselves
+
+            return recompute(self, request, args, kwargs, cache_key, cache_timeout, render, private)
+
+        def recompute(self, request, args, kwargs, cache_key, cache_timeout, render, private, lock_key=None):
+            try:
+                # Get fresh response
+                started = time.monotonic()
+                response = view_func(self, request, *args, **kwargs)
+
+                # Cache successful responses (cache the data, not the Response object)
+                if hasattr(response, 'status_code') and response.status_code == 200:
+                    try:
+                        if hasattr(response, 'data'):
+                            if render:
+                                entry = _render_entry(self, request, response)
+                            else:
+                                # Only cache the data, not the rendered response
+                                entry = {'data': response.data}
+                                # Headers set by the view (e.g. X-Estimated-Count)
+                                headers = {
+                                    name: value for name, value in response.items()
+                                    if name.lower() != 'content-type'
+                                }
+                                if headers:
+                                    entry['headers'] = headers
+                            payload = _entry_payload(entry)
+                            entry['etag'] = _compute_etag(payload)
+                            entry['delta'] = time.monotonic() - started
+                            entry['expires_at'] = time.time() + cache_timeout
+
+                            # Keep stale entries around for the revalidation window
+                            cache.set(cache_key, entry, cache_timeout + (stale_ttl or 0))
+                            if local and _local_cache_enabled():
+                                local_cache.set(cache_key, entry, cache_timeout)
+                            cache_metrics.record_set(cache_type, len(payload), entry['delta'])
+
+                            if render:
+                                # Serve the bytes we just rendered instead of rendering again
+                                return _entry_response(request, entry, private)
+                            if _etag_matches(request, entry['etag']):
+                                return _entry_response(request, entry, private)
+                            _patch_http_caching(response, entry['etag'], private)
+                        else:
+                            logger.warning("Response has no data attribute: %s", cache_key)
+                    except Exception as e:
+                        # If caching fails, just return the response without caching
+                        cache_metrics.record_set_failure(cache_type)
+                        logger.warning("Cache SET failed for key %s: %s", cache_key, e)
+
+                return response
+            finally:
+                if lock_key:
+                    cache.delete(lock_key)
+
         return wrapper
     return decorator
 
 
-def invalidate_cache_pattern(pattern):
-    """Invalidate all cache keys matching a pattern"""
-    # Check if we're using a cache backend that supports pattern invalidation
-    cache_backend = settings.CACHES.get('default', {}).get('BACKEND', '')
-
-    # Skip invalidation for dummy cache or unsupported backends
-    if 'dummy' in cache_backend.lower():
-        return 0
-
-    try:
-        from django_redis import get_redis_connection
-        redis_conn = get_redis_connection("default")
-        keys = redis_conn.keys(f"insidelab:1:{pattern}*")
-        if keys:
-            redis_conn.delete(*keys)
-            return len(keys)
-        return 0
-    except Exception as e:
-        # Silently skip for unsupported backends (e.g., DummyCache in tests)
-        if 'does not support this feature' not in str(e):
-            print(f"Cache invalidation error: {e}")
-        return 0
-
+def cache_api_view(cache_type, **options):
+    """
+    cache_response for function-based (@api_view) views
 
-def invalidate_model_cache(model_name, obj_id=None):
-    """Invalidate cache for a specific model"""
-    patterns = [
-        f"{model_name.upper()}",
-        f"{model_name.lower()}_list",
-        f"{model_name.lower()}_detail",
-    ]
+    Place it below @api_view/@permission_classes. Takes the same options as
+    cache_response except rendered, which needs a view instance.
+    """
+    def decorator(view_func):
+        cached = cache_response(cache_type, **options)(
+            lambda view, request, *args, **kwargs: view_func(request, *args, **kwargs)
+        )
 
-    if obj_id:
-        patterns.append(f"{model_name.lower()}_{obj_id}")
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            return cached(None, request, *args, **kwargs)
+        return wrapper
+    return decorator
 
-    total_deleted = 0
-    for pattern in patterns:
-        total_deleted += invalidate_cache_pattern(pattern)
 
-    return total_deleted
+def invalidate_model_cache(model_name):
+    """Invalidate all cache namespaces that depend on a model (after commit, coalesced)"""
+    namespaces = MODEL_CACHE_DEPENDENCIES.get(model_name.lower(), [])
+    invalidate_namespaces(*namespaces)
+    return namespaces
 
 
 class CacheManager:
@@ -128,33 +504,33 @@ class CacheManager:
     def get_universities():
         """Get cached universities list"""
         cache_key = get_cache_key('UNIVERSITIES', 'list')
-        return cache.get(cache_key)
+        return tiered_get(cache_key)
 
     @staticmethod
     def set_universities(data, timeout=None):
         """Cache universities list"""
         cache_key = get_cache_key('UNIVERSITIES', 'list')
         cache_timeout = timeout or settings.CACHE_TIMEOUTS.get('UNIVERSITIES', 86400)
-        cache.set(cache_key, data, cache_timeout)
+        tiered_set(cache_key, data, cache_timeout)
 
     @staticmethod
     def get_university_departments(university_id):
         """Get cached departments for a university"""
         cache_key = get_cache_key('DEPARTMENTS', 'university', university_id)
-        return cache.get(cache_key)
+        return tiered_get(cache_key)
 
     @staticmethod
     def set_university_departments(university_id, data, timeout=None):
         """Cache departments for a university"""
         cache_key = get_cache_key('DEPARTMENTS', 'university', university_id)
         cache_timeout = timeout or settings.CACHE_TIMEOUTS.get('DEPARTMENTS', 43200)
-        cache.set(cache_key, data, cache_timeout)
+        tiered_set(cache_key, data, cache_timeout)
 
     @staticmethod
     def delete_university_departments(university_id):
         """Delete cached departments for a university"""
         cache_key = get_cache_key('DEPARTMENTS', 'university', university_id)
-        cache.delete(cache_key)
+        tiered_delete(cache_key)
 
     @staticmethod
     def get_labs(filters=None):
@@ -169,47 +545,64 @@ class CacheManager:
         cache_timeout = timeout or settings.CACHE_TIMEOUTS.get('LABS', 1800)
         cache.set(cache_key, data, cache_timeout)
 
+    @staticmethod
+    def get_rating_categories():
+        """Get active rating categories (ordered by sort_order), cached"""
+        cache_key = get_cache_key('RATING_CATEGORIES', 'active')
+        categories = tiered_get(cache_key)
+        if categories is None:
+            from apps.reviews.models import RatingCategory
+            categories = list(RatingCategory.objects.filter(is_active=True).order_by('sort_order').values(
+                'id', 'name', 'display_name', 'description', 'sort_order'
+            ))
+            cache_timeout = getattr(settings, 'CACHE_TIMEOUTS', {}).get('RATING_CATEGORIES', 43200)
+            tiered_set(cache_key, categories, cache_timeout)
+        return categories
+
+    @staticmethod
+    def get_active_rating_category_names():
+        """Get the set of active rating category display names, cached"""
+        cache_key = get_cache_key('RATING_CATEGORIES', 'active_names')
+        names = tiered_get(cache_key)
+        if names is None:
+            names = frozenset(category['display_name'] for category in CacheManager.get_rating_categories())
+            cache_timeout = getattr(settings, 'CACHE_TIMEOUTS', {}).get('RATING_CATEGORIES', 43200)
+            tiered_set(cache_key, names, cache_timeout)
+        return names
+
+    @staticmethod
+    def invalidate_lab_caches(lab_id=None):
+        """Invalidate lab caches (lab detail/list responses include related data)"""
+        invalidate_namespaces('LABS')
+
     @staticmethod
     def invalidate_related_caches(model_name, obj_id=None):
         """Invalidate all related caches when data changes"""
-        if model_name.lower() == 'university':
-            invalidate_cache_pattern('UNIVERSITIES')
-            invalidate_cache_pattern('DEPARTMENTS')
-            invalidate_cache_pattern('PROFESSORS')
-            invalidate_cache_pattern('LABS')
-
-        elif model_name.lower() == 'department':
-            invalidate_cache_pattern('DEPARTMENTS')
-            invalidate_cache_pattern('PROFESSORS')
-            invalidate_cache_pattern('LABS')
+        invalidate_model_cache(model_name)
 
-        elif model_name.lower() == 'lab':
-            invalidate_cache_pattern('LABS')
-            invalidate_cache_pattern('REVIEWS')
 
-        elif model_name.lower() == 'professor':
-            invalidate_cache_pattern('PROFESSORS')
-            invalidate_cache_pattern('LABS')
+# Cache warming (endpoint warmers are registered next to their views)
+@register_warmer('universities', namespaces=['UNIVERSITIES'], priority=PRIORITY_CRITICAL)
+def warm_universities():
+    """University list used across the app"""
+    from apps.universities.models import University
+    CacheManager.set_universities(list(University.objects.values('id', 'name', 'country', 'city')))
 
-        elif model_name.lower() == 'review':
-            invalidate_cache_pattern('REVIEWS')
-            invalidate_cache_pattern('LABS')  # Labs cache includes ratings
 
+@register_warmer('rating_categories', namespaces=['RATING_CATEGORIES'], priority=PRIORITY_CRITICAL)
+def warm_rating_categories():
+    CacheManager.get_rating_categories()
 
-# Cache warming functions
-def warm_cache():
-    """Warm up frequently accessed cache entries"""
-    from apps.universities.models import University
-    from apps.labs.models import Lab
 
-    # Warm university cache
-    universities = list(University.objects.values('id', 'name', 'country', 'city'))
-    CacheManager.set_universities(universities)
+@register_warmer(
+    'rating_category_names', namespaces=['RATING_CATEGORIES'], priority=PRIORITY_CRITICAL,
+    after=['rating_categories'],
+)
+def warm_rating_category_names():
+    # Built from the cached category list
+    CacheManager.get_active_rating_category_names()
 
-    # Warm popular labs cache
-    popular_labs = list(Lab.objects.filter(
-        overall_rating__gte=4.0
-    ).values('id', 'name', 'overall_rating', 'review_count')[:50])
-    CacheManager.set_labs(popular_labs, {'popular': True})
 
-    print(f"Cache warmed: {len(universities)} universities, {len(popular_labs)} popular labs")
\ No newline at end of file
+def warm_cache(**options):
+    """Warm up frequently accessed cache entries (all registered warmers)"""
+    return warm_caches(**options)
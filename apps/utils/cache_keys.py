@@ -0,0 +1,139 @@
+# apps/utils/cache_keys.py
+"""
+Query-parameter normalization for response cache keys.
+
+A key declaration maps every query parameter that affects a response to a
+normalizer. Normalizers take the raw value and return its canonical form,
+or None when the value is equivalent to leaving the parameter out.
+Parameters that are not declared are ignored, so tracking parameters or
+typos do not fragment the cache.
+"""
+import re
+from decimal import Decimal, InvalidOperation
+from urllib.parse import urlencode
+
+
+# Never part of a cache key (analytics / cache busting)
+TRACKING_PARAMS = {'fbclid', 'gclid', 'msclkid', '_'}
+TRACKING_PARAM_PREFIXES = ('utm_',)
+
+
+def normalize_text(value):
+    """Strip surrounding whitespace (CharFilter does the same)"""
+    return value.strip()
+
+
+def normalize_search(value):
+    """Case-insensitive free text: collapse whitespace and lowercase"""
+    value = re.sub(r'\s+', ' ', value).strip().lower()
+    return value or None
+
+
+def normalize_number(default=None):
+    """Numbers: '3', '3.0' and ' 3 ' are the same value; the default is dropped"""
+    def normalizer(value):
+        try:
+            number = Decimal(value.strip())
+        except (InvalidOperation, ValueError):
+            return value.strip()
+        if not number.is_finite():
+            return value.strip()
+        canonical = format(number.normalize(), 'f')
+        if default is not None and number == Decimal(default):
+            return None
+        return canonical
+    return normalizer
+
+
+_BOOLEAN_VALUES = {'true': 'true', '1': 'true', 'false': 'false', '0': 'false'}
+
+
+def normalize_bool(value):
+    """Booleans in the spellings accepted by django-filter's BooleanFilter"""
+    stripped = value.strip()
+    return _BOOLEAN_VALUES.get(stripped.lower(), stripped)
+
+
+def normalize_csv(value):
+    """Comma-separated sets: order, duplicates and blanks do not matter"""
+    items = sorted({item.strip() for item in value.split(',') if item.strip()})
+    return ','.join(items) or None
+
+
+def normalize_choice(*choices, default=None):
+    """Values outside choices behave like the default and are dropped"""
+    def normalizer(value):
+        value = value.strip()
+        if value == default or value not in choices:
+            return None
+        return value
+    return normalizer
+
+
+# Query params read by the default DRF list machinery (PageNumberPagination,
+# SearchFilter, OrderingFilter)
+LIST_QUERY_PARAMS = {
+    'page': normalize_number(default=1),
+    'search': normalize_search,
+    'ordering': normalize_text,
+}
+
+# Query params of the opt-in keyset pagination (see pagination.py)
+KEYSET_QUERY_PARAMS = {
+    'pagination': normalize_choice('cursor'),
+    'cursor': normalize_text,
+    'count': normalize_choice('estimate'),
+}
+
+
+def filterset_query_params(filterset_class, **params):
+    """
+    Key declaration for a list endpoint filtered by filterset_class.
+
+    Filters are normalized by type; keyword arguments add or override
+    parameters (e.g. fields=normalize_choice('minimal')).
+    """
+    import django_filters
+
+    declared = dict(LIST_QUERY_PARAMS)
+    for name, filter_ in filterset_class.base_filters.items():
+        if isinstance(filter_, django_filters.NumberFilter):
+            declared[name] = normalize_number()
+        elif isinstance(filter_, django_filters.BooleanFilter):
+            declared[name] = normalize_bool
+        else:
+            declared[name] = normalize_text
+    declared.update(params)
+    return declared
+
+
+def _is_tracking_param(name):
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PARAM_PREFIXES)
+
+
+def canonical_query_string(query_dict, declared=None):
+    """
+    Canonical form of a request's query parameters for cache keys.
+
+    Parameters are sorted by name (the values of a repeated parameter keep
+    their order). With a declaration, only declared parameters are kept and
+    their values normalized; without one, every parameter except tracking
+    parameters is kept verbatim.
+    """
+    items = []
+    for name in sorted(query_dict.keys()):
+        if declared is None:
+            if _is_tracking_param(name):
+                continue
+            items.extend((name, value) for value in query_dict.getlist(name))
+            continue
+
+        if name not in declared:
+            continue
+        normalizer = declared[name]
+        for value in query_dict.getlist(name):
+            if normalizer is not None:
+                value = normalizer(value)
+            if value is not None:
+                items.append((name, value))
+    return urlencode(items)
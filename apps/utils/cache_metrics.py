@@ -0,0 +1,236 @@
+# apps/utils/cache_metrics.py
+import os
+import socket
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from django.core.cache import cache
+
+
+# Histogram bucket upper bounds
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)  # seconds
+SIZE_BUCKETS = (1024, 10 * 1024, 100 * 1024, 1024 * 1024, 10 * 1024 * 1024)  # bytes
+
+COUNTERS = ('hits', 'misses', 'sets', 'set_failures')
+HISTOGRAMS = {
+    'lookup_seconds': LATENCY_BUCKETS,
+    'recompute_seconds': LATENCY_BUCKETS,
+    'payload_bytes': SIZE_BUCKETS,
+}
+
+# Each worker publishes its cumulative snapshot to the shared cache at most
+# this often, so metrics can be merged across processes without a round trip
+# per request
+PUBLISH_INTERVAL = 10  # seconds
+WORKER_KEY_PREFIX = 'cache_metrics:worker'
+WORKER_REGISTRY_KEY = 'cache_metrics:workers'
+WORKER_SNAPSHOT_TTL = 60 * 10
+
+
+class Histogram:
+    """Fixed-bucket histogram (non-cumulative bucket counts + sum/count)"""
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.buckets = [0] * (len(bounds) + 1)  # Last bucket is +Inf
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, value):
+        self.buckets[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def as_dict(self):
+        return {
+            'bounds': list(self.bounds),
+            'buckets': list(self.buckets),
+            'sum': self.sum,
+            'count': self.count,
+        }
+
+
+class CacheTypeMetrics:
+    def __init__(self):
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.histograms = {name: Histogram(bounds) for name, bounds in HISTOGRAMS.items()}
+
+    def as_dict(self):
+        data = dict(self.counters)
+        for name, histogram in self.histograms.items():
+            data[name] = histogram.as_dict()
+        return data
+
+
+class CacheMetrics:
+    """
+    Per-process hit/miss/latency metrics, keyed by cache_type.
+
+    Recording only touches process memory; snapshots are published to the
+    shared cache periodically and merged by collect().
+    """
+
+    def __init__(self):
+        self._metrics = defaultdict(CacheTypeMetrics)
+        self._lock = threading.Lock()
+        self._last_publish = 0.0
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+
+    def record_hit(self, cache_type, lookup_seconds):
+        with self._lock:
+            metrics = self._metrics[cache_type]
+            metrics.counters['hits'] += 1
+            metrics.histograms['lookup_seconds'].observe(lookup_seconds)
+        self._maybe_publish()
+
+    def record_miss(self, cache_type, lookup_seconds):
+        with self._lock:
+            metrics = self._metrics[cache_type]
+            metrics.counters['misses'] += 1
+            metrics.histograms['lookup_seconds'].observe(lookup_seconds)
+        self._maybe_publish()
+
+    def record_set(self, cache_type, payload_bytes, recompute_seconds):
+        with self._lock:
+            metrics = self._metrics[cache_type]
+            metrics.counters['sets'] += 1
+            metrics.histograms['payload_bytes'].observe(payload_bytes)
+            metrics.histograms['recompute_seconds'].observe(recompute_seconds)
+
+    def record_set_failure(self, cache_type):
+        with self._lock:
+            self._metrics[cache_type].counters['set_failures'] += 1
+
+    def snapshot(self):
+        """Metrics of this process as plain dicts"""
+        with self._lock:
+            return {cache_type: metrics.as_dict() for cache_type, metrics in self._metrics.items()}
+
+    def reset(self):
+        with self._lock:
+            self._metrics.clear()
+            self._last_publish = 0.0
+
+    def _maybe_publish(self):
+        if time.monotonic() - self._last_publish >= PUBLISH_INTERVAL:
+            self.publish()
+
+    def publish(self):
+        """Store this worker's snapshot in the shared cache"""
+        self._last_publish = time.monotonic()
+        snapshot = self.snapshot()
+        if not snapshot:
+            return
+        try:
+            cache.set(f"{WORKER_KEY_PREFIX}:{self.worker_id}", snapshot, WORKER_SNAPSHOT_TTL)
+            # Read-modify-write is racy, but every worker re-registers on each publish
+            workers = set(cache.get(WORKER_REGISTRY_KEY) or ())
+            if self.worker_id not in workers:
+                workers.add(self.worker_id)
+                cache.set(WORKER_REGISTRY_KEY, workers, None)
+        except Exception:
+            # Metrics must never break request handling
+            pass
+
+    def collect(self):
+        """Metrics merged across all workers that published recently"""
+        self.publish()
+        try:
+            workers = set(cache.get(WORKER_REGISTRY_KEY) or ())
+            keys = {f"{WORKER_KEY_PREFIX}:{worker_id}": worker_id for worker_id in workers}
+            snapshots = cache.get_many(list(keys)) if keys else {}
+
+            # Forget workers whose snapshot expired
+            alive = {keys[key] for key in snapshots}
+            if alive != workers:
+                cache.set(WORKER_REGISTRY_KEY, alive, None)
+        except Exception:
+            snapshots = {}
+
+        if not snapshots:
+            # Shared cache unavailable (e.g. DummyCache): report this process only
+            return {'workers': 1, 'cache_types': self.snapshot()}
+        return {'workers': len(snapshots), 'cache_types': merge_snapshots(snapshots.values())}
+
+
+def merge_snapshots(snapshots):
+    """Sum per-worker snapshots into one"""
+    merged = {}
+    for snapshot in snapshots:
+        for cache_type, data in snapshot.items():
+            target = merged.setdefault(cache_type, CacheTypeMetrics().as_dict())
+            for name in COUNTERS:
+                target[name] += data.get(name, 0)
+            for name in HISTOGRAMS:
+                histogram = data.get(name)
+                if not histogram:
+                    continue
+                target[name]['buckets'] = [a + b for a, b in zip(target[name]['buckets'], histogram['buckets'])]
+                target[name]['sum'] += histogram['sum']
+                target[name]['count'] += histogram['count']
+    return merged
+
+
+def summarize(cache_type_metrics):
+    """Derived figures (hit ratio, averages) for one cache_type"""
+    hits = cache_type_metrics['hits']
+    lookups = hits + cache_type_metrics['misses']
+
+    def average(name):
+        histogram = cache_type_metrics[name]
+        return histogram['sum'] / histogram['count'] if histogram['count'] else 0
+
+    return {
+        'hits': hits,
+        'misses': cache_type_metrics['misses'],
+        'hit_ratio': hits / lookups if lookups else None,
+        'sets': cache_type_metrics['sets'],
+        'set_failures': cache_type_metrics['set_failures'],
+        'avg_payload_bytes': average('payload_bytes'),
+        'avg_lookup_ms': average('lookup_seconds') * 1000,
+        'avg_recompute_ms': average('recompute_seconds') * 1000,
+    }
+
+
+cache_metrics = CacheMetrics()
+
+
+def sample_keyspace(redis_conn, sample_size=10000, memory_sample_size=200):
+    """
+    Estimate key counts and memory per cache namespace.
+
+    Samples keys with SCAN (never KEYS, which blocks Redis) and scales the
+    sample up to the total key count reported by INFO keyspace.
+    """
+    raw_prefix = cache.make_key('')
+    counts = defaultdict(int)
+    memory = defaultdict(int)
+    memory_samples = defaultdict(int)
+    sampled = 0
+
+    for raw_key in redis_conn.scan_iter(match=f"{raw_prefix}*", count=1000):
+        key = raw_key.decode() if isinstance(raw_key, bytes) else raw_key
+        namespace = key[len(raw_prefix):].split(':', 1)[0]
+        counts[namespace] += 1
+        if sampled < memory_sample_size:
+            memory[namespace] += redis_conn.memory_usage(raw_key) or 0
+            memory_samples[namespace] += 1
+        sampled += 1
+        if sampled >= sample_size:
+            break
+
+    db_index = redis_conn.connection_pool.connection_kwargs.get('db', 0)
+    total_keys = redis_conn.info('keyspace').get(f'db{db_index}', {}).get('keys', sampled)
+    scale = total_keys / sampled if sampled else 0
+
+    namespaces = {}
+    for namespace, count in counts.items():
+        estimated_keys = round(count * scale)
+        avg_bytes = memory[namespace] / memory_samples[namespace] if memory_samples[namespace] else None
+        namespaces[namespace] = {
+            'sampled_keys': count,
+            'estimated_keys': estimated_keys,
+            'estimated_bytes': round(avg_bytes * estimated_keys) if avg_bytes is not None else None,
+        }
+    return {'total_keys': total_keys, 'sampled_keys': sampled, 'namespaces': namespaces}
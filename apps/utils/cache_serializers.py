@@ -0,0 +1,149 @@
+# apps/utils/cache_serializers.py
+"""
+Cache value codec for django-redis.
+
+Every value gets a one-byte header (format version + codec), then:
+
+- JSON-shaped values (API payloads: dicts, lists, strings, numbers) are
+  encoded with orjson, everything else with pickle;
+- payloads below COMPRESS_MIN_BYTES are stored uncompressed, larger ones
+  are compressed with lz4 (or zlib level 1 when lz4 is not installed).
+
+Values with an unknown header (entries written by PickleSerializer +
+ZlibCompressor, or by a future format) decode to None, i.e. a cache miss.
+
+Use with the identity compressor, compression is decided per value here:
+
+    'SERIALIZER': 'apps.utils.cache_serializers.TaggedSerializer',
+    'COMPRESSOR': 'django_redis.compressors.identity.IdentityCompressor',
+"""
+import math
+import pickle
+import zlib
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover - optional dependency
+    lz4_frame = None
+
+try:
+    from django_redis.serializers.base import BaseSerializer
+except ImportError:  # pragma: no cover - django-redis is only needed with Redis
+    BaseSerializer = object
+
+
+FORMAT_VERSION = 1
+
+# Codec ids (low bits of the header byte)
+SERIALIZER_PICKLE = 0
+SERIALIZER_JSON = 1
+COMPRESSOR_NONE = 0
+COMPRESSOR_ZLIB = 1
+COMPRESSOR_LZ4 = 2
+
+DEFAULT_COMPRESS_MIN_BYTES = 1024
+ZLIB_LEVEL = 1  # Speed over ratio: entries are read far more often than written
+
+
+def _header(serializer, compressor):
+    return bytes([FORMAT_VERSION << 4 | serializer << 2 | compressor])
+
+
+def _parse_header(byte):
+    return byte >> 4, (byte >> 2) & 0b11, byte & 0b11
+
+
+def is_json_shaped(value):
+    """
+    Whether value survives a JSON round trip unchanged (apart from
+    dict/list subclasses such as DRF's ReturnDict becoming plain ones).
+    """
+    stack = [value]
+    while stack:
+        item = stack.pop()
+        if item is None or isinstance(item, (str, bool)):
+            continue
+        if isinstance(item, int):
+            # orjson is limited to 64-bit integers
+            if not -2 ** 63 <= item < 2 ** 64:
+                return False
+        elif isinstance(item, float):
+            if not math.isfinite(item):
+                return False
+        elif isinstance(item, dict):
+            if not all(isinstance(key, str) for key in item):
+                return False
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+        else:
+            # tuples, datetimes, Decimals, bytes, sets, model instances, ...
+            return False
+    return True
+
+
+class TaggedSerializer(BaseSerializer):
+    """orjson/pickle + size-dependent compression with a version tag"""
+
+    def __init__(self, options=None):
+        options = options or {}
+        self.compress_min_bytes = options.get('COMPRESS_MIN_BYTES', DEFAULT_COMPRESS_MIN_BYTES)
+        self.use_json = options.get('JSON', True) and orjson is not None
+        self.compressor = COMPRESSOR_LZ4 if lz4_frame is not None else COMPRESSOR_ZLIB
+
+    def dumps(self, value):
+        serializer = SERIALIZER_PICKLE
+        payload = None
+        if self.use_json and is_json_shaped(value):
+            try:
+                payload = orjson.dumps(value)
+                serializer = SERIALIZER_JSON
+            except TypeError:
+                payload = None
+        if payload is None:
+            payload = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+        compressor = COMPRESSOR_NONE
+        if len(payload) >= self.compress_min_bytes:
+            compressor = self.compressor
+            payload = self._compress(payload, compressor)
+        return _header(serializer, compressor) + payload
+
+    def loads(self, value):
+        if not value:
+            return None
+        version, serializer, compressor = _parse_header(value[0])
+        if version != FORMAT_VERSION:
+            # Legacy or foreign entry: treat as a miss, it is rewritten on the next set
+            return None
+
+        payload = self._decompress(memoryview(value)[1:], compressor)
+        if payload is None:
+            return None
+        if serializer == SERIALIZER_JSON:
+            if orjson is None:
+                return None
+            return orjson.loads(payload)
+        return pickle.loads(payload)
+
+    @staticmethod
+    def _compress(payload, compressor):
+        if compressor == COMPRESSOR_LZ4:
+            return lz4_frame.compress(payload)
+        return zlib.compress(payload, ZLIB_LEVEL)
+
+    @staticmethod
+    def _decompress(payload, compressor):
+        if compressor == COMPRESSOR_NONE:
+            return bytes(payload)
+        if compressor == COMPRESSOR_ZLIB:
+            return zlib.decompress(payload)
+        if compressor == COMPRESSOR_LZ4 and lz4_frame is not None:
+            return lz4_frame.decompress(payload)
+        # Written by a worker with lz4 installed, this one cannot read it
+        return None
@@ -0,0 +1,258 @@
+# apps/utils/cache_warming.py
+"""
+Cache warmer registry.
+
+Cached endpoints and CacheManager entries register a warmer: how to rebuild
+the entry, which namespaces it lives in, its priority and the warmers it
+has to run after. Warmers are run
+
+- by `cache_management --action warm` (after deploys), on a bounded pool,
+- in the background shortly after one of their namespaces is invalidated
+  or found without a generation counter (Redis restart / eviction),
+
+so cold caches are rebuilt before real users hit Postgres for them.
+
+Endpoint warmers issue an anonymous GET through the view itself, so the
+entry lands under the exact key cache_response uses for anonymous requests.
+"""
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+
+logger = logging.getLogger(__name__)
+
+# Lower runs first
+PRIORITY_CRITICAL = 0
+PRIORITY_HIGH = 10
+PRIORITY_NORMAL = 50
+PRIORITY_LOW = 100
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_DELAY = 2           # Seconds to collect invalidations before warming
+WARM_LOCK_TIMEOUT = 120     # Max seconds one worker owns a warmer
+WARM_LOCK_PREFIX = 'cache_warming:lock'
+
+
+class CacheWarmer:
+    """A registered way to rebuild cache entries"""
+
+    def __init__(self, name, func, namespaces, priority=PRIORITY_NORMAL, after=()):
+        self.name = name
+        self.func = func
+        self.namespaces = frozenset(namespaces)
+        self.priority = priority
+        self.after = frozenset(after)
+
+    def __repr__(self):
+        return f"<CacheWarmer {self.name} priority={self.priority}>"
+
+
+_registry = {}
+_state = threading.local()
+
+
+def register_warmer(name, namespaces, priority=PRIORITY_NORMAL, after=()):
+    """Decorator registering a function that rebuilds cache entries"""
+    def decorator(func):
+        _registry[name] = CacheWarmer(name, func, namespaces, priority, after)
+        return func
+    return decorator
+
+
+def register_endpoint_warmer(url_name, namespaces, priority=PRIORITY_NORMAL, query=None, after=()):
+    """Register a cached GET endpoint (by URL name) to be warmed"""
+    def warm():
+        warm_endpoint(url_name, query)
+
+    name = url_name if not query else f"{url_name}?{'&'.join(f'{k}={v}' for k, v in sorted(query.items()))}"
+    _registry[name] = CacheWarmer(name, warm, namespaces, priority, after)
+
+
+def get_warmers():
+    """All registered warmers (loads the URLconf, which imports every view module)"""
+    from django.urls import get_resolver
+    get_resolver().url_patterns
+    return dict(_registry)
+
+
+def _warming_settings():
+    return getattr(settings, 'CACHE_WARMING', {})
+
+
+def _warm_host():
+    host = _warming_settings().get('HOST')
+    if host:
+        return host
+    hosts = [host for host in settings.ALLOWED_HOSTS if host and host != '*' and not host.startswith('.')]
+    return hosts[0] if hosts else 'localhost'
+
+
+def warm_endpoint(url_name, query=None):
+    """Run an anonymous JSON GET through a cached view"""
+    from django.test import RequestFactory
+    from django.urls import resolve, reverse
+
+    path = reverse(url_name)
+    match = resolve(path)
+    request = RequestFactory().get(
+        path, query or {}, HTTP_ACCEPT='application/json',
+        HTTP_HOST=_warm_host(), secure=not settings.DEBUG,
+    )
+    response = match.func(request, *match.args, **match.kwargs)
+    if response.status_code != 200:
+        raise RuntimeError(f"GET {path} returned {response.status_code}")
+
+
+def _select(warmers, namespaces=None, names=None, max_priority=None):
+    selected = warmers.values()
+    if max_priority is not None:
+        selected = [warmer for warmer in selected if warmer.priority <= max_priority]
+    if namespaces is not None:
+        namespaces = set(namespaces)
+        selected = [warmer for warmer in selected if warmer.namespaces & namespaces]
+    if names is not None:
+        selected = [warmer for warmer in selected if warmer.name in names]
+    return sorted(selected, key=lambda warmer: (warmer.priority, warmer.name))
+
+
+class _InlineExecutor:
+    """Executor running tasks in the calling thread (max_workers <= 1)"""
+
+    def submit(self, func, *args):
+        future = Future()
+        future.set_result(func(*args))
+        return future
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+def _run_warmer(warmer, in_pool):
+    lock_key = f"{WARM_LOCK_PREFIX}:{warmer.name}"
+    # Another process is already rebuilding these entries
+    if not cache.add(lock_key, 1, WARM_LOCK_TIMEOUT):
+        return {'name': warmer.name, 'status': 'skipped', 'seconds': 0.0, 'error': None}
+
+    started = time.perf_counter()
+    _state.warming = True
+    try:
+        warmer.func()
+        result = {'name': warmer.name, 'status': 'warmed', 'error': None}
+    except Exception as e:
+        logger.warning("Cache warmer %s failed: %s", warmer.name, e)
+        result = {'name': warmer.name, 'status': 'failed', 'error': str(e)}
+    finally:
+        _state.warming = False
+        cache.delete(lock_key)
+        if in_pool:
+            # Pool threads hold their own DB connections
+            connections.close_all()
+    result['seconds'] = time.perf_counter() - started
+    return result
+
+
+def warm_caches(namespaces=None, names=None, max_priority=None, max_workers=None):
+    """
+    Run the selected warmers (all by default) and return one result per warmer.
+
+    Warmers start in priority order on a pool of max_workers threads; a
+    warmer waits for the selected warmers it is declared to run after
+    (a failed dependency does not block it, it just builds more itself).
+    """
+    if max_workers is None:
+        max_workers = _warming_settings().get('MAX_WORKERS', DEFAULT_MAX_WORKERS)
+    pending = _select(get_warmers(), namespaces, names, max_priority)
+    selected = {warmer.name for warmer in pending}
+    finished = set()
+    results = []
+
+    in_pool = max_workers > 1
+    executor = ThreadPoolExecutor(max_workers, thread_name_prefix='cache-warm') if in_pool else _InlineExecutor()
+    with executor:
+        running = {}
+        while pending or running:
+            for warmer in list(pending):
+                if len(running) >= max(max_workers, 1):
+                    break
+                if (warmer.after & selected) - finished:
+                    continue
+                pending.remove(warmer)
+                running[executor.submit(_run_warmer, warmer, in_pool)] = warmer
+
+            if not running:
+                # Only warmers with circular dependencies are left
+                for warmer in pending:
+                    results.append({
+                        'name': warmer.name, 'status': 'failed', 'seconds': 0.0,
+                        'error': 'circular dependency',
+                    })
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                warmer = running.pop(future)
+                finished.add(warmer.name)
+                results.append(future.result())
+
+    return results
+
+
+# Background warming after invalidation
+
+_pending_namespaces = set()
+_pending_lock = threading.Lock()
+_timer = None
+
+
+def warming_enabled():
+    if not _warming_settings().get('ON_INVALIDATE', True):
+        return False
+    # Nothing to warm without a shared cache
+    cache_backend = settings.CACHES.get('default', {}).get('BACKEND', '')
+    return 'dummy' not in cache_backend.lower()
+
+
+def schedule_warming(namespaces):
+    """
+    Warm the given namespaces in the background.
+
+    Calls within DELAY seconds are merged into one run, so a burst of
+    invalidations rebuilds each entry once.
+    """
+    global _timer
+    # Namespaces seeded by a running warmer are being warmed already
+    if not namespaces or getattr(_state, 'warming', False) or not warming_enabled():
+        return
+    with _pending_lock:
+        _pending_namespaces.update(namespaces)
+        if _timer is None:
+            _timer = threading.Timer(_warming_settings().get('DELAY', DEFAULT_DELAY), _warm_pending)
+            # Non-daemon, so management commands finish warming before exiting
+            _timer.daemon = False
+            _timer.start()
+
+
+def _warm_pending():
+    global _timer
+    with _pending_lock:
+        namespaces = set(_pending_namespaces)
+        _pending_namespaces.clear()
+        _timer = None
+    try:
+        results = warm_caches(namespaces)
+        logger.info(
+            "Warmed %d cache entries for %s",
+            sum(result['status'] == 'warmed' for result in results), sorted(namespaces),
+        )
+    except Exception as e:
+        logger.warning("Cache warming for %s failed: %s", sorted(namespaces), e)
+    finally:
+        connections.close_all()
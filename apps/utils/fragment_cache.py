@@ -0,0 +1,152 @@
+# apps/utils/fragment_cache.py
+"""
+Per-object serialized fragment cache.
+
+List endpoints serialize the same objects again for every filter/page
+combination. Fragments are cached per (serializer, object id, updated_at),
+so they are shared by every list that contains the object: a page is looked
+up with one get_many and only the misses are loaded and serialized.
+
+An object's own saves change updated_at and therefore its keys. Changes to
+related rows shown inside a fragment (e.g. the head professor's name in a
+lab card) are invalidated per object by the signal receivers in signals.py.
+"""
+import hashlib
+from functools import lru_cache
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.module_loading import import_string
+from rest_framework.response import Response
+from .cache import get_namespace_generation
+
+
+# Serializers whose output only depends on the object (not on the request),
+# grouped by model. Only these are served from the fragment cache.
+FRAGMENT_SERIALIZERS = {
+    'labs.Lab': [
+        'apps.labs.serializers.LabListSerializer',
+        'apps.labs.serializers.LabCompactSerializer',
+        'apps.labs.serializers.LabMinimalSerializer',
+    ],
+    'universities.Professor': [
+        'apps.universities.serializers.ProfessorSerializer',
+        'apps.universities.serializers.ProfessorMinimalSerializer',
+    ],
+    'publications.Publication': [
+        'apps.publications.serializers.PublicationListSerializer',
+        'apps.publications.serializers.PublicationMinimalSerializer',
+    ],
+}
+
+FRAGMENT_NAMESPACE = 'FRAGMENTS'
+VERSION_FIELD = 'updated_at'
+
+
+@lru_cache(maxsize=None)
+def _serializer_label(serializer_class):
+    """Serializer path plus a digest of its fields, so deploys that change
+    the serializer never read fragments of the old shape"""
+    field_names = ','.join(serializer_class().fields.keys())
+    digest = hashlib.md5(field_names.encode()).hexdigest()[:8]
+    return f"{serializer_class.__module__}.{serializer_class.__qualname__}:{digest}"
+
+
+@lru_cache(maxsize=None)
+def _cacheable_serializers():
+    return {
+        import_string(path): model_label
+        for model_label, paths in FRAGMENT_SERIALIZERS.items()
+        for path in paths
+    }
+
+
+def is_fragment_cacheable(serializer_class):
+    return serializer_class in _cacheable_serializers()
+
+
+def _version(updated_at):
+    return int(updated_at.timestamp() * 1_000_000) if updated_at else 0
+
+
+def _fragment_key(generation, label, pk, updated_at):
+    return f"{FRAGMENT_NAMESPACE}:{generation}:{label}:{pk}:{_version(updated_at)}"
+
+
+def _fragment_timeout():
+    return getattr(settings, 'CACHE_TIMEOUTS', {}).get(FRAGMENT_NAMESPACE, 60 * 60)
+
+
+def serialize_many(objects, serializer_class, load_objects, context=None):
+    """
+    Serialize objects through the fragment cache.
+
+    objects only need pk and updated_at loaded; load_objects(pks) returns the
+    fully loaded (prefetched) objects for the cache misses.
+    """
+    generation = get_namespace_generation(FRAGMENT_NAMESPACE)
+    label = _serializer_label(serializer_class)
+    keys = [_fragment_key(generation, label, obj.pk, getattr(obj, VERSION_FIELD)) for obj in objects]
+    # None marks entries the cache could not decode (see cache_serializers)
+    cached = {key: value for key, value in cache.get_many(keys).items() if value is not None}
+
+    missing = {obj.pk: key for obj, key in zip(objects, keys) if key not in cached}
+    if missing:
+        loaded = list(load_objects(list(missing)))
+        data = serializer_class(loaded, many=True, context=context or {}).data
+        fresh = {}
+        for obj, item in zip(loaded, data):
+            # Store under the key of the version that was listed
+            key = missing.get(obj.pk)
+            if key is not None:
+                fresh[key] = item
+        cache.set_many(fresh, _fragment_timeout())
+        cached.update(fresh)
+
+    return [cached[key] for key in keys if key in cached]
+
+
+def invalidate_fragments(model_label, pks):
+    """Drop the cached fragments of the given objects (all serializers)"""
+    pks = [pk for pk in pks if pk is not None]
+    paths = FRAGMENT_SERIALIZERS.get(model_label)
+    if not pks or not paths:
+        return
+
+    model = apps.get_model(model_label)
+    versions = model.objects.filter(pk__in=pks).values_list('pk', VERSION_FIELD)
+    generation = get_namespace_generation(FRAGMENT_NAMESPACE)
+    labels = [_serializer_label(import_string(path)) for path in paths]
+    cache.delete_many([
+        _fragment_key(generation, label, pk, updated_at)
+        for pk, updated_at in versions
+        for label in labels
+    ])
+
+
+class FragmentCacheListMixin:
+    """
+    ViewSet mixin that serves list items from the fragment cache.
+
+    Pagination runs on a light queryset (pk and updated_at only); the full
+    queryset with its select/prefetch_related is only used for misses.
+    """
+
+    def list(self, request, *args, **kwargs):
+        serializer_class = self.get_serializer_class()
+        if not is_fragment_cacheable(serializer_class):
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        light_queryset = queryset.select_related(None).prefetch_related(None).only('pk', VERSION_FIELD)
+
+        page = self.paginate_queryset(light_queryset)
+        objects = page if page is not None else list(light_queryset)
+
+        def load_objects(pks):
+            return self.get_queryset().filter(pk__in=pks)
+
+        data = serialize_many(objects, serializer_class, load_objects, self.get_serializer_context())
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
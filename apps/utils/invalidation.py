@@ -0,0 +1,213 @@
+# apps/utils/invalidation.py
+"""
+Transaction-aware, coalesced cache invalidation.
+
+Model signals do not touch the cache directly. They record what has to be
+invalidated (namespace generations, object fragments, single keys), and the
+records are:
+
+- held until the surrounding transaction commits (and dropped if it rolls
+  back, so no cache entry is ever built from uncommitted data),
+- deduplicated, and
+- flushed once per request (CacheInvalidationMiddleware) or per
+  batch_invalidations() block, e.g. around a management command.
+
+Outside of a transaction and a batch they are flushed right away.
+
+defer_until_commit() applies the same per-transaction coalescing to other
+post-commit work keyed by ids (read model refreshes, search vectors).
+"""
+import logging
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from django.db import transaction
+
+
+logger = logging.getLogger(__name__)
+
+_state = threading.local()
+
+
+class InvalidationBuffer:
+    """Deduplicated set of pending invalidations"""
+
+    def __init__(self):
+        self.namespaces = set()
+        self.fragments = defaultdict(set)  # model label -> pks
+        self.keys = set()
+
+    def __bool__(self):
+        return bool(self.namespaces or self.fragments or self.keys)
+
+    def merge(self, other):
+        self.namespaces |= other.namespaces
+        for model_label, pks in other.fragments.items():
+            self.fragments[model_label] |= pks
+        self.keys |= other.keys
+
+    def flush(self):
+        from django.core.cache import cache
+        from .cache import invalidate_cache_namespace
+        from .cache_warming import schedule_warming
+        from .fragment_cache import FRAGMENT_NAMESPACE, invalidate_fragments
+
+        for namespace in sorted(self.namespaces):
+            invalidate_cache_namespace(namespace)
+        # A FRAGMENTS generation bump already covers every single fragment
+        if FRAGMENT_NAMESPACE not in self.namespaces:
+            for model_label, pks in self.fragments.items():
+                invalidate_fragments(model_label, pks)
+        if self.keys:
+            cache.delete_many(list(self.keys))
+        # Rebuild hot entries of the invalidated namespaces in the background
+        schedule_warming(self.namespaces)
+
+        logger.debug(
+            "Flushed cache invalidations: namespaces=%s, fragments=%s, keys=%d",
+            sorted(self.namespaces),
+            {model_label: len(pks) for model_label, pks in self.fragments.items()},
+            len(self.keys),
+        )
+
+
+def _deliver(buffer):
+    """Hand committed invalidations to the active batch, or flush them"""
+    batch = getattr(_state, 'batch', None)
+    if batch is not None:
+        batch.merge(buffer)
+    else:
+        buffer.flush()
+
+
+def _is_registered(connection, callback):
+    """Whether callback is still queued to run when the transaction commits"""
+    # On rollback Django discards the callback, and with it the stale pending state
+    return any(callback in entry for entry in connection.run_on_commit)
+
+
+def _transaction_buffer(connection):
+    """Buffer of the current transaction, flushed by a single on_commit callback"""
+    pending = getattr(_state, 'pending', None)
+    if pending is not None and _is_registered(connection, pending.on_commit):
+        return pending
+
+    pending = InvalidationBuffer()
+
+    def on_commit():
+        if getattr(_state, 'pending', None) is pending:
+            _state.pending = None
+        _deliver(pending)
+
+    pending.on_commit = on_commit
+    _state.pending = pending
+    transaction.on_commit(on_commit)
+    return pending
+
+
+def _submit(buffer):
+    connection = transaction.get_connection()
+    if connection.in_atomic_block:
+        _transaction_buffer(connection).merge(buffer)
+    else:
+        _deliver(buffer)
+
+
+def invalidate_namespaces(*namespaces):
+    """Bump the generation of cache namespaces once the data is committed"""
+    buffer = InvalidationBuffer()
+    buffer.namespaces.update(namespaces)
+    _submit(buffer)
+
+
+def invalidate_object_fragments(model_label, pks):
+    """Drop the serialized fragments of objects once the data is committed"""
+    buffer = InvalidationBuffer()
+    buffer.fragments[model_label].update(pk for pk in pks if pk is not None)
+    _submit(buffer)
+
+
+def delete_cache_keys(*keys):
+    """Delete single cache keys once the data is committed"""
+    buffer = InvalidationBuffer()
+    buffer.keys.update(keys)
+    _submit(buffer)
+
+
+class _DeferredCall:
+    """Id sets collected for one callback until the transaction commits"""
+
+    def __init__(self, key, callback):
+        self.key = key
+        self.callback = callback
+        self.id_sets = {}
+
+    def merge(self, id_sets):
+        for name, pks in id_sets.items():
+            self.id_sets.setdefault(name, set()).update(pks)
+
+    def run(self):
+        deferred = getattr(_state, 'deferred', {})
+        if deferred.get(self.key) is self:
+            del deferred[self.key]
+        self.callback(**self.id_sets)
+
+
+def defer_until_commit(key, callback, **id_sets):
+    """
+    Call callback(**id_sets) once the current transaction commits.
+
+    Calls with the same key in one transaction are coalesced into a single
+    callback with the union of each id set, and dropped on rollback.
+    Outside a transaction the callback runs right away. None ids are
+    ignored and nothing runs when every set is empty, so the callback must
+    give each id set keyword a default.
+    """
+    id_sets = {name: {pk for pk in pks if pk is not None} for name, pks in id_sets.items()}
+    if not any(id_sets.values()):
+        return
+    connection = transaction.get_connection()
+    if not connection.in_atomic_block:
+        callback(**id_sets)
+        return
+
+    if not hasattr(_state, 'deferred'):
+        _state.deferred = {}
+    pending = _state.deferred.get(key)
+    if pending is None or not _is_registered(connection, pending.run):
+        pending = _state.deferred[key] = _DeferredCall(key, callback)
+        transaction.on_commit(pending.run)
+    pending.merge(id_sets)
+
+
+@contextmanager
+def batch_invalidations():
+    """
+    Collect invalidations and flush them once when the block exits.
+
+    Use around bulk writes (imports, recalculate_averages, ...) to turn
+    thousands of signal-triggered invalidations into one flush. Nested
+    blocks join the outermost one.
+    """
+    if getattr(_state, 'batch', None) is not None:
+        yield _state.batch
+        return
+
+    batch = _state.batch = InvalidationBuffer()
+    try:
+        yield batch
+    finally:
+        _state.batch = None
+        if batch:
+            batch.flush()
+
+
+class CacheInvalidationMiddleware:
+    """Coalesce the invalidations of a request into one flush"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with batch_invalidations():
+            return self.get_response(request)
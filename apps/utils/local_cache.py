@@ -0,0 +1,146 @@
+# apps/utils/local_cache.py
+import pickle
+import threading
+import time
+from collections import OrderedDict, Counter
+from django.conf import settings
+
+
+# Defaults, overridable through settings.LOCAL_CACHE
+LOCAL_CACHE_DEFAULTS = {
+    'MAX_BYTES': 8 * 1024 * 1024,   # Memory cap per worker process
+    'MAX_TTL': 300,                 # Upper bound for any local entry (seconds)
+    # How long a namespace generation read from the shared cache is reused
+    # (seconds). Saves the shared-cache round trip on local hits, at the cost
+    # of other processes seeing an invalidation up to this much later.
+    'GENERATION_TTL': 1,
+    # Max entries per cache namespace; namespaces not listed are not cached locally
+    'NAMESPACE_LIMITS': {
+        'UNIVERSITIES': 16,
+        'DEPARTMENTS': 256,
+        'RATING_CATEGORIES': 4,
+    },
+}
+
+
+def _estimate_size(value):
+    """Approximate memory footprint of a value (its pickled size)"""
+    try:
+        return len(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return None
+
+
+class LocalCache:
+    """
+    Bounded per-process LRU/TTL cache that sits in front of the shared cache.
+
+    Keys are the generation-stamped keys built by get_cache_key, so entries of
+    an invalidated namespace are never hit again and age out through the LRU.
+    Cached values are shared between requests and must be treated as read-only.
+
+    The generations of locally cached namespaces are kept for generation_ttl
+    seconds as well, so a local hit needs no shared-cache round trip at all.
+    An invalidation made by another process is therefore picked up after at
+    most generation_ttl seconds; the invalidating process sees it at once.
+    """
+
+    def __init__(self, max_bytes, max_ttl, namespace_limits, generation_ttl=0):
+        self.max_bytes = max_bytes
+        self.max_ttl = max_ttl
+        self.namespace_limits = namespace_limits
+        self.generation_ttl = generation_ttl
+        self._entries = OrderedDict()  # key -> (namespace, expires_at, size, value)
+        self._generations = {}  # namespace -> (expires_at, generation)
+        self._namespace_counts = Counter()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _namespace(key):
+        return key.split(':', 1)[0]
+
+    def accepts(self, key):
+        """Whether entries of this key's namespace are cached locally"""
+        return self.namespace_limits.get(self._namespace(key), 0) > 0
+
+    def get_generation(self, namespace):
+        """Recently read generation of a locally cached namespace (None if unknown or expired)"""
+        item = self._generations.get(namespace)
+        if item is None or item[0] <= time.monotonic():
+            return None
+        return item[1]
+
+    def set_generation(self, namespace, generation):
+        if self.generation_ttl > 0 and self.namespace_limits.get(namespace, 0) > 0:
+            self._generations[namespace] = (time.monotonic() + self.generation_ttl, generation)
+
+    def get(self, key):
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            if item[1] <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return item[3]
+
+    def set(self, key, value, timeout=None):
+        namespace = self._namespace(key)
+        limit = self.namespace_limits.get(namespace, 0)
+        if limit <= 0:
+            return False
+
+        size = _estimate_size(value)
+        if size is None or size > self.max_bytes:
+            return False
+
+        ttl = min(timeout or self.max_ttl, self.max_ttl)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            # Per-namespace limit: evict the least recently used entry of this namespace
+            while self._namespace_counts[namespace] >= limit:
+                oldest = next(k for k, item in self._entries.items() if item[0] == namespace)
+                self._remove(oldest)
+
+            # Global memory cap: evict least recently used entries overall
+            while self._entries and self._bytes + size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+            self._entries[key] = (namespace, time.monotonic() + ttl, size, value)
+            self._namespace_counts[namespace] += 1
+            self._bytes += size
+        return True
+
+    def delete(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._namespace_counts.clear()
+            self._bytes = 0
+            self._generations.clear()
+
+    def _remove(self, key):
+        namespace, _, size, _ = self._entries.pop(key)
+        self._namespace_counts[namespace] -= 1
+        self._bytes -= size
+
+
+def _build_local_cache():
+    options = {**LOCAL_CACHE_DEFAULTS, **getattr(settings, 'LOCAL_CACHE', {})}
+    return LocalCache(
+        max_bytes=options['MAX_BYTES'],
+        max_ttl=options['MAX_TTL'],
+        namespace_limits=options['NAMESPACE_LIMITS'],
+        generation_ttl=options['GENERATION_TTL'],
+    )
+
+
+local_cache = _build_local_cache()
@@ -0,0 +1,89 @@
+# apps/utils/management/commands/cache_benchmark.py
+import pickle
+import time
+import zlib
+from django.core.management.base import BaseCommand
+from apps.utils.cache_serializers import TaggedSerializer
+
+
+class PickleZlibCodec:
+    """What django-redis' PickleSerializer + ZlibCompressor store"""
+    name = 'pickle+zlib'
+
+    def dumps(self, value):
+        return zlib.compress(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+
+    def loads(self, value):
+        return pickle.loads(zlib.decompress(value))
+
+
+class TaggedCodec:
+    name = 'tagged (orjson/pickle, lz4 above 1KB)'
+
+    def __init__(self):
+        self.serializer = TaggedSerializer({})
+
+    def dumps(self, value):
+        return self.serializer.dumps(value)
+
+    def loads(self, value):
+        return self.serializer.loads(value)
+
+
+class Command(BaseCommand):
+    help = 'Compare cache codecs (encode/decode CPU and bytes) on real API payloads'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=200, help='Round trips per payload')
+        parser.add_argument('--size', type=int, default=100, help='Items per list payload')
+
+    def handle(self, *args, **options):
+        codecs = [PickleZlibCodec(), TaggedCodec()]
+
+        for name, data in self.collect_payloads(options['size']):
+            # Wrap the data the way cache_response stores it
+            entry = {'data': data, 'etag': '"0"', 'delta': 0.1, 'expires_at': time.time()}
+            self.stdout.write(f"\n📦 {name}")
+            for codec in codecs:
+                encoded, encode_ms, decode_ms = self.measure(codec, entry, options['iterations'])
+                self.stdout.write(
+                    f"   {codec.name:<40} {len(encoded):>9} bytes   "
+                    f"encode {encode_ms:7.3f} ms   decode {decode_ms:7.3f} ms"
+                )
+
+    def collect_payloads(self, size):
+        """Serialized data of the lab list, publication list and statistics endpoints"""
+        from rest_framework.test import APIRequestFactory
+        from apps.labs.models import Lab
+        from apps.labs.serializers import LabListSerializer
+        from apps.publications.models import Publication
+        from apps.publications.serializers import PublicationListSerializer, prefetch_publication_summaries
+        from apps.publications.views import PublicationViewSet
+
+        factory = APIRequestFactory()
+
+        labs = Lab.objects.select_related(
+            'head_professor', 'university', 'university_department__university',
+            'university_department__department', 'research_group'
+        ).prefetch_related('recruitment_status', 'professors')[:size]
+        yield 'lab list', LabListSerializer(labs, many=True).data
+
+        publications = prefetch_publication_summaries(Publication.objects.all())[:size]
+        yield 'publication list', PublicationListSerializer(publications, many=True).data
+
+        statistics = PublicationViewSet.as_view({'get': 'statistics'})(factory.get('/'))
+        if statistics.status_code == 200:
+            yield 'publication statistics', statistics.data
+
+    @staticmethod
+    def measure(codec, value, iterations):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            encoded = codec.dumps(value)
+        encode_ms = (time.perf_counter() - started) * 1000 / iterations
+
+        started = time.perf_counter()
+        for _ in range(iterations):
+            codec.loads(encoded)
+        decode_ms = (time.perf_counter() - started) * 1000 / iterations
+        return encoded, encode_ms, decode_ms
@@ -2,6 +2,7 @@
 from django.core.management.base import BaseCommand
 from django.core.cache import cache
 from apps.utils.cache import warm_cache, CacheManager
+from apps.utils.cache_metrics import cache_metrics, sample_keyspace, summarize
 from apps.utils.signals import invalidate_all_caches, warm_critical_caches
 
 
@@ -16,13 +17,25 @@ class Command(BaseCommand):
             choices=['warm', 'clear', 'status', 'warmcritical'],
             required=True
         )
+        parser.add_argument(
+            '--namespaces',
+            nargs='+',
+            help='Only warm entries of these cache namespaces (e.g. LABS PUBLICATIONS)',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help='Number of warmers run in parallel (default: CACHE_WARMING MAX_WORKERS)',
+        )
 
     def handle(self, *args, **options):
         action = options['action']
 
         if action == 'warm':
             self.stdout.write('Warming up caches...')
-            warm_cache()
+            results = warm_cache(namespaces=options['namespaces'], max_workers=options['workers'])
+            self._write_warm_results(results)
             self.stdout.write(self.style.SUCCESS('✅ Cache warming completed'))
 
         elif action == 'clear':
@@ -32,7 +45,7 @@ class Command(BaseCommand):
 
         elif action == 'warmcritical':
             self.stdout.write('Warming critical caches...')
-            warm_critical_caches()
+            self._write_warm_results(warm_critical_caches())
             self.stdout.write(self.style.SUCCESS('✅ Critical caches warmed'))
 
         elif action == 'status':
@@ -58,11 +71,42 @@ class Command(BaseCommand):
                 self.stdout.write(f"   Cache hits: {info.get('keyspace_hits', 'N/A')}")
                 self.stdout.write(f"   Cache misses: {info.get('keyspace_misses', 'N/A')}")
 
-                # Count keys by pattern
-                patterns = ['UNIVERSITIES*', 'DEPARTMENTS*', 'LABS*', 'PROFESSORS*', 'REVIEWS*']
-                for pattern in patterns:
-                    keys = redis_conn.keys(f"insidelab:1:{pattern}")
-                    self.stdout.write(f"   {pattern}: {len(keys)} keys")
+                # Estimate keys/memory per namespace from a SCAN sample
+                keyspace = sample_keyspace(redis_conn)
+                self.stdout.write(
+                    f"🔑 Keys: {keyspace['total_keys']} total, {keyspace['sampled_keys']} sampled"
+                )
+                for namespace, stats in sorted(keyspace['namespaces'].items()):
+                    memory = stats['estimated_bytes']
+                    memory = f"{memory / 1024:.1f} KB" if memory is not None else 'N/A'
+                    self.stdout.write(f"   {namespace}: ~{stats['estimated_keys']} keys, ~{memory}")
 
             except Exception as e:
-                self.stdout.write(self.style.ERROR(f'❌ Cache status check failed: {e}'))
\ No newline at end of file
+                self.stdout.write(self.style.ERROR(f'❌ Cache status check failed: {e}'))
+
+            self._write_metrics()
+
+    def _write_warm_results(self, results):
+        for result in results:
+            if result['status'] == 'failed':
+                self.stdout.write(self.style.WARNING(f"   ⚠️ {result['name']}: {result['error']}"))
+            else:
+                self.stdout.write(f"   {result['name']}: {result['status']} ({result['seconds'] * 1000:.0f}ms)")
+        warmed = sum(result['status'] == 'warmed' for result in results)
+        self.stdout.write(f"🔥 {warmed}/{len(results)} warmers rebuilt their entries")
+
+    def _write_metrics(self):
+        collected = cache_metrics.collect()
+        self.stdout.write(f"📈 Cache Metrics ({collected['workers']} workers):")
+        if not collected['cache_types']:
+            self.stdout.write('   No cache lookups recorded yet')
+        for cache_type, metrics in sorted(collected['cache_types'].items()):
+            summary = summarize(metrics)
+            hit_ratio = f"{summary['hit_ratio']:.1%}" if summary['hit_ratio'] is not None else 'N/A'
+            self.stdout.write(
+                f"   {cache_type}: hits={summary['hits']} misses={summary['misses']} "
+                f"hit_ratio={hit_ratio} set_failures={summary['set_failures']} "
+                f"avg_payload={summary['avg_payload_bytes'] / 1024:.1f}KB "
+                f"avg_lookup={summary['avg_lookup_ms']:.2f}ms "
+                f"avg_recompute={summary['avg_recompute_ms']:.1f}ms"
+            )
@@ -0,0 +1,197 @@
+# apps/utils/pagination.py
+"""
+Opt-in keyset (cursor) pagination for large lists.
+
+Page numbers need an OFFSET scan and a COUNT(*) over the filtered queryset,
+both of which grow with the table. Views using KeysetPaginationMixin switch
+to keyset pagination when the request asks for it:
+
+    /publications/?pagination=cursor            first page
+    /publications/?pagination=cursor&cursor=... next/previous links
+
+Pages are fetched with a WHERE on the last seen values of the view's
+cursor_ordering (which must end with a unique field) and LIMIT, so every
+page costs the same and is served by the matching composite index. The
+response has next/previous links instead of a count; ?count=estimate adds
+an X-Estimated-Count header taken from the query planner on PostgreSQL
+(an exact count elsewhere).
+
+Cursor mode always uses cursor_ordering; ?ordering= only applies to page
+numbers.
+"""
+import base64
+import json
+from functools import reduce
+from operator import or_
+
+from django.core.exceptions import ValidationError
+from django.db import connections
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination
+from rest_framework.utils.urls import replace_query_param
+
+
+PAGINATION_QUERY_PARAM = 'pagination'
+CURSOR_MODE = 'cursor'
+COUNT_QUERY_PARAM = 'count'
+COUNT_ESTIMATE = 'estimate'
+ESTIMATED_COUNT_HEADER = 'X-Estimated-Count'
+
+ANNOTATION_PREFIX = 'keyset_'
+
+
+def wants_keyset_pagination(request):
+    """?pagination=cursor, or a cursor from a previous page's link"""
+    params = request.query_params
+    return params.get(PAGINATION_QUERY_PARAM) == CURSOR_MODE or bool(params.get(KeysetPagination.cursor_query_param))
+
+
+def estimate_count(queryset):
+    """Row estimate of the planner on PostgreSQL, an exact count on other databases"""
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return queryset.count()
+
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def _split(field):
+    return field.lstrip('-'), field.startswith('-')
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor pagination over a composite ordering.
+
+    DRF's CursorPagination keys on the first ordering field only and skips
+    ties with an OFFSET; here the cursor holds every ordering value, so pages
+    never scan ties again.
+    """
+
+    def __init__(self, ordering):
+        self.ordering = tuple(ordering)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+        self.model = queryset.model
+        values, reverse = self.decode_cursor(request)
+
+        self.estimated_count = None
+        if request.query_params.get(COUNT_QUERY_PARAM) == COUNT_ESTIMATE:
+            self.estimated_count = estimate_count(queryset)
+
+        ordering = self._reversed_ordering() if reverse else self.ordering
+        # Cursor values are read from annotations: list views may defer the ordering fields
+        queryset = queryset.annotate(**{
+            ANNOTATION_PREFIX + name: F(name) for name, _ in map(_split, self.ordering)
+        }).order_by(*ordering)
+        if values is not None:
+            queryset = queryset.filter(self._after(ordering, values))
+
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        self.page = results[:self.page_size]
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, values is not None
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+    def _reversed_ordering(self):
+        return tuple(name if descending else f'-{name}' for name, descending in map(_split, self.ordering))
+
+    def _after(self, ordering, values):
+        """Rows after values in ordering: (a > x) OR (a = x AND b > y) OR ..."""
+        clauses = []
+        for index, field in enumerate(ordering):
+            name, descending = _split(field)
+            clause = Q(**{f"{name}__{'lt' if descending else 'gt'}": values[index]})
+            for previous, value in zip(ordering[:index], values[:index]):
+                clause &= Q(**{_split(previous)[0]: value})
+            clauses.append(clause)
+        return reduce(or_, clauses)
+
+    def _position(self, instance):
+        position = []
+        for name, _ in map(_split, self.ordering):
+            value = getattr(instance, ANNOTATION_PREFIX + name)
+            position.append(value.isoformat() if hasattr(value, 'isoformat') else value)
+        return position
+
+    def decode_cursor(self, request):
+        """(ordering values, reverse) of the cursor parameter, (None, False) on the first page"""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')))
+            position, reverse = payload['p'], bool(payload.get('r'))
+            if len(position) != len(self.ordering):
+                raise ValueError
+            values = [
+                self.model._meta.get_field(name).to_python(value)
+                for (name, _), value in zip(map(_split, self.ordering), position)
+            ]
+        except (TypeError, ValueError, KeyError, UnicodeError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+        return values, reverse
+
+    def encode_cursor(self, position, reverse=False):
+        payload = json.dumps({'p': position, 'r': int(reverse)}, separators=(',', ':'), default=str)
+        encoded = base64.urlsafe_b64encode(payload.encode()).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self._position(self.page[-1]))
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self._position(self.page[0]), reverse=True)
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        if self.estimated_count is not None:
+            response[ESTIMATED_COUNT_HEADER] = str(self.estimated_count)
+        return response
+
+
+class KeysetPaginationMixin:
+    """
+    Keyset pagination on request for a list view.
+
+    cursor_ordering is the view's default ordering followed by a unique
+    field, e.g. ('-publication_year', '-citation_count', 'id'). Only the list
+    action pages by cursor; extra actions keep their own ordering.
+    """
+    cursor_ordering = None
+
+    def get_cursor_ordering(self):
+        if getattr(self, 'action', None) != 'list':
+            return None
+        return self.cursor_ordering
+
+    @property
+    def paginator(self):
+        if not hasattr(self, '_paginator'):
+            ordering = self.get_cursor_ordering()
+            if ordering and wants_keyset_pagination(self.request):
+                self._paginator = KeysetPagination(ordering)
+            else:
+                return super().paginator
+        return self._paginator
@@ -1,8 +1,14 @@
 # apps/utils/signals.py
-from django.db.models.signals import post_save, post_delete
+from django.db.models.signals import m2m_changed, post_save, post_delete, pre_delete, pre_save
 from django.dispatch import receiver
 from django.core.cache import cache
-from .cache import CacheManager, invalidate_model_cache
+from django.db.models import Q
+from .cache import CacheManager, get_cache_key
+from .invalidation import delete_cache_keys, invalidate_object_fragments
+from .local_cache import local_cache
+
+# Receivers only record invalidations; they are applied once the transaction
+# commits, deduplicated per request/batch (see invalidation.py)
 
 
 @receiver(post_save, sender='universities.University')
@@ -10,7 +16,6 @@ from .cache import CacheManager, invalidate_model_cache
 def invalidate_university_cache(sender, instance, **kwargs):
     """Invalidate university-related caches when University changes"""
     CacheManager.invalidate_related_caches('university', instance.id)
-    print(f"Invalidated university cache for: {instance.name}")
 
 
 @receiver(post_save, sender='universities.Department')
@@ -18,19 +23,14 @@ def invalidate_university_cache(sender, instance, **kwargs):
 def invalidate_department_cache(sender, instance, **kwargs):
     """Invalidate department-related caches when Department changes"""
     CacheManager.invalidate_related_caches('department', instance.id)
-    print(f"Invalidated department cache for: {instance.name}")
 
 
 @receiver(post_save, sender='universities.UniversityDepartment')
 @receiver(post_delete, sender='universities.UniversityDepartment')
 def invalidate_university_department_cache(sender, instance, **kwargs):
     """Invalidate university department caches when UniversityDepartment changes"""
+    # DEPARTMENTS generation bump also covers the per-university department lists
     CacheManager.invalidate_related_caches('department')
-    # Also invalidate specific university's department cache
-    if hasattr(instance, 'university_id'):
-        cache_key = f"insidelab:1:DEPARTMENTS:university:{instance.university_id}"
-        cache.delete(cache_key)
-    print(f"Invalidated university department cache for: {instance}")
 
 
 @receiver(post_save, sender='universities.Professor')
@@ -38,39 +38,36 @@ def invalidate_university_department_cache(sender, instance, **kwargs):
 def invalidate_professor_cache(sender, instance, **kwargs):
     """Invalidate professor-related caches when Professor changes"""
     CacheManager.invalidate_related_caches('professor', instance.id)
-    print(f"Invalidated professor cache for: {instance.name}")
 
 
 @receiver(post_save, sender='labs.Lab')
 @receiver(post_delete, sender='labs.Lab')
 def invalidate_lab_cache(sender, instance, **kwargs):
     """Invalidate lab-related caches when Lab changes"""
-    # Only invalidate specific lab cache, not all LABS pattern
-    from django.core.cache import cache
-    lab_cache_key = f"insidelab:1:LAB:{instance.id}"
-    cache.delete(lab_cache_key)
-    # Note: Removed pattern-based invalidation for performance
+    # Generation bumps are O(1), so namespace invalidation is cheap again
+    CacheManager.invalidate_related_caches('lab', instance.id)
 
 
 @receiver(post_save, sender='reviews.Review')
 @receiver(post_delete, sender='reviews.Review')
 def invalidate_review_cache(sender, instance, **kwargs):
     """Invalidate review-related caches when Review changes"""
-    # Skip full cache invalidation - too slow for production
-    # Instead, only invalidate specific cache keys
-    from django.core.cache import cache
+    # Generation bumps are O(1), so namespace invalidation is cheap again
+    CacheManager.invalidate_related_caches('review', instance.id)
+
 
-    # Invalidate specific review cache
-    review_cache_key = f"insidelab:1:REVIEW:{instance.id}"
-    cache.delete(review_cache_key)
+@receiver(post_save, sender='publications.Publication')
+@receiver(post_delete, sender='publications.Publication')
+def invalidate_publication_cache(sender, instance, **kwargs):
+    """Invalidate publication-related caches when Publication changes"""
+    CacheManager.invalidate_related_caches('publication', instance.id)
 
-    # Invalidate specific lab's cache only if it exists
-    if hasattr(instance, 'lab_id') and instance.lab_id:
-        lab_cache_key = f"insidelab:1:LAB:{instance.lab_id}"
-        cache.delete(lab_cache_key)
 
-    # Note: Removed pattern-based cache invalidation to improve performance
-    # Cache will expire naturally based on TTL settings
+@receiver(post_save, sender='reviews.RatingCategory')
+@receiver(post_delete, sender='reviews.RatingCategory')
+def invalidate_rating_category_cache(sender, instance, **kwargs):
+    """Invalidate rating category caches when RatingCategory changes"""
+    CacheManager.invalidate_related_caches('rating_category', instance.id)
 
 
 @receiver(post_save, sender='universities.ResearchGroup')
@@ -78,15 +75,295 @@ def invalidate_review_cache(sender, instance, **kwargs):
 def invalidate_research_group_cache(sender, instance, **kwargs):
     """Invalidate research group caches when ResearchGroup changes"""
     CacheManager.invalidate_related_caches('research_group', instance.id)
-    print(f"Invalidated research group cache for: {instance.name}")
+
+
+@receiver(post_save, sender='publications.ResearchArea')
+@receiver(post_delete, sender='publications.ResearchArea')
+@receiver(post_save, sender='publications.PublicationResearchArea')
+@receiver(post_delete, sender='publications.PublicationResearchArea')
+def invalidate_research_area_cache(sender, instance, **kwargs):
+    """Invalidate the research area hierarchy when areas or their links change"""
+    CacheManager.invalidate_related_caches('research_area', instance.id)
+
+
+# Per-object fragment invalidation: an object's own saves change its
+# updated_at (and so its fragment keys); these receivers drop the fragments
+# of objects that display the changed row. Deletions are handled in
+# pre_delete, before SET_NULL clears the links.
+
+@receiver(post_save, sender='universities.Professor')
+@receiver(pre_delete, sender='universities.Professor')
+def invalidate_professor_lab_fragments(sender, instance, **kwargs):
+    """Lab cards show head professor and member names"""
+    from apps.labs.models import Lab
+    lab_ids = Lab.objects.filter(
+        Q(head_professor_id=instance.id) | Q(professors__id=instance.id)
+    ).values_list('id', flat=True)
+    invalidate_object_fragments('labs.Lab', [instance.lab_id, *lab_ids])
+
+
+@receiver(post_save, sender='labs.Lab')
+@receiver(pre_delete, sender='labs.Lab')
+def invalidate_lab_professor_fragments(sender, instance, **kwargs):
+    """Professor cards show their lab's name, tags and recruitment status"""
+    from apps.universities.models import Professor
+    professor_ids = Professor.objects.filter(
+        Q(lab_id=instance.id) | Q(headed_labs__id=instance.id)
+    ).values_list('id', flat=True)
+    invalidate_object_fragments('universities.Professor', list(professor_ids))
+
+
+@receiver(post_save, sender='labs.RecruitmentStatus')
+@receiver(post_delete, sender='labs.RecruitmentStatus')
+def invalidate_recruitment_fragments(sender, instance, **kwargs):
+    """Recruitment status is embedded in lab and professor cards"""
+    from apps.universities.models import Professor
+    invalidate_object_fragments('labs.Lab', [instance.lab_id])
+    professor_ids = Professor.objects.filter(
+        Q(lab_id=instance.lab_id) | Q(headed_labs__id=instance.lab_id)
+    ).values_list('id', flat=True)
+    invalidate_object_fragments('universities.Professor', list(professor_ids))
+
+
+@receiver(post_save, sender='publications.PublicationAuthor')
+@receiver(post_delete, sender='publications.PublicationAuthor')
+@receiver(post_save, sender='publications.PublicationVenue')
+@receiver(post_delete, sender='publications.PublicationVenue')
+@receiver(post_save, sender='publications.PublicationResearchArea')
+@receiver(post_delete, sender='publications.PublicationResearchArea')
+def invalidate_publication_relation_fragments(sender, instance, **kwargs):
+    """Authors, venues and research areas are listed in publication cards"""
+    invalidate_object_fragments('publications.Publication', [instance.publication_id])
+
+
+@receiver(post_save, sender='publications.Author')
+@receiver(post_save, sender='publications.Venue')
+@receiver(post_save, sender='publications.ResearchArea')
+def invalidate_related_publication_fragments(sender, instance, **kwargs):
+    """Renaming an author/venue/research area changes its publications' cards"""
+    from apps.publications.models import Publication
+    lookup = {
+        'Author': 'authors',
+        'Venue': 'venues',
+        'ResearchArea': 'research_areas',
+    }[sender.__name__]
+    publication_ids = Publication.objects.filter(**{lookup: instance.id}).values_list('id', flat=True)
+    invalidate_object_fragments('publications.Publication', list(publication_ids))
+
+
+# Full-text search vectors of publications (PostgreSQL only), recomputed
+# after commit from the publication row and its authors/venues
+
+@receiver(post_save, sender='publications.Publication')
+def update_publication_search_vector(sender, instance, update_fields=None, **kwargs):
+    """Title, keywords, abstract and notes are indexed"""
+    from apps.publications.search import SEARCH_VECTOR_FIELDS, schedule_search_vector_update
+    if update_fields is not None and not SEARCH_VECTOR_FIELDS & set(update_fields):
+        return
+    schedule_search_vector_update([instance.pk])
+
+
+@receiver(post_save, sender='publications.Publication')
+def sync_publication_keyword_index(sender, instance, update_fields=None, raw=False, **kwargs):
+    """Keep the normalized keyword table in sync with Publication.keywords"""
+    from apps.publications.keywords import sync_publication_keywords
+    if raw or (update_fields is not None and 'keywords' not in update_fields):
+        return
+    sync_publication_keywords([instance])
+
+
+@receiver(post_save, sender='publications.PublicationAuthor')
+@receiver(post_delete, sender='publications.PublicationAuthor')
+@receiver(post_save, sender='publications.PublicationVenue')
+@receiver(post_delete, sender='publications.PublicationVenue')
+def update_relation_search_vector(sender, instance, **kwargs):
+    """Author and venue names are indexed with their publications"""
+    from apps.publications.search import schedule_search_vector_update
+    schedule_search_vector_update([instance.publication_id])
+
+
+@receiver(post_save, sender='publications.Author')
+@receiver(post_save, sender='publications.Venue')
+def update_related_search_vectors(sender, instance, update_fields=None, **kwargs):
+    """Renaming an author/venue changes the search vectors of its publications"""
+    from apps.publications.models import Publication
+    from apps.publications.search import is_full_text_supported, schedule_search_vector_update
+    if not is_full_text_supported():
+        return
+    if update_fields is not None and not {'name', 'short_name'} & set(update_fields):
+        return
+    lookup = 'authors' if sender.__name__ == 'Author' else 'venues'
+    publication_ids = Publication.objects.filter(**{lookup: instance.id}).values_list('id', flat=True)
+    schedule_search_vector_update(list(publication_ids))
+
+
+# Per-lab publication statistics (LabPublicationStats read model), recomputed
+# after commit for the labs whose publications changed
+
+@receiver(post_save, sender='publications.Publication')
+def refresh_publication_lab_stats(sender, instance, created=False, update_fields=None, raw=False, **kwargs):
+    """Citations, year and open access feed the lab statistics"""
+    from apps.publications.lab_stats import (
+        LAB_STATS_FIELDS, lab_ids_for_publications, schedule_lab_stats_refresh
+    )
+    # A new publication has no labs yet, they are added through m2m_changed
+    if raw or created or (update_fields is not None and not LAB_STATS_FIELDS & set(update_fields)):
+        return
+    schedule_lab_stats_refresh(lab_ids_for_publications([instance.pk]))
+
+
+@receiver(pre_delete, sender='publications.Publication')
+def refresh_deleted_publication_lab_stats(sender, instance, **kwargs):
+    """The lab links are gone after the delete, so collect the labs first"""
+    from apps.publications.lab_stats import lab_ids_for_publications, schedule_lab_stats_refresh
+    schedule_lab_stats_refresh(lab_ids_for_publications([instance.pk]))
+
+
+@receiver(m2m_changed, sender='publications.Publication_labs')
+def refresh_linked_lab_stats(sender, instance, action, reverse, pk_set, **kwargs):
+    """Publications added to or removed from labs"""
+    from apps.publications.lab_stats import schedule_lab_stats_refresh
+    if action not in ('post_add', 'post_remove', 'pre_clear'):
+        return
+    if reverse:
+        lab_ids = [instance.pk]
+    elif action == 'pre_clear':
+        lab_ids = list(instance.labs.values_list('id', flat=True))
+    else:
+        lab_ids = pk_set or []
+    schedule_lab_stats_refresh(lab_ids)
+
+
+@receiver(post_save, sender='publications.PublicationVenue')
+@receiver(post_delete, sender='publications.PublicationVenue')
+@receiver(post_save, sender='publications.PublicationResearchArea')
+@receiver(post_delete, sender='publications.PublicationResearchArea')
+def refresh_relation_lab_stats(sender, instance, raw=False, **kwargs):
+    """Venues and research areas are counted per lab"""
+    from apps.publications.lab_stats import lab_ids_for_publications, schedule_lab_stats_refresh
+    if raw:
+        return
+    schedule_lab_stats_refresh(lab_ids_for_publications([instance.publication_id]))
+
+
+@receiver(post_save, sender='publications.Venue')
+@receiver(post_save, sender='publications.ResearchArea')
+def refresh_related_lab_stats(sender, instance, created=False, raw=False, **kwargs):
+    """Venue/research area names, tiers and colors are copied into the statistics"""
+    from apps.labs.models import Lab
+    from apps.publications.lab_stats import schedule_lab_stats_refresh
+    if raw or created:
+        return
+    lookup = 'publications__venues' if sender.__name__ == 'Venue' else 'publications__research_areas'
+    schedule_lab_stats_refresh(Lab.objects.filter(**{lookup: instance.id}).values_list('id', flat=True).distinct())
+
+
+# Author/professor citation metrics (h-index, i10-index, total citations),
+# recomputed after commit for the authors whose publications changed
+
+@receiver(post_save, sender='publications.Publication')
+def refresh_publication_citation_metrics(sender, instance, created=False, update_fields=None, raw=False, **kwargs):
+    """Citation counts feed the metrics of the publication's authors"""
+    from apps.publications.citation_metrics import author_ids_for_publications, schedule_citation_metrics_refresh
+    # A new publication has no authors yet, they are linked through PublicationAuthor
+    if raw or created or (update_fields is not None and 'citation_count' not in update_fields):
+        return
+    schedule_citation_metrics_refresh(author_ids=author_ids_for_publications([instance.pk]))
+
+
+@receiver(pre_delete, sender='publications.Publication')
+def refresh_deleted_publication_citation_metrics(sender, instance, **kwargs):
+    """The author links are gone after the delete, so collect the authors first"""
+    from apps.publications.citation_metrics import author_ids_for_publications, schedule_citation_metrics_refresh
+    schedule_citation_metrics_refresh(author_ids=author_ids_for_publications([instance.pk]))
+
+
+@receiver(post_save, sender='publications.PublicationAuthor')
+@receiver(post_delete, sender='publications.PublicationAuthor')
+def refresh_linked_author_citation_metrics(sender, instance, raw=False, **kwargs):
+    """Publications added to or removed from an author"""
+    from apps.publications.citation_metrics import schedule_citation_metrics_refresh
+    if raw:
+        return
+    schedule_citation_metrics_refresh(author_ids=[instance.author_id])
+
+
+@receiver(post_save, sender='universities.Professor')
+def refresh_professor_citation_metrics(sender, instance, update_fields=None, raw=False, **kwargs):
+    """The Scholar id decides which publications count for a professor"""
+    from apps.publications.citation_metrics import schedule_citation_metrics_refresh
+    if raw or (update_fields is not None and 'scholar_id' not in update_fields):
+        return
+    schedule_citation_metrics_refresh(professor_ids=[instance.pk])
+
+
+# Co-authorship and lab-to-lab edges (CoauthorEdge, LabCollaborationEdge),
+# recomputed after commit for the authors and labs whose links changed
+
+@receiver(pre_save, sender='publications.PublicationAuthor')
+def remember_previous_collaboration_link(sender, instance, raw=False, **kwargs):
+    """A changed author or affiliation lab also leaves stale edges for the old one"""
+    if raw or instance.pk is None:
+        return
+    instance._previous_collaboration_link = sender.objects.filter(pk=instance.pk).values_list(
+        'author_id', 'affiliation_lab_id'
+    ).first()
+
+
+@receiver(post_save, sender='publications.PublicationAuthor')
+@receiver(post_delete, sender='publications.PublicationAuthor')
+def refresh_collaboration_edges(sender, instance, raw=False, **kwargs):
+    """Authors and labs added to or removed from a publication"""
+    from apps.publications.collaboration_graph import schedule_collaboration_refresh
+    if raw:
+        return
+    author_ids, lab_ids = [instance.author_id], [instance.affiliation_lab_id]
+    previous = getattr(instance, '_previous_collaboration_link', None)
+    if previous:
+        author_ids.append(previous[0])
+        lab_ids.append(previous[1])
+    schedule_collaboration_refresh(author_ids=author_ids, lab_ids=lab_ids)
+
+
+@receiver(pre_save, sender='publications.Publication')
+def remember_previous_publication_year(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Edges only have to be refreshed when the year actually changes"""
+    if raw or instance.pk is None or (update_fields is not None and 'publication_year' not in update_fields):
+        return
+    instance._previous_publication_year = sender.objects.filter(pk=instance.pk).values_list(
+        'publication_year', flat=True
+    ).first()
+
+
+@receiver(post_save, sender='publications.Publication')
+def refresh_publication_collaboration_edges(sender, instance, created=False, update_fields=None, raw=False,
+                                            **kwargs):
+    """The publication year is stored as first/last collaboration year"""
+    from apps.publications.collaboration_graph import links_for_publications, schedule_collaboration_refresh
+    if raw or created or (update_fields is not None and 'publication_year' not in update_fields):
+        return
+    previous = instance.__dict__.pop('_previous_publication_year', None)
+    if previous == instance.publication_year:
+        return
+    author_ids, lab_ids = links_for_publications([instance.pk])
+    schedule_collaboration_refresh(author_ids=author_ids, lab_ids=lab_ids)
+
+
+# Research area hierarchy (materialized ResearchArea.path); inserts and moves
+# are handled in ResearchArea.save()
+
+@receiver(post_delete, sender='publications.ResearchArea')
+def detach_research_area_descendants(sender, instance, **kwargs):
+    """Children of a deleted area become roots (SET_NULL), so their paths are shortened"""
+    from apps.publications.research_area_tree import detach_descendants
+    detach_descendants(instance.pk)
 
 
 @receiver(post_save, sender='authentication.User')
 def invalidate_user_cache(sender, instance, **kwargs):
     """Invalidate user-specific caches when User changes"""
     # Invalidate user profile cache
-    cache_key = f"insidelab:1:USER_PROFILE:{instance.id}"
-    cache.delete(cache_key)
+    delete_cache_keys(get_cache_key('USER_PROFILE', instance.id))
     # Only log in development/debug mode to reduce noise in production
     import logging
     logger = logging.getLogger(__name__)
@@ -97,11 +374,11 @@ def invalidate_user_cache(sender, instance, **kwargs):
 def invalidate_all_caches():
     """Invalidate all application caches - use sparingly"""
     cache.clear()
+    local_cache.clear()
     print("All caches cleared!")
 
 
 def warm_critical_caches():
     """Warm up critical caches after invalidation"""
-    from .cache import warm_cache
-    warm_cache()
-    print("Critical caches warmed up!")
\ No newline at end of file
+    from .cache_warming import PRIORITY_HIGH, warm_caches
+    return warm_caches(max_priority=PRIORITY_HIGH)
\ No newline at end of file
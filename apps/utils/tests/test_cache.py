@@ -0,0 +1,326 @@
+import time
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+import json
+
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from apps.utils.cache import (
+    cache_response, get_cache_key, get_namespace_generation, invalidate_cache_namespace,
+    CacheManager, _build_response_cache_key
+)
+from apps.universities.models import University
+
+
+LOCMEM_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'insidelab-cache-tests',
+    }
+}
+
+
+class CountingView:
+    """Minimal view object that counts how often the wrapped action really runs"""
+
+    def __init__(self):
+        self.calls = 0
+
+    @cache_response('UNIVERSITIES', timeout=60)
+    def list(self, request):
+        self.calls += 1
+        return Response({'calls': self.calls})
+
+
+class SingleFlightView(CountingView):
+    """Counting view cached in single-flight mode"""
+
+    @cache_response('PUBLICATIONS', timeout=60, single_flight=True)
+    def list(self, request):
+        self.calls += 1
+        return Response({'calls': self.calls})
+
+
+class StaleWhileRevalidateView(CountingView):
+    """Counting view cached with a stale-while-revalidate window"""
+
+    @cache_response('LAB_STATS', timeout=60, stale_ttl=600)
+    def list(self, request):
+        self.calls += 1
+        return Response({'calls': self.calls})
+
+
+class RenderedView(APIView):
+    """DRF view caching its rendered JSON bytes"""
+    permission_classes = [AllowAny]
+    authentication_classes = []
+    calls = 0
+
+    @cache_response('PROFESSORS', timeout=60, rendered=True)
+    def get(self, request):
+        RenderedView.calls += 1
+        return Response({'name': 'Dr. Test', 'calls': RenderedView.calls})
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class NamespaceGenerationTest(TestCase):
+    """Test cases for generation-based cache invalidation"""
+
+    def setUp(self):
+        cache.clear()
+        self.factory = APIRequestFactory()
+
+    def test_generation_is_stable_until_invalidated(self):
+        """Test the generation only changes on invalidation"""
+        first = get_namespace_generation('LABS')
+        self.assertEqual(first, get_namespace_generation('LABS'))
+
+        invalidate_cache_namespace('LABS')
+        self.assertEqual(get_namespace_generation('LABS'), first + 1)
+
+    def test_cache_key_changes_after_invalidation(self):
+        """Test keys of an invalidated namespace are never reused"""
+        key_before = get_cache_key('LABS', 'list')
+        invalidate_cache_namespace('LABS')
+        self.assertNotEqual(key_before, get_cache_key('LABS', 'list'))
+
+    def test_invalidation_is_scoped_to_namespace(self):
+        """Test bumping one namespace leaves others untouched"""
+        university_key = get_cache_key('UNIVERSITIES', 'list')
+        invalidate_cache_namespace('LABS')
+        self.assertEqual(university_key, get_cache_key('UNIVERSITIES', 'list'))
+
+    def test_cache_response_recomputes_after_invalidation(self):
+        """Test cached responses are served until the namespace is invalidated"""
+        view = CountingView()
+        request = self.factory.get('/api/v1/universities/')
+
+        view.list(request)
+        view.list(request)
+        self.assertEqual(view.calls, 1)
+
+        invalidate_cache_namespace('UNIVERSITIES')
+        view.list(request)
+        self.assertEqual(view.calls, 2)
+
+    def test_model_signal_invalidates_dependent_namespaces(self):
+        """Test saving a University invalidates university-related namespaces"""
+        CacheManager.set_universities([{'id': 1, 'name': 'Cached University'}])
+        self.assertIsNotNone(CacheManager.get_universities())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            University.objects.create(name="Signal University", country="USA")
+
+        self.assertIsNone(CacheManager.get_universities())
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class SingleFlightTest(TestCase):
+    """Test cases for single-flight recomputation and XFetch early refresh"""
+
+    def setUp(self):
+        cache.clear()
+        self.factory = APIRequestFactory()
+        self.request = self.factory.get('/api/v1/publications/statistics/')
+
+    def _entry_key(self):
+        view = SingleFlightView()
+        view.list(self.request)
+        return view, _build_response_cache_key('PUBLICATIONS', self.request, False)
+
+    def test_waiter_uses_result_of_lock_holder(self):
+        """Test a worker that loses the lock waits instead of recomputing"""
+        view, cache_key = self._entry_key()
+        entry = cache.get(cache_key)
+        cache.delete(cache_key)
+        cache.add(f"{cache_key}:lock", 1, 30)
+
+        def lock_holder_finishes(seconds):
+            cache.set(cache_key, entry, 60)
+
+        with mock.patch('apps.utils.cache.time.sleep', side_effect=lock_holder_finishes):
+            response = view.list(self.request)
+
+        self.assertEqual(view.calls, 1)
+        self.assertEqual(response.data, {'calls': 1})
+
+    def test_expiring_entry_is_refreshed_early(self):
+        """Test an entry about to expire is recomputed before its TTL ends"""
+        view, cache_key = self._entry_key()
+        entry = cache.get(cache_key)
+        entry['delta'] = 60
+        entry['expires_at'] = time.time() + 1
+        cache.set(cache_key, entry, 60)
+
+        with mock.patch('apps.utils.cache.random.random', return_value=0.5):
+            view.list(self.request)
+        self.assertEqual(view.calls, 2)
+
+    def test_early_refresh_serves_current_value_while_locked(self):
+        """Test only the lock holder refreshes early, others serve the old value"""
+        view, cache_key = self._entry_key()
+        entry = cache.get(cache_key)
+        entry['delta'] = 60
+        entry['expires_at'] = time.time() + 1
+        cache.set(cache_key, entry, 60)
+        cache.add(f"{cache_key}:lock", 1, 30)
+
+        with mock.patch('apps.utils.cache.random.random', return_value=0.5):
+            response = view.list(self.request)
+        self.assertEqual(view.calls, 1)
+        self.assertEqual(response.data, {'calls': 1})
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class StaleWhileRevalidateTest(TestCase):
+    """Test cases for serving stale entries while refreshing in the background"""
+
+    def setUp(self):
+        cache.clear()
+        self.factory = APIRequestFactory()
+        self.request = self.factory.get('/api/v1/publications/lab-stats/rankings/')
+        self.view = StaleWhileRevalidateView()
+        self.view.list(self.request)
+        self.cache_key = _build_response_cache_key('LAB_STATS', self.request, False)
+
+    def _make_stale(self):
+        entry = cache.get(self.cache_key)
+        entry['expires_at'] = time.time() - 1
+        cache.set(self.cache_key, entry, 600)
+
+    def test_fresh_entry_is_not_refreshed(self):
+        """Test entries within the soft TTL are served without a refresh"""
+        with mock.patch('apps.utils.cache._submit_refresh') as submit:
+            self.view.list(self.request)
+        submit.assert_not_called()
+
+    def test_stale_entry_is_served_and_refreshed_in_background(self):
+        """Test a stale entry is returned immediately and refreshed once"""
+        self._make_stale()
+
+        def run_inline(func, *args):
+            func(*args)
+
+        with mock.patch('apps.utils.cache._submit_refresh', side_effect=run_inline):
+            response = self.view.list(self.request)
+
+        self.assertEqual(response.data, {'calls': 1})
+        self.assertEqual(self.view.calls, 1)  # The refresh ran on a copy of the view
+        self.assertEqual(cache.get(self.cache_key)['data'], {'calls': 2})
+
+    def test_refresh_is_scheduled_once(self):
+        """Test concurrent stale hits schedule a single background refresh"""
+        self._make_stale()
+
+        with mock.patch('apps.utils.cache._submit_refresh') as submit:
+            self.view.list(self.request)
+            self.view.list(self.request)
+        self.assertEqual(submit.call_count, 1)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class RenderedResponseCacheTest(TestCase):
+    """Test cases for caching pre-rendered JSON bytes"""
+
+    def setUp(self):
+        cache.clear()
+        RenderedView.calls = 0
+        self.factory = APIRequestFactory()
+        self.view = RenderedView.as_view()
+
+    def test_hits_serve_cached_bytes(self):
+        """Test hits return the rendered bytes without running the view"""
+        first = self.view(self.factory.get('/api/v1/universities/1/professors/'))
+        second = self.view(self.factory.get('/api/v1/universities/1/professors/'))
+
+        self.assertEqual(RenderedView.calls, 1)
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second['Content-Type'], 'application/json')
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(json.loads(second.content), {'name': 'Dr. Test', 'calls': 1})
+
+    def test_browsable_api_is_not_served_json_bytes(self):
+        """Test non-JSON renderers do not receive the cached JSON bytes"""
+        self.view(self.factory.get('/api/v1/universities/1/professors/'))
+        response = self.view(self.factory.get('/api/v1/universities/1/professors/', HTTP_ACCEPT='text/html'))
+
+        self.assertIsInstance(response, Response)
+        self.assertEqual(response.data, {'name': 'Dr. Test', 'calls': 2})
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ConditionalResponseTest(TestCase):
+    """Test cases for ETag / If-None-Match handling of cached responses"""
+
+    def setUp(self):
+        cache.clear()
+        RenderedView.calls = 0
+        self.factory = APIRequestFactory()
+
+    def test_cached_response_has_etag(self):
+        """Test misses and hits carry the same strong ETag and revalidation headers"""
+        view = CountingView()
+        request = self.factory.get('/api/v1/universities/')
+
+        first = view.list(request)
+        second = view.list(request)
+
+        self.assertTrue(first['ETag'].startswith('"'))
+        self.assertEqual(first['ETag'], second['ETag'])
+        self.assertIn('must-revalidate', second['Cache-Control'])
+        self.assertIn('public', second['Cache-Control'])
+
+    def test_matching_if_none_match_returns_304(self):
+        """Test a matching If-None-Match is answered with an empty 304"""
+        view = CountingView()
+        etag = view.list(self.factory.get('/api/v1/universities/'))['ETag']
+
+        response = view.list(self.factory.get('/api/v1/universities/', HTTP_IF_NONE_MATCH=etag))
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(view.calls, 1)
+
+    def test_stale_etag_gets_full_response(self):
+        """Test an outdated ETag gets the new payload after invalidation"""
+        view = CountingView()
+        etag = view.list(self.factory.get('/api/v1/universities/'))['ETag']
+        invalidate_cache_namespace('UNIVERSITIES')
+
+        response = view.list(self.factory.get('/api/v1/universities/', HTTP_IF_NONE_MATCH=etag))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, {'calls': 2})
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_rendered_hits_support_304(self):
+        """Test rendered entries are revalidated like data entries"""
+        view = RenderedView.as_view()
+        etag = view(self.factory.get('/api/v1/universities/1/professors/'))['ETag']
+
+        response = view(self.factory.get('/api/v1/universities/1/professors/', HTTP_IF_NONE_MATCH=etag))
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(RenderedView.calls, 1)
+
+    def test_api_view_supports_304(self):
+        """Test function-based views answer a matching If-None-Match with a 304 until invalidated"""
+        from apps.reviews.models import RatingCategory
+        from apps.reviews.views import get_review_categories
+
+        etag = get_review_categories(self.factory.get('/api/v1/reviews/categories/'))['ETag']
+
+        response = get_review_categories(self.factory.get('/api/v1/reviews/categories/', HTTP_IF_NONE_MATCH=etag))
+        self.assertEqual(response.status_code, 304)
+
+        RatingCategory.objects.create(name='funding', display_name='Funding')
+        invalidate_cache_namespace('RATING_CATEGORIES')
+        response = get_review_categories(self.factory.get('/api/v1/reviews/categories/', HTTP_IF_NONE_MATCH=etag))
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('Funding', response.data['categories'])
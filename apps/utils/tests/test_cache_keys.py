@@ -0,0 +1,84 @@
+from django.http import QueryDict
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from rest_framework.test import APIRequestFactory
+
+from apps.labs.filters import LabFilter
+from apps.utils.cache import _build_response_cache_key
+from apps.utils.cache_keys import (
+    canonical_query_string, filterset_query_params, normalize_bool, normalize_choice,
+    normalize_csv, normalize_number, normalize_search
+)
+from .test_cache import LOCMEM_CACHES
+
+
+LAB_QUERY_PARAMS = filterset_query_params(LabFilter, fields=normalize_choice('minimal', 'compact'))
+
+
+class CanonicalQueryStringTest(SimpleTestCase):
+    """Test cases for query-parameter normalization of cache keys"""
+
+    def test_parameter_order_does_not_matter(self):
+        """Test params are sorted by name"""
+        self.assertEqual(
+            canonical_query_string(QueryDict('lab=3&fields=')),
+            canonical_query_string(QueryDict('fields=&lab=3')),
+        )
+
+    def test_tracking_params_are_dropped(self):
+        """Test analytics params never reach the key"""
+        self.assertEqual(
+            canonical_query_string(QueryDict('lab=3&utm_source=mail&fbclid=x&_=123')),
+            'lab=3',
+        )
+
+    def test_undeclared_params_are_ignored(self):
+        """Test params outside the declaration do not fragment the cache"""
+        self.assertEqual(
+            canonical_query_string(QueryDict('university_id=2&foo=bar&page_size=5'), LAB_QUERY_PARAMS),
+            'university_id=2',
+        )
+
+    def test_values_are_normalized(self):
+        """Test equivalent values produce the same key"""
+        first = canonical_query_string(
+            QueryDict('min_rating=4.50&recruiting_phd=True&search=%20Deep%20%20Learning&page=1'),
+            LAB_QUERY_PARAMS
+        )
+        second = canonical_query_string(
+            QueryDict('search=deep+learning&recruiting_phd=1&min_rating=4.5'),
+            LAB_QUERY_PARAMS
+        )
+        self.assertEqual(first, second)
+        self.assertEqual(first, 'min_rating=4.5&recruiting_phd=true&search=deep+learning')
+
+    def test_default_choice_is_dropped(self):
+        """Test values equivalent to the default are left out"""
+        self.assertEqual(canonical_query_string(QueryDict('fields=full'), LAB_QUERY_PARAMS), '')
+        self.assertEqual(canonical_query_string(QueryDict('fields=compact'), LAB_QUERY_PARAMS), 'fields=compact')
+
+    def test_normalizers(self):
+        """Test the individual normalizers"""
+        self.assertEqual(normalize_number()(' 3.0 '), '3')
+        self.assertEqual(normalize_number()('abc'), 'abc')
+        self.assertIsNone(normalize_number(default=1)('1'))
+        self.assertEqual(normalize_bool('False'), 'false')
+        self.assertEqual(normalize_csv('2021, 2020,,2021'), '2020,2021')
+        self.assertIsNone(normalize_search('   '))
+        self.assertEqual(normalize_choice('')(''), '')
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ResponseCacheKeyTest(TestCase):
+    """Test cases for response cache keys built from declared params"""
+
+    def test_equivalent_requests_share_a_key(self):
+        """Test reordered, tracked and defaulted requests map to one key"""
+        factory = APIRequestFactory()
+        first = factory.get('/api/v1/labs/?university_id=2&fields=compact&page=1')
+        second = factory.get('/api/v1/labs/?fields=compact&utm_campaign=x&university_id=2')
+
+        self.assertEqual(
+            _build_response_cache_key('LABS', first, False, query_params=LAB_QUERY_PARAMS),
+            _build_response_cache_key('LABS', second, False, query_params=LAB_QUERY_PARAMS),
+        )
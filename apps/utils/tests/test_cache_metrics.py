@@ -0,0 +1,81 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.utils.cache_metrics import CacheMetrics, cache_metrics, merge_snapshots, summarize
+from apps.utils.views import cache_metrics_view
+from .test_cache import CountingView, LOCMEM_CACHES
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class CacheMetricsTest(TestCase):
+    """Test cases for per-cache_type hit/miss/latency metrics"""
+
+    def setUp(self):
+        cache.clear()
+        cache_metrics.reset()
+        self.factory = APIRequestFactory()
+
+    def test_cache_response_records_hits_misses_and_sets(self):
+        """Test cache_response feeds the counters and histograms"""
+        view = CountingView()
+        request = self.factory.get('/api/v1/universities/')
+        view.list(request)
+        view.list(request)
+        view.list(request)
+
+        metrics = cache_metrics.snapshot()['UNIVERSITIES']
+        self.assertEqual(metrics['hits'], 2)
+        self.assertEqual(metrics['misses'], 1)
+        self.assertEqual(metrics['sets'], 1)
+        self.assertEqual(metrics['lookup_seconds']['count'], 3)
+        self.assertEqual(metrics['payload_bytes']['count'], 1)
+        self.assertGreater(metrics['payload_bytes']['sum'], 0)
+
+    def test_collect_merges_workers(self):
+        """Test snapshots published by several workers are summed"""
+        other = CacheMetrics()
+        other.worker_id = 'other-host:1'
+        other.record_hit('LABS', 0.002)
+        other.publish()
+        cache_metrics.record_hit('LABS', 0.004)
+        cache_metrics.record_miss('LABS', 0.001)
+
+        collected = cache_metrics.collect()
+
+        self.assertEqual(collected['workers'], 2)
+        summary = summarize(collected['cache_types']['LABS'])
+        self.assertEqual(summary['hits'], 2)
+        self.assertEqual(summary['misses'], 1)
+        self.assertAlmostEqual(summary['hit_ratio'], 2 / 3)
+
+    def test_merge_snapshots_sums_histogram_buckets(self):
+        """Test histogram buckets are merged bucket by bucket"""
+        first, second = CacheMetrics(), CacheMetrics()
+        first.record_set('LABS', 500, 0.02)
+        second.record_set('LABS', 50000, 0.02)
+
+        merged = merge_snapshots([first.snapshot(), second.snapshot()])['LABS']
+
+        self.assertEqual(merged['sets'], 2)
+        self.assertEqual(merged['payload_bytes']['buckets'][:3], [1, 0, 1])
+
+    def test_metrics_endpoint_requires_admin(self):
+        """Test the metrics endpoint is only available to staff users"""
+        user = get_user_model().objects.create_user(
+            username='metrics', email='metrics@example.com', password='pass1234'
+        )
+        request = self.factory.get('/api/v1/cache/metrics/')
+        force_authenticate(request, user=user)
+        self.assertEqual(cache_metrics_view(request).status_code, 403)
+
+        user.is_staff = True
+        user.save()
+        cache_metrics.record_miss('LABS', 0.001)
+        request = self.factory.get('/api/v1/cache/metrics/')
+        force_authenticate(request, user=user)
+        response = cache_metrics_view(request)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['cache_types']['LABS']['misses'], 1)
@@ -0,0 +1,64 @@
+import pickle
+import zlib
+from datetime import datetime
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+
+from apps.utils.cache_serializers import (
+    COMPRESSOR_NONE, SERIALIZER_JSON, SERIALIZER_PICKLE, TaggedSerializer, _parse_header, is_json_shaped
+)
+
+
+class TaggedSerializerTest(SimpleTestCase):
+    """Test cases for the tagged cache value codec"""
+
+    def setUp(self):
+        self.serializer = TaggedSerializer({'COMPRESS_MIN_BYTES': 256})
+
+    def roundtrip(self, value):
+        encoded = self.serializer.dumps(value)
+        return encoded, self.serializer.loads(encoded)
+
+    def test_api_payload_uses_json(self):
+        """Test dict/list payloads are stored as JSON"""
+        value = {'results': [{'id': 1, 'name': 'Lab', 'rating': 4.5, 'active': True, 'tags': None}]}
+        encoded, decoded = self.roundtrip(value)
+
+        _, serializer, compressor = _parse_header(encoded[0])
+        self.assertEqual(serializer, SERIALIZER_JSON)
+        self.assertEqual(compressor, COMPRESSOR_NONE)
+        self.assertEqual(decoded, value)
+
+    def test_non_json_values_fall_back_to_pickle(self):
+        """Test tuples, datetimes, Decimals and bytes keep their type"""
+        for value in [(1, 2), frozenset({1}), datetime(2024, 1, 1), Decimal('4.50'), {'content': b'{}'}]:
+            encoded, decoded = self.roundtrip(value)
+            self.assertEqual(_parse_header(encoded[0])[1], SERIALIZER_PICKLE)
+            self.assertEqual(decoded, value)
+
+    def test_large_payloads_are_compressed(self):
+        """Test values above COMPRESS_MIN_BYTES are compressed"""
+        value = [{'title': 'Deep learning for robotics', 'year': 2024}] * 100
+        encoded, decoded = self.roundtrip(value)
+
+        self.assertNotEqual(_parse_header(encoded[0])[2], COMPRESSOR_NONE)
+        self.assertLess(len(encoded), 256)
+        self.assertEqual(decoded, value)
+
+    def test_small_payloads_are_not_compressed(self):
+        """Test small values skip compression"""
+        encoded, _ = self.roundtrip({'id': 1})
+        self.assertEqual(_parse_header(encoded[0])[2], COMPRESSOR_NONE)
+
+    def test_legacy_entries_are_misses(self):
+        """Test pickle+zlib entries of the previous format decode to None"""
+        legacy = zlib.compress(pickle.dumps({'id': 1}, pickle.HIGHEST_PROTOCOL))
+        self.assertIsNone(self.serializer.loads(legacy))
+
+    def test_json_shape_detection(self):
+        """Test values JSON would change are detected"""
+        self.assertTrue(is_json_shaped({'a': [1, 'b', None, 1.5]}))
+        self.assertFalse(is_json_shaped({1: 'int key'}))
+        self.assertFalse(is_json_shaped([float('nan')]))
+        self.assertFalse(is_json_shaped(2 ** 70))
@@ -0,0 +1,134 @@
+import threading
+import time
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from rest_framework.test import APIClient
+
+from apps.utils import cache_warming
+from apps.utils.cache_warming import (
+    PRIORITY_CRITICAL, PRIORITY_LOW, get_warmers, register_warmer, schedule_warming, warm_caches
+)
+from apps.universities.models import University
+from .test_cache import LOCMEM_CACHES
+
+
+class WarmerRegistryTestMixin:
+    """Registers test warmers and removes them again"""
+
+    def setUp(self):
+        super().setUp()
+        # Load the view warmers first, so they survive the patched registry
+        get_warmers()
+        patcher = mock.patch.dict(cache_warming._registry)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.calls = []
+
+    def register(self, name, namespaces=('TEST',), priority=50, after=(), func=None):
+        def warm():
+            self.calls.append(name)
+            if func:
+                func()
+        register_warmer(name, namespaces, priority, after)(warm)
+
+
+class WarmCachesTest(WarmerRegistryTestMixin, SimpleTestCase):
+    """Test cases for warmer scheduling"""
+
+    def test_priority_and_dependencies(self):
+        """Test warmers run by priority once the warmers they follow are done"""
+        self.register('a', priority=PRIORITY_LOW)
+        self.register('b', priority=PRIORITY_CRITICAL, after=['a'])
+        self.register('c', priority=10)
+
+        results = warm_caches(names=['a', 'b', 'c'], max_workers=1)
+
+        self.assertEqual(self.calls, ['c', 'a', 'b'])
+        self.assertEqual([result['status'] for result in results], ['warmed'] * 3)
+
+    def test_pool_waits_for_dependencies(self):
+        """Test a dependent warmer only starts after its dependency finished"""
+        finished = threading.Event()
+        self.register('slow', func=lambda: (time.sleep(0.05), finished.set()))
+        self.register('dependent', priority=PRIORITY_CRITICAL, after=['slow'],
+                      func=lambda: self.assertTrue(finished.is_set()))
+        self.register('other', priority=PRIORITY_CRITICAL)
+
+        with mock.patch.object(cache_warming.connections, 'close_all'):
+            results = warm_caches(names=['slow', 'dependent', 'other'], max_workers=3)
+
+        self.assertEqual(self.calls[-1], 'dependent')
+        self.assertEqual({result['status'] for result in results}, {'warmed'})
+
+    def test_failures_are_reported(self):
+        """Test a failing warmer is reported and does not block its dependents"""
+        def fail():
+            raise ValueError('boom')
+        self.register('broken', func=fail)
+        self.register('next', after=['broken'])
+
+        results = {result['name']: result for result in warm_caches(names=['broken', 'next'], max_workers=1)}
+
+        self.assertEqual(results['broken']['status'], 'failed')
+        self.assertEqual(results['broken']['error'], 'boom')
+        self.assertEqual(results['next']['status'], 'warmed')
+
+    def test_select_by_namespace(self):
+        """Test only warmers of the given namespaces run"""
+        self.register('labs', namespaces=['LABS_TEST'])
+        self.register('reviews', namespaces=['REVIEWS_TEST'])
+
+        warm_caches(namespaces=['LABS_TEST'], max_workers=1)
+
+        self.assertEqual(self.calls, ['labs'])
+
+
+@override_settings(CACHES=LOCMEM_CACHES, CACHE_WARMING={'ON_INVALIDATE': True, 'DELAY': 60})
+class ScheduleWarmingTest(SimpleTestCase):
+    """Test cases for background warming after invalidation"""
+
+    def tearDown(self):
+        cache_warming._timer = None
+        cache_warming._pending_namespaces.clear()
+
+    def test_invalidations_are_coalesced(self):
+        """Test several invalidations start a single delayed run"""
+        with mock.patch.object(cache_warming.threading, 'Timer') as timer:
+            schedule_warming(['LABS'])
+            schedule_warming(['LABS', 'REVIEWS'])
+
+        timer.assert_called_once()
+        self.assertEqual(cache_warming._pending_namespaces, {'LABS', 'REVIEWS'})
+
+    @override_settings(CACHE_WARMING={'ON_INVALIDATE': False})
+    def test_disabled(self):
+        """Test nothing is scheduled when warming on invalidation is off"""
+        with mock.patch.object(cache_warming.threading, 'Timer') as timer:
+            schedule_warming(['LABS'])
+        timer.assert_not_called()
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class EndpointWarmerTest(TestCase):
+    """Test cases for warming cached endpoints"""
+
+    def setUp(self):
+        cache.clear()
+        University.objects.create(name='MIT', country='USA', city='Cambridge')
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_warmed_endpoint_is_served_from_cache(self):
+        """Test the first real request after warming needs no queries"""
+        results = warm_caches(names=['university-list'], max_workers=1)
+        self.assertEqual(results[0]['status'], 'warmed')
+
+        with self.assertNumQueries(0):
+            response = APIClient().get(reverse('university-list'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['results'][0]['name'], 'MIT')
@@ -0,0 +1,83 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from rest_framework.test import APIRequestFactory
+
+from apps.labs.models import Lab
+from apps.labs.serializers import LabListSerializer
+from apps.labs.views import LabViewSet
+from apps.universities.models import University, Department, UniversityDepartment, Professor
+from apps.utils.local_cache import local_cache
+from .test_cache import LOCMEM_CACHES
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class FragmentCacheTest(TestCase):
+    """Test cases for the per-object serialized fragment cache"""
+
+    def setUp(self):
+        cache.clear()
+        local_cache.clear()
+        self.factory = APIRequestFactory()
+        self.view = LabViewSet.as_view({'get': 'list'})
+
+        # Apply the invalidations of the fixtures, later writes get their own callback
+        with self.captureOnCommitCallbacks(execute=True):
+            university = University.objects.create(name="Fragment University", country="USA")
+            department = Department.objects.create(name="Fragment Science")
+            uni_dept = UniversityDepartment.objects.create(university=university, department=department)
+            self.professor = Professor.objects.create(
+                name="Dr. Fragment", email="fragment@test.edu", university_department=uni_dept
+            )
+            self.labs = [
+                Lab.objects.create(name=f"Fragment Lab {i}", head_professor=self.professor)
+                for i in range(3)
+            ]
+
+    def _list(self, query=''):
+        response = self.view(self.factory.get(f'/api/v1/labs/{query}'))
+        self.assertEqual(response.status_code, 200)
+        return response.data['results']
+
+    def _serialized_count(self, query):
+        """Number of labs serialized for a request"""
+        with mock.patch.object(
+            LabListSerializer, 'to_representation', autospec=True,
+            side_effect=LabListSerializer.to_representation
+        ) as to_representation:
+            results = self._list(query)
+        return results, to_representation.call_count
+
+    def test_fragments_are_shared_across_filters(self):
+        """Test objects serialized for one filter are reused by another"""
+        results, serialized = self._serialized_count('')
+        self.assertEqual(serialized, 3)
+        self.assertEqual({lab['name'] for lab in results}, {lab.name for lab in self.labs})
+
+        results, serialized = self._serialized_count(f'?head_professor={self.professor.id}&ordering=name')
+        self.assertEqual(serialized, 0)
+        self.assertEqual([lab['name'] for lab in results], sorted(lab.name for lab in self.labs))
+
+    def test_saving_an_object_refreshes_its_fragment(self):
+        """Test only the changed object is serialized again"""
+        self._list()
+        lab = self.labs[0]
+        lab.name = "Renamed Fragment Lab"
+        lab.save()
+
+        results, serialized = self._serialized_count('?ordering=name')
+        self.assertEqual(serialized, 1)
+        self.assertIn("Renamed Fragment Lab", [item['name'] for item in results])
+
+    def test_related_change_invalidates_dependent_fragments(self):
+        """Test renaming the head professor invalidates the lab cards"""
+        self._list()
+        self.professor.name = "Dr. Renamed"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.professor.save()
+
+        results, serialized = self._serialized_count('?ordering=-name')
+        self.assertEqual(serialized, 3)
+        self.assertEqual({lab['head_professor_name'] for lab in results}, {"Dr. Renamed"})
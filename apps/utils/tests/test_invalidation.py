@@ -0,0 +1,110 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+
+from apps.universities.models import University
+from apps.utils.cache import get_namespace_generation
+from apps.utils.invalidation import batch_invalidations, defer_until_commit, invalidate_namespaces
+from apps.utils.local_cache import local_cache
+from .test_cache import LOCMEM_CACHES
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class TransactionAwareInvalidationTest(TestCase):
+    """Test cases for invalidations deferred to transaction commit"""
+
+    def setUp(self):
+        cache.clear()
+        local_cache.clear()
+
+    def test_invalidation_waits_for_commit(self):
+        """Test generations are bumped only once the transaction commits"""
+        before = get_namespace_generation('UNIVERSITIES')
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            University.objects.create(name="Pending University", country="USA")
+            self.assertEqual(get_namespace_generation('UNIVERSITIES'), before)
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(get_namespace_generation('UNIVERSITIES'), before + 1)
+
+    def test_invalidations_are_coalesced(self):
+        """Test many saves in one transaction bump each namespace once"""
+        before = get_namespace_generation('UNIVERSITIES')
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            for i in range(5):
+                University.objects.create(name=f"Bulk University {i}", country="USA")
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(get_namespace_generation('UNIVERSITIES'), before + 1)
+
+    def test_batch_flushes_once(self):
+        """Test a batch block collects committed invalidations and flushes on exit"""
+        before = get_namespace_generation('LABS')
+
+        with mock.patch('apps.utils.cache.invalidate_cache_namespace') as invalidate:
+            with batch_invalidations():
+                with self.captureOnCommitCallbacks(execute=True):
+                    invalidate_namespaces('LABS')
+                with self.captureOnCommitCallbacks(execute=True):
+                    invalidate_namespaces('LABS', 'REVIEWS')
+                invalidate.assert_not_called()
+
+        self.assertEqual(sorted(call.args[0] for call in invalidate.call_args_list), ['LABS', 'REVIEWS'])
+        self.assertEqual(get_namespace_generation('LABS'), before)
+
+    def test_deferred_calls_are_coalesced(self):
+        """Test deferred callbacks with the same key run once with the merged id sets"""
+        callback = mock.Mock()
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            defer_until_commit('test', callback, author_ids=[1, None])
+            defer_until_commit('test', callback, author_ids=[2], lab_ids=[3])
+            defer_until_commit('test', callback, author_ids=[])
+            callback.assert_not_called()
+
+        self.assertEqual(len(callbacks), 1)
+        callback.assert_called_once_with(author_ids={1, 2}, lab_ids={3})
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class RollbackInvalidationTest(TransactionTestCase):
+    """Test cases for invalidations of rolled back transactions"""
+
+    def setUp(self):
+        cache.clear()
+        local_cache.clear()
+
+    def test_rolled_back_invalidations_are_dropped(self):
+        """Test a rolled back transaction does not invalidate anything"""
+        before = get_namespace_generation('UNIVERSITIES')
+
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                University.objects.create(name="Rolled Back University", country="USA")
+                raise RuntimeError
+
+        self.assertEqual(get_namespace_generation('UNIVERSITIES'), before)
+
+        with transaction.atomic():
+            University.objects.create(name="Committed University", country="USA")
+        self.assertEqual(get_namespace_generation('UNIVERSITIES'), before + 1)
+
+    def test_rolled_back_deferred_calls_are_dropped(self):
+        """Test a rolled back transaction drops its deferred calls and later ones run"""
+        callback = mock.Mock()
+
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                defer_until_commit('test', callback, lab_ids=[1])
+                raise RuntimeError
+
+        with transaction.atomic():
+            defer_until_commit('test', callback, lab_ids=[2])
+        callback.assert_called_once_with(lab_ids={2})
+
+        defer_until_commit('test', callback, lab_ids=[3])
+        callback.assert_called_with(lab_ids={3})
@@ -0,0 +1,124 @@
+import time
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, SimpleTestCase, override_settings
+
+from apps.utils.cache import CacheManager, _generation_key, invalidate_cache_namespace
+from apps.utils.local_cache import LocalCache, local_cache
+from apps.reviews.models import RatingCategory
+
+
+LOCMEM_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'insidelab-local-cache-tests',
+    }
+}
+
+
+class LocalCacheTest(SimpleTestCase):
+    """Test cases for the bounded per-process LRU cache"""
+
+    def setUp(self):
+        self.local = LocalCache(
+            max_bytes=10 * 1024,
+            max_ttl=60,
+            namespace_limits={'UNIVERSITIES': 2, 'DEPARTMENTS': 10}
+        )
+
+    def test_get_and_set(self):
+        """Test values are returned until they are deleted"""
+        self.local.set('UNIVERSITIES:1:list', ['MIT'])
+        self.assertEqual(self.local.get('UNIVERSITIES:1:list'), ['MIT'])
+
+        self.local.delete('UNIVERSITIES:1:list')
+        self.assertIsNone(self.local.get('UNIVERSITIES:1:list'))
+
+    def test_unlisted_namespace_is_not_cached(self):
+        """Test namespaces without a limit bypass the local cache"""
+        self.assertFalse(self.local.set('LABS:1:list', ['lab']))
+        self.assertIsNone(self.local.get('LABS:1:list'))
+
+    def test_namespace_limit_evicts_least_recently_used(self):
+        """Test the per-namespace limit evicts the LRU entry of that namespace"""
+        self.local.set('DEPARTMENTS:1:a', 'kept')
+        self.local.set('UNIVERSITIES:1:a', 'a')
+        self.local.set('UNIVERSITIES:1:b', 'b')
+        self.local.get('UNIVERSITIES:1:a')
+        self.local.set('UNIVERSITIES:1:c', 'c')
+
+        self.assertEqual(self.local.get('UNIVERSITIES:1:a'), 'a')
+        self.assertIsNone(self.local.get('UNIVERSITIES:1:b'))
+        self.assertEqual(self.local.get('DEPARTMENTS:1:a'), 'kept')
+
+    def test_memory_cap(self):
+        """Test entries are evicted to stay under the memory cap"""
+        payload = 'x' * 4000
+        for i in range(5):
+            self.local.set(f'DEPARTMENTS:1:{i}', payload)
+
+        self.assertIsNone(self.local.get('DEPARTMENTS:1:0'))
+        self.assertEqual(self.local.get('DEPARTMENTS:1:4'), payload)
+        self.assertLessEqual(self.local._bytes, self.local.max_bytes)
+
+    def test_oversized_values_are_skipped(self):
+        """Test values larger than the memory cap are not cached"""
+        self.assertFalse(self.local.set('DEPARTMENTS:1:big', 'x' * 20 * 1024))
+
+    def test_entries_expire(self):
+        """Test entries expire after their TTL"""
+        with mock.patch('apps.utils.local_cache.time.monotonic', return_value=1000):
+            self.local.set('DEPARTMENTS:1:a', 'a', timeout=10)
+        with mock.patch('apps.utils.local_cache.time.monotonic', return_value=1011):
+            self.assertIsNone(self.local.get('DEPARTMENTS:1:a'))
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class TieredCacheTest(TestCase):
+    """Test cases for the per-process tier in front of the shared cache"""
+
+    def setUp(self):
+        cache.clear()
+        local_cache.clear()
+
+    def test_local_hit_skips_shared_cache(self):
+        """Test a warm local entry is served without reading the payload from the shared cache"""
+        CacheManager.set_universities([{'id': 1, 'name': 'MIT'}])
+
+        with mock.patch.object(cache, 'get', wraps=cache.get) as shared_get:
+            self.assertEqual(CacheManager.get_universities(), [{'id': 1, 'name': 'MIT'}])
+        # The namespace generation was just read, so nothing is read from the shared cache
+        self.assertEqual(shared_get.call_count, 0)
+
+    def test_other_process_invalidation_seen_after_generation_ttl(self):
+        """Test a generation bumped elsewhere is picked up once the local generation expires"""
+        CacheManager.set_universities([{'id': 1, 'name': 'MIT'}])
+        # Another process bumps the shared counter directly
+        cache.incr(_generation_key('UNIVERSITIES'))
+        self.assertIsNotNone(CacheManager.get_universities())
+
+        now = time.monotonic()
+        with mock.patch('apps.utils.local_cache.time.monotonic', return_value=now + local_cache.generation_ttl + 1):
+            self.assertIsNone(CacheManager.get_universities())
+
+    def test_generation_bump_invalidates_local_entries(self):
+        """Test invalidating the namespace also hides local copies"""
+        CacheManager.set_universities([{'id': 1, 'name': 'MIT'}])
+        invalidate_cache_namespace('UNIVERSITIES')
+        self.assertIsNone(CacheManager.get_universities())
+
+    def test_rating_categories_are_cached(self):
+        """Test active rating categories are loaded once and refreshed on change"""
+        with self.captureOnCommitCallbacks(execute=True):
+            RatingCategory.objects.create(name='test_local_category', display_name='Local Category')
+
+        names = CacheManager.get_active_rating_category_names()
+        self.assertIn('Local Category', names)
+        with self.assertNumQueries(0):
+            CacheManager.get_active_rating_category_names()
+            CacheManager.get_rating_categories()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            RatingCategory.objects.filter(name='test_local_category').get().delete()
+        self.assertNotIn('Local Category', CacheManager.get_active_rating_category_names())
@@ -0,0 +1,117 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework.test import APIRequestFactory
+
+from apps.publications.models import Author, Publication
+from apps.publications.views import AuthorViewSet, PublicationViewSet
+from apps.utils.local_cache import local_cache
+from apps.utils.pagination import KeysetPagination
+from .test_cache import LOCMEM_CACHES
+
+
+@mock.patch.object(KeysetPagination, 'page_size', 2)
+class KeysetPaginationTest(TestCase):
+    """Test cases for the opt-in keyset pagination"""
+
+    def setUp(self):
+        self.factory = APIRequestFactory()
+        self.view = AuthorViewSet.as_view({'get': 'list'})
+        # Ties on total_citations are ordered by name, then id
+        for name, citations in [('Erin', 10), ('Alice', 50), ('Dave', 10), ('Bob', 50), ('Carol', 30)]:
+            Author.objects.create(name=name, total_citations=citations)
+        Author.objects.create(name='Dave', total_citations=10)
+
+    def get(self, url='/', **params):
+        request = self.factory.get(url, params)
+        response = self.view(request)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_pages_follow_the_composite_ordering(self):
+        """Test next links walk every row once in (-total_citations, name, id) order"""
+        names = []
+        response = self.get(pagination='cursor')
+        self.assertNotIn('count', response.data)
+        self.assertIsNone(response.data['previous'])
+        while True:
+            names += [item['name'] for item in response.data['results']]
+            if not response.data['next']:
+                break
+            response = self.get(response.data['next'])
+
+        self.assertEqual(names, ['Alice', 'Bob', 'Carol', 'Dave', 'Dave', 'Erin'])
+
+    def test_previous_link(self):
+        """Test the previous link returns the page before the cursor"""
+        second = self.get(self.get(pagination='cursor').data['next'])
+        third = self.get(second.data['next'])
+
+        previous = self.get(third.data['previous'])
+        self.assertEqual(
+            [item['name'] for item in previous.data['results']],
+            [item['name'] for item in second.data['results']]
+        )
+        self.assertEqual(previous.data['next'], second.data['next'])
+
+    def test_every_page_is_one_query(self):
+        """Test deep pages cost the same single query without a count or offset"""
+        pages = []
+        url, params = '/', {'pagination': 'cursor'}
+        while url:
+            with CaptureQueriesContext(connection) as queries:
+                response = self.get(url, **params)
+            pages.append([query['sql'] for query in queries if 'FROM "authors"' in query['sql']])
+            url, params = response.data['next'], {}
+
+        self.assertEqual([len(page) for page in pages], [1, 1, 1])
+        for (sql,) in pages:
+            self.assertNotIn('COUNT(', sql)
+            self.assertNotIn('OFFSET', sql)
+
+    def test_estimated_count_header(self):
+        """Test ?count=estimate adds the count header only when asked"""
+        response = self.get(pagination='cursor', count='estimate')
+        self.assertEqual(response['X-Estimated-Count'], '6')
+        self.assertFalse(self.get(pagination='cursor').has_header('X-Estimated-Count'))
+
+    def test_invalid_cursor(self):
+        """Test malformed cursors are rejected"""
+        for cursor in ['garbage', 'eyJwIjpbMV19']:
+            response = self.view(self.factory.get('/', {'cursor': cursor}))
+            self.assertEqual(response.status_code, 404)
+
+    def test_page_numbers_by_default(self):
+        """Test lists keep page-number pagination unless cursor mode is requested"""
+        response = self.get()
+        self.assertEqual(response.data['count'], 6)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+@mock.patch.object(KeysetPagination, 'page_size', 2)
+class PublicationKeysetPaginationTest(TestCase):
+    """Test cases for keyset pagination of the cached publication list"""
+
+    def setUp(self):
+        cache.clear()
+        local_cache.clear()
+        self.factory = APIRequestFactory()
+        self.view = PublicationViewSet.as_view({'get': 'list'})
+        for title, year, citations in [('A', 2024, 5), ('B', 2024, 9), ('C', 2023, 40), ('D', 2022, 1)]:
+            Publication.objects.create(title=title, publication_year=year, citation_count=citations)
+
+    def test_cursor_pages_of_fragment_cached_list(self):
+        """Test the deferred list queryset pages by cursor and cached pages keep the count header"""
+        response = self.view(self.factory.get('/', {'pagination': 'cursor', 'count': 'estimate'}))
+        self.assertEqual([item['title'] for item in response.data['results']], ['B', 'A'])
+        next_page = self.view(self.factory.get(response.data['next']))
+        self.assertEqual([item['title'] for item in next_page.data['results']], ['C', 'D'])
+
+        with self.assertNumQueries(0):
+            cached = self.view(self.factory.get('/', {'pagination': 'cursor', 'count': 'estimate'}))
+        self.assertEqual(cached['X-Estimated-Count'], '4')
+        self.assertEqual(cached.data['next'], response.data['next'])
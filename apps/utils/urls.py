@@ -0,0 +1,7 @@
+# apps/utils/urls.py
+from django.urls import path
+from . import views
+
+urlpatterns = [
+    path('metrics/', views.cache_metrics_view, name='cache-metrics'),
+]
@@ -0,0 +1,19 @@
+# apps/utils/views.py
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from .cache_metrics import cache_metrics, summarize
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def cache_metrics_view(request):
+    """Hit/miss/latency metrics per cache_type, merged across workers"""
+    collected = cache_metrics.collect()
+    return Response({
+        'workers': collected['workers'],
+        'cache_types': {
+            cache_type: {**summarize(metrics), 'raw': metrics}
+            for cache_type, metrics in sorted(collected['cache_types'].items())
+        },
+    })
@@ -53,6 +53,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'apps.utils.invalidation.CacheInvalidationMiddleware',  # Flush cache invalidations once per request
 ]
 
 ROOT_URLCONF = 'insidelab.urls'
@@ -133,6 +134,10 @@ REST_FRAMEWORK = {
         'rest_framework.filters.OrderingFilter',
     ],
     'DEFAULT_METADATA_CLASS': 'rest_framework.metadata.SimpleMetadata',
+    'DEFAULT_THROTTLE_RATES': {
+        # Anonymous full publication exports (PublicationViewSet.export)
+        'publication_export_anon': '20/hour',
+    },
 }
 
 # JWT Configuration
@@ -31,12 +31,13 @@ try:
             'LOCATION': 'redis://127.0.0.1:6379/1',
             'OPTIONS': {
                 'CLIENT_CLASS': 'django_redis.client.DefaultClient',
-                'SERIALIZER': 'django_redis.serializers.pickle.PickleSerializer',
-                'COMPRESSOR': 'django_redis.compressors.zlib.ZlibCompressor',
+                'SERIALIZER': 'apps.utils.cache_serializers.TaggedSerializer',
+                'COMPRESSOR': 'django_redis.compressors.identity.IdentityCompressor',
+                'COMPRESS_MIN_BYTES': 1024,
                 'IGNORE_EXCEPTIONS': True,  # Ignore cache errors to prevent application crashes
             },
             'KEY_PREFIX': 'insidelab_dev',
-            'VERSION': 2,  # Incremented to invalidate old JSON-serialized cache
+            'VERSION': 3,  # Incremented for the tagged orjson/pickle cache format
             'TIMEOUT': 300,
         }
     }
@@ -59,6 +60,8 @@ CACHE_TIMEOUTS = {
     'RESEARCH_GROUPS': 60 * 60 * 2,    # 2 hours
     'USER_PROFILE': 60 * 30,           # 30 minutes
     'SEARCH_RESULTS': 60 * 10,         # 10 minutes
+    'RATING_CATEGORIES': 60 * 60 * 12, # 12 hours
+    'FRAGMENTS': 60 * 60,              # 1 hour
 }
 
 # CORS settings for development (more permissive)
@@ -189,12 +189,15 @@ if REDIS_URL:
                     'socket_connect_timeout': 10,
                     'socket_timeout': 10,
                 },
-                'SERIALIZER': 'django_redis.serializers.pickle.PickleSerializer',
-                'COMPRESSOR': 'django_redis.compressors.zlib.ZlibCompressor',
+                # orjson for API payloads (pickle otherwise), compression only above
+                # COMPRESS_MIN_BYTES; see apps/utils/cache_serializers.py
+                'SERIALIZER': 'apps.utils.cache_serializers.TaggedSerializer',
+                'COMPRESSOR': 'django_redis.compressors.identity.IdentityCompressor',
+                'COMPRESS_MIN_BYTES': 1024,
                 'IGNORE_EXCEPTIONS': True,  # Ignore cache errors to prevent application crashes
             },
             'KEY_PREFIX': 'insidelab_prod',
-            'VERSION': 2,  # Incremented to invalidate old JSON-serialized cache
+            'VERSION': 3,  # Incremented for the tagged orjson/pickle cache format
             'TIMEOUT': 300,
         }
     }
@@ -218,6 +221,16 @@ CACHE_TIMEOUTS = {
     'RESEARCH_GROUPS': 60 * 60,        # 1 hour
     'USER_PROFILE': 60 * 15,           # 15 minutes
     'SEARCH_RESULTS': 60 * 5,          # 5 minutes
+    'RATING_CATEGORIES': 60 * 60 * 6,  # 6 hours
+    'FRAGMENTS': 60 * 60 * 6,          # 6 hours
+}
+
+# Cache warming (see apps/utils/cache_warming.py)
+CACHE_WARMING = {
+    'HOST': config('PRODUCTION_DOMAIN', default='') or 'insidelab.up.railway.app',  # Host of warm-up requests (pagination links)
+    'MAX_WORKERS': 4,                    # Parallel warmers, bounded to spare the DB pool
+    'ON_INVALIDATE': True,               # Rebuild entries shortly after their namespace is invalidated
+    'DELAY': 2,                          # Seconds to coalesce invalidations before warming
 }
 
 # Production CORS settings (more restrictive)
@@ -47,6 +47,13 @@ CACHE_TIMEOUTS = {
     'RESEARCH_GROUPS': 60 * 60 * 2,
     'USER_PROFILE': 60 * 30,
     'SEARCH_RESULTS': 60 * 10,
+    'RATING_CATEGORIES': 60 * 60 * 12,
+    'FRAGMENTS': 60 * 60,
+}
+
+# No background cache warming threads during tests (see apps/utils/cache_warming.py)
+CACHE_WARMING = {
+    'ON_INVALIDATE': False,
 }
 
 # CORS settings (permissive for tests)
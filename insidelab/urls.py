@@ -115,6 +115,7 @@ urlpatterns = [
         path('publications/', include('apps.publications.urls')),
         path('reviews/', include('apps.reviews.urls')),
         path('interviews/', include('apps.interviews.urls')),
+        path('cache/', include('apps.utils.urls')),
         # Unified research areas endpoint
         path('research-areas/', include('apps.publications.research_areas_urls'))
     ])),
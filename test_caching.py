@@ -132,21 +132,22 @@ def test_caching_implementation():
     # Test 6: Cache invalidation
     print("\n6. Testing cache invalidation:")
     try:
-        from apps.utils.cache import invalidate_cache_pattern
+        from apps.utils.cache import get_cache_key, invalidate_cache_namespace
 
         # Set a test cache entry
-        cache.set('insidelab:1:TEST_PATTERN:123', 'test_data', 300)
+        cache_key = get_cache_key('TEST_NAMESPACE', 123)
+        cache.set(cache_key, 'test_data', 300)
 
         # Verify it's there
-        if cache.get('insidelab:1:TEST_PATTERN:123') == 'test_data':
+        if cache.get(cache_key) == 'test_data':
             print("  ✅ Test cache entry created")
 
-            # Invalidate with pattern
-            deleted_count = invalidate_cache_pattern('TEST_PATTERN')
-            print(f"  ✅ Cache invalidation: {deleted_count} keys deleted")
+            # Invalidate by bumping the namespace generation
+            generation = invalidate_cache_namespace('TEST_NAMESPACE')
+            print(f"  ✅ Cache invalidation: namespace generation is now {generation}")
 
-            # Verify it's gone
-            if cache.get('insidelab:1:TEST_PATTERN:123') is None:
+            # Verify the entry is no longer reachable
+            if cache.get(get_cache_key('TEST_NAMESPACE', 123)) is None:
                 print("  ✅ Cache invalidation: WORKING")
             else:
                 print("  ❌ Cache invalidation: FAILED")